@@ -0,0 +1,45 @@
+"""세션 보관 API"""
+
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from sqlmodel import Session
+
+from app.db.session import get_session
+
+router = APIRouter()
+
+
+@router.get("")
+async def list_archives(
+    session: Session = Depends(get_session),
+):
+    """보관된 월 목록과 운영 테이블에 남은 월별 보관 가능 여부"""
+    # 서비스 모듈은 처음 쓸 때 임포트 (서버 시작 시간)
+    from app.services.archive_service import ArchiveService
+
+    service = ArchiveService(session)
+    return {
+        "archives": [
+            {
+                "year_month": a.year_month,
+                "file_name": a.file_name,
+                "session_count": a.session_count,
+                "archived_at": a.archived_at.isoformat(),
+            }
+            for a in service.list_archives()
+        ],
+        "candidates": service.candidate_months(),
+    }
+
+
+@router.post("/run")
+async def run_archive(
+    dry_run: bool = Query(False, description="대상만 확인하고 옮기지 않음"),
+    today: Optional[date] = Query(None, description="마감 판단 기준일 (기본: 오늘)"),
+    session: Session = Depends(get_session),
+):
+    """마감된 월(전부 내보내기 완료 + 급여 마감일 경과) 보관"""
+    from app.services.archive_service import ArchiveService
+
+    return ArchiveService(session).run(today, dry_run=dry_run)
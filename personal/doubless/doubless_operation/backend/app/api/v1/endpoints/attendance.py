@@ -0,0 +1,51 @@
+"""출석 API"""
+
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlmodel import Session, select
+
+from app.db.session import get_session
+from app.db.models.attendance_cache import AttendanceCache
+
+router = APIRouter()
+
+
+@router.get("")
+async def list_attendance(
+    day: Optional[date] = Query(None, alias="date", description="조회일 YYYY-MM-DD (기본: 오늘)"),
+    limit: int = Query(200, le=1000),
+    offset: int = Query(0),
+    session: Session = Depends(get_session),
+):
+    """하루 출석 목록 (최근 입장 순, (attendance_date, attendance_time) 인덱스 조회)"""
+    day = (day or date.today()).isoformat()
+    records = session.exec(
+        select(AttendanceCache)
+        .where(AttendanceCache.attendance_date == day)
+        .order_by(AttendanceCache.attendance_time.desc())
+        .offset(offset)
+        .limit(limit)
+    ).all()
+    return {"date": day, "count": len(records), "attendance": records}
+
+
+@router.post("/sync")
+async def sync_attendance(
+    session: Session = Depends(get_session),
+):
+    """CRM에서 출석 동기화 (마지막 출석일 이후 월 구간만)"""
+    # CRM 관련 모듈은 처음 쓸 때 임포트 (서버 시작 시간)
+    from app.services.attendance_sync_service import AttendanceSyncService
+
+    try:
+        result = await AttendanceSyncService(session).sync()
+
+        return {
+            "success": True,
+            "message": f"Synced {result['count']} attendance records ({result['mode']})",
+            **result,
+        }
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Sync failed: {str(e)}")
@@ -0,0 +1,32 @@
+"""DB 백업 API"""
+
+import asyncio
+from datetime import datetime
+from fastapi import APIRouter
+
+from app.services.backup_service import BackupService
+
+router = APIRouter()
+
+
+@router.get("")
+async def list_backups():
+    """백업 파일 목록 (최신순)"""
+    service = BackupService()
+    return {
+        "targets": {name: str(path) for name, path in service.targets().items()},
+        "backups": [
+            {
+                "file_name": path.name,
+                "size": path.stat().st_size,
+                "created_at": datetime.fromtimestamp(path.stat().st_mtime).isoformat(),
+            }
+            for path in service.list_backups()
+        ],
+    }
+
+
+@router.post("/run")
+async def run_backup():
+    """지금 백업 (스레드에서 실행, 무결성 검사 포함)"""
+    return await asyncio.to_thread(BackupService().run)
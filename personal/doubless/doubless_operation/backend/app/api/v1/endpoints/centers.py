@@ -0,0 +1,26 @@
+"""센터 API"""
+
+from fastapi import APIRouter
+
+from app.core.centers import current_center_code, get_centers
+from app.db.session import engines
+
+router = APIRouter()
+
+
+@router.get("")
+async def list_centers():
+    """설정된 센터 목록 (계정 정보 제외)과 현재 요청 센터"""
+    opened = set(engines.opened())
+    return {
+        "current": current_center_code(),
+        "centers": [
+            {
+                "code": center.code,
+                "name": center.name,
+                "is_default": center.is_default,
+                "opened": center.is_default or center.code in opened,
+            }
+            for center in get_centers().values()
+        ],
+    }
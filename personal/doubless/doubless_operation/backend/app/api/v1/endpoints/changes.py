@@ -0,0 +1,25 @@
+"""변경 피드 API"""
+
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from sqlmodel import Session
+
+from app.db.session import get_session
+from app.services.change_feed import ChangeFeedService, CHANGE_PAGE_SIZE
+
+router = APIRouter()
+
+
+@router.get("")
+async def get_changes(
+    since: Optional[int] = Query(None, ge=0, description="마지막으로 받은 변경 버전 (생략하면 전체 재조회)"),
+    limit: int = Query(CHANGE_PAGE_SIZE, ge=1, le=10000, description="한 번에 읽을 변경 로그 수"),
+    session: Session = Depends(get_session),
+):
+    """버전 이후 변경 조회
+
+    테이블별 upsert 행과 delete id를 행마다 마지막 변경만 남겨 반환한다.
+    reload에 있는 테이블은 목록을 다시 불러와야 한다.
+    has_more가 true면 받은 version으로 이어서 조회한다.
+    """
+    return ChangeFeedService(session).changes_since(since, limit)
@@ -2,49 +2,37 @@
 
 from datetime import date
 from fastapi import APIRouter, Depends
+from sqlalchemy import case, func
 from sqlmodel import Session, select
 
 from app.db.session import get_session
 from app.db.models.session_log import SessionLog, SessionStatus
 from app.db.models.member_cache import MemberCache
+from app.db.models.lesson_ticket_cache import LessonTicketCache
 
 router = APIRouter()
 
+RECENT_SESSION_LIMIT = 10
 
-@router.get("/today")
-async def get_today_dashboard(
-    session: Session = Depends(get_session),
-):
-    """오늘 대시보드 데이터"""
-    today = date.today().isoformat()
 
-    # 오늘 세션
-    session_query = select(SessionLog).where(SessionLog.session_date == today)
-    sessions = session.exec(session_query).all()
+def _today_summary(session: Session, today: str) -> dict:
+    """오늘 세션 요약 (하루치 세션을 한 번만 조회하여 건수와 목록을 함께 계산)"""
+    sessions = session.exec(
+        select(SessionLog)
+        .where(SessionLog.session_date == today)
+        .order_by(SessionLog.session_time)
+    ).all()
 
-    completed = sum(1 for s in sessions if s.session_status == SessionStatus.COMPLETED)
-    cancelled = sum(1 for s in sessions if s.session_status == SessionStatus.CANCELLED)
-    no_show = sum(1 for s in sessions if s.session_status == SessionStatus.NO_SHOW)
-
-    # 미내보내기 건수
-    pending_query = select(SessionLog).where(SessionLog.exported == False)
-    pending = session.exec(pending_query).all()
-
-    # 회원 수
-    member_query = select(MemberCache)
-    members = session.exec(member_query).all()
+    counts = {status: 0 for status in SessionStatus}
+    for s in sessions:
+        counts[s.session_status] += 1
 
     return {
-        "date": today,
-        "sessions": {
-            "total": len(sessions),
-            "completed": completed,
-            "cancelled": cancelled,
-            "no_show": no_show,
-        },
-        "pending_export": len(pending),
-        "members_cached": len(members),
-        "recent_sessions": [
+        "total": len(sessions),
+        "completed": counts[SessionStatus.COMPLETED],
+        "cancelled": counts[SessionStatus.CANCELLED],
+        "no_show": counts[SessionStatus.NO_SHOW],
+        "recent": [
             {
                 "id": s.id,
                 "time": s.session_time,
@@ -52,6 +40,86 @@ async def get_today_dashboard(
                 "member": s.member_name,
                 "status": s.session_status.value,
             }
-            for s in sorted(sessions, key=lambda x: x.session_time)[:10]
+            for s in sessions[:RECENT_SESSION_LIMIT]
         ],
     }
+
+
+def _pending_export_count(session: Session) -> int:
+    """미내보내기 건수 (COUNT 쿼리)"""
+    return session.exec(
+        select(func.count()).select_from(SessionLog).where(SessionLog.exported == False)
+    ).one()
+
+
+def _member_stats(session: Session) -> dict:
+    """회원 캐시 통계 (COUNT/MAX 한 번)"""
+    total, synced_at = session.exec(
+        select(func.count(), func.max(MemberCache.synced_at))
+    ).one()
+    return {
+        "total": total,
+        "synced_at": synced_at.isoformat() if synced_at else None,
+    }
+
+
+def _lesson_ticket_stats(session: Session) -> dict:
+    """수강권 캐시 통계 (COUNT/SUM/MAX 한 번)"""
+    total, active, synced_at = session.exec(
+        select(
+            func.count(),
+            func.coalesce(func.sum(case((LessonTicketCache.remaining_count > 0, 1), else_=0)), 0),
+            func.max(LessonTicketCache.synced_at),
+        )
+    ).one()
+    return {
+        "total": total,
+        "active": active,
+        "synced_at": synced_at.isoformat() if synced_at else None,
+    }
+
+
+def _today_payload(session: Session, today: str) -> dict:
+    """/today 응답 구성"""
+    summary = _today_summary(session, today)
+    recent = summary.pop("recent")
+    return {
+        "date": today,
+        "sessions": summary,
+        "pending_export": _pending_export_count(session),
+        "members_cached": _member_stats(session)["total"],
+        "recent_sessions": recent,
+    }
+
+
+@router.get("/today")
+async def get_today_dashboard(
+    session: Session = Depends(get_session),
+):
+    """오늘 대시보드 데이터"""
+    return _today_payload(session, date.today().isoformat())
+
+
+@router.get("/bootstrap")
+async def get_dashboard_bootstrap(
+    session: Session = Depends(get_session),
+):
+    """대시보드 초기 데이터 일괄 조회
+
+    오늘 통계, 미내보내기 건수, 회원/수강권 통계, 오늘 세션 목록을
+    하나의 DB 세션에서 집계 쿼리로 계산해 한 번의 요청으로 반환한다.
+    """
+    today = date.today().isoformat()
+    summary = _today_summary(session, today)
+    recent = summary.pop("recent")
+    members = _member_stats(session)
+
+    return {
+        "date": today,
+        "sessions": summary,
+        "pending_export": _pending_export_count(session),
+        "members_cached": members["total"],
+        "recent_sessions": recent,
+        "members": members,
+        "lesson_tickets": _lesson_ticket_stats(session),
+    }
@@ -0,0 +1,35 @@
+"""실시간 이벤트 API (Server-Sent Events)"""
+
+from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
+
+router = APIRouter()
+
+
+@router.get("")
+async def stream_events():
+    """세션 생성/수정/삭제와 대시보드 카운터 증감 이벤트 스트림
+
+    이벤트: session.created, session.updated, session.deleted, dashboard.delta, export.created
+    """
+    # 서비스 모듈은 처음 쓸 때 임포트 (서버 시작 시간)
+    from app.services.event_broadcaster import broadcaster
+
+    subscriber = broadcaster.subscribe()
+    return StreamingResponse(
+        broadcaster.stream(subscriber),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/stats")
+async def get_event_stats():
+    """브로드캐스터 상태 (접속 수, 발행/연결 종료 건수)"""
+    from app.services.event_broadcaster import broadcaster
+
+    return {
+        "subscribers": broadcaster.subscriber_count,
+        "published": broadcaster.published,
+        "dropped": broadcaster.dropped,
+    }
@@ -1,16 +1,18 @@
 """데이터 내보내기 API"""
 
+import asyncio
 from datetime import datetime, date
+from enum import Enum
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import FileResponse
 from pydantic import BaseModel
+from sqlalchemy import func
 from sqlmodel import Session, select
 
 from app.db.session import get_session
 from app.db.models.session_log import SessionLog
 from app.db.models.export_log import ExportLog
-from app.services.export_service import ExportService
 
 router = APIRouter()
 
@@ -21,6 +23,19 @@ class ExportRequest(BaseModel):
     end_date: str
 
 
+class ExcelExportKind(str, Enum):
+    """엑셀 내보내기 종류"""
+    WORKLOG = "worklog"         # 업무일지 (일자별 시트)
+    PAYROLL = "payroll"         # 급여 (트레이너별 시트)
+
+
+class ExcelExportRequest(BaseModel):
+    """엑셀 내보내기 요청"""
+    kind: ExcelExportKind
+    start_date: str
+    end_date: str
+
+
 class ExportResponse(BaseModel):
     """내보내기 응답"""
     export_id: str
@@ -52,11 +67,11 @@ async def get_pending_count(
     session: Session = Depends(get_session),
 ):
     """미내보내기 건수 조회"""
-    query = select(SessionLog).where(SessionLog.exported == False)
-    results = session.exec(query).all()
+    query = select(func.count()).select_from(SessionLog).where(SessionLog.exported == False)
+    pending = session.exec(query).one()
     return {
-        "pending_count": len(results),
-        "message": f"{len(results)}건의 미내보내기 데이터가 있습니다.",
+        "pending_count": pending,
+        "message": f"{pending}건의 미내보내기 데이터가 있습니다.",
     }
 
 
@@ -66,14 +81,39 @@ async def create_export(
     session: Session = Depends(get_session),
 ):
     """데이터 내보내기 실행"""
+    # 서비스 모듈은 처음 쓸 때 임포트 (서버 시작 시간)
+    from app.services.event_broadcaster import broadcaster
+    from app.services.export_service import ExportService
+
     try:
         service = ExportService(session)
         result = service.export_sessions(data.start_date, data.end_date)
+        broadcaster.publish("export.created", {"export_id": result.export_id, "session_count": result.session_count})
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Export failed: {str(e)}")
 
 
+@router.post("/excel", response_model=ExportResponse)
+async def create_excel_export(
+    data: ExcelExportRequest,
+    session: Session = Depends(get_session),
+):
+    """엑셀 내보내기 실행 (업무일지/급여 시트)"""
+    # 엑셀 모듈은 처음 쓸 때 임포트 (서버 시작 시간)
+    from app.services.excel_export_service import ExcelExportService
+
+    service = ExcelExportService(session)
+    run = service.export_worklog if data.kind == ExcelExportKind.WORKLOG else service.export_payroll
+    try:
+        # 워커 대기와 시트 병합이 수 초 걸리므로 스레드에서 실행 (SSE 등 다른 요청이 멈추지 않도록)
+        return await asyncio.to_thread(run, data.start_date, data.end_date)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Excel export failed: {str(e)}")
+
+
 @router.get("/{export_id}/download")
 async def download_export(
     export_id: str,
@@ -87,6 +127,7 @@ async def download_export(
         raise HTTPException(status_code=404, detail="Export not found")
 
     from pathlib import Path
+    from app.services.excel_export_service import XLSX_MEDIA_TYPE
     file_path = Path(export_log.file_path)
 
     if not file_path.exists():
@@ -95,5 +136,5 @@ async def download_export(
     return FileResponse(
         path=file_path,
         filename=file_path.name,
-        media_type="application/json",
+        media_type=XLSX_MEDIA_TYPE if file_path.suffix == ".xlsx" else "application/json",
     )
@@ -0,0 +1,56 @@
+"""회원/수강권 이력 API"""
+
+from datetime import datetime, date, time
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlmodel import Session
+
+from app.db.session import get_session
+
+router = APIRouter()
+
+
+def _parse_as_of(as_of: str) -> datetime:
+    """기준 시점 파싱 (날짜만 주면 그날의 마지막 시점)"""
+    try:
+        if len(as_of) == 10:
+            return datetime.combine(date.fromisoformat(as_of), time.max)
+        return datetime.fromisoformat(as_of)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="as_of must be YYYY-MM-DD or ISO datetime")
+
+
+@router.get("/members/{jgjm_key}")
+async def get_member_as_of(
+    jgjm_key: int,
+    as_of: str = Query(..., description="기준 일자 (YYYY-MM-DD) 또는 일시"),
+    session: Session = Depends(get_session),
+):
+    """특정 시점의 회원 정보와 수강권"""
+    # 서비스 모듈은 처음 쓸 때 임포트 (서버 시작 시간)
+    from app.services.history_service import HistoryService
+
+    at = _parse_as_of(as_of)
+    service = HistoryService(session)
+
+    member = service.member_as_of(jgjm_key, at)
+    tickets = service.lesson_tickets_as_of(jgjm_key, at)
+    if member is None and not tickets:
+        raise HTTPException(status_code=404, detail="No history for member at that time")
+
+    return {
+        "jgjm_key": jgjm_key,
+        "as_of": at.isoformat(),
+        "member": member,
+        "lesson_tickets": tickets,
+    }
+
+
+@router.get("/members/{jgjm_key}/versions")
+async def get_member_versions(
+    jgjm_key: int,
+    session: Session = Depends(get_session),
+):
+    """회원/수강권 변경 이력 전체"""
+    from app.services.history_service import HistoryService
+
+    return {"jgjm_key": jgjm_key, **HistoryService(session).member_versions(jgjm_key)}
@@ -7,8 +7,11 @@ from pydantic import BaseModel
 from sqlmodel import Session, select, delete
 
 from app.db.session import get_session
+from app.db.change_tracking import mark_replaced
 from app.db.models.lesson_ticket_cache import LessonTicketCache
-from app.services.broj_client import BrojClient
+from app.db.models.sync_state import SyncState
+from app.profile.memory import memory_stage
+from app.services.maintenance_service import analyze_tables
 
 router = APIRouter()
 
@@ -33,16 +36,6 @@ class LessonTicketResponse(BaseModel):
         from_attributes = True
 
 
-def ms_to_date(ms: Optional[int]) -> Optional[str]:
-    """밀리초 타임스탬프를 날짜 문자열로 변환"""
-    if ms is None:
-        return None
-    try:
-        return datetime.fromtimestamp(ms / 1000).strftime("%Y-%m-%d")
-    except (ValueError, TypeError, OSError):
-        return None
-
-
 @router.get("", response_model=list[LessonTicketResponse])
 async def list_lesson_tickets(
     trainer: Optional[str] = Query(None, description="트레이너 필터"),
@@ -117,41 +110,58 @@ async def sync_lesson_tickets(
     session: Session = Depends(get_session),
 ):
     """CRM에서 수강권 동기화"""
+    # CRM 클라이언트는 처음 쓸 때 임포트 (서버 시작 시간)
+    from app.services.broj_client import BrojClient
+    from app.services.crm_mapping import to_lesson_ticket_cache
+    from app.services.history_service import HistoryService
+    from app.services.ticket_validity import SYNC_NAME, ticket_index
+
     try:
         client = BrojClient()
         await client.login()
-        tickets_data = await client.fetch_lesson_tickets()
-
-        # 기존 데이터 삭제
-        session.exec(delete(LessonTicketCache))
-
-        count = 0
-        for ticket in tickets_data:
-            cache = LessonTicketCache(
-                jglesson_ticket_key=ticket.get("jglesson_ticket_key"),
-                jgjm_key=ticket.get("jgjm_key"),
-                member_name=ticket.get("jgjm_member_name", ""),
-                member_phone=ticket.get("jgjm_member_phone_number"),
-                ticket_type=ticket.get("jglesson_ticket_type", ""),
-                total_count=ticket.get("jglesson_ticket_origin_count", 0) or ticket.get("jglesson_origin_ticket_count", 0) or 0,
-                remaining_count=ticket.get("jglesson_ticket_count", 0) or 0,
-                trainer_key=ticket.get("jgjm_trainer_key"),
-                trainer_name=ticket.get("trainer_name"),
-                start_date=ms_to_date(ticket.get("jglesson_ticket_started_dttm")),
-                end_date=ms_to_date(ticket.get("jglesson_ticket_closed_dttm")),
-                status=ticket.get("status"),
-                synced_at=datetime.now(),
-            )
-            session.add(cache)
-            count += 1
-
-        session.commit()
-
+        with memory_stage("fetch"):
+            tickets_data = await client.fetch_lesson_tickets()
+
+        with memory_stage("apply"):
+            # 기존 데이터 삭제
+            session.exec(delete(LessonTicketCache))
+            mark_replaced(session, LessonTicketCache)
+
+            synced_at = datetime.now()
+            caches = []
+            for ticket in tickets_data:
+                cache = to_lesson_ticket_cache(ticket, synced_at)
+                session.add(cache)
+                caches.append(cache)
+
+            # 변경분 이력 기록
+            history = HistoryService(session).record_lesson_tickets(caches, synced_at)
+
+            # 전체 동기화 기록 (이후 수강권 미등록 경고 사용)
+            state = session.exec(select(SyncState).where(SyncState.name == SYNC_NAME)).first()
+            state = state or SyncState(name=SYNC_NAME)
+            state.last_sync_at = state.last_full_sync_at = synced_at
+            state.last_sync_mode = "full"
+            state.last_fetched = len(caches)
+            state.last_changed = history["inserted"]
+            session.add(state)
+        with memory_stage("commit"):
+            session.commit()
+
+        # 전체 교체 후 통계 갱신
+        analyze_tables(session, LessonTicketCache)
+
+        # 수강권 유효성 인덱스 재구성
+        with memory_stage("ticket_index"):
+            ticket_index.rebuild(session)
+
+        count = len(caches)
         return {
             "success": True,
             "message": f"Synced {count} lesson tickets",
             "count": count,
-            "synced_at": datetime.now().isoformat(),
+            "history": history,
+            "synced_at": synced_at.isoformat(),
         }
 
     except Exception as e:
@@ -0,0 +1,22 @@
+"""DB 유지보수 API"""
+
+import asyncio
+from fastapi import APIRouter, Query
+
+from app.services.maintenance_service import MaintenanceService
+
+router = APIRouter()
+
+
+@router.get("/metrics")
+async def get_metrics():
+    """DB별 파일 크기, 빈 페이지, WAL 크기, 체크포인트 지연"""
+    return await asyncio.to_thread(MaintenanceService().metrics)
+
+
+@router.post("/run")
+async def run_maintenance(
+    full: bool = Query(True, description="유휴 여부와 관계없이 optimize/vacuum까지 실행"),
+):
+    """지금 점검 (체크포인트, full이면 통계 갱신과 vacuum 포함)"""
+    return await asyncio.to_thread(MaintenanceService().run, True if full else None)
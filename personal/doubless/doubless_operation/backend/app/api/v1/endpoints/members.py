@@ -1,18 +1,29 @@
 """회원 API"""
 
-from datetime import datetime
+from datetime import date, datetime, timedelta
+from enum import Enum
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
+from sqlalchemy import func
 from sqlmodel import Session, select
 
 from app.db.session import get_session
+from app.core.config import get_settings
 from app.db.models.member_cache import MemberCache
-from app.services.broj_client import BrojClient
+from app.db.models.lesson_ticket_cache import LessonTicketCache
+from app.db.models.attendance_cache import AttendanceCache
 
 router = APIRouter()
 
 
+class SyncMode(str, Enum):
+    """동기화 모드"""
+    AUTO = "auto"
+    FULL = "full"
+    INCREMENTAL = "incremental"
+
+
 class MemberResponse(BaseModel):
     """회원 응답"""
     id: int
@@ -26,6 +37,7 @@ class MemberResponse(BaseModel):
     membership_end: Optional[str]
     classification: Optional[str]
     customer_status: Optional[str]
+    last_attendance: Optional[str]
     synced_at: datetime
 
     class Config:
@@ -79,41 +91,20 @@ async def search_members(
 
 @router.post("/sync")
 async def sync_members(
+    mode: SyncMode = Query(SyncMode.AUTO, description="auto: 주기에 따라 전체/증분 자동 선택"),
     session: Session = Depends(get_session),
 ):
     """CRM에서 회원 동기화"""
+    # CRM 관련 모듈은 처음 쓸 때 임포트 (서버 시작 시간)
+    from app.services.member_sync_service import MemberSyncService
+
     try:
-        client = BrojClient()
-        await client.login()
-        members_data = await client.fetch_members()
-
-        # 기존 데이터 삭제 후 새로 삽입
-        session.exec(select(MemberCache)).all()
-        # Delete all existing
-        from sqlmodel import delete
-        session.exec(delete(MemberCache))
-
-        count = 0
-        for member in members_data:
-            cache = MemberCache(
-                jgjm_key=member.get("jgjm_key"),
-                name=member.get("jgjm_member_name", ""),
-                phone=member.get("jgjm_member_phone_number"),
-                gender=member.get("jgjm_member_sex"),
-                classification=member.get("classification"),
-                customer_status=member.get("customer_status"),
-                synced_at=datetime.now(),
-            )
-            session.add(cache)
-            count += 1
-
-        session.commit()
+        result = await MemberSyncService(session).sync(mode=mode.value)
 
         return {
             "success": True,
-            "message": f"Synced {count} members",
-            "count": count,
-            "synced_at": datetime.now().isoformat(),
+            "message": f"Synced {result['count']} members ({result['mode']})",
+            **result,
         }
 
     except Exception as e:
@@ -132,3 +123,109 @@ async def get_member_stats(
         "total": len(results),
         "synced_at": results[0].synced_at.isoformat() if results else None,
     }
+
+
+@router.get("/inactive")
+async def list_inactive_members(
+    days: Optional[int] = Query(None, ge=1, description="이 일수 동안 출석이 없는 회원 (기본: inactive_member_days)"),
+    include_never: bool = Query(False, description="출석 기록이 없는 회원 포함"),
+    limit: int = Query(100, le=1000),
+    offset: int = Query(0),
+    session: Session = Depends(get_session),
+):
+    """미방문 회원 (마지막 출석이 오래된 순, last_attendance 인덱스 범위 조회)"""
+    days = days or get_settings().inactive_member_days
+    cutoff = (date.today() - timedelta(days=days - 1)).isoformat()
+    condition = MemberCache.last_attendance < cutoff
+    if include_never:
+        condition = condition | MemberCache.last_attendance.is_(None)
+
+    total = session.exec(select(func.count()).select_from(MemberCache).where(condition)).one()
+    members = session.exec(
+        select(MemberCache)
+        .where(condition)
+        .order_by(MemberCache.last_attendance)
+        .offset(offset)
+        .limit(limit)
+    ).all()
+
+    today = date.today()
+    return {
+        "days": days,
+        "cutoff": cutoff,
+        "total": total,
+        "members": [
+            {
+                "jgjm_key": m.jgjm_key,
+                "name": m.name,
+                "phone": m.phone,
+                "trainer_name": m.trainer_name,
+                "customer_status": m.customer_status,
+                "last_attendance": m.last_attendance,
+                "days_since": (today - date.fromisoformat(m.last_attendance[:10])).days if m.last_attendance else None,
+            }
+            for m in members
+        ],
+    }
+
+
+@router.get("/{jgjm_key}/last-visit")
+async def get_member_last_visit(
+    jgjm_key: int,
+    session: Session = Depends(get_session),
+):
+    """회원 마지막 출석 (출석 캐시 기준, 출석 동기화 후 갱신)"""
+    member = session.exec(select(MemberCache).where(MemberCache.jgjm_key == jgjm_key)).first()
+    if not member:
+        raise HTTPException(status_code=404, detail="Member not found")
+
+    # (jgjm_key, attendance_date) 인덱스로 최근 출석 한 건
+    visit = session.exec(
+        select(AttendanceCache)
+        .where(AttendanceCache.jgjm_key == jgjm_key)
+        .order_by(AttendanceCache.attendance_date.desc(), AttendanceCache.attendance_time.desc())
+        .limit(1)
+    ).first()
+
+    last_attendance = member.last_attendance
+    return {
+        "jgjm_key": jgjm_key,
+        "name": member.name,
+        "last_attendance": last_attendance,
+        "days_since": (date.today() - date.fromisoformat(last_attendance[:10])).days if last_attendance else None,
+        "visit": visit,
+    }
+
+
+@router.get("/{jgjm_key}/detail")
+async def get_member_detail(
+    jgjm_key: int,
+    session: Session = Depends(get_session),
+):
+    """회원 상세 (캐시 즉시 반환, TTL 초과 시 백그라운드 CRM 갱신)"""
+    member = session.exec(select(MemberCache).where(MemberCache.jgjm_key == jgjm_key)).first()
+    if not member:
+        raise HTTPException(status_code=404, detail="Member not found")
+
+    tickets = session.exec(
+        select(LessonTicketCache)
+        .where(LessonTicketCache.jgjm_key == jgjm_key)
+        .order_by(LessonTicketCache.remaining_count.desc())
+    ).all()
+
+    synced_at = min([member.synced_at] + [t.synced_at for t in tickets])
+    ttl = timedelta(seconds=get_settings().member_detail_ttl_seconds)
+    stale = datetime.now() - synced_at > ttl
+
+    from app.services.member_refresh import member_refresher
+
+    if stale:
+        member_refresher.schedule(jgjm_key, member.phone or member.name)
+
+    return {
+        "member": member,
+        "lesson_tickets": tickets,
+        "synced_at": synced_at.isoformat(),
+        "stale": stale,
+        "refreshing": member_refresher.is_refreshing(jgjm_key),
+    }
@@ -0,0 +1,98 @@
+"""월 마감 API"""
+
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel
+from sqlmodel import Session
+
+from app.db.session import get_session
+from app.db.models.month_close import MonthClose
+from app.api.v1.endpoints.reports import _validate_year_month
+
+router = APIRouter()
+
+
+class CloseRequest(BaseModel):
+    """마감 요청"""
+    closed_by: Optional[str] = None
+
+
+class ReopenRequest(BaseModel):
+    """재오픈 요청 (사유 필수)"""
+    reason: str
+    reopened_by: Optional[str] = None
+
+
+def _close_response(c: MonthClose) -> dict:
+    return {
+        "id": c.id,
+        "year_month": c.year_month,
+        "status": c.status.value,
+        "session_count": c.session_count,
+        "checksum": c.checksum,
+        "closed_at": c.closed_at.isoformat(),
+        "closed_by": c.closed_by,
+        "reopened_at": c.reopened_at.isoformat() if c.reopened_at else None,
+        "reopened_by": c.reopened_by,
+        "reopen_reason": c.reopen_reason,
+    }
+
+
+@router.get("")
+async def list_periods(
+    session: Session = Depends(get_session),
+):
+    """마감 이력"""
+    # 서비스 모듈은 처음 쓸 때 임포트 (서버 시작 시간)
+    from app.services.period_close_service import PeriodCloseService
+
+    return {"closes": [_close_response(c) for c in PeriodCloseService(session).list_closes()]}
+
+
+@router.post("/{year_month}/close")
+async def close_period(
+    year_month: str,
+    data: CloseRequest = CloseRequest(),
+    session: Session = Depends(get_session),
+):
+    """월 마감 (이후 해당 월 세션 수정 불가, 리포트는 스냅샷으로 제공)"""
+    from app.services.period_close_service import PeriodCloseError, PeriodCloseService
+
+    _validate_year_month(year_month)
+    try:
+        month_close = PeriodCloseService(session).close(year_month, data.closed_by)
+    except PeriodCloseError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return _close_response(month_close)
+
+
+@router.post("/{year_month}/reopen")
+async def reopen_period(
+    year_month: str,
+    data: ReopenRequest,
+    session: Session = Depends(get_session),
+):
+    """마감 해제 (스냅샷 무효화)"""
+    from app.services.period_close_service import PeriodCloseError, PeriodCloseService
+
+    _validate_year_month(year_month)
+    try:
+        month_close = PeriodCloseService(session).reopen(year_month, data.reason, data.reopened_by)
+    except PeriodCloseError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return _close_response(month_close)
+
+
+@router.get("/{year_month}/verify")
+async def verify_period(
+    year_month: str,
+    session: Session = Depends(get_session),
+):
+    """마감 체크섬 검증 (현재 세션 원본과 비교)"""
+    from app.services.period_close_service import PeriodCloseError, PeriodCloseService
+
+    _validate_year_month(year_month)
+    try:
+        return PeriodCloseService(session).verify(year_month)
+    except PeriodCloseError as e:
+        raise HTTPException(status_code=409, detail=str(e))
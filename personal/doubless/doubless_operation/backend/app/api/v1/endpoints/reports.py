@@ -0,0 +1,89 @@
+"""리포트 API"""
+
+import re
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlmodel import Session
+
+from app.db.session import get_session
+
+router = APIRouter()
+
+YEAR_MONTH_PATTERN = re.compile(r"^\d{4}-\d{2}$")
+
+
+def _validate_year_month(year_month: str) -> str:
+    """YYYY-MM 형식 확인"""
+    if not YEAR_MONTH_PATTERN.match(year_month):
+        raise HTTPException(status_code=400, detail="year_month must be YYYY-MM")
+    return year_month
+
+
+@router.get("/monthly")
+async def get_monthly_report(
+    year_month: str = Query(..., description="조회 월 (YYYY-MM)"),
+    trainer: Optional[str] = Query(None, description="트레이너 필터"),
+    session: Session = Depends(get_session),
+):
+    """월별 트레이너/회원 세션 집계 (마감된 월은 마감 스냅샷)"""
+    # 서비스 모듈은 처음 쓸 때 임포트 (서버 시작 시간)
+    from app.services.period_close_service import PeriodCloseService
+    from app.services.rollup_service import RollupService
+
+    _validate_year_month(year_month)
+    closes = PeriodCloseService(session)
+    month_close = closes.active_close(year_month)
+    if month_close:
+        rows = closes.snapshot(year_month, trainer)
+    else:
+        rows = RollupService(session).get_month(year_month, trainer)
+
+    trainers: dict[str, dict] = {}
+    for r in rows:
+        summary = trainers.setdefault(r.trainer_name, {
+            "trainer_name": r.trainer_name,
+            "total": 0,
+            "by_status": {},
+            "by_type": {},
+            "event_count": 0,
+        })
+        summary["total"] += r.session_count
+        summary["event_count"] += r.event_count
+        summary["by_status"][r.session_status] = summary["by_status"].get(r.session_status, 0) + r.session_count
+        summary["by_type"][r.session_type] = summary["by_type"].get(r.session_type, 0) + r.session_count
+
+    return {
+        "year_month": year_month,
+        "closed": month_close is not None,
+        "checksum": month_close.checksum if month_close else None,
+        "trainers": list(trainers.values()),
+        "rows": [
+            {
+                "trainer_name": r.trainer_name,
+                "member_name": r.member_name,
+                "session_type": r.session_type,
+                "session_status": r.session_status,
+                "session_count": r.session_count,
+                "event_count": r.event_count,
+            }
+            for r in rows
+        ],
+    }
+
+
+@router.post("/monthly/{year_month}/rebuild")
+async def rebuild_monthly_report(
+    year_month: str,
+    session: Session = Depends(get_session),
+):
+    """월별 집계 재계산"""
+    from app.services.rollup_service import RollupService
+
+    _validate_year_month(year_month)
+    count = RollupService(session).rebuild_month(year_month)
+    session.commit()
+    return {
+        "year_month": year_month,
+        "rows": count,
+        "message": f"{year_month} 집계 {count}건 재계산",
+    }
@@ -11,6 +11,10 @@ from app.db.models.session_log import SessionLog, SessionStatus
 
 router = APIRouter()
 
+# 업무일지 그리드 시간대 (06:00 ~ 23:00)
+GRID_HOURS = range(6, 24)
+GRID_MAX_DAYS = 62
+
 
 # Request/Response 스키마
 class SessionCreate(BaseModel):
@@ -23,6 +27,8 @@ class SessionCreate(BaseModel):
     session_type: str = "PT"
     session_status: SessionStatus = SessionStatus.COMPLETED
     session_index: Optional[str] = None
+    session_no: Optional[int] = None
+    session_total: Optional[int] = None
     is_event: bool = False
     registration_type: Optional[str] = None
     note: Optional[str] = None
@@ -38,6 +44,8 @@ class SessionUpdate(BaseModel):
     session_type: Optional[str] = None
     session_status: Optional[SessionStatus] = None
     session_index: Optional[str] = None
+    session_no: Optional[int] = None
+    session_total: Optional[int] = None
     is_event: Optional[bool] = None
     registration_type: Optional[str] = None
     note: Optional[str] = None
@@ -54,6 +62,8 @@ class SessionResponse(BaseModel):
     session_type: str
     session_status: SessionStatus
     session_index: Optional[str]
+    session_no: Optional[int] = None
+    session_total: Optional[int] = None
     is_event: bool
     registration_type: Optional[str]
     note: Optional[str]
@@ -64,22 +74,38 @@ class SessionResponse(BaseModel):
         from_attributes = True
 
 
+class SessionCreateResponse(SessionResponse):
+    """세션 생성/수정 응답 (회차 제안, 수강권 경고 포함)"""
+    number_suggestion: Optional[dict] = None
+    ticket_warnings: list[str] = []
+
+
+def check_ticket(session: Session, log: SessionLog) -> list[str]:
+    """세션의 수강권 유효성 경고"""
+    from app.services.ticket_validity import ticket_index
+
+    ticket_index.ensure_loaded(session)
+    return ticket_index.check(
+        log.member_key, log.member_name, log.session_date, log.session_type, log.session_status, log.session_time,
+    )
+
+
 @router.get("", response_model=list[SessionResponse])
 async def list_sessions(
     date: Optional[str] = Query(None, description="날짜 필터 (YYYY-MM-DD)"),
     trainer: Optional[str] = Query(None, description="트레이너 필터"),
     session: Session = Depends(get_session),
 ):
-    """세션 목록 조회"""
-    query = select(SessionLog).order_by(SessionLog.session_date.desc(), SessionLog.session_time)
-
-    if date:
-        query = query.where(SessionLog.session_date == date)
-    if trainer:
-        query = query.where(SessionLog.trainer_name == trainer)
-
-    results = session.exec(query).all()
-    return results
+    """세션 목록 조회 (날짜를 지정하면 보관된 월도 조회)"""
+    # 서비스 모듈은 처음 쓸 때 임포트 (서버 시작 시간)
+    from app.services.archive_service import ArchiveService
+
+    return ArchiveService(session).get_logs(
+        date,
+        date,
+        where=lambda t: [t.c.trainer_name == trainer] if trainer else [],
+        order_by=("session_date DESC", "session_time"),
+    )
 
 
 @router.get("/daily/{date}", response_model=list[SessionResponse])
@@ -87,14 +113,10 @@ async def get_daily_sessions(
     date: str,
     session: Session = Depends(get_session),
 ):
-    """일별 세션 조회"""
-    query = (
-        select(SessionLog)
-        .where(SessionLog.session_date == date)
-        .order_by(SessionLog.session_time)
-    )
-    results = session.exec(query).all()
-    return results
+    """일별 세션 조회 (보관된 월 포함)"""
+    from app.services.archive_service import ArchiveService
+
+    return ArchiveService(session).get_logs(date, date, order_by=("session_time",))
 
 
 @router.get("/trainers")
@@ -107,17 +129,139 @@ async def get_trainers(
     return {"trainers": sorted(set(results))}
 
 
-@router.post("", response_model=SessionResponse)
+@router.get("/grid")
+async def get_session_grid(
+    start: str = Query(..., description="시작일 (YYYY-MM-DD)"),
+    end: str = Query(..., description="종료일 (YYYY-MM-DD)"),
+    session: Session = Depends(get_session),
+):
+    """업무일지 그리드 조회 (트레이너 × 일자 × 시간대)
+
+    엑셀 업무일지와 같은 배치로 피벗된 결과를 반환한다.
+    회원명/상태는 사전(members, statuses) 인덱스로 인코딩되며,
+    grid[trainer][day][hour] 셀은 null 또는 [member, status, session_id, session_index] 형태다.
+    같은 칸에 두 번째 이후 세션이나 시간대 밖 세션은 overflow에
+    [trainer, day, hour, member, status, session_id, session_index] 형태로 담긴다.
+    """
+    from app.services.archive_service import ArchiveService
+
+    try:
+        start_day = date.fromisoformat(start)
+        end_day = date.fromisoformat(end)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="start/end must be YYYY-MM-DD")
+
+    if end_day < start_day:
+        raise HTTPException(status_code=400, detail="end must not be before start")
+    if (end_day - start_day).days >= GRID_MAX_DAYS:
+        raise HTTPException(status_code=400, detail=f"Range must be at most {GRID_MAX_DAYS} days")
+
+    # (session_date, session_time) 인덱스 범위 조회 (보관 월이면 session_logs_all 뷰)
+    table = ArchiveService(session).session_log_table(start, end)
+    query = (
+        select(
+            table.c.id,
+            table.c.session_date,
+            table.c.session_time,
+            table.c.trainer_name,
+            table.c.member_name,
+            table.c.session_status,
+            table.c.session_index,
+        )
+        .where(table.c.session_date >= start)
+        .where(table.c.session_date <= end)
+        .order_by(table.c.session_date, table.c.session_time)
+    )
+    rows = session.exec(query).all()
+
+    dates = [
+        date.fromordinal(d).isoformat()
+        for d in range(start_day.toordinal(), end_day.toordinal() + 1)
+    ]
+    date_index = {d: i for i, d in enumerate(dates)}
+    trainers = sorted({r[3] for r in rows})
+    trainer_index = {t: i for i, t in enumerate(trainers)}
+    statuses = [s.value for s in SessionStatus]
+    status_index = {s: i for i, s in enumerate(statuses)}
+    members: list[str] = []
+    member_index: dict[str, int] = {}
+
+    grid: list[list[list]] = [
+        [[None] * len(GRID_HOURS) for _ in dates]
+        for _ in trainers
+    ]
+    overflow = []
+
+    for session_id, session_date, session_time, trainer_name, member_name, status, session_index in rows:
+        m = member_index.get(member_name)
+        if m is None:
+            m = member_index[member_name] = len(members)
+            members.append(member_name)
+
+        t = trainer_index[trainer_name]
+        d = date_index[session_date]
+        s = status_index[status.value if hasattr(status, "value") else status]
+
+        try:
+            h = int(session_time[:2]) - GRID_HOURS[0]
+        except ValueError:
+            h = -1
+
+        if 0 <= h < len(GRID_HOURS) and grid[t][d][h] is None:
+            grid[t][d][h] = [m, s, session_id, session_index]
+        else:
+            overflow.append([t, d, h, m, s, session_id, session_index])
+
+    return {
+        "start": start,
+        "end": end,
+        "hours": [f"{hour:02d}:00" for hour in GRID_HOURS],
+        "dates": dates,
+        "trainers": trainers,
+        "members": members,
+        "statuses": statuses,
+        "grid": grid,
+        "overflow": overflow,
+    }
+
+
+@router.get("/next-number")
+async def suggest_next_number(
+    member_name: str = Query(..., description="회원명"),
+    session_date: str = Query(..., description="수업일 (YYYY-MM-DD)"),
+    session_time: str = Query("23:59", description="수업 시간 (HH:MM)"),
+    member_key: Optional[int] = Query(None, description="CRM jgjm_key"),
+    session: Session = Depends(get_session),
+):
+    """다음 PT 회차 제안 (직전 세션 + 활성 수강권 기준)"""
+    from app.services.session_number_service import SessionNumberService
+
+    return SessionNumberService(session).suggest(member_key, member_name, session_date, session_time)
+
+
+@router.post("", response_model=SessionCreateResponse)
 async def create_session(
     data: SessionCreate,
     session: Session = Depends(get_session),
 ):
-    """세션 생성"""
+    """세션 생성 (PT 회차 미입력 시 자동 입력)"""
+    from app.services.event_broadcaster import dashboard_state, publish_session_event, session_payload
+    from app.services.rollup_service import RollupService
+    from app.services.session_number_service import SessionNumberService
+
     log = SessionLog(**data.model_dump())
+    suggestion = SessionNumberService(session).apply(log)
     session.add(log)
+    RollupService(session).on_create(log)
     session.commit()
     session.refresh(log)
-    return log
+
+    publish_session_event("created", session_payload(log), after=dashboard_state(log))
+
+    response = SessionCreateResponse.model_validate(log)
+    response.number_suggestion = suggestion
+    response.ticket_warnings = check_ticket(session, log)
+    return response
 
 
 @router.get("/{session_id}", response_model=SessionResponse)
@@ -132,26 +276,44 @@ async def get_session_by_id(
     return log
 
 
-@router.put("/{session_id}", response_model=SessionResponse)
+@router.put("/{session_id}", response_model=SessionCreateResponse)
 async def update_session(
     session_id: int,
     data: SessionUpdate,
     session: Session = Depends(get_session),
 ):
     """세션 수정"""
+    from app.services.event_broadcaster import dashboard_state, publish_session_event, session_payload
+    from app.services.rollup_service import RollupService, rollup_key
+    from app.services.session_number_service import format_session_number, parse_session_number
+
     log = session.get(SessionLog, session_id)
     if not log:
         raise HTTPException(status_code=404, detail="Session not found")
 
+    old_key, old_is_event = rollup_key(log), log.is_event
+    before = dashboard_state(log)
+
     update_data = data.model_dump(exclude_unset=True)
     for key, value in update_data.items():
         setattr(log, key, value)
 
+    # 회차 표기와 구조화 회차 동기화
+    if "session_index" in update_data and not ({"session_no", "session_total"} & update_data.keys()):
+        log.session_no, log.session_total = parse_session_number(log.session_index)
+    elif {"session_no", "session_total"} & update_data.keys() and "session_index" not in update_data:
+        log.session_index = format_session_number(log.session_no, log.session_total)
+
     log.updated_at = datetime.now()
     session.add(log)
+    RollupService(session).on_update(old_key, old_is_event, log)
     session.commit()
     session.refresh(log)
-    return log
+    publish_session_event("updated", session_payload(log), before, dashboard_state(log))
+
+    response = SessionCreateResponse.model_validate(log)
+    response.ticket_warnings = check_ticket(session, log)
+    return response
 
 
 @router.delete("/{session_id}")
@@ -160,12 +322,18 @@ async def delete_session(
     session: Session = Depends(get_session),
 ):
     """세션 삭제"""
+    from app.services.event_broadcaster import dashboard_state, publish_session_event, session_payload
+    from app.services.rollup_service import RollupService
+
     log = session.get(SessionLog, session_id)
     if not log:
         raise HTTPException(status_code=404, detail="Session not found")
 
+    payload, before = session_payload(log), dashboard_state(log)
     session.delete(log)
+    RollupService(session).on_delete(log)
     session.commit()
+    publish_session_event("deleted", payload, before=before)
     return {"message": "Session deleted"}
 
 
@@ -2,7 +2,7 @@
 
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import sessions, members, exports, dashboard, trainers, lesson_tickets
+from app.api.v1.endpoints import sessions, members, exports, dashboard, trainers, lesson_tickets, reports, history, changes, events, archive, periods, backups, maintenance, centers, attendance
 
 api_router = APIRouter()
 
@@ -24,6 +24,12 @@ api_router.include_router(
     tags=["members"],
 )
 
+api_router.include_router(
+    attendance.router,
+    prefix="/attendance",
+    tags=["attendance"],
+)
+
 api_router.include_router(
     trainers.router,
     tags=["trainers"],
@@ -40,3 +46,57 @@ api_router.include_router(
     prefix="/exports",
     tags=["exports"],
 )
+
+api_router.include_router(
+    reports.router,
+    prefix="/reports",
+    tags=["reports"],
+)
+
+api_router.include_router(
+    history.router,
+    prefix="/history",
+    tags=["history"],
+)
+
+api_router.include_router(
+    changes.router,
+    prefix="/changes",
+    tags=["changes"],
+)
+
+api_router.include_router(
+    events.router,
+    prefix="/events",
+    tags=["events"],
+)
+
+api_router.include_router(
+    archive.router,
+    prefix="/archive",
+    tags=["archive"],
+)
+
+api_router.include_router(
+    periods.router,
+    prefix="/periods",
+    tags=["periods"],
+)
+
+api_router.include_router(
+    backups.router,
+    prefix="/backups",
+    tags=["backups"],
+)
+
+api_router.include_router(
+    maintenance.router,
+    prefix="/maintenance",
+    tags=["maintenance"],
+)
+
+api_router.include_router(
+    centers.router,
+    prefix="/centers",
+    tags=["centers"],
+)
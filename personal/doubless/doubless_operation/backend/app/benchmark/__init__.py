@@ -0,0 +1,5 @@
+"""API 벤치마크 (가상 운영 DB 생성, ASGI 부하 실행, 결과 비교)
+
+app 설정(DATABASE_URL 등)을 읽기 전에 환경변수를 정해야 하므로 scripts/api_benchmark.py에서
+환경을 준비한 뒤 하위 모듈을 직접 임포트한다.
+"""
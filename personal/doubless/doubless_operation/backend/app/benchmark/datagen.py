@@ -0,0 +1,250 @@
+"""벤치마크용 operation.db 생성
+
+회원/수강권은 Broj 대역 서버(app.broj_stub)와 같은 SyntheticCrm 데이터를 동기화한 것처럼 넣고,
+세션은 그 회원들의 수강권으로, 출석은 대역 서버의 출석 기록으로 months개월에 걸쳐 만든다. 시드가 같으면 같은 DB가 나온다.
+
+ORM을 거치면 수십만 행 적재가 오래 걸리므로 테이블에 executemany로 직접 넣는다
+(change_log 행 단위 기록 대신 동기화와 같은 replace 표시만 남김). 월별 집계는 RollupService로 다시 계산한다.
+"""
+
+import random
+import time
+from dataclasses import dataclass, asdict
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import insert
+from sqlmodel import Session
+
+from app.broj_stub.dataset import TRAINERS, SyntheticCrm
+from app.db.models import (
+    AttendanceCache,
+    ChangeLog,
+    ExportLog,
+    LessonTicketCache,
+    LessonTicketHistory,
+    MemberCache,
+    MemberHistory,
+    SessionLog,
+    SessionStatus,
+    Staff,
+    Trainer,
+)
+from app.db.session import get_engine, init_db
+from app.services.crm_mapping import to_attendance_cache, to_lesson_ticket_cache, to_member_cache
+from app.services.history_service import LESSON_TICKET_FIELDS, MEMBER_FIELDS, content_hash
+from app.services.rollup_service import RollupService
+
+BATCH_SIZE = 5000
+
+SESSION_TYPES = ["PT"] * 17 + ["OT"] * 2 + ["기타"]
+SESSION_STATUSES = (
+    [SessionStatus.COMPLETED] * 85 + [SessionStatus.CANCELLED] * 7
+    + [SessionStatus.NO_SHOW] * 5 + [SessionStatus.PAYMENT] * 3
+)
+STAFF_ROLES = ["인포", "인포", "매니저"]
+
+
+@dataclass
+class Scale:
+    """데이터 규모"""
+
+    members: int = 20_000
+    sessions: int = 100_000
+    trainers: int = 12
+    months: int = 24                                # 세션 기간 (오늘 기준 이전 개월 수)
+    seed: int = 42
+
+
+def trainer_names(count: int) -> list[str]:
+    """트레이너 이름 (대역 서버 수강권의 담당 트레이너 먼저)"""
+    names = TRAINERS[:count]
+    names += [f"트레이너{n}" for n in range(len(names) + 1, count + 1)]
+    return names
+
+
+def _insert(conn, model, rows: list[dict]) -> None:
+    for start in range(0, len(rows), BATCH_SIZE):
+        conn.execute(insert(model.__table__), rows[start:start + BATCH_SIZE])
+
+
+def _cache_row(obj, now: datetime) -> dict:
+    row = obj.model_dump(exclude={"id"})
+    row["synced_at"] = now
+    return row
+
+
+def _history_row(obj, fields: list[str], now: datetime) -> dict:
+    row = {field: getattr(obj, field) for field in fields}
+    row.update(content_hash=content_hash(obj, fields), valid_from=now, valid_to=None)
+    return row
+
+
+def generate(scale: Scale, crm: Optional[SyntheticCrm] = None, today: Optional[date] = None, verbose: bool = False) -> dict:
+    """현재 설정(DATABASE_URL)의 DB에 벤치마크 데이터 생성 (빈 DB 기준)"""
+    started = time.perf_counter()
+    today = today or date.today()
+    crm = crm or SyntheticCrm(members=scale.members, seed=scale.seed, today=today)
+    rng = random.Random(scale.seed)
+    now = datetime.now()
+
+    def log(message: str) -> None:
+        if verbose:
+            print(f"  {message} ({time.perf_counter() - started:.1f}초)", flush=True)
+
+    engine = get_engine()
+    init_db(engine)
+
+    trainers = trainer_names(scale.trainers)
+    with engine.begin() as conn:
+        _insert(conn, Trainer, [{"name": name, "phone": None, "status": "ACTIVE", "created_at": now} for name in trainers])
+        _insert(conn, Staff, [
+            {"name": f"직원{n}", "role": rng.choice(STAFF_ROLES), "phone": None, "status": "ACTIVE", "created_at": now}
+            for n in range(1, max(scale.trainers // 3, 1) + 1)
+        ])
+
+        attendance = _attendance(crm, scale, today, now)
+        _insert(conn, AttendanceCache, attendance)
+        log(f"출석 {len(attendance):,}건")
+
+        # 출석 동기화를 마친 것처럼 회원별 마지막 출석 채움
+        last_attendance: dict[int, str] = {}
+        for row in attendance:
+            visited = f"{row['attendance_date']} {row['attendance_time']}"
+            if visited > last_attendance.get(row["jgjm_key"], ""):
+                last_attendance[row["jgjm_key"]] = visited
+
+        members = [to_member_cache(crm.member(i), now) for i in range(crm.member_count)]
+        _insert(conn, MemberCache, [
+            _cache_row(m, now) | {"last_attendance": last_attendance.get(m.jgjm_key)} for m in members
+        ])
+        _insert(conn, MemberHistory, [_history_row(m, MEMBER_FIELDS, now) | {"jgjm_key": m.jgjm_key} for m in members])
+        log(f"회원 {len(members):,}명")
+
+        tickets = [to_lesson_ticket_cache(crm.lesson_ticket(p), now) for p in range(len(crm.lesson_ticket_owners))]
+        _insert(conn, LessonTicketCache, [_cache_row(t, now) for t in tickets])
+        _insert(conn, LessonTicketHistory, [
+            _history_row(t, LESSON_TICKET_FIELDS, now) | {"jglesson_ticket_key": t.jglesson_ticket_key} for t in tickets
+        ])
+        log(f"수강권 {len(tickets):,}건")
+
+        _insert(conn, ChangeLog, [
+            {"table_name": model.__tablename__, "row_id": None, "op": "replace", "changed_at": now}
+            for model in (Trainer, Staff, MemberCache, LessonTicketCache)
+        ])
+
+        sessions = _sessions(scale, tickets, trainers, today, rng, now)
+        _insert(conn, SessionLog, sessions)
+        log(f"세션 {len(sessions):,}건")
+
+        exports = _exports(sessions, today, now)
+        _insert(conn, ExportLog, exports)
+
+    months = sorted({s["session_date"][:7] for s in sessions})
+    with Session(engine) as session:
+        rollups = sum(RollupService(session).rebuild_month(month) for month in months)
+        session.commit()
+    log(f"월별 집계 {len(months)}개월")
+
+    with engine.connect() as conn:
+        conn.exec_driver_sql("ANALYZE")
+
+    return {
+        **asdict(scale),
+        "lesson_tickets": len(tickets),
+        "attendance": len(attendance),
+        "session_months": len(months),
+        "rollups": rollups,
+        "exports": len(exports),
+        "seconds": round(time.perf_counter() - started, 1),
+    }
+
+
+def _attendance(crm: SyntheticCrm, scale: Scale, today: date, now: datetime) -> list[dict]:
+    """대역 서버 출석 기록 (세션과 같은 months개월)"""
+    first_day = (today.replace(day=1) - timedelta(days=31 * (scale.months - 1))).replace(day=1)
+    rows = []
+    for offset in range((today - first_day).days + 1):
+        for record in crm.attendance_day(first_day + timedelta(days=offset)):
+            cache = to_attendance_cache(record, now)
+            if cache is not None:
+                rows.append(_cache_row(cache, now))
+    return rows
+
+
+def _sessions(scale: Scale, tickets: list, trainers: list[str], today: date, rng: random.Random, now: datetime) -> list[dict]:
+    """수강권 회원의 세션 (회원별 날짜순 회차, 지난 달까지는 내보내기 완료)"""
+    first_day = (today.replace(day=1) - timedelta(days=31 * (scale.months - 1))).replace(day=1)
+    span = (today - first_day).days + 1
+    current_month = today.strftime("%Y-%m")
+
+    drafts = []
+    for _ in range(scale.sessions):
+        ticket = rng.choice(tickets) if tickets else None
+        day = first_day + timedelta(days=rng.randrange(span))
+        drafts.append((
+            ticket.jgjm_key if ticket else None,
+            ticket.member_name if ticket else f"회원{rng.randrange(scale.members)}",
+            day.isoformat(),
+            f"{rng.randint(6, 22):02d}:{rng.choice(('00', '30'))}",
+            ticket.total_count if ticket else None,
+        ))
+    drafts.sort(key=lambda d: (d[0] or 0, d[2], d[3]))
+
+    rows = []
+    numbers: dict[Optional[int], int] = {}
+    for member_key, member_name, session_date, session_time, total in drafts:
+        session_type = rng.choice(SESSION_TYPES)
+        status = rng.choice(SESSION_STATUSES)
+        session_no = session_total = None
+        if session_type == "PT" and total and status != SessionStatus.PAYMENT:
+            session_no = numbers.get(member_key, 0) % total + 1
+            numbers[member_key] = session_no
+            session_total = total
+        month = session_date[:7]
+        exported = month < current_month
+        rows.append({
+            "session_date": session_date,
+            "session_time": session_time,
+            "trainer_name": rng.choice(trainers),
+            "member_name": member_name,
+            "member_key": member_key,
+            "session_type": session_type,
+            "session_status": status.name,
+            "session_index": f"{session_no}/{session_total}" if session_no else None,
+            "session_no": session_no,
+            "session_total": session_total,
+            "is_event": rng.random() < 0.05,
+            "registration_type": rng.choice(("new", "renewal")) if session_no == 1 else None,
+            "note": None,
+            "created_at": now,
+            "updated_at": None,
+            "exported": exported,
+            "export_id": f"exp-{month.replace('-', '')}28-210000" if exported else None,
+        })
+    rows.sort(key=lambda r: (r["session_date"], r["session_time"]))
+    return rows
+
+
+def _exports(sessions: list[dict], today: date, now: datetime) -> list[dict]:
+    """지난 달까지 월별 내보내기 이력 (파일은 만들지 않음)"""
+    counts: dict[str, int] = {}
+    for s in sessions:
+        if s["export_id"]:
+            counts[s["export_id"]] = counts.get(s["export_id"], 0) + 1
+    rows = []
+    for export_id, count in sorted(counts.items()):
+        month = f"{export_id[4:8]}-{export_id[8:10]}"
+        rows.append({
+            "export_id": export_id,
+            "export_date": f"{month}-28",
+            "start_date": f"{month}-01",
+            "end_date": f"{month}-31",
+            "session_count": count,
+            "file_path": "",
+            "file_size_bytes": 0,
+            "status": "completed",
+            "error_message": None,
+            "created_at": now,
+        })
+    return rows
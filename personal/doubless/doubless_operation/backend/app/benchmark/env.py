@@ -0,0 +1,33 @@
+"""벤치마크/프로파일링 실행 환경
+
+앱 설정은 처음 읽을 때 캐시되므로 app.core.config를 임포트하기 전에 임시 DB, 데이터 디렉토리,
+Broj 대역 서버 주소를 환경변수로 지정한다. (이 모듈은 앱 모듈을 임포트하지 않는다)
+"""
+
+import os
+import socket
+from pathlib import Path
+
+JGROUP_KEY = "533109104"
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def prepare_environment(work_dir: Path, crm_port: int) -> None:
+    """앱 설정을 읽기 전에 임시 DB/데이터 디렉토리와 대역 서버 주소 지정"""
+    os.environ.update({
+        "DATABASE_URL": f"sqlite:///{work_dir / 'operation.db'}",
+        "DATA_DIR_PATH": str(work_dir),
+        "DOUBLESS_DB_PATH": str(work_dir / "doubless.db"),
+        "BROJ_URL": f"http://127.0.0.1:{crm_port}",
+        "BROJ_ID": "benchmark",
+        "BROJ_PWD": "benchmark",
+        "BROJ_JGROUP_KEY": JGROUP_KEY,
+        "CENTERS": "[]",
+        "BACKUP_INTERVAL_HOURS": "0",
+        "MAINTENANCE_INTERVAL_SECONDS": "0",
+    })
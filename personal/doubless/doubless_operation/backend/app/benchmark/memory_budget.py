@@ -0,0 +1,133 @@
+"""동기화/내보내기/임포트 메모리 예산
+
+회원 동기화, 수강권 동기화, 세션 JSON 내보내기, 업무일지 엑셀 임포트를 현재 센터 규모(CURRENT)의
+factor배 가상 데이터로 한 번씩 실행하고, tracemalloc 최대와 RSS 증가가 MEMORY_BUDGETS를 넘는지 본다.
+대상마다 새 프로세스에서 실행해야 RSS가 섞이지 않는다 (scripts/memory_benchmark.py).
+"""
+
+import asyncio
+import importlib.util
+from dataclasses import dataclass, replace
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Optional
+
+from app.benchmark.datagen import Scale
+from app.profile.memory import MB
+from app.profile.targets import Target, TargetContext
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[3] / "scripts"
+
+# 현재 센터 규모: 회원 1,042명 (Broj 동기화 기록), 월 세션 약 2,500건
+# 기준일을 고정해 지난달(2026-03) 한 달치를 내보내기/임포트하므로 시드가 같으면 결과가 같다
+CURRENT = Scale(members=1_050, sessions=2_600, trainers=12, months=2)
+BENCH_TODAY = date(2026, 4, 1)
+DEFAULT_FACTOR = 10
+
+
+@dataclass
+class MemoryBudget:
+    """대상별 예산 (MB)"""
+
+    peak_mb: float                                  # tracemalloc 최대 (Python 할당)
+    rss_mb: float                                   # 시작 대비 최대 RSS 증가
+
+
+# 10배 규모 측정값(Linux, Python 3.11)에 약 30% 여유를 둔 값, 넘으면 회귀
+# import_worklog는 pandas가 있는 환경에서 측정해 다시 맞출 것 (지금은 어림값)
+MEMORY_BUDGETS: dict[str, MemoryBudget] = {
+    "sync_members": MemoryBudget(peak_mb=80, rss_mb=105),           # 측정 61MB / +79MB
+    "sync_lesson_tickets": MemoryBudget(peak_mb=110, rss_mb=135),   # 측정 86MB / +103MB
+    "export_sessions": MemoryBudget(peak_mb=180, rss_mb=195),       # 측정 139MB / +150MB (commit 단계 최대)
+    "import_worklog": MemoryBudget(peak_mb=200, rss_mb=300),
+}
+
+
+def scaled(factor: float, seed: int = 42) -> Scale:
+    """CURRENT의 factor배 규모"""
+    return replace(
+        CURRENT,
+        members=int(CURRENT.members * factor),
+        sessions=int(CURRENT.sessions * factor),
+        seed=seed,
+    )
+
+
+def _prev_month(today: date) -> tuple[str, str]:
+    last = today.replace(day=1) - timedelta(days=1)
+    return last.replace(day=1).isoformat(), last.isoformat()
+
+
+def _sync_members(ctx: TargetContext) -> Callable[[], str]:
+    from app.db.session import get_session_context
+    from app.services.member_sync_service import MemberSyncService
+
+    def run() -> str:
+        with get_session_context() as session:
+            result = asyncio.run(MemberSyncService(session).sync(mode="full"))
+            return f"회원 {result['count']:,}명"
+    return run
+
+
+def _sync_lesson_tickets(ctx: TargetContext) -> Callable[[], str]:
+    from app.api.v1.endpoints.lesson_tickets import sync_lesson_tickets
+    from app.db.session import get_session_context
+
+    def run() -> str:
+        with get_session_context() as session:
+            result = asyncio.run(sync_lesson_tickets(session=session))
+            return f"수강권 {result['count']:,}건"
+    return run
+
+
+def _export_sessions(ctx: TargetContext) -> Callable[[], str]:
+    from app.db.session import get_session_context
+    from app.services.export_service import ExportService
+
+    start, end = _prev_month(ctx.today)
+
+    def run() -> str:
+        with get_session_context() as session:
+            log = ExportService(session).export_sessions(start, end)
+            return f"세션 {log.session_count:,}건, {log.file_size_bytes:,} bytes"
+    return run
+
+
+def _import_worklog(ctx: TargetContext) -> Callable[[], str]:
+    from app.db.session import get_session_context
+    from app.services.excel_export_service import ExcelExportService
+
+    # 지난달 업무일지 엑셀(일자별 시트)을 만들어 다시 임포트
+    start, end = _prev_month(ctx.today)
+    with get_session_context() as session:
+        log = ExcelExportService(session, workers=1).export_worklog(start, end)
+
+    spec = importlib.util.spec_from_file_location("import_worklog", SCRIPTS_DIR / "import_worklog.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    year, month = int(start[:4]), int(start[5:7])
+
+    def run() -> str:
+        return f"세션 {module.import_worklog(log.file_path, year, month):,}건"
+    return run
+
+
+TARGETS: dict[str, Target] = {t.name: t for t in [
+    Target("sync_members", "회원 전체 동기화 (Broj 대역 서버)", _sync_members, crm=True),
+    Target("sync_lesson_tickets", "수강권 동기화 (Broj 대역 서버)", _sync_lesson_tickets, crm=True),
+    Target("export_sessions", "지난달 세션 JSON 내보내기", _export_sessions),
+    Target("import_worklog", "지난달 업무일지 엑셀 임포트 (pandas 필요)", _import_worklog),
+]}
+
+
+def check(name: str, result: dict, budget: Optional[MemoryBudget] = None) -> list[str]:
+    """예산 위반 설명 목록"""
+    budget = budget or MEMORY_BUDGETS[name]
+    violations = []
+    peak_mb = result["peak_bytes"] / MB
+    rss_mb = result["rss_growth_bytes"] / MB
+    if peak_mb > budget.peak_mb:
+        violations.append(f"tracemalloc 최대 {peak_mb:.1f}MB > {budget.peak_mb:.0f}MB")
+    if rss_mb > budget.rss_mb:
+        violations.append(f"RSS 증가 {rss_mb:.1f}MB > {budget.rss_mb:.0f}MB")
+    return violations
@@ -0,0 +1,155 @@
+"""엔드포인트별 쿼리 계획/쿼리 수 점검
+
+벤치마크 경로(ROUTES)를 한 번씩 호출하면서 요청마다 실행된 SQL을 모아
+- 요청당 SQL 문 수가 예산(Budget.max_statements)을 넘는지 (N+1 방지)
+- 자주 쓰는 테이블(HOT_TABLES)을 인덱스 없이 전체 스캔(SCAN)하는지
+를 EXPLAIN QUERY PLAN으로 확인한다. 전체 조회가 의도된 엔드포인트는 allow_scan에 테이블을 적는다.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Optional
+
+import httpx
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.benchmark.routes import API_PREFIX, ROUTES, Context, Route
+
+HOT_TABLES = ("session_logs", "member_cache", "lesson_ticket_cache", "attendance_cache")
+DEFAULT_MAX_STATEMENTS = 10
+
+# 계획을 볼 필요가 없는 문장
+_SKIP = re.compile(r"^\s*(PRAGMA|ANALYZE|BEGIN|COMMIT|ROLLBACK|SAVEPOINT|RELEASE|INSERT)\b", re.IGNORECASE)
+_SCAN = re.compile(r"^SCAN (\w+)")
+
+
+@dataclass
+class Budget:
+    """엔드포인트 예산"""
+
+    max_statements: int = DEFAULT_MAX_STATEMENTS
+    allow_scan: tuple[str, ...] = ()                # 전체 스캔이 의도된 테이블
+
+
+# 기본값(SQL 10문, 스캔 불가)과 다른 엔드포인트만
+BUDGETS: dict[str, Budget] = {
+    # 전체 목록/통계
+    "GET /members/stats": Budget(allow_scan=("member_cache",)),
+    "GET /lesson-tickets/stats": Budget(allow_scan=("lesson_ticket_cache",)),
+    "GET /sessions/trainers": Budget(allow_scan=("session_logs",)),
+    "GET /members": Budget(allow_scan=("member_cache",)),
+    "GET /changes": Budget(allow_scan=("member_cache", "lesson_ticket_cache")),
+
+    # 대시보드의 캐시 건수/최근 동기화 시각은 테이블 전체 집계
+    "GET /dashboard/today": Budget(allow_scan=("member_cache",)),
+    "GET /dashboard/bootstrap": Budget(allow_scan=("member_cache", "lesson_ticket_cache")),
+
+    # 이름/전화번호 부분 일치(LIKE '%q%')는 인덱스를 쓸 수 없음
+    "GET /members/search": Budget(allow_scan=("member_cache",)),
+
+    # 수강권 인덱스(ticket_index)가 비어 있을 때 한 번 전체 로드
+    "POST /sessions": Budget(allow_scan=("lesson_ticket_cache",)),
+
+    # 급여 시트는 트레이너마다 세션/수강권/회원 조회 (가상 데이터 트레이너 12명 기준)
+    "POST /exports/excel": Budget(60),
+
+    # 보관 대상 월 판단은 전체 세션의 월별 집계
+    "GET /archive": Budget(allow_scan=("session_logs",)),
+    "POST /archive/run": Budget(30, allow_scan=("session_logs",)),
+}
+
+
+@dataclass
+class Violation:
+    route: str
+    kind: str                                       # statements, scan
+    detail: str
+    sql: Optional[str] = None
+
+
+@dataclass
+class RouteQueries:
+    """경로 하나의 요청별 SQL"""
+
+    route: str
+    statements: list[int] = field(default_factory=list)        # 요청별 SQL 문 수
+    plans: dict[str, list[str]] = field(default_factory=dict)  # SQL -> EXPLAIN QUERY PLAN detail
+    statuses: dict[str, int] = field(default_factory=dict)
+
+
+class StatementRecorder:
+    """with 블록 동안 실행된 (SQL, 파라미터) 기록"""
+
+    def __init__(self):
+        self.statements: list[tuple[str, object]] = []
+
+    def __enter__(self) -> "StatementRecorder":
+        event.listen(Engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        event.remove(Engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if executemany and parameters:
+            parameters = parameters[0]
+        self.statements.append((statement, parameters))
+
+
+def explain(engine: Engine, statement: str, parameters) -> list[str]:
+    """EXPLAIN QUERY PLAN detail 목록 (실행하지 않음)"""
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters or ())
+        return [row[3] for row in cursor.fetchall()]
+    finally:
+        raw.close()
+
+
+def scanned_tables(plan: list[str]) -> set[str]:
+    """계획에서 전체 스캔하는 테이블 (커버링 인덱스 전체 스캔 포함)"""
+    return {m.group(1) for detail in plan if (m := _SCAN.match(detail))}
+
+
+async def record_route(client: httpx.AsyncClient, engine: Engine, route: Route, ctx: Context, requests: int) -> RouteQueries:
+    """경로를 requests번 호출하며 SQL과 계획 수집"""
+    result = RouteQueries(route=route.name)
+    for i in range(requests):
+        req = route.build(ctx, i)
+        with StatementRecorder() as recorder:
+            response = await client.request(route.method, API_PREFIX + req.path, params=req.params, json=req.json)
+        status = str(response.status_code)
+        result.statuses[status] = result.statuses.get(status, 0) + 1
+        if route.collect and response.status_code < 300:
+            route.collect(ctx, response.json())
+
+        result.statements.append(len(recorder.statements))
+        for statement, parameters in recorder.statements:
+            if statement in result.plans or _SKIP.match(statement):
+                continue
+            try:
+                result.plans[statement] = explain(engine, statement, parameters)
+            except Exception as e:                  # 임시 테이블 등 요청 밖에서 볼 수 없는 문장
+                result.plans[statement] = [f"(explain failed: {e})"]
+    return result
+
+
+def check(result: RouteQueries, budget: Optional[Budget] = None) -> list[Violation]:
+    """예산 위반 목록"""
+    budget = budget or BUDGETS.get(result.route, Budget())
+    violations = []
+    worst = max(result.statements, default=0)
+    if worst > budget.max_statements:
+        violations.append(Violation(result.route, "statements", f"{worst} > {budget.max_statements}"))
+    for statement, plan in result.plans.items():
+        for table in sorted(scanned_tables(plan) & set(HOT_TABLES)):
+            if table not in budget.allow_scan:
+                violations.append(Violation(result.route, "scan", f"SCAN {table}", statement))
+    return violations
+
+
+def routes_to_check(include_heavy: bool = True) -> list[Route]:
+    """점검 대상 경로 (CRM 동기화와 스트림 제외)"""
+    return [r for r in ROUTES if not r.crm and not r.stream and (include_heavy or not r.heavy)]
@@ -0,0 +1,254 @@
+"""벤치마크 대상 API 목록
+
+api/v1/endpoints의 모든 엔드포인트를 실행 순서대로 나열한다. 요청마다 build(ctx, i)로
+경로/쿼리/본문을 만들고, 생성 요청의 응답은 ctx에 모아 뒤 요청(수정/삭제/다운로드)이 쓴다.
+
+- heavy: 엑셀/동기화/백업처럼 한 번이 오래 걸리는 요청 (requests 대신 heavy_requests번, 동시 1)
+- count: 요청 수가 데이터에 묶인 경우 (마감할 수 있는 월 수 등)
+- stream: SSE처럼 끝나지 않는 응답 (첫 바이트까지 시간 측정)
+"""
+
+import random
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any, Callable, Optional
+
+from sqlalchemy import func
+from sqlmodel import Session, select
+
+from app.db.models import LessonTicketCache, MemberCache, SessionLog
+
+API_PREFIX = "/api/v1"
+
+
+@dataclass
+class Request:
+    path: str
+    params: Optional[dict] = None
+    json: Any = None
+
+
+@dataclass
+class Context:
+    """요청 생성에 쓰는 데이터 (DB에서 뽑은 표본 + 앞 요청 결과)"""
+
+    today: date
+    rng: random.Random
+    member_keys: list[int]
+    member_names: list[str]
+    ticket_members: list[tuple[int, str]]
+    trainers: list[str]
+    months: list[str]
+    session_ids: list[int]
+    created: dict[str, list] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, session: Session, today: date, seed: int, sample: int = 2000) -> "Context":
+        rng = random.Random(seed)
+        members = session.exec(select(MemberCache.jgjm_key, MemberCache.name).order_by(func.random()).limit(sample)).all()
+        tickets = session.exec(
+            select(LessonTicketCache.jgjm_key, LessonTicketCache.member_name)
+            .where(LessonTicketCache.remaining_count > 0)
+            .order_by(func.random())
+            .limit(sample)
+        ).all()
+        months = session.exec(select(func.substr(SessionLog.session_date, 1, 7)).distinct()).all()
+        # 마감되지 않을 이번 달 세션 (수정 요청 대상)
+        session_ids = session.exec(
+            select(SessionLog.id).where(SessionLog.session_date >= today.strftime("%Y-%m-01")).limit(sample)
+        ).all()
+        trainers = session.exec(select(SessionLog.trainer_name).distinct()).all()
+        return cls(
+            today=today,
+            rng=rng,
+            member_keys=[m[0] for m in members],
+            member_names=[m[1] for m in members],
+            ticket_members=[tuple(t) for t in tickets],
+            trainers=sorted(trainers),
+            months=sorted(months),
+            session_ids=list(session_ids),
+        )
+
+    def pick(self, items: list):
+        return self.rng.choice(items) if items else None
+
+    def day(self, within_days: int = 365) -> str:
+        return (self.today - timedelta(days=self.rng.randrange(within_days))).isoformat()
+
+    def past_months(self) -> list[str]:
+        """마감 가능한 월 (이번 달 제외)"""
+        current = self.today.strftime("%Y-%m")
+        return [m for m in self.months if m < current]
+
+    def take(self, key: str, i: int):
+        """앞 요청이 만든 항목 i번째"""
+        items = self.created.get(key) or []
+        return items[i % len(items)] if items else None
+
+
+@dataclass
+class Route:
+    method: str
+    path: str                                       # 결과 표시용 템플릿
+    build: Callable[[Context, int], Request]
+    heavy: bool = False
+    stream: bool = False
+    count: Optional[Callable[[Context], int]] = None
+    collect: Optional[Callable[[Context, Any], None]] = None   # 응답 JSON 보관
+    crm: bool = False                               # Broj 대역 서버 필요
+
+    @property
+    def name(self) -> str:
+        return f"{self.method} {self.path}"
+
+
+def _keep(key: str, field_name: Optional[str] = None):
+    def collect(ctx: Context, body) -> None:
+        value = body.get(field_name) if field_name else body
+        if value is not None:
+            ctx.created.setdefault(key, []).append(value)
+    return collect
+
+
+def _session_body(ctx: Context, i: int) -> dict:
+    member_key, member_name = ctx.pick(ctx.ticket_members) or (None, f"벤치회원{i}")
+    return {
+        "session_date": ctx.today.isoformat(),
+        "session_time": f"{6 + i % 17:02d}:{'30' if i % 2 else '00'}",
+        "trainer_name": ctx.pick(ctx.trainers) or "김코치",
+        "member_name": member_name,
+        "member_key": member_key,
+        "session_type": "PT",
+    }
+
+
+def _month_count(ctx: Context) -> int:
+    return len(ctx.past_months())
+
+
+def _week(ctx: Context, i: int) -> dict:
+    start = date.fromisoformat(ctx.day())
+    return {"start": start.isoformat(), "end": (start + timedelta(days=6)).isoformat()}
+
+
+def _prev_month_range(ctx: Context) -> dict:
+    last = ctx.today.replace(day=1) - timedelta(days=1)
+    return {"start_date": last.replace(day=1).isoformat(), "end_date": last.isoformat()}
+
+
+def _q(name: Optional[str]) -> str:
+    return (name or "김")[:2]
+
+
+ROUTES: list[Route] = [
+    Route("GET", "/centers", lambda ctx, i: Request("/centers")),
+
+    # 대시보드
+    Route("GET", "/dashboard/today", lambda ctx, i: Request("/dashboard/today")),
+    Route("GET", "/dashboard/bootstrap", lambda ctx, i: Request("/dashboard/bootstrap")),
+
+    # 세션 조회
+    Route("GET", "/sessions", lambda ctx, i: Request("/sessions", {"date": ctx.day()})),
+    Route("GET", "/sessions/daily/{date}", lambda ctx, i: Request(f"/sessions/daily/{ctx.day()}")),
+    Route("GET", "/sessions/trainers", lambda ctx, i: Request("/sessions/trainers")),
+    Route("GET", "/sessions/grid", lambda ctx, i: Request("/sessions/grid", _week(ctx, i))),
+    Route("GET", "/sessions/next-number", lambda ctx, i: Request("/sessions/next-number", {
+        "member_name": (m := ctx.pick(ctx.ticket_members) or (None, "회원"))[1],
+        "member_key": m[0],
+        "session_date": ctx.today.isoformat(),
+    })),
+    Route("GET", "/sessions/{session_id}", lambda ctx, i: Request(f"/sessions/{ctx.pick(ctx.session_ids) or 1}")),
+    Route("GET", "/sessions/stats/today", lambda ctx, i: Request("/sessions/stats/today")),
+
+    # 세션 생성/수정/삭제
+    Route("POST", "/sessions", lambda ctx, i: Request("/sessions", json=_session_body(ctx, i)),
+          collect=_keep("sessions", "id")),
+    Route("PUT", "/sessions/{session_id}", lambda ctx, i: Request(
+        f"/sessions/{ctx.take('sessions', i)}", json={"note": f"benchmark {i}"})),
+    Route("DELETE", "/sessions/{session_id}", lambda ctx, i: Request(f"/sessions/{ctx.take('sessions', i)}"),
+          count=lambda ctx: len(ctx.created.get("sessions", []))),
+
+    # 회원
+    Route("GET", "/members", lambda ctx, i: Request("/members", {"limit": 100, "offset": ctx.rng.randrange(0, 10000, 100)})),
+    Route("GET", "/members/search", lambda ctx, i: Request("/members/search", {"q": _q(ctx.pick(ctx.member_names))})),
+    Route("GET", "/members/stats", lambda ctx, i: Request("/members/stats")),
+    Route("GET", "/members/{jgjm_key}/detail", lambda ctx, i: Request(f"/members/{ctx.pick(ctx.member_keys)}/detail")),
+    Route("GET", "/members/{jgjm_key}/last-visit", lambda ctx, i: Request(f"/members/{ctx.pick(ctx.member_keys)}/last-visit")),
+    Route("GET", "/members/inactive", lambda ctx, i: Request("/members/inactive", {"days": ctx.rng.choice((14, 30, 60))})),
+
+    # 출석
+    Route("GET", "/attendance", lambda ctx, i: Request("/attendance", {
+        "date": (ctx.today - timedelta(days=ctx.rng.randrange(28))).isoformat()})),
+
+    # 수강권
+    Route("GET", "/lesson-tickets", lambda ctx, i: Request("/lesson-tickets", {"trainer": ctx.pick(ctx.trainers), "limit": 100})),
+    Route("GET", "/lesson-tickets/search", lambda ctx, i: Request("/lesson-tickets/search", {"q": _q(ctx.pick(ctx.member_names))})),
+    Route("GET", "/lesson-tickets/by-member/{jgjm_key}", lambda ctx, i: Request(
+        f"/lesson-tickets/by-member/{(ctx.pick(ctx.ticket_members) or (0,))[0]}")),
+    Route("GET", "/lesson-tickets/stats", lambda ctx, i: Request("/lesson-tickets/stats")),
+
+    # 트레이너/직원
+    Route("GET", "/trainers", lambda ctx, i: Request("/trainers")),
+    Route("POST", "/trainers", lambda ctx, i: Request("/trainers", json={"name": f"벤치트레이너{i}"}),
+          collect=_keep("trainers", "id")),
+    Route("PUT", "/trainers/{trainer_id}", lambda ctx, i: Request(
+        f"/trainers/{ctx.take('trainers', i)}", json={"phone": f"010-0000-{i:04d}"})),
+    Route("DELETE", "/trainers/{trainer_id}", lambda ctx, i: Request(f"/trainers/{ctx.take('trainers', i)}"),
+          count=lambda ctx: len(ctx.created.get("trainers", []))),
+    Route("GET", "/staff", lambda ctx, i: Request("/staff")),
+    Route("POST", "/staff", lambda ctx, i: Request("/staff", json={"name": f"벤치직원{i}"}),
+          collect=_keep("staff", "id")),
+    Route("PUT", "/staff/{staff_id}", lambda ctx, i: Request(
+        f"/staff/{ctx.take('staff', i)}", json={"role": "매니저"})),
+    Route("DELETE", "/staff/{staff_id}", lambda ctx, i: Request(f"/staff/{ctx.take('staff', i)}"),
+          count=lambda ctx: len(ctx.created.get("staff", []))),
+
+    # 리포트, 이력, 변경 피드
+    Route("GET", "/reports/monthly", lambda ctx, i: Request("/reports/monthly", {"year_month": ctx.pick(ctx.months)})),
+    Route("POST", "/reports/monthly/{year_month}/rebuild", lambda ctx, i: Request(
+        f"/reports/monthly/{ctx.pick(ctx.months)}/rebuild")),
+    Route("GET", "/history/members/{jgjm_key}", lambda ctx, i: Request(
+        f"/history/members/{ctx.pick(ctx.member_keys)}", {"as_of": ctx.today.isoformat()})),
+    Route("GET", "/history/members/{jgjm_key}/versions", lambda ctx, i: Request(
+        f"/history/members/{ctx.pick(ctx.member_keys)}/versions")),
+    Route("GET", "/changes", lambda ctx, i: Request("/changes", {"since": 0})),
+
+    # 내보내기
+    Route("GET", "/exports", lambda ctx, i: Request("/exports")),
+    Route("GET", "/exports/pending", lambda ctx, i: Request("/exports/pending")),
+    # export_id가 초 단위라 같은 초에 다시 내보내면 충돌하므로 한 번만
+    Route("POST", "/exports", lambda ctx, i: Request("/exports", json={
+        "start_date": ctx.today.strftime("%Y-%m-01"), "end_date": ctx.today.isoformat()}),
+        heavy=True, count=lambda ctx: 1, collect=_keep("exports", "export_id")),
+    Route("POST", "/exports/excel", lambda ctx, i: Request("/exports/excel", json={
+        "kind": ("worklog", "payroll")[i % 2], **_prev_month_range(ctx)}), heavy=True),
+    Route("GET", "/exports/{export_id}/download", lambda ctx, i: Request(f"/exports/{ctx.take('exports', i)}/download"),
+          count=lambda ctx: len(ctx.created.get("exports", []))),
+
+    # 월 마감, 보관
+    Route("GET", "/periods", lambda ctx, i: Request("/periods")),
+    Route("POST", "/periods/{year_month}/close", lambda ctx, i: Request(
+        f"/periods/{ctx.past_months()[i]}/close", json={"closed_by": "benchmark"}),
+        count=_month_count, collect=_keep("closed", "year_month")),
+    Route("GET", "/periods/{year_month}/verify", lambda ctx, i: Request(f"/periods/{ctx.take('closed', i)}/verify")),
+    Route("GET", "/archive", lambda ctx, i: Request("/archive")),
+    Route("POST", "/archive/run", lambda ctx, i: Request("/archive/run", {"dry_run": "true"})),
+    Route("POST", "/periods/{year_month}/reopen", lambda ctx, i: Request(
+        f"/periods/{ctx.take('closed', i)}/reopen", json={"reason": "benchmark"}),
+        count=lambda ctx: len(ctx.created.get("closed", []))),
+
+    # 실시간 이벤트
+    Route("GET", "/events", lambda ctx, i: Request("/events"), stream=True),
+    Route("GET", "/events/stats", lambda ctx, i: Request("/events/stats")),
+
+    # 백업, 유지보수
+    Route("GET", "/backups", lambda ctx, i: Request("/backups")),
+    Route("POST", "/backups/run", lambda ctx, i: Request("/backups/run"), heavy=True),
+    Route("GET", "/maintenance/metrics", lambda ctx, i: Request("/maintenance/metrics")),
+    Route("POST", "/maintenance/run", lambda ctx, i: Request("/maintenance/run", {"full": "true"}), heavy=True),
+
+    # CRM 동기화 (Broj 대역 서버)
+    Route("POST", "/members/sync", lambda ctx, i: Request("/members/sync", {"mode": "full"}), heavy=True, crm=True),
+    Route("POST", "/lesson-tickets/sync", lambda ctx, i: Request("/lesson-tickets/sync"), heavy=True, crm=True),
+    Route("POST", "/attendance/sync", lambda ctx, i: Request("/attendance/sync"), heavy=True, crm=True),
+]
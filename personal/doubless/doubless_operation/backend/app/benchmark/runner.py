@@ -0,0 +1,244 @@
+"""API 부하 실행과 결과 저장
+
+서버를 띄우지 않고 httpx.ASGITransport로 앱을 직접 호출한다. 경로마다 requests건을
+concurrency개 작업이 나눠 보내고, 요청별 지연으로 p50/p95/p99와 처리량을 계산한다.
+결과는 커밋 해시를 붙인 JSON으로 저장해 커밋 사이에 비교한다.
+"""
+
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+import httpx
+import uvicorn
+
+from app.benchmark.routes import API_PREFIX, ROUTES, Context, Route
+from app.broj_stub import SyntheticCrm, create_app
+
+RESULT_VERSION = 1
+STUB_THREAD = "broj-stub"
+
+
+def percentile(values: list[float], p: float) -> float:
+    """정렬된 값의 p 백분위수 (nearest-rank)"""
+    if not values:
+        return 0.0
+    rank = max(int(round(p / 100 * len(values) + 0.5)) - 1, 0)
+    return values[min(rank, len(values) - 1)]
+
+
+def uncovered_routes(app) -> list[str]:
+    """ROUTES에 없는 /api/v1 엔드포인트 (엔드포인트 추가 시 목록 갱신 확인용)"""
+    covered = {(r.method, API_PREFIX + r.path) for r in ROUTES}
+    missing = []
+    for route in app.routes:
+        path = getattr(route, "path", "")
+        if not path.startswith(API_PREFIX):
+            continue
+        for method in getattr(route, "methods", ()) or ():
+            if method != "HEAD" and (method, path) not in covered:
+                missing.append(f"{method} {path}")
+    return sorted(missing)
+
+
+async def _first_byte(app, path: str, timeout: float = 10) -> tuple[int, float]:
+    """끝나지 않는 응답(SSE)의 첫 본문까지 시간 (받으면 연결 종료)"""
+    started = time.perf_counter()
+    status = 0
+    requested = False
+    got_body = asyncio.Event()
+
+    async def receive():
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await got_body.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body" and message.get("body"):
+            got_body.set()
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": API_PREFIX + path, "raw_path": (API_PREFIX + path).encode(),
+        "query_string": b"", "headers": [(b"host", b"bench")], "client": ("127.0.0.1", 0),
+        "server": ("bench", 80), "root_path": "",
+    }
+    task = asyncio.create_task(app(scope, receive, send))
+    try:
+        await asyncio.wait_for(got_body.wait(), timeout)
+        elapsed = time.perf_counter() - started
+        await asyncio.wait_for(task, timeout)
+    except asyncio.TimeoutError:
+        task.cancel()
+        return 0, time.perf_counter() - started
+    return status, elapsed
+
+
+async def run_route(client: httpx.AsyncClient, app, route: Route, ctx: Context, requests: int, concurrency: int) -> dict:
+    """경로 하나에 requests건 요청"""
+    latencies: list[float] = []
+    statuses: dict[str, int] = {}
+    next_index = 0
+
+    async def worker() -> None:
+        nonlocal next_index
+        while next_index < requests:
+            i = next_index
+            next_index += 1
+            req = route.build(ctx, i)
+            started = time.perf_counter()
+            if route.stream:
+                status, elapsed = await _first_byte(app, req.path)
+            else:
+                response = await client.request(route.method, API_PREFIX + req.path, params=req.params, json=req.json)
+                elapsed = time.perf_counter() - started
+                status = response.status_code
+                if route.collect and status < 300:
+                    route.collect(ctx, response.json())
+            latencies.append(elapsed)
+            statuses[str(status)] = statuses.get(str(status), 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(max(min(concurrency, requests), 1))))
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+    errors = sum(n for status, n in statuses.items() if not status.startswith(("2", "3")))
+    return {
+        "method": route.method,
+        "path": route.path,
+        "requests": len(latencies),
+        "errors": errors,
+        "statuses": statuses,
+        "concurrency": concurrency,
+        "seconds": round(wall, 4),
+        "throughput_rps": round(len(latencies) / wall, 2) if wall else 0.0,
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 3) if latencies else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "max_ms": round(latencies[-1] * 1000, 3) if latencies else 0.0,
+    }
+
+
+async def run_benchmark(
+    app,
+    ctx: Context,
+    requests: int = 200,
+    concurrency: int = 8,
+    heavy_requests: int = 2,
+    crm: bool = True,
+    only: Optional[list[str]] = None,
+    verbose: bool = True,
+) -> dict[str, dict]:
+    """ROUTES 순서대로 실행 (경로 이름 -> 결과)"""
+    results: dict[str, dict] = {}
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=600) as client:
+        for route in ROUTES:
+            if route.crm and not crm:
+                continue
+            if only and not any(pattern in route.name for pattern in only):
+                continue
+            if route.count:
+                n = min(route.count(ctx), requests)
+            else:
+                n = heavy_requests if route.heavy else requests
+            if n <= 0:
+                continue
+            result = await run_route(client, app, route, ctx, n, 1 if route.heavy else concurrency)
+            results[route.name] = result
+            if verbose:
+                print(
+                    f"  {route.name:<45} {result['requests']:>5}건 {result['throughput_rps']:>9.1f}/s "
+                    f"p50 {result['p50_ms']:>8.1f} p95 {result['p95_ms']:>8.1f} p99 {result['p99_ms']:>8.1f}ms"
+                    + (f"  오류 {result['errors']} {result['statuses']}" if result["errors"] else ""),
+                    flush=True,
+                )
+    return results
+
+
+class CrmStubServer:
+    """Broj 대역 서버를 스레드에서 실행 (루프백 주소, 오프라인)"""
+
+    def __init__(self, crm: SyntheticCrm, port: int):
+        config = uvicorn.Config(create_app(crm), host="127.0.0.1", port=port, log_level="warning", lifespan="off")
+        self.server = uvicorn.Server(config)
+        self.thread = threading.Thread(target=self.server.run, name=STUB_THREAD, daemon=True)
+
+    def __enter__(self) -> "CrmStubServer":
+        self.thread.start()
+        while not self.server.started:
+            if not self.thread.is_alive():
+                raise RuntimeError("Broj stub server failed to start")
+            time.sleep(0.05)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.server.should_exit = True
+        self.thread.join(timeout=10)
+
+
+def git_revision(cwd: Path) -> dict:
+    """현재 커밋 (git이 없으면 빈 값)"""
+    def git(*args: str) -> str:
+        try:
+            return subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True, timeout=10).stdout.strip()
+        except (OSError, subprocess.SubprocessError):
+            return ""
+
+    return {"commit": git("rev-parse", "--short", "HEAD"), "dirty": bool(git("status", "--porcelain", "--untracked-files=no", "--", "."))}
+
+
+def environment() -> dict:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def save_results(path: Path, meta: dict, results: dict[str, dict]) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {"version": RESULT_VERSION, "meta": meta, "routes": results}
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    return path
+
+
+def result_file_name(meta: dict) -> str:
+    stamp = datetime.fromisoformat(meta["started_at"]).strftime("%Y%m%d_%H%M%S")
+    commit = meta.get("git", {}).get("commit") or "nogit"
+    return f"api_{stamp}_{commit}.json"
+
+
+def compare(current: dict[str, dict], baseline: dict[str, dict]) -> list[dict]:
+    """경로별 p50/p95/처리량 변화율 (%)"""
+    def change(new: float, old: float) -> Optional[float]:
+        return round((new - old) / old * 100, 1) if old else None
+
+    rows = []
+    for name, result in current.items():
+        old = baseline.get(name)
+        if not old:
+            continue
+        rows.append({
+            "route": name,
+            "p50_ms": (old["p50_ms"], result["p50_ms"], change(result["p50_ms"], old["p50_ms"])),
+            "p95_ms": (old["p95_ms"], result["p95_ms"], change(result["p95_ms"], old["p95_ms"])),
+            "throughput_rps": (old["throughput_rps"], result["throughput_rps"],
+                               change(result["throughput_rps"], old["throughput_rps"])),
+        })
+    return rows
@@ -0,0 +1,6 @@
+"""Broj CRM 로컬 대역 서버 (가상 데이터, 지연/오류 주입)"""
+
+from app.broj_stub.dataset import SyntheticCrm
+from app.broj_stub.server import StubOptions, create_app
+
+__all__ = ["SyntheticCrm", "StubOptions", "create_app"]
@@ -0,0 +1,365 @@
+"""Broj CRM 가상 데이터
+
+시드가 같으면 항상 같은 데이터가 나온다. 회원 10만 명 이상도 메모리에 전부 올리지 않도록
+이름/전화번호(키워드 검색용)와 수강권/회원권 소유자 배열만 미리 만들고, 나머지 필드는
+요청한 페이지의 레코드만 (seed, 번호)로 만든 난수로 그때그때 생성한다.
+출석/매출은 날짜별로 생성해 최근 조회한 날짜만 캐시한다.
+"""
+
+import random
+from array import array
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import Iterator, Optional, Sequence
+
+MEMBER_KEY_BASE = 10_000_000
+LESSON_TICKET_KEY_BASE = 50_000_000
+TICKET_KEY_BASE = 70_000_000
+TRAINER_KEY_BASE = 900_000
+
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류전홍고문양손배백허유남심노하곽성차주우구민진나엄채원천방공현함변염여추도석선설마길연위표명기반왕금옥육인맹제모탁국어은편용예경봉사부가복태목형피두감호소"
+GIVEN = "민서지현우준도윤하은수연예진주원영성재희유정호훈경아승동혜태상나리기선보채래석찬규빈한용중"
+TRAINERS = ["김코치", "이코치", "박코치", "최코치", "정코치", "강코치", "조코치", "윤코치"]
+ADDRESSES = ["서울 강남구", "서울 서초구", "서울 송파구", "서울 강동구", "경기 성남시", "경기 하남시"]
+CLASSIFICATIONS = ["PT회원", "PT회원", "헬스회원", "헬스회원", "헬스회원", "GX회원"]
+CUSTOMER_STATUSES = ["ACTIVE", "ACTIVE", "ACTIVE", "EXPIRED", "EXPIRED", "HOLDING"]
+LESSON_TICKET_TYPES = [("PT 10회", 10), ("PT 20회", 20), ("PT 30회", 30), ("OT 2회", 2)]
+MEMBERSHIPS = [("헬스 1개월", 30, 99000), ("헬스 3개월", 90, 270000), ("헬스 6개월", 180, 480000), ("헬스 12개월", 365, 840000)]
+DOORS = ["정문", "후문"]
+
+# 회원 1명당 하루 평균 출석/결제 건수
+ATTENDANCE_RATE = 0.02
+SALES_RATE = 0.001
+
+# 회원 가입일 분포 (today 기준 이 일수 안)
+HISTORY_DAYS = 3 * 365
+
+
+def to_ms(value: datetime) -> int:
+    """datetime을 밀리초 타임스탬프로 변환 (CRM 응답 형식)"""
+    return int(value.timestamp() * 1000)
+
+
+class SyntheticCrm:
+    """가상 CRM 데이터 (회원, 수강권, 회원권, 출석, 매출)"""
+
+    def __init__(self, members: int = 100_000, seed: int = 42, today: Optional[date] = None,
+                 jgroup_key: str = "533109104"):
+        self.member_count = members
+        self.seed = seed
+        self.today = today or date.today()
+        self.jgroup_key = jgroup_key
+        self.first_day = self.today - timedelta(days=HISTORY_DAYS)
+
+        rng = random.Random(seed)
+        self.names: list[str] = []
+        self.phones: list[str] = []
+        # 수강권/회원권 -> 소유 회원 번호 (가입 순서)
+        self.lesson_ticket_owners = array("i")
+        self.ticket_owners = array("i")
+        for i in range(members):
+            self.names.append(rng.choice(SURNAMES) + rng.choice(GIVEN) + rng.choice(GIVEN))
+            self.phones.append(f"010-{rng.randrange(10000):04d}-{rng.randrange(10000):04d}")
+            for _ in range(rng.choice((0, 0, 1, 1, 1, 2, 3))):
+                self.lesson_ticket_owners.append(i)
+            for _ in range(rng.choice((1, 1, 1, 2, 2, 3))):
+                self.ticket_owners.append(i)
+
+        # 변경 시뮬레이션 (회원 번호 -> 바뀐 필드), 수정 시각 역순
+        self.overrides: dict[int, dict] = {}
+        self.updated_order: list[int] = []
+
+    def _rng(self, kind: int, index: int) -> random.Random:
+        return random.Random((self.seed * 1_000_003 + kind) * 10_000_019 + index)
+
+    # 회원
+
+    def profile(self, index: int) -> tuple[str, str]:
+        """회원 성별, 주소 (수강권/출석/매출 레코드에도 같은 값)"""
+        rng = self._rng(6, index)
+        return rng.choice(("M", "F")), rng.choice(ADDRESSES)
+
+    def created_at(self, index: int) -> datetime:
+        """회원 가입 시각 (회원 번호 순서대로 증가)"""
+        span = HISTORY_DAYS * 86400
+        offset = span * index // max(self.member_count, 1)
+        return datetime.combine(self.first_day, time(9)) + timedelta(seconds=offset)
+
+    def member(self, index: int) -> dict:
+        """회원 1명 (jcustomer/jgroup 응답 형식)"""
+        rng = self._rng(1, index)
+        sex, address = self.profile(index)
+        created = self.created_at(index)
+        birth = datetime(rng.randint(1960, 2005), rng.randint(1, 12), rng.randint(1, 28))
+        member = {
+            "jgjm_key": MEMBER_KEY_BASE + index,
+            "jgjm_member_name": self.names[index],
+            "jgjm_member_phone_number": self.phones[index],
+            "jgjm_member_sex": sex,
+            "jgjm_member_birth_dttm": to_ms(birth),
+            "jgjm_address": address,
+            "jgjm_attendance_number": self.phones[index][-4:],
+            "jgjm_remarks": None,
+            "jgjm_send_sms": rng.random() < 0.7,
+            "classification": rng.choice(CLASSIFICATIONS),
+            "customer_status": rng.choice(CUSTOMER_STATUSES),
+            "created_dttm": to_ms(created),
+            "updated_dttm": to_ms(created),
+            "ticket_start": to_ms(created),
+            "ticket_end": to_ms(created + timedelta(days=rng.choice((30, 90, 180, 365)))),
+        }
+        override = self.overrides.get(index)
+        if override:
+            member.update(override)
+        return member
+
+    def member_index(self, jgjm_key: int) -> Optional[int]:
+        index = jgjm_key - MEMBER_KEY_BASE
+        return index if 0 <= index < self.member_count else None
+
+    def member_order(self, sort_column: str, descending: bool) -> Iterator[int]:
+        """정렬 순서의 회원 번호 (updated_dttm은 바뀐 회원이 먼저)"""
+        if sort_column == "updated_dttm" and descending:
+            yield from reversed(self.updated_order)
+            changed = self.overrides
+            yield from (i for i in range(self.member_count - 1, -1, -1) if i not in changed)
+        elif descending:
+            yield from range(self.member_count - 1, -1, -1)
+        else:
+            yield from range(self.member_count)
+
+    def search_members(self, keyword: str) -> list[int]:
+        """이름/전화번호에 keyword가 들어간 회원 번호"""
+        return [i for i in range(self.member_count) if keyword in self.names[i] or keyword in self.phones[i]]
+
+    def mutate(self, count: int) -> list[int]:
+        """무작위 회원 count명의 상태를 바꿈 (증분 동기화 측정용)"""
+        rng = random.Random(self.seed + len(self.updated_order) + 1)
+        now = to_ms(datetime.now())
+        changed = []
+        for index in rng.sample(range(self.member_count), min(count, self.member_count)):
+            self.overrides[index] = {
+                "customer_status": rng.choice(CUSTOMER_STATUSES),
+                "classification": rng.choice(CLASSIFICATIONS),
+                "updated_dttm": now,
+            }
+            if index in self.updated_order:
+                self.updated_order.remove(index)
+            self.updated_order.append(index)
+            changed.append(MEMBER_KEY_BASE + index)
+        return changed
+
+    # 수강권 (jgroup/lessonticket)
+
+    def lesson_ticket(self, position: int) -> dict:
+        owner = self.lesson_ticket_owners[position]
+        rng = self._rng(2, position)
+        name, origin = rng.choice(LESSON_TICKET_TYPES)
+        started = min(self.created_at(owner) + timedelta(days=rng.randrange(0, 60)),
+                      datetime.combine(self.today, time(9)))
+        closed = started + timedelta(days=origin * 10)
+        remaining = rng.randint(0, origin)
+        trainer = rng.randrange(len(TRAINERS))
+        expired = closed.date() < self.today or remaining == 0
+        return {
+            "jglesson_ticket_key": LESSON_TICKET_KEY_BASE + position,
+            "jglesson_ticket_type": name,
+            "jglesson_ticket_count": remaining,
+            "jglesson_ticket_origin_count": origin,
+            "jglesson_origin_ticket_count": origin,
+            "jglesson_ticket_point": 0,
+            "jglesson_ticket_origin_point": 0,
+            "jglesson_origin_ticket_point": 0,
+            "jglesson_ticket_started_dttm": to_ms(started),
+            "jglesson_ticket_closed_dttm": to_ms(closed),
+            "last_lesson_dttm": to_ms(started + timedelta(days=(origin - remaining) * 7)) if remaining < origin else None,
+            "jgjm_key": MEMBER_KEY_BASE + owner,
+            "jgjm_member_name": self.names[owner],
+            "jgjm_member_phone_number": self.phones[owner],
+            "jgjm_member_sex": self.profile(owner)[0],
+            "jgjm_preview_type": None,
+            "jgjm_trainer_key": TRAINER_KEY_BASE + trainer,
+            "trainer_key": TRAINER_KEY_BASE + trainer,
+            "trainer_name": TRAINERS[trainer],
+            "kind": "PT" if name.startswith("PT") else "OT",
+            "attendance_type": "COUNT",
+            "status": "만료" if expired else "활성",
+            "real_used_lesson_count": origin - remaining,
+            "real_unused_lesson_count": remaining,
+            "created_dttm": to_ms(started),
+        }
+
+    def search_lesson_tickets(self, keyword: str) -> list[int]:
+        return [p for p, owner in enumerate(self.lesson_ticket_owners)
+                if keyword in self.names[owner] or keyword in self.phones[owner]]
+
+    # 회원권 (jgroup/ticketdetails)
+
+    def ticket(self, position: int) -> dict:
+        owner = self.ticket_owners[position]
+        rng = self._rng(3, position)
+        name, days, price = rng.choice(MEMBERSHIPS)
+        started = min(self.created_at(owner) + timedelta(days=rng.randrange(0, 365)),
+                      datetime.combine(self.today, time(9)))
+        closed = started + timedelta(days=days)
+        sex, address = self.profile(owner)
+        return {
+            "jtd_key": TICKET_KEY_BASE + position,
+            "jtd_name": name,
+            "jtd_memo": None,
+            "jtd_started_dttm": to_ms(started),
+            "jtd_closed_dttm": to_ms(closed),
+            "created": to_ms(started),
+            "Customer": {
+                "jgjm_key": MEMBER_KEY_BASE + owner,
+                "jgjm_member_name": self.names[owner],
+                "jgjm_member_phone_number": self.phones[owner],
+                "jgjm_member_sex": sex,
+                "jgjm_address": address,
+            },
+            "ticket_status": "EXPIRED" if closed.date() < self.today else "VALID",
+            "ticket_type": "PERIOD",
+            "classification": "헬스",
+            "jgp_history_price": price,
+            "type": "TICKET",
+            "transferable": False,
+            "transferableCount": 0,
+            "has_holding_limits": True,
+            "count_holding_limits": 2,
+            "days_holding_limits": 30,
+            "pass_origin_count": None,
+            "pass_count": None,
+            "remaining_minutes": None,
+            "remaining_origin_minutes": None,
+        }
+
+    def ticket_positions(self, standard: date, expired_days: int, status: str) -> Sequence[int]:
+        """기준일에 유효하거나 만료 후 expired_days일 안인 회원권 (status=all이면 전체)"""
+        if status.lower() == "all":
+            return range(len(self.ticket_owners))
+        cutoff = to_ms(datetime.combine(standard - timedelta(days=expired_days), time()))
+        return [p for p in range(len(self.ticket_owners)) if self.ticket(p)["jtd_closed_dttm"] >= cutoff]
+
+    # 출석 (api/jgroup/{key}/attendance)
+
+    def attendance_count(self, day: date) -> int:
+        if not self.first_day <= day <= self.today:
+            return 0
+        # 가입한 회원 수에 비례, 주말은 절반
+        joined = self.member_count * ((day - self.first_day).days + 1) // (HISTORY_DAYS + 1)
+        weekend = 0.5 if day.weekday() >= 5 else 1.0
+        return int(joined * ATTENDANCE_RATE * weekend)
+
+    @lru_cache(maxsize=64)
+    def attendance_day(self, day: date) -> list[dict]:
+        """하루 출석 목록 (시각 역순)"""
+        count = self.attendance_count(day)
+        rng = self._rng(4, day.toordinal())
+        joined = max(self.member_count * ((day - self.first_day).days + 1) // (HISTORY_DAYS + 1), 1)
+        records = []
+        for n in range(count):
+            owner = rng.randrange(joined)
+            started = datetime.combine(day, time(6)) + timedelta(seconds=rng.randrange(16 * 3600))
+            sex, address = self.profile(owner)
+            records.append({
+                "jgm_attendance_key": day.toordinal() * 100_000 + n,
+                "jgjm_key": MEMBER_KEY_BASE + owner,
+                "jgjm_member_name": self.names[owner],
+                "jgjm_member_phone_number": self.phones[owner],
+                "jgjm_member_sex": sex,
+                "jgjm_address": address,
+                "jgm_attendance_started_dttm": to_ms(started),
+                "jgm_attendance_closed_dttm": to_ms(started + timedelta(minutes=rng.randint(40, 120))),
+                "temperature": None,
+                "status": "ATTENDANCE",
+                "customer_status": "ACTIVE",
+                "ticket_key": TICKET_KEY_BASE + rng.randrange(max(len(self.ticket_owners), 1)),
+                "ticket_name": rng.choice(MEMBERSHIPS)[0],
+                "ticket_type": "PERIOD",
+                "pass_count": None,
+                "door_name": rng.choice(DOORS),
+                "member_authority": "MEMBER",
+                "vaccine_type": None,
+                "vaccine_completed": None,
+            })
+        records.sort(key=lambda r: r["jgm_attendance_started_dttm"], reverse=True)
+        return records
+
+    # 매출 (jgproducthistory/jpql)
+
+    def sales_count(self, day: date) -> int:
+        if not self.first_day <= day <= self.today:
+            return 0
+        return max(int(self.member_count * SALES_RATE), 1)
+
+    @lru_cache(maxsize=64)
+    def sales_day(self, day: date) -> list[dict]:
+        """하루 결제 목록 (시각 역순)"""
+        rng = self._rng(5, day.toordinal())
+        joined = max(self.member_count * ((day - self.first_day).days + 1) // (HISTORY_DAYS + 1), 1)
+        records = []
+        for n in range(self.sales_count(day)):
+            owner = rng.randrange(joined)
+            created = datetime.combine(day, time(9)) + timedelta(seconds=rng.randrange(12 * 3600))
+            name, days, price = rng.choice(MEMBERSHIPS)
+            sale = rng.choice((0, 0, 0, 10000, 30000))
+            card = rng.random() < 0.8
+            trainer = rng.randrange(len(TRAINERS))
+            records.append({
+                "jgp_history_key": day.toordinal() * 10_000 + n,
+                "jgp_history_created_dttm": to_ms(created),
+                "jgp_history_started_dttm": to_ms(created),
+                "jgp_history_closed_dttm": to_ms(created + timedelta(days=days)),
+                "jgp_history_price": price - sale,
+                "product_origin_price": price,
+                "jgp_history_sale": sale,
+                "jgp_history_service": 0,
+                "payment_method_type": "CARD" if card else "CASH",
+                "payment_type": "PAYMENT",
+                "jgp_history_card": price - sale if card else 0,
+                "jgp_history_money": 0 if card else price - sale,
+                "jgp_history_credit": 0,
+                "jgp_history_card_type": "신한" if card else None,
+                "jgp_history_installment": 0,
+                "jgp_history_product": name,
+                "jgp_history_type": "TICKET",
+                "jgp_history_count": None,
+                "jgp_history_day": days,
+                "product_quantity": 1,
+                "jgjm_key": MEMBER_KEY_BASE + owner,
+                "jgjm_member_name": self.names[owner],
+                "jgjm_address": self.profile(owner)[1],
+                "customer_name": self.names[owner],
+                "trainer_key": TRAINER_KEY_BASE + trainer,
+                "trainer_name": TRAINERS[trainer],
+                "status": "NORMAL",
+                "classification": "헬스",
+                "type": "NEW" if rng.random() < 0.4 else "RENEW",
+                "jgp_history_memo": None,
+                "jgp_history_is_refund": False,
+                "package_uuid": None,
+            })
+        records.sort(key=lambda r: r["jgp_history_created_dttm"], reverse=True)
+        return records
+
+
+def days_between(start: date, end: date, descending: bool = True) -> list[date]:
+    """start~end 날짜 목록 (양 끝 포함)"""
+    days = [start + timedelta(days=n) for n in range((end - start).days + 1)]
+    return days[::-1] if descending else days
+
+
+def page_by_day(days: list[date], count, records, offset: int, size: int) -> list[dict]:
+    """날짜별로 나뉜 목록에서 offset부터 size건 (건너뛰는 날짜는 생성하지 않음)"""
+    page: list[dict] = []
+    for day in days:
+        n = count(day)
+        if offset >= n:
+            offset -= n
+            continue
+        rows = records(day)
+        page.extend(rows[offset:offset + size - len(page)])
+        offset = 0
+        if len(page) >= size:
+            break
+    return page
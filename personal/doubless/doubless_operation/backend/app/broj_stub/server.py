@@ -0,0 +1,267 @@
+"""Broj CRM 대역 서버
+
+BrojClient와 레거시 다운로드 스크립트(download_members/attendance/sales.py)가 쓰는
+엔드포인트를 실제 서버와 같은 경로, 같은 응답 형식으로 흉내 낸다. 데이터는 SyntheticCrm이 만든다.
+
+모든 요청(/_stub 제외)에 latency_ms + 0~jitter_ms 지연을 넣고, error_rate 확률로
+error_status 응답을 돌려준다. 실행 중에는 PUT /_stub/config로 바꿀 수 있다.
+"""
+
+import asyncio
+import json
+import random
+import secrets
+from datetime import date, datetime
+from itertools import islice
+from typing import Optional
+from urllib.parse import parse_qs
+
+from fastapi import FastAPI, Header, HTTPException, Query, Request
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from app.broj_stub.dataset import SyntheticCrm, days_between, page_by_day
+
+STUB_PREFIX = "/_stub"
+
+
+class StubOptions(BaseModel):
+    """지연/오류 주입 설정"""
+
+    latency_ms: float = 0                           # 요청마다 넣는 지연
+    jitter_ms: float = 0                            # 0~jitter_ms 추가 지연 (균등 분포)
+    error_rate: float = 0                           # 오류 응답 확률 (0~1)
+    error_status: int = 503                         # 오류 응답 상태 코드
+    seed: Optional[int] = None                      # 지연/오류 난수 시드 (None이면 매번 다름)
+
+
+class StubStats(BaseModel):
+    requests: int = 0
+    errors: int = 0
+    by_path: dict[str, int] = {}
+
+
+async def _form(request: Request) -> dict[str, str]:
+    """application/x-www-form-urlencoded 본문 (python-multipart 없이 파싱)"""
+    body = (await request.body()).decode("utf-8")
+    return {key: values[0] for key, values in parse_qs(body, keep_blank_values=True).items()}
+
+
+def _page(items: list, page_index: int, size: int) -> list:
+    start = max(page_index, 0) * size
+    return items[start:start + size]
+
+
+def create_app(crm: SyntheticCrm, options: Optional[StubOptions] = None) -> FastAPI:
+    """대역 서버 앱
+
+    목록 응답은 JSONResponse로 바로 돌려준다 (jsonable_encoder를 거치면 1000건 페이지 직렬화가 몇 배 느려짐).
+    """
+    app = FastAPI(title="Broj CRM stub", docs_url=f"{STUB_PREFIX}/docs", openapi_url=f"{STUB_PREFIX}/openapi.json")
+    app.state.crm = crm
+    app.state.options = options or StubOptions()
+    app.state.stats = StubStats()
+    app.state.rng = random.Random(app.state.options.seed)
+    tokens: set[str] = set()
+
+    @app.middleware("http")
+    async def inject(request: Request, call_next):
+        """지연/오류 주입"""
+        if request.url.path.startswith(STUB_PREFIX):
+            return await call_next(request)
+        opts: StubOptions = app.state.options
+        stats: StubStats = app.state.stats
+        stats.requests += 1
+        route = request.url.path.replace(crm.jgroup_key, "{key}")
+        stats.by_path[route] = stats.by_path.get(route, 0) + 1
+
+        rng = app.state.rng
+        delay = opts.latency_ms + (rng.uniform(0, opts.jitter_ms) if opts.jitter_ms else 0)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        if opts.error_rate and rng.random() < opts.error_rate:
+            stats.errors += 1
+            return JSONResponse({"error": "injected error", "status": opts.error_status}, status_code=opts.error_status)
+        return await call_next(request)
+
+    def check_auth(authorization: Optional[str]) -> None:
+        token = (authorization or "").removeprefix("Bearer ").strip()
+        if token not in tokens:
+            raise HTTPException(status_code=401, detail="Invalid access token")
+
+    def check_jgroup(key: str) -> None:
+        if str(key) != crm.jgroup_key:
+            raise HTTPException(status_code=404, detail=f"Unknown jgroup: {key}")
+
+    # 인증
+
+    @app.post("/BroJServer/joauth/login")
+    async def login(request: Request):
+        form = await _form(request)
+        if not form.get("member_id") or not form.get("member_password"):
+            raise HTTPException(status_code=401, detail="Invalid credentials")
+        token = secrets.token_hex(16)
+        tokens.add(token)
+        response = JSONResponse({"result": {"access_token": token, "jgroup_key": crm.jgroup_key}})
+        response.set_cookie("accessToken", token)
+        response.set_cookie("jgroup_key", crm.jgroup_key)
+        return response
+
+    @app.get("/BroJServer/api/jgroup")
+    async def jgroup_list(authorization: Optional[str] = Header(None)):
+        check_auth(authorization)
+        return {"_embedded": {"jgroups": [{"jgroup_key": int(crm.jgroup_key), "jgroup_name": "더블에스"}]}}
+
+    @app.get("/BroJServer/api/jgroup/{jgroup_key}")
+    async def jgroup_token(jgroup_key: str, authorization: Optional[str] = Header(None)):
+        check_auth(authorization)
+        check_jgroup(jgroup_key)
+        return {"jgroup_key": int(crm.jgroup_key), "access_token": secrets.token_hex(16)}
+
+    @app.get("/BroJServer/api/authorization/jgroup")
+    async def jgroup_authorization(jgroup_key: str, authorization: Optional[str] = Header(None)):
+        check_auth(authorization)
+        check_jgroup(jgroup_key)
+        return {"result": secrets.token_hex(16)}
+
+    # 회원
+
+    @app.get("/BroJServer/api/jcustomer/jgroup/{jgroup_key}")
+    async def members(
+        jgroup_key: str,
+        size: int = 1000,
+        page_index: int = 0,
+        keyword: str = "",
+        sort_column: str = "created_dttm",
+        sort_type: str = "desc",
+        authorization: Optional[str] = Header(None),
+    ):
+        check_auth(authorization)
+        check_jgroup(jgroup_key)
+        descending = sort_type.lower() == "desc"
+        if keyword:
+            indexes = crm.search_members(keyword)
+            if descending:
+                indexes.reverse()
+            indexes = _page(indexes, page_index, size)
+        else:
+            start = max(page_index, 0) * size
+            indexes = list(islice(crm.member_order(sort_column, descending), start, start + size))
+        return JSONResponse({"result": [crm.member(i) for i in indexes]})
+
+    # 수강권
+
+    @app.get("/BroJServer/api/jgroup/lessonticket/{jgroup_key}")
+    async def lesson_tickets(
+        jgroup_key: str,
+        page_index: int = 0,
+        page_size: Optional[int] = None,
+        size: Optional[int] = None,
+        keyword: str = "",
+        sort_type: str = "desc",
+        authorization: Optional[str] = Header(None),
+    ):
+        check_auth(authorization)
+        check_jgroup(jgroup_key)
+        per_page = page_size or size or 1000
+        if keyword:
+            positions = crm.search_lesson_tickets(keyword)
+        else:
+            positions = range(len(crm.lesson_ticket_owners))
+        if sort_type.lower() == "desc":
+            positions = positions[::-1]
+        return JSONResponse({"result": [crm.lesson_ticket(p) for p in _page(positions, page_index, per_page)]})
+
+    # 회원권
+
+    @app.get("/BroJServer/jgroup/ticketdetails/{jgroup_key}")
+    async def ticket_details(
+        jgroup_key: str,
+        page_index: int = 0,
+        page_size: int = 1000,
+        status: str = "all",
+        jtd_expired_day: int = 10,
+        authorization: Optional[str] = Header(None),
+    ):
+        check_auth(authorization)
+        check_jgroup(jgroup_key)
+        positions = crm.ticket_positions(crm.today, jtd_expired_day, status)
+        page = [crm.ticket(p) for p in _page(positions[::-1], page_index, page_size)]
+        return JSONResponse({"result": {"gospel": page, "total_count": len(positions)}})
+
+    # 출석
+
+    @app.get("/BroJServer/api/jgroup/{jgroup_key}/attendance")
+    async def attendance(
+        jgroup_key: str,
+        start_date: date,
+        close_date: date,
+        size: int = 400,
+        page_index: int = 0,
+        sort_type: str = "desc",
+        authorization: Optional[str] = Header(None),
+    ):
+        check_auth(authorization)
+        check_jgroup(jgroup_key)
+        descending = sort_type.lower() == "desc"
+        records = crm.attendance_day if descending else (lambda day: crm.attendance_day(day)[::-1])
+        days = days_between(start_date, close_date, descending)
+        page = page_by_day(days, crm.attendance_count, records, max(page_index, 0) * size, size)
+        return JSONResponse({"result": page})
+
+    # 매출
+
+    @app.post("/BroJServer/jgroup/api/reterive/jgproducthistory/jpql")
+    async def sales(request: Request, authorization: Optional[str] = Header(None)):
+        check_auth(authorization)
+        try:
+            search = json.loads((await _form(request))["search_json_string"])
+            page = search.get("page") or {}
+            start = datetime.fromtimestamp(search["flag_start_time"] / 1000).date()
+            finish = datetime.fromtimestamp(search["flag_finish_time"] / 1000).date()
+        except (ValueError, KeyError, TypeError) as e:
+            raise HTTPException(status_code=400, detail=f"Invalid search_json_string: {e}")
+        check_jgroup(search.get("jgroup_key"))
+
+        size = page.get("page_size", 100)
+        descending = search.get("sort_desc", True)
+        records = crm.sales_day if descending else (lambda day: crm.sales_day(day)[::-1])
+        days = days_between(start, finish, descending)
+        rows = page_by_day(days, crm.sales_count, records, max(page.get("page_index", 0), 0) * size, size)
+        return JSONResponse({"lamb_list": rows, "lamb_total_count": sum(crm.sales_count(day) for day in days)})
+
+    # 대역 서버 제어
+
+    @app.get(f"{STUB_PREFIX}/config")
+    async def get_config():
+        return {
+            "options": app.state.options,
+            "members": crm.member_count,
+            "lesson_tickets": len(crm.lesson_ticket_owners),
+            "tickets": len(crm.ticket_owners),
+            "seed": crm.seed,
+            "today": crm.today.isoformat(),
+            "jgroup_key": crm.jgroup_key,
+        }
+
+    @app.put(f"{STUB_PREFIX}/config")
+    async def set_config(options: StubOptions):
+        app.state.options = options
+        app.state.rng = random.Random(options.seed)
+        return {"options": options}
+
+    @app.get(f"{STUB_PREFIX}/stats")
+    async def get_stats():
+        return app.state.stats
+
+    @app.post(f"{STUB_PREFIX}/stats/reset")
+    async def reset_stats():
+        app.state.stats = StubStats()
+        return app.state.stats
+
+    @app.post(f"{STUB_PREFIX}/mutate")
+    async def mutate(count: int = Query(100, ge=1)):
+        """회원 count명 변경 (updated_dttm 갱신)"""
+        return {"changed": crm.mutate(count)}
+
+    return app
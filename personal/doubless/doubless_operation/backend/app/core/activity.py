@@ -0,0 +1,28 @@
+"""API 요청 활동 추적 (유휴 시간 판단용)"""
+
+import time
+
+_last_request = time.monotonic()
+
+
+def touch() -> None:
+    """요청 시각 갱신"""
+    global _last_request
+    _last_request = time.monotonic()
+
+
+def idle_seconds() -> float:
+    """마지막 요청 이후 경과 시간 (초)"""
+    return time.monotonic() - _last_request
+
+
+class ActivityMiddleware:
+    """HTTP 요청마다 활동 시각을 갱신하는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            touch()
+        await self.app(scope, receive, send)
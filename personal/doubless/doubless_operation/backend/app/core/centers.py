@@ -0,0 +1,144 @@
+"""멀티 센터 라우팅
+
+한 프로세스가 여러 센터를 서비스한다. 센터마다 SQLite 파일과 Broj 계정이 따로 있고,
+요청은 헤더(X-Center-Code) 또는 경로 접두사(/centers/<code>/api/...)로 센터를 고른다.
+지정하지 않으면 기본 센터(center_code)로 처리한다.
+
+현재 센터는 contextvar에 담기므로 요청 안에서 만든 세션, CRM 클라이언트, 백그라운드 태스크가
+같은 센터를 쓴다. 프로세스 단위 객체(수강권 인덱스, SSE 브로드캐스터 등)는 CenterLocal로 센터별로 둔다.
+"""
+
+import json
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Callable, Generic, Iterator, Optional, TypeVar
+
+from app.core.config import CenterConfig, get_settings
+
+CENTER_PATH_PREFIX = "/centers/"
+CENTER_CODE_PATTERN = re.compile(r"^[A-Za-z0-9_-]+$")
+
+_current_center: ContextVar[Optional[str]] = ContextVar("current_center", default=None)
+
+T = TypeVar("T")
+
+
+class UnknownCenterError(LookupError):
+    """설정에 없는 센터 코드"""
+
+    def __init__(self, code: str):
+        self.code = code
+        super().__init__(f"Unknown center: {code}")
+
+
+@lru_cache
+def get_centers() -> dict[str, CenterConfig]:
+    """센터 코드 -> 설정 (기본 센터 먼저)"""
+    centers = get_settings().center_configs()
+    for code in centers:
+        if not CENTER_CODE_PATTERN.match(code):
+            raise ValueError(f"Invalid center code: {code}")
+    return centers
+
+
+def default_center_code() -> str:
+    return get_settings().center_code
+
+
+def current_center_code() -> str:
+    """현재 요청의 센터 코드 (지정하지 않았으면 기본 센터)"""
+    return _current_center.get() or default_center_code()
+
+
+def get_center(code: Optional[str] = None) -> CenterConfig:
+    """센터 설정 (code를 생략하면 현재 센터)"""
+    code = code or current_center_code()
+    center = get_centers().get(code)
+    if center is None:
+        raise UnknownCenterError(code)
+    return center
+
+
+@contextmanager
+def use_center(code: str) -> Iterator[CenterConfig]:
+    """블록 안에서 현재 센터 지정 (스크립트, 백그라운드 작업용)"""
+    center = get_center(code)
+    token = _current_center.set(center.code)
+    try:
+        yield center
+    finally:
+        _current_center.reset(token)
+
+
+class CenterLocal(Generic[T]):
+    """센터별 인스턴스 (속성 접근은 현재 센터 인스턴스로 위임)
+
+    모듈 전역 객체를 CenterLocal로 바꾸면 호출부를 고치지 않고 센터별로 분리된다.
+    """
+
+    def __init__(self, factory: Callable[[], T]):
+        self._factory = factory
+        self._instances: dict[str, T] = {}
+
+    def get(self, code: Optional[str] = None) -> T:
+        code = code or current_center_code()
+        instance = self._instances.get(code)
+        if instance is None:
+            instance = self._instances.setdefault(code, self._factory())
+        return instance
+
+    def instances(self) -> dict[str, T]:
+        return dict(self._instances)
+
+    def __getattr__(self, name: str):
+        return getattr(self.get(), name)
+
+
+class CenterMiddleware:
+    """요청 센터 지정 ASGI 미들웨어
+
+    /centers/<code>/api/... 경로는 접두사를 떼고 /api/...로 넘긴다.
+    (EventSource처럼 헤더를 붙일 수 없는 클라이언트용)
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.header = get_settings().center_header.lower().encode("latin-1")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        code = None
+        path = scope["path"]
+        if path.startswith(CENTER_PATH_PREFIX):
+            code, _, rest = path[len(CENTER_PATH_PREFIX):].partition("/")
+            scope = dict(scope, path="/" + rest, raw_path=("/" + rest).encode())
+        else:
+            for key, value in scope.get("headers", []):
+                if key == self.header:
+                    code = value.decode("latin-1").strip()
+                    break
+
+        if code and code not in get_centers():
+            await _not_found(send, code)
+            return
+
+        token = _current_center.set(code or None)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_center.reset(token)
+
+
+async def _not_found(send, code: str) -> None:
+    body = json.dumps({"detail": f"Unknown center: {code}"}).encode()
+    await send({
+        "type": "http.response.start",
+        "status": 404,
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+    })
+    await send({"type": "http.response.body", "body": body})
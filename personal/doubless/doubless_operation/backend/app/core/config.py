@@ -2,10 +2,34 @@
 
 from functools import lru_cache
 from pathlib import Path
-from pydantic import SecretStr
+from pydantic import BaseModel, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+class CenterConfig(BaseModel):
+    """센터별 설정 (DB 파일, Broj 계정)"""
+
+    code: str
+    name: str = ""
+    database_url: str = ""                          # 비우면 data/centers/<code>/operation.db
+    broj_url: str = ""                              # 비우면 기본 broj_url
+    broj_id: str = ""
+    broj_pwd: SecretStr = SecretStr("")
+    broj_jgroup_key: str = ""
+    is_default: bool = False                        # 기본 센터 (center_code, database_url, broj_*)
+
+    @property
+    def data_dir(self) -> Path:
+        """센터 데이터 디렉토리 (보관 파일, 내보내기)"""
+        data_dir = get_settings().data_dir
+        return data_dir if self.is_default else data_dir / "centers" / self.code
+
+    @property
+    def exports_dir(self) -> Path:
+        """센터 내보내기 디렉토리"""
+        return self.data_dir / "exports"
+
+
 class Settings(BaseSettings):
     """애플리케이션 설정"""
 
@@ -25,12 +49,68 @@ class Settings(BaseSettings):
     broj_pwd: SecretStr = SecretStr("")
     broj_jgroup_key: str = ""
 
+    # 회원 증분 동기화
+    member_sync_sort_column: str = "created_dttm"   # CRM이 지원하면 수정일시 컬럼 사용
+    member_sync_page_size: int = 200                # 증분 동기화 페이지 크기
+    member_sync_unchanged_run: int = 20             # 연속 미변경 건수가 이만큼이면 중단
+    member_full_sync_hours: int = 24                # 전체 동기화 주기 (시간)
+
+    # 출석 동기화 (마지막 출석일부터 월 단위로 조회)
+    attendance_initial_months: int = 12             # 출석 캐시가 비었을 때 가져올 개월 수 (이번 달 포함)
+    attendance_page_size: int = 400
+    inactive_member_days: int = 30                  # 이 기간 동안 출석이 없으면 미방문 회원
+
+    # 회원 상세 캐시 유효 시간 (초과 시 백그라운드 갱신)
+    member_detail_ttl_seconds: int = 300
+
+    # 실시간 이벤트 (SSE)
+    sse_queue_size: int = 100                       # 클라이언트별 대기 이벤트 수 (초과 시 연결 종료)
+    sse_heartbeat_seconds: float = 15               # 유휴 연결 keep-alive 주기
+    sse_batch_ms: int = 50                          # 이 시간 동안 모인 이벤트를 한 번에 전송
+    sse_retry_ms: int = 3000                        # 브라우저 재접속 대기
+
+    # 세션 보관 (session_archive_YYYY.db)
+    payroll_close_day: int = 10                     # M월 급여는 M+1월 이 날짜에 마감
+
+    # SQLite 연결 설정
+    sqlite_wal: bool = True                         # WAL 모드 (읽기와 쓰기가 서로 막지 않음)
+    sqlite_cache_size_kb: int = 16384               # 연결별 페이지 캐시
+    sqlite_journal_size_limit_mb: int = 64          # 체크포인트 후 남기는 WAL 파일 최대 크기
+
+    # DB 유지보수 (체크포인트, ANALYZE/optimize, incremental_vacuum)
+    maintenance_interval_seconds: int = 300         # 점검 주기, 0이면 사용 안 함
+    maintenance_idle_seconds: int = 600             # 이 시간 동안 API 요청이 없으면 유휴 작업 실행
+    wal_checkpoint_mb: int = 16                     # WAL이 이 크기를 넘으면 TRUNCATE 체크포인트
+    vacuum_freelist_ratio: float = 0.1              # 빈 페이지 비율이 이 이상이면 incremental_vacuum
+    vacuum_max_pages: int = 10000                   # incremental_vacuum 1회 최대 페이지 수
+
+    # DB 백업 (data/backups)
+    backup_interval_hours: float = 24               # 자동 백업 주기, 0이면 사용 안 함
+    backup_retention: int = 7                       # DB별로 남길 백업 개수
+    backup_pages_per_step: int = 256                # 한 단계에 복사할 페이지 수
+    backup_step_sleep_ms: int = 5                   # 단계 사이 대기 (그동안 다른 연결이 쓰기 가능)
+    doubless_db_path: str = ""                      # 통합 DB 경로 (비우면 ../../data/doubless.db)
+
     # Center Info
     center_name: str = "더블에스"
     center_code: str = "DOUBLESS001"
 
+    # 멀티 센터 (기본 센터는 위 center_*, database_url, broj_* 설정)
+    centers: list[CenterConfig] = []                # 추가 센터 (JSON 목록)
+    center_header: str = "X-Center-Code"            # 센터 지정 헤더 (또는 /centers/<code>/api/... 경로)
+    center_engine_idle_seconds: int = 600           # 추가 센터 DB 연결을 이 시간 동안 안 쓰면 닫음
+
     # Application
     debug: bool = False
+    data_dir_path: str = ""                         # 데이터 디렉토리 (비우면 backend/data)
+
+    # Excel Export
+    excel_export_workers: int = 0                   # 0이면 CPU 코어 수
+
+    # 센터 내보내기 통합 (중앙 DB)
+    aggregate_db_path: str = ""                     # 비우면 data/central.db
+    aggregate_workers: int = 0                      # 파싱 워커 프로세스 수, 0이면 CPU 코어 수
+    aggregate_batch_files: int = 50                 # 이 파일 수마다 커밋
 
     @property
     def base_dir(self) -> Path:
@@ -39,7 +119,9 @@ class Settings(BaseSettings):
 
     @property
     def data_dir(self) -> Path:
-        """데이터 디렉토리"""
+        """데이터 디렉토리 (내보내기, 백업, 보관 파일, 추가 센터 DB)"""
+        if self.data_dir_path:
+            return Path(self.data_dir_path)
         return self.base_dir / "data"
 
     @property
@@ -47,6 +129,43 @@ class Settings(BaseSettings):
         """내보내기 디렉토리"""
         return self.data_dir / "exports"
 
+    @property
+    def backups_dir(self) -> Path:
+        """DB 백업 디렉토리"""
+        return self.data_dir / "backups"
+
+    def center_configs(self) -> dict[str, CenterConfig]:
+        """센터 코드 -> 설정 (기본 센터 먼저, 비어 있는 값은 기본값으로 채움)"""
+        default = CenterConfig(
+            code=self.center_code,
+            name=self.center_name,
+            database_url=self.database_url,
+            broj_url=self.broj_url,
+            broj_id=self.broj_id,
+            broj_pwd=self.broj_pwd,
+            broj_jgroup_key=self.broj_jgroup_key,
+            is_default=True,
+        )
+        configs = {default.code: default}
+        for center in self.centers:
+            if center.code in configs:
+                raise ValueError(f"Duplicate center code: {center.code}")
+            data_dir = self.data_dir / "centers" / center.code
+            configs[center.code] = center.model_copy(update={
+                "name": center.name or center.code,
+                "database_url": center.database_url or f"sqlite:///{data_dir / 'operation.db'}",
+                "broj_url": center.broj_url or self.broj_url,
+                "is_default": False,
+            })
+        return configs
+
+    @property
+    def doubless_db(self) -> Path:
+        """통합 DB(doubless.db) 경로"""
+        if self.doubless_db_path:
+            return Path(self.doubless_db_path)
+        return self.base_dir.parent.parent / "data" / "doubless.db"
+
 
 @lru_cache
 def get_settings() -> Settings:
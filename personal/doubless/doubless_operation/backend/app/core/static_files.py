@@ -0,0 +1,262 @@
+"""프론트엔드 빌드 정적 파일 서빙
+
+StaticFiles 대신 쓰는 ASGI 앱. 시작할 때 디렉토리를 한 번 훑어 파일 색인(크기, 수정 시각, ETag,
+.br/.gz 변형)을 메모리에 두고, 요청마다 파일 시스템을 뒤지지 않는다.
+
+- 압축: 빌드 후 만든 .br/.gz를 Accept-Encoding에 맞춰 보낸다. 없으면 서버 시작 시(precompress) 또는
+  첫 요청 때 .gz(brotli 모듈이 있으면 .br도)를 만들어 옆에 저장하고, 쓸 수 없는 디렉토리면 메모리에 둔다.
+- 캐시: 해시가 붙은 빌드 산출물(assets/index-B1x2y3z4.js)은 1년 immutable, 나머지(index.html 등)는
+  no-cache로 매번 ETag/If-Modified-Since 재검증 (변경 없으면 304).
+- 색인에 없는 경로가 오면 (서버 실행 중 다시 빌드한 경우) RESCAN_SECONDS에 한 번만 다시 훑는다.
+- 확장자 없는 경로는 index.html로 보낸다 (BrowserRouter 새로고침, API 경로 제외).
+"""
+
+import gzip
+import mimetypes
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Optional
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, PlainTextResponse, Response
+
+# Vite 산출물 이름: <이름>-<8자 해시>.<확장자>
+HASHED_ASSET = re.compile(r"^assets/.+-[A-Za-z0-9_-]{8}\.[A-Za-z0-9]+$")
+COMPRESSIBLE = {".html", ".js", ".mjs", ".css", ".json", ".svg", ".txt", ".map", ".xml", ".webmanifest", ".ico"}
+COMPRESS_MIN_BYTES = 1024                           # 이보다 작으면 압축 이득보다 헤더가 큼
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+RESCAN_SECONDS = 5.0
+NO_FALLBACK = ("api/", "centers/")                  # 없는 API 경로는 index.html 대신 404
+ENCODINGS = {"br": ".br", "gzip": ".gz"}            # 선호 순서
+# Windows 레지스트리가 .js를 text/plain으로 등록한 PC가 있어 모듈 스크립트가 막히지 않도록 고정
+MEDIA_TYPES = {".js": "text/javascript", ".mjs": "text/javascript", ".css": "text/css", ".html": "text/html"}
+
+
+def _brotli():
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+@dataclass
+class Variant:
+    """압축 변형 하나 (파일 또는 메모리)"""
+
+    size: int
+    etag: str
+    path: Optional[Path] = None
+    body: Optional[bytes] = None
+
+
+@dataclass
+class StaticEntry:
+    """색인 항목"""
+
+    path: Path
+    stat: os.stat_result
+    media_type: str
+    immutable: bool
+    variants: dict[str, Variant] = field(default_factory=dict)
+    compressed: bool = False                        # 첫 요청 압축을 이미 시도함
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.stat.st_mtime_ns:x}-{self.stat.st_size:x}"'
+
+    @property
+    def compressible(self) -> bool:
+        return self.path.suffix in COMPRESSIBLE and self.stat.st_size >= COMPRESS_MIN_BYTES
+
+
+def _variant_etag(etag: str, encoding: str) -> str:
+    return f"{etag[:-1]}-{encoding}\""
+
+
+def _accepted(accept_encoding: str) -> set[str]:
+    """Accept-Encoding에서 q=0이 아닌 인코딩"""
+    accepted = set()
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(name.strip().lower())
+    return accepted
+
+
+class PrecompressedStaticFiles:
+    """압축 변형/캐시 헤더/메모리 색인을 쓰는 정적 파일 ASGI 앱"""
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.index: dict[str, StaticEntry] = {}
+        self._scanned = 0.0
+        self.scan()
+
+    def scan(self) -> None:
+        """디렉토리를 훑어 색인 다시 만들기"""
+        index = {}
+        for root, _, files in os.walk(self.directory):
+            names = set(files)
+            for name in files:
+                if name.endswith((".br", ".gz")):
+                    continue
+                path = Path(root) / name
+                rel = path.relative_to(self.directory).as_posix()
+                stat = path.stat()
+                entry = StaticEntry(
+                    path=path,
+                    stat=stat,
+                    media_type=MEDIA_TYPES.get(path.suffix) or mimetypes.guess_type(name)[0] or "application/octet-stream",
+                    immutable=bool(HASHED_ASSET.match(rel)),
+                )
+                # 원본보다 오래된 변형은 이전 빌드의 것이므로 무시
+                for encoding, suffix in ENCODINGS.items():
+                    if name + suffix in names:
+                        variant_stat = (path.parent / (name + suffix)).stat()
+                        if variant_stat.st_mtime_ns >= stat.st_mtime_ns:
+                            entry.variants[encoding] = Variant(
+                                size=variant_stat.st_size,
+                                etag=_variant_etag(entry.etag, encoding),
+                                path=path.parent / (name + suffix),
+                            )
+                index[rel] = entry
+        self.index = index
+        self._scanned = time.monotonic()
+
+    def _find(self, rel: str) -> Optional[str]:
+        candidates = [rel + "index.html"] if rel == "" or rel.endswith("/") else [rel, rel + "/index.html"]
+        return next((key for key in candidates if key in self.index), None)
+
+    def _lookup(self, rel: str) -> Optional[str]:
+        """요청 경로 -> 색인 키"""
+        key = self._find(rel)
+        if key is None and time.monotonic() - self._scanned >= RESCAN_SECONDS:
+            self.scan()
+            key = self._find(rel)
+        spa_route = "." not in rel.rsplit("/", 1)[-1] and not rel.startswith(NO_FALLBACK)
+        if key is None and spa_route and "index.html" in self.index:
+            key = "index.html"
+        return key
+
+    def _current(self, key: str) -> Optional[StaticEntry]:
+        """해시 없는 파일은 요청마다 stat으로 바뀌었는지 확인 (다시 빌드한 index.html)"""
+        entry = self.index[key]
+        if entry.immutable:
+            return entry
+        try:
+            stat = entry.path.stat()
+        except FileNotFoundError:
+            stat = None
+        if stat is None or (stat.st_mtime_ns, stat.st_size) != (entry.stat.st_mtime_ns, entry.stat.st_size):
+            self.scan()
+            return self.index.get(key)
+        return entry
+
+    def _compress(self, entry: StaticEntry) -> None:
+        """빌드에서 만들지 않은 변형을 만들어 저장 (쓸 수 없으면 메모리)"""
+        data = entry.path.read_bytes()
+        encoders = {"gzip": lambda d: gzip.compress(d, compresslevel=9, mtime=0)}
+        brotli = _brotli()
+        if brotli is not None:
+            encoders["br"] = lambda d: brotli.compress(d, quality=11)
+        for encoding, encode in encoders.items():
+            if encoding in entry.variants:
+                continue
+            body = encode(data)
+            if len(body) >= len(data):
+                continue
+            variant = Variant(size=len(body), etag=_variant_etag(entry.etag, encoding))
+            target = entry.path.with_name(entry.path.name + ENCODINGS[encoding])
+            try:
+                tmp = target.with_name(target.name + ".tmp")
+                tmp.write_bytes(body)
+                os.replace(tmp, target)
+                variant.path = target
+            except OSError:
+                variant.body = body
+            entry.variants[encoding] = variant
+
+    def precompress(self) -> int:
+        """압축 변형이 없는 파일을 모두 압축 (시작 시 백그라운드, 첫 요청이 기다리지 않도록)"""
+        count = 0
+        for entry in list(self.index.values()):
+            if entry.compressible and not entry.compressed:
+                entry.compressed = True
+                self._compress(entry)
+                count += 1
+        return count
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["method"] not in ("GET", "HEAD"):
+            await PlainTextResponse("Method Not Allowed", status_code=405)(scope, receive, send)
+            return
+
+        path = scope["path"]
+        root_path = scope.get("root_path", "")
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path):]
+        key = self._lookup(path.lstrip("/"))
+        entry = self._current(key) if key is not None else None
+        if entry is None:
+            await PlainTextResponse("Not Found", status_code=404)(scope, receive, send)
+            return
+
+        if entry.compressible and not entry.compressed:
+            entry.compressed = True
+            await run_in_threadpool(self._compress, entry)
+
+        request_headers = Headers(scope=scope)
+        accepted = _accepted(request_headers.get("accept-encoding", ""))
+        encoding = next((e for e in ENCODINGS if e in accepted and e in entry.variants), None)
+        variant = entry.variants.get(encoding) if encoding else None
+        etag = variant.etag if variant else entry.etag
+
+        headers = {
+            "etag": etag,
+            "last-modified": formatdate(entry.stat.st_mtime, usegmt=True),
+            "cache-control": IMMUTABLE if entry.immutable else REVALIDATE,
+        }
+        if entry.variants:
+            headers["vary"] = "Accept-Encoding"
+
+        if self._not_modified(request_headers, etag, entry.stat.st_mtime):
+            await Response(status_code=304, headers=headers)(scope, receive, send)
+            return
+
+        if variant is None:
+            response = FileResponse(entry.path, headers=headers, media_type=entry.media_type, stat_result=entry.stat)
+        else:
+            headers["content-encoding"] = encoding
+            if variant.body is not None:
+                response = Response(variant.body, headers=headers, media_type=entry.media_type)
+            else:
+                response = FileResponse(variant.path, headers=headers, media_type=entry.media_type)
+        await response(scope, receive, send)
+
+    @staticmethod
+    def _not_modified(headers: Headers, etag: str, mtime: float) -> bool:
+        """If-None-Match가 있으면 그것만, 없으면 If-Modified-Since로 판단"""
+        if_none_match = headers.get("if-none-match")
+        if if_none_match is not None:
+            tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            return "*" in tags or etag in tags
+        if_modified_since = headers.get("if-modified-since")
+        if if_modified_since:
+            try:
+                return int(mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
@@ -0,0 +1,68 @@
+"""변경 로그 기록 (ORM flush 훅)
+
+추적 대상 모델의 추가/수정/삭제를 flush 시점에 change_log에 같은 트랜잭션으로 기록한다.
+테이블 전체를 교체하는 동기화는 mark_replaced()로 행 단위 기록 대신 replace 표시를 남긴다.
+
+ORM을 거치지 않는 쓰기(Core insert/update, 원시 SQL)는 flush 훅에 잡히지 않는다.
+- 세션 보관(archive_service): session_logs 원시 SQL DELETE, mark_replaced로 replace 표시
+- 월별 집계(rollup_service), 월 마감(period_close_service): executemany INSERT,
+  대상 테이블(monthly_session_rollup, month_close_aggregates)이 추적 대상이 아니므로 기록 없음
+- 출석 동기화(attendance_sync_service): member_cache.last_attendance Core UPDATE, 기록 없음
+  (변경 피드로는 마지막 방문일 변경을 알 수 없으므로 /members/{jgjm_key}/last-visit으로 조회)
+"""
+
+from datetime import datetime
+from sqlalchemy import event, insert
+from sqlmodel import Session
+
+from app.db.models.change_log import ChangeLog
+from app.db.models.session_log import SessionLog
+from app.db.models.trainer import Trainer, Staff
+from app.db.models.member_cache import MemberCache
+from app.db.models.lesson_ticket_cache import LessonTicketCache
+
+TRACKED_MODELS = (SessionLog, Trainer, Staff, MemberCache, LessonTicketCache)
+TRACKED_TABLES = {model.__tablename__: model for model in TRACKED_MODELS}
+
+# session.info 키: 이번 트랜잭션에서 전체 교체된 테이블
+REPLACED_KEY = "change_log_replaced"
+
+
+def mark_replaced(session: Session, model) -> None:
+    """테이블 전체 교체 표시 (이번 트랜잭션의 행 단위 기록 생략)"""
+    session.info.setdefault(REPLACED_KEY, set()).add(model.__tablename__)
+    session.add(ChangeLog(table_name=model.__tablename__, op="replace"))
+
+
+def _after_flush(session, flush_context) -> None:
+    """flush된 추적 대상 행을 change_log에 기록"""
+    replaced = session.info.get(REPLACED_KEY, ())
+    now = datetime.now()
+    entries = []
+
+    def add(obj, op: str) -> None:
+        if isinstance(obj, TRACKED_MODELS) and obj.__tablename__ not in replaced:
+            entries.append({"table_name": obj.__tablename__, "row_id": obj.id, "op": op, "changed_at": now})
+
+    for obj in session.new:
+        add(obj, "upsert")
+    for obj in session.dirty:
+        if session.is_modified(obj, include_collections=False):
+            add(obj, "upsert")
+    for obj in session.deleted:
+        add(obj, "delete")
+
+    if entries:
+        session.connection().execute(insert(ChangeLog.__table__), entries)
+
+
+def _clear_replaced(session) -> None:
+    session.info.pop(REPLACED_KEY, None)
+
+
+def install_change_tracking() -> None:
+    """Session flush 훅 등록 (중복 등록 무시)"""
+    if not event.contains(Session, "after_flush", _after_flush):
+        event.listen(Session, "after_flush", _after_flush)
+        event.listen(Session, "after_commit", _clear_replaced)
+        event.listen(Session, "after_rollback", _clear_replaced)
@@ -4,6 +4,14 @@ from app.db.models.member_cache import MemberCache
 from app.db.models.export_log import ExportLog
 from app.db.models.trainer import Trainer, Staff, StaffStatus
 from app.db.models.lesson_ticket_cache import LessonTicketCache
+from app.db.models.monthly_session_rollup import MonthlySessionRollup
+from app.db.models.member_history import MemberHistory
+from app.db.models.lesson_ticket_history import LessonTicketHistory
+from app.db.models.sync_state import SyncState
+from app.db.models.change_log import ChangeLog
+from app.db.models.session_archive import SessionArchive
+from app.db.models.month_close import MonthClose, MonthCloseAggregate, MonthCloseStatus
+from app.db.models.attendance_cache import AttendanceCache
 
 __all__ = [
     "SessionLog",
@@ -14,4 +22,14 @@ __all__ = [
     "Staff",
     "StaffStatus",
     "LessonTicketCache",
+    "MonthlySessionRollup",
+    "MemberHistory",
+    "LessonTicketHistory",
+    "SyncState",
+    "ChangeLog",
+    "SessionArchive",
+    "MonthClose",
+    "MonthCloseAggregate",
+    "MonthCloseStatus",
+    "AttendanceCache",
 ]
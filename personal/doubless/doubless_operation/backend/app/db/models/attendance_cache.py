@@ -0,0 +1,37 @@
+"""출석 캐시 모델 (CRM 출입 기록)"""
+
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import Index
+from sqlmodel import Field, SQLModel
+
+
+class AttendanceCache(SQLModel, table=True):
+    """출석 캐시 테이블 (CRM 데이터, 레거시 attendance 테이블과 같은 기록)"""
+    __tablename__ = "attendance_cache"
+    __table_args__ = (
+        Index("ix_attendance_cache_member_date", "jgjm_key", "attendance_date"),
+        Index("ix_attendance_cache_date_time", "attendance_date", "attendance_time"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+
+    # CRM 키
+    attendance_key: int = Field(unique=True)        # jgm_attendance_key
+    jgjm_key: Optional[int] = None                  # 회원 키
+
+    # 회원 정보
+    member_name: str = ""
+
+    # 출석 시각
+    attendance_date: str                            # YYYY-MM-DD
+    attendance_time: str                            # HH:MM:SS
+    closed_at: Optional[str] = None                 # 퇴장 YYYY-MM-DD HH:MM:SS
+
+    # 이용권/출입문
+    ticket_name: Optional[str] = None
+    door_name: Optional[str] = None
+    status: Optional[str] = None                    # ATTENDANCE 등
+
+    # 동기화
+    synced_at: datetime = Field(default_factory=datetime.now)
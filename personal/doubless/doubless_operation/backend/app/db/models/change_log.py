@@ -0,0 +1,25 @@
+"""변경 로그 모델"""
+
+from datetime import datetime
+from typing import Optional
+from sqlmodel import Field, SQLModel
+
+
+class ChangeLog(SQLModel, table=True):
+    """변경 로그 테이블 (추가 전용)
+
+    id가 변경 버전이며, 클라이언트는 마지막으로 받은 버전 이후의 변경만 조회한다.
+    """
+    __tablename__ = "change_log"
+
+    # 변경 버전
+    id: Optional[int] = Field(default=None, primary_key=True)
+
+    # 대상 테이블/행
+    table_name: str
+    row_id: Optional[int] = None                    # replace 표시는 None
+
+    # upsert, delete, replace (테이블 전체 교체)
+    op: str
+
+    changed_at: datetime = Field(default_factory=datetime.now)
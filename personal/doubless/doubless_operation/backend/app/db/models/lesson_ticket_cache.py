@@ -2,12 +2,16 @@
 
 from datetime import datetime
 from typing import Optional
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
 
 class LessonTicketCache(SQLModel, table=True):
     """수강권 캐시 테이블 (CRM 데이터)"""
     __tablename__ = "lesson_ticket_cache"
+    __table_args__ = (
+        Index("ix_lesson_ticket_cache_remaining_name", "remaining_count", "member_name"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
 
@@ -0,0 +1,50 @@
+"""수강권 이력 모델 (SCD type 2)"""
+
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import Index
+from sqlmodel import Field, SQLModel
+
+
+class LessonTicketHistory(SQLModel, table=True):
+    """수강권 이력 테이블
+
+    동기화 시 내용 해시가 바뀐 경우에만 새 버전을 추가하고 이전 버전의 valid_to를 닫는다.
+    valid_to가 NULL이면 현재 버전.
+    """
+    __tablename__ = "lesson_ticket_history"
+    __table_args__ = (
+        Index("ix_lesson_ticket_history_ticket_valid", "jglesson_ticket_key", "valid_from", "valid_to"),
+        Index("ix_lesson_ticket_history_member_valid", "jgjm_key", "valid_from", "valid_to"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+
+    # CRM 키
+    jglesson_ticket_key: int
+    jgjm_key: int
+
+    # 회원 정보
+    member_name: str
+    member_phone: Optional[str] = None
+
+    # 수강권 정보
+    ticket_type: str
+    total_count: int
+    remaining_count: int
+
+    # 담당 트레이너
+    trainer_key: Optional[int] = None
+    trainer_name: Optional[str] = None
+
+    # 기간
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+
+    # 상태
+    status: Optional[str] = None
+
+    # 이력
+    content_hash: str
+    valid_from: datetime
+    valid_to: Optional[datetime] = Field(default=None, index=True)
@@ -29,5 +29,8 @@ class MemberCache(SQLModel, table=True):
     classification: Optional[str] = None            # 회원 분류
     customer_status: Optional[str] = None           # 회원 상태
 
+    # 마지막 출석 (attendance_cache에서 갱신, 미방문 회원 조회용)
+    last_attendance: Optional[str] = Field(default=None, index=True)   # YYYY-MM-DD HH:MM:SS
+
     # 동기화
     synced_at: datetime = Field(default_factory=datetime.now)
@@ -0,0 +1,43 @@
+"""회원 이력 모델 (SCD type 2)"""
+
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import Index
+from sqlmodel import Field, SQLModel
+
+
+class MemberHistory(SQLModel, table=True):
+    """회원 이력 테이블
+
+    동기화 시 내용 해시가 바뀐 경우에만 새 버전을 추가하고 이전 버전의 valid_to를 닫는다.
+    valid_to가 NULL이면 현재 버전.
+    """
+    __tablename__ = "member_history"
+    __table_args__ = (
+        Index("ix_member_history_key_valid", "jgjm_key", "valid_from", "valid_to"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+
+    # CRM 키
+    jgjm_key: int
+
+    # 기본 정보
+    name: str
+    phone: Optional[str] = None
+    gender: Optional[str] = None
+
+    # 이용권 현황
+    trainer_name: Optional[str] = None
+    pt_remaining: Optional[int] = None
+    pt_total: Optional[int] = None
+    membership_end: Optional[str] = None
+
+    # 분류
+    classification: Optional[str] = None
+    customer_status: Optional[str] = None
+
+    # 이력
+    content_hash: str
+    valid_from: datetime
+    valid_to: Optional[datetime] = Field(default=None, index=True)
@@ -0,0 +1,69 @@
+"""월 마감 모델"""
+
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+from sqlalchemy import Index, text
+from sqlmodel import Field, SQLModel
+
+
+class MonthCloseStatus(str, Enum):
+    """마감 상태"""
+    CLOSED = "closed"
+    REOPENED = "reopened"       # 재오픈되어 스냅샷 무효
+
+
+class MonthClose(SQLModel, table=True):
+    """월 마감 테이블
+
+    월마다 마감할 때마다 한 행이 추가되며, status가 closed인 행이 현재 유효한 마감이다.
+    유효한 마감은 월마다 하나뿐이도록 부분 유니크 인덱스로 막는다 (동시 마감 요청).
+    checksum은 마감 시점 해당 월 세션 원본 행의 SHA-256이다.
+    """
+    __tablename__ = "month_closes"
+    __table_args__ = (
+        Index("ix_month_closes_month_status", "year_month", "status"),
+        # Enum 컬럼은 이름(CLOSED)으로 저장됨
+        Index(
+            "ix_month_closes_active_month", "year_month", unique=True,
+            sqlite_where=text(f"status = '{MonthCloseStatus.CLOSED.name}'"),
+        ),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+
+    year_month: str                                  # YYYY-MM
+    status: MonthCloseStatus = Field(default=MonthCloseStatus.CLOSED)
+
+    # 마감 시점 요약
+    session_count: int = 0
+    checksum: str
+
+    closed_at: datetime = Field(default_factory=datetime.now)
+    closed_by: Optional[str] = None
+
+    # 재오픈
+    reopened_at: Optional[datetime] = None
+    reopened_by: Optional[str] = None
+    reopen_reason: Optional[str] = None
+
+
+class MonthCloseAggregate(SQLModel, table=True):
+    """월 마감 집계 스냅샷 (변경하지 않음)
+
+    member_name이 없는 행은 트레이너 합계, 있는 행은 트레이너별 회원 집계다.
+    """
+    __tablename__ = "month_close_aggregates"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    close_id: int = Field(foreign_key="month_closes.id", index=True)
+
+    # 집계 키
+    trainer_name: str
+    member_name: Optional[str] = None
+    session_type: str
+    session_status: str
+
+    # 집계 값
+    session_count: int = 0
+    event_count: int = 0
@@ -0,0 +1,38 @@
+"""월별 세션 집계 모델"""
+
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import UniqueConstraint
+from sqlmodel import Field, SQLModel
+
+
+class MonthlySessionRollup(SQLModel, table=True):
+    """월별 트레이너/회원 세션 집계 테이블
+
+    session_logs 쓰기 시 증분 갱신되며, 월 단위로 재계산할 수 있다.
+    (year_month, trainer_name, member_name, session_type, session_status) 유니크 인덱스가
+    월 단위 조회의 범위 검색 인덱스를 겸한다.
+    """
+    __tablename__ = "monthly_session_rollup"
+    __table_args__ = (
+        UniqueConstraint(
+            "year_month", "trainer_name", "member_name", "session_type", "session_status",
+            name="uq_monthly_session_rollup_key",
+        ),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+
+    # 집계 키
+    year_month: str                                  # YYYY-MM
+    trainer_name: str
+    member_name: str
+    session_type: str                                # PT, OT, 기타
+    session_status: str                              # completed, cancelled, no_show, payment
+
+    # 집계 값
+    session_count: int = 0
+    event_count: int = 0                             # 이벤트권 세션 수
+
+    # 시스템
+    updated_at: datetime = Field(default_factory=datetime.now)
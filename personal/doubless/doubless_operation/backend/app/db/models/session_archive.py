@@ -0,0 +1,19 @@
+"""세션 보관 모델"""
+
+from datetime import datetime
+from typing import Optional
+from sqlmodel import Field, SQLModel
+
+
+class SessionArchive(SQLModel, table=True):
+    """보관된 월 목록 (session_logs에서 session_archive_YYYY.db로 옮긴 월)"""
+    __tablename__ = "session_archives"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+
+    year_month: str = Field(unique=True, index=True)   # YYYY-MM
+    year: int
+    file_name: str                                      # session_archive_YYYY.db
+    session_count: int = 0
+
+    archived_at: datetime = Field(default_factory=datetime.now)
@@ -3,6 +3,7 @@
 from datetime import datetime
 from enum import Enum
 from typing import Optional
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
 
@@ -17,13 +18,20 @@ class SessionStatus(str, Enum):
 class SessionLog(SQLModel, table=True):
     """업무일지 테이블"""
     __tablename__ = "session_logs"
+    __table_args__ = (
+        Index("ix_session_logs_date_time", "session_date", "session_time"),
+        Index("ix_session_logs_member_date_time", "member_key", "session_date", "session_time"),
+        Index("ix_session_logs_member_name_date_time", "member_name", "session_date", "session_time"),
+        Index("ix_session_logs_trainer_date", "trainer_name", "session_date"),
+        Index("ix_session_logs_exported", "exported"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
 
     # 기본 정보
     session_date: str = Field(index=True)           # YYYY-MM-DD
     session_time: str                                # HH:MM
-    trainer_name: str = Field(index=True)            # 트레이너명
+    trainer_name: str                                # 트레이너명
     member_name: str                                 # 회원명
     member_key: Optional[int] = None                 # CRM jgjm_key (선택)
 
@@ -31,6 +39,8 @@ class SessionLog(SQLModel, table=True):
     session_type: str = Field(default="PT")          # PT, OT, 기타
     session_status: SessionStatus = Field(default=SessionStatus.COMPLETED)
     session_index: Optional[str] = None              # "15/20" 형태
+    session_no: Optional[int] = None                 # 회차 (15)
+    session_total: Optional[int] = None              # 총 회차 (20)
 
     # 급여 관련
     is_event: bool = Field(default=False)            # 이벤트권 여부
@@ -0,0 +1,24 @@
+"""동기화 상태 모델"""
+
+from datetime import datetime
+from typing import Optional
+from sqlmodel import Field, SQLModel
+
+
+class SyncState(SQLModel, table=True):
+    """동기화 상태 테이블 (대상별 마지막 동기화 시각)"""
+    __tablename__ = "sync_state"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+
+    # 동기화 대상 (members, lesson_tickets 등)
+    name: str = Field(unique=True, index=True)
+
+    # 마지막 동기화
+    last_sync_at: Optional[datetime] = None
+    last_sync_mode: Optional[str] = None            # full, incremental
+    last_full_sync_at: Optional[datetime] = None
+
+    # 마지막 동기화 통계
+    last_fetched: int = 0
+    last_changed: int = 0
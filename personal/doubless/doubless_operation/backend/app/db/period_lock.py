@@ -0,0 +1,64 @@
+"""마감 월 세션 수정 차단 (ORM flush 훅)
+
+마감된 월(month_closes.status = closed)의 session_logs 행을 추가/수정/삭제하는 flush를 막는다.
+내보내기 표시(exported, export_id)와 session_index에서 파생되는 회차 번호(session_no, session_total)만
+바뀌는 수정은 허용한다. 회차 번호는 마감 체크섬(CHECKSUM_COLUMNS)에 들어가지 않고, 원본인 session_index는 잠겨 있다.
+"""
+
+from sqlalchemy import event, inspect, select
+from sqlmodel import Session
+
+from app.db.models.month_close import MonthClose, MonthCloseStatus
+from app.db.models.session_log import SessionLog
+
+# 마감 월에도 바뀔 수 있는 컬럼 (회차 번호는 backfill_session_numbers가 채움)
+UNLOCKED_COLUMNS = {"exported", "export_id", "updated_at", "session_no", "session_total"}
+
+
+class MonthClosedError(Exception):
+    """마감된 월 수정 시도"""
+
+    def __init__(self, months: list[str]):
+        self.months = months
+        super().__init__(f"Month is closed: {', '.join(months)} (reopen it first)")
+
+
+def _touched_months(session) -> set[str]:
+    """이번 flush에서 바뀌는 세션의 월 (수정은 변경 전 월 포함)"""
+    months = set()
+    for obj in session.new:
+        if isinstance(obj, SessionLog):
+            months.add(obj.session_date[:7])
+    for obj in session.deleted:
+        if isinstance(obj, SessionLog):
+            months.add(obj.session_date[:7])
+    for obj in session.dirty:
+        if not isinstance(obj, SessionLog):
+            continue
+        state = inspect(obj)
+        changed = {attr.key for attr in state.attrs if attr.history.has_changes()}
+        if not changed - UNLOCKED_COLUMNS:
+            continue
+        months.add(obj.session_date[:7])
+        months.update(d[:7] for d in state.attrs.session_date.history.deleted if d)
+    return months
+
+
+def _before_flush(session, flush_context, instances) -> None:
+    """마감 월 세션 변경이 있으면 MonthClosedError"""
+    months = _touched_months(session)
+    if not months:
+        return
+    closed = session.connection().execute(
+        select(MonthClose.year_month)
+        .where(MonthClose.status == MonthCloseStatus.CLOSED)
+        .where(MonthClose.year_month.in_(months))
+    ).scalars().all()
+    if closed:
+        raise MonthClosedError(sorted(set(closed)))
+
+
+def install_period_lock() -> None:
+    """Session flush 훅 등록 (중복 등록 무시)"""
+    if not event.contains(Session, "before_flush", _before_flush):
+        event.listen(Session, "before_flush", _before_flush)
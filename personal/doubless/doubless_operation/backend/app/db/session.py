@@ -1,43 +1,248 @@
-"""데이터베이스 세션 관리"""
+"""데이터베이스 세션 관리
 
+기본 센터는 모듈 전역 engine을 쓰고, 추가 센터 엔진은 EnginePool이 처음 요청될 때 열어
+테이블을 만들고, center_engine_idle_seconds 동안 쓰이지 않으면 닫는다.
+"""
+
+import asyncio
+import re
+import threading
+import time
+import zlib
 from contextlib import contextmanager
-from typing import Generator
+from functools import lru_cache
+from typing import Generator, Optional
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine, make_url
 from sqlmodel import Session, SQLModel, create_engine
 from pathlib import Path
 
+from app.core.centers import get_center, get_centers
 from app.core.config import get_settings
+from app.db.change_tracking import install_change_tracking
+from app.db.period_lock import install_period_lock
+from app.db.sqlite_pragmas import install_sqlite_pragmas
 
 settings = get_settings()
 
 # 데이터 디렉토리 생성
 settings.data_dir.mkdir(parents=True, exist_ok=True)
 
-# SQLite 엔진 생성
-engine = create_engine(
-    settings.database_url,
-    echo=settings.debug,
-    connect_args={"check_same_thread": False},
+
+def _create_engine(database_url: str) -> Engine:
+    """SQLite 엔진 생성 (WAL 등 연결 설정 포함)"""
+    new_engine = create_engine(
+        database_url,
+        echo=settings.debug,
+        connect_args={"check_same_thread": False},
+    )
+    install_sqlite_pragmas(new_engine)
+    return new_engine
+
+
+# 기본 센터 엔진
+engine = _create_engine(settings.database_url)
+
+# 추적 대상 테이블 변경을 change_log에 기록
+install_change_tracking()
+
+# 마감된 월 세션 수정 차단
+install_period_lock()
+
+
+# 모델에서 빠진 인덱스 (기존 DB에 남아 있으면 쓰기마다 갱신 비용만 듦)
+DROPPED_INDEXES = (
+    "ix_session_logs_trainer_name",                 # (trainer_name, session_date) 복합 인덱스로 대체
 )
 
 
-def init_db() -> None:
-    """데이터베이스 초기화 (테이블 생성)"""
-    # 모델 임포트 (테이블 생성을 위해)
-    from app.db.models import session_log, member_cache, export_log  # noqa: F401
+@lru_cache
+def schema_version() -> int:
+    """모델 스키마 지문 (테이블/컬럼/인덱스가 바뀌면 달라지는 양의 32비트 정수)"""
+    from app.db import models  # noqa: F401  모든 테이블을 metadata에 등록
+
+    parts = []
+    for table in sorted(SQLModel.metadata.sorted_tables, key=lambda t: t.name):
+        parts.append(table.name)
+        parts += [f"{c.name}:{c.type}:{c.nullable}:{c.primary_key}:{c.unique}" for c in table.columns]
+        parts += sorted(f"{i.name}:{','.join(c.name for c in i.columns)}:{i.unique}" for i in table.indexes)
+    return zlib.crc32("\n".join(parts).encode()) & 0x7FFFFFFF or 1
+
+
+def init_db(target: Optional[Engine] = None) -> bool:
+    """데이터베이스 초기화 (테이블/컬럼/인덱스 생성, target을 생략하면 기본 센터)
+
+    스키마 지문을 PRAGMA user_version에 저장해 두고, 같으면 건너뛴다 (매 시작마다 create_all/인덱스 확인 생략).
+    스키마를 갱신했으면 True.
+    """
+    target = target or engine
+    version = schema_version()
+    with target.connect() as conn:
+        if conn.exec_driver_sql("PRAGMA user_version").scalar() == version:
+            return False
+
+    existing = set(inspect(target).get_table_names())
+    SQLModel.metadata.create_all(target)
+    _add_missing_columns(target)
+
+    # 기존 테이블에 추가된 인덱스 생성 (create_all은 기존 테이블의 인덱스를 만들지 않음)
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(target, checkfirst=True)
+
+    with target.begin() as conn:
+        for name in DROPPED_INDEXES:
+            conn.exec_driver_sql(f"DROP INDEX IF EXISTS {name}")
+
+    # 기존 DB에 월별 집계 테이블이 새로 생겼으면 기존 세션으로 채움 (비어 있으면 /reports/monthly가 0건)
+    if "session_logs" in existing and "monthly_session_rollup" not in existing:
+        _backfill_rollup(target)
+
+    with target.begin() as conn:
+        conn.exec_driver_sql(f"PRAGMA user_version = {version}")
+    return True
+
+
+def _backfill_rollup(target: Engine) -> None:
+    """monthly_session_rollup 전체 재계산"""
+    from app.services.rollup_service import RollupService
+
+    with Session(target) as session:
+        RollupService(session).rebuild_all()
+
+
+def _add_missing_columns(target: Engine) -> None:
+    """기존 테이블에 모델에 추가된 컬럼 생성 (nullable 컬럼만)"""
+    inspector = inspect(target)
+    with target.begin() as conn:
+        for table in SQLModel.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {c["name"] for c in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing or not column.nullable:
+                    continue
+                column_type = column.type.compile(dialect=target.dialect)
+                conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN "{column.name}" {column_type}'))
+
+
+class EnginePool:
+    """센터별 엔진 (추가 센터는 처음 쓸 때 열고, 오래 쓰지 않으면 닫음)"""
+
+    def __init__(self):
+        self._engines: dict[str, Engine] = {}
+        self._last_used: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def get(self, code: Optional[str] = None) -> Engine:
+        """센터 엔진 (code를 생략하면 현재 센터)"""
+        center = get_center(code)
+        if center.is_default:
+            return engine
+
+        self._last_used[center.code] = time.monotonic()
+        opened = self._engines.get(center.code)
+        if opened is not None:
+            return opened
+        with self._lock:
+            opened = self._engines.get(center.code)
+            if opened is None:
+                center.data_dir.mkdir(parents=True, exist_ok=True)
+                opened = _create_engine(center.database_url)
+                init_db(opened)
+                self._engines[center.code] = opened
+            return opened
+
+    def opened(self) -> list[str]:
+        """열려 있는 추가 센터 코드"""
+        return list(self._engines)
+
+    def evict_idle(self, max_idle_seconds: float) -> list[str]:
+        """오래 쓰지 않은 추가 센터 엔진 닫기 (사용 중인 연결이 있으면 유지)"""
+        now = time.monotonic()
+        evicted = []
+        with self._lock:
+            for code, opened in list(self._engines.items()):
+                if now - self._last_used.get(code, 0) < max_idle_seconds:
+                    continue
+                if opened.pool.checkedout():
+                    continue
+                del self._engines[code]
+                opened.dispose()
+                evicted.append(code)
+        return evicted
+
+
+# 프로세스 단위 엔진 풀
+engines = EnginePool()
+
+
+async def run_engine_eviction() -> None:
+    """유휴 센터 엔진 정리 (앱 lifespan에서 태스크로 실행)"""
+    idle = settings.center_engine_idle_seconds
+    if idle <= 0 or len(get_centers()) == 1:
+        return
+    while True:
+        await asyncio.sleep(min(idle, 60))
+        engines.evict_idle(idle)
+
+
+# 세션 보관 파일 (archive_service.archive_file_name)
+ARCHIVE_FILE = re.compile(r"^session_archive_\d{4}\.db$")
+
+
+def _sqlite_path(database_url: str) -> Optional[Path]:
+    """SQLite 파일 경로 (파일 DB가 아니면 None)"""
+    url = make_url(database_url)
+    if url.get_backend_name() != "sqlite" or not url.database or url.database == ":memory:":
+        return None
+    return Path(url.database).resolve()
+
+
+def database_files() -> dict[str, Path]:
+    """백업/유지보수 대상 SQLite 파일 (이름 -> 경로, 파일이 있는 것만)
+
+    기본 센터는 operation, 추가 센터는 operation_<센터 코드>
+    """
+    files = {}
+    for code, center in get_centers().items():
+        path = _sqlite_path(center.database_url)
+        if path:
+            files["operation" if center.is_default else f"operation_{code}"] = path
+    files["doubless"] = settings.doubless_db.resolve()
+    return {name: path for name, path in files.items() if path.exists()}
+
+
+def archive_files() -> dict[str, Path]:
+    """센터별 세션 보관 파일 (이름 -> 경로)
+
+    기본 센터는 session_archive_YYYY, 추가 센터는 session_archive_YYYY_<센터 코드>
+    """
+    files = {}
+    for code, center in get_centers().items():
+        for path in sorted(center.data_dir.glob("session_archive_*.db")):
+            match = ARCHIVE_FILE.match(path.name)
+            if match:
+                name = path.stem if center.is_default else f"{path.stem}_{code}"
+                files[name] = path.resolve()
+    return files
+
 
-    SQLModel.metadata.create_all(engine)
+def get_engine(code: Optional[str] = None) -> Engine:
+    """센터 엔진 (code를 생략하면 현재 센터)"""
+    return engines.get(code)
 
 
 def get_session() -> Generator[Session, None, None]:
-    """FastAPI 의존성용 세션"""
-    with Session(engine) as session:
+    """FastAPI 의존성용 세션 (요청 센터의 DB)"""
+    with Session(get_engine()) as session:
         yield session
 
 
 @contextmanager
 def get_session_context() -> Generator[Session, None, None]:
-    """컨텍스트 매니저용 세션"""
-    session = Session(engine)
+    """컨텍스트 매니저용 세션 (현재 센터의 DB)"""
+    session = Session(get_engine())
     try:
         yield session
         session.commit()
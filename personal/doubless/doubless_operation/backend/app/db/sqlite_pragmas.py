@@ -0,0 +1,39 @@
+"""SQLite 연결 설정 (엔진 connect 훅)
+
+WAL 모드에서는 읽기와 쓰기가 서로 막지 않으므로 SSE/대시보드 조회가 많아도 쓰기가 밀리지 않는다.
+WAL에서는 synchronous=NORMAL로도 커밋 단위 일관성이 유지된다 (전원 차단 시 마지막 커밋만 유실 가능).
+journal_size_limit는 체크포인트 후 WAL 파일을 이 크기로 줄여 파일이 계속 커지지 않게 한다.
+"""
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import get_settings
+
+
+def apply_pragmas(dbapi_connection) -> None:
+    """연결 하나에 설정 적용 (sqlite3.Connection)"""
+    settings = get_settings()
+    cursor = dbapi_connection.cursor()
+    try:
+        if settings.sqlite_wal:
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA cache_size=-{int(settings.sqlite_cache_size_kb)}")
+        cursor.execute(f"PRAGMA journal_size_limit={int(settings.sqlite_journal_size_limit_mb) * 1024 * 1024}")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+    finally:
+        cursor.close()
+
+
+def _on_connect(dbapi_connection, connection_record) -> None:
+    apply_pragmas(dbapi_connection)
+
+
+def install_sqlite_pragmas(engine: Engine) -> None:
+    """엔진 connect 훅 등록 (SQLite 파일 DB만, 중복 등록 무시)"""
+    database = engine.url.database
+    if engine.url.get_backend_name() != "sqlite" or not database or database == ":memory:":
+        return
+    if not event.contains(engine, "connect", _on_connect):
+        event.listen(engine, "connect", _on_connect)
@@ -3,23 +3,49 @@ Doubless Operation - 센터 운영 시스템
 업무일지 작성 및 데이터 추출
 """
 
-from contextlib import asynccontextmanager
-from fastapi import FastAPI
+# 시작 시간 측정은 다른 임포트보다 먼저
+from app.core import startup
+
+import asyncio
+from contextlib import asynccontextmanager, suppress
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import JSONResponse
 from pathlib import Path
 
 from app.api.v1.router import api_router
-from app.db.session import init_db
+from app.core.activity import ActivityMiddleware
+from app.core.centers import CenterMiddleware
+from app.core.static_files import PrecompressedStaticFiles
+from app.db.session import init_db, run_engine_eviction
+from app.db.period_lock import MonthClosedError
+from app.services.backup_service import run_backup_schedule
+from app.services.maintenance_service import run_maintenance_schedule
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """앱 라이프사이클 관리"""
-    # 시작 시 DB 초기화
-    init_db()
+    # 시작 시 DB 초기화 (스키마 버전이 같으면 건너뜀)
+    updated = init_db()
+    startup.mark("init_db", "스키마 갱신" if updated else "변경 없음")
+    # 주기적 DB 백업, 유지보수
+    tasks = [
+        asyncio.create_task(run_backup_schedule()),
+        asyncio.create_task(run_maintenance_schedule()),
+        asyncio.create_task(run_engine_eviction()),
+    ]
+    # 프론트엔드 빌드 압축 변형 미리 만들기
+    if static_files is not None:
+        tasks.append(asyncio.create_task(asyncio.to_thread(static_files.precompress)))
+    startup.mark("ready")
+    startup.log_report()
     yield
     # 종료 시 정리 작업
+    for task in tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
 
 
 app = FastAPI(
@@ -38,19 +64,35 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 유휴 시간 판단용 요청 시각 기록
+app.add_middleware(ActivityMiddleware)
+
+# 헤더/경로 접두사로 요청 센터 지정
+app.add_middleware(CenterMiddleware)
+
+@app.exception_handler(MonthClosedError)
+async def month_closed_handler(request: Request, exc: MonthClosedError):
+    """마감된 월 세션 수정 시도 -> 409"""
+    return JSONResponse(status_code=409, content={"detail": str(exc), "months": exc.months})
+
+
 # API 라우터 등록
 app.include_router(api_router, prefix="/api/v1")
 
-# 정적 파일 서빙 (프론트엔드 빌드)
-static_path = Path(__file__).parent.parent / "static"
-if static_path.exists():
-    app.mount("/", StaticFiles(directory=static_path, html=True), name="static")
-
 
 @app.get("/health")
 async def health_check():
-    """헬스 체크"""
-    return {"status": "healthy", "service": "doubless-operation"}
+    """헬스 체크 (시작 단계별 소요 시간 포함)"""
+    return {"status": "healthy", "service": "doubless-operation", "startup": startup.report()}
+
+
+# 정적 파일 서빙 (프론트엔드 빌드, 압축 변형/캐시 헤더), "/" 마운트가 /health를 가리지 않도록 마지막에 등록
+static_path = Path(__file__).parent.parent / "static"
+static_files = PrecompressedStaticFiles(static_path) if static_path.exists() else None
+if static_files is not None:
+    app.mount("/", static_files, name="static")
+
+startup.mark("imports")
 
 
 if __name__ == "__main__":
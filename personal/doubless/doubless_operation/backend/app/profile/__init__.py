@@ -0,0 +1,22 @@
+"""프로파일러 (python -m app.profile)
+
+profiler/memory 모듈은 표준 라이브러리만 쓰므로 앱 설정 없이도 임포트할 수 있다 (레거시 스크립트 --profile).
+targets/sql은 앱 설정을 읽으므로 __main__에서 환경을 준비한 뒤 임포트한다.
+서비스가 memory_stage만 쓰더라도 cProfile/pstats까지 읽지 않도록 이름은 처음 쓸 때 임포트한다.
+"""
+
+import importlib
+
+_EXPORTS = {
+    "MemoryTracker": "app.profile.memory",
+    "memory_stage": "app.profile.memory",
+    "Profiler": "app.profile.profiler",
+}
+
+__all__ = ["MemoryTracker", "Profiler", "memory_stage"]
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
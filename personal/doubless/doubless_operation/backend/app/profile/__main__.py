@@ -0,0 +1,132 @@
+"""python -m app.profile <대상> [옵션]
+
+임시 디렉토리에 가상 운영 DB(app.benchmark.datagen)를 만들고 대상 하나를 프로파일링해
+상위 함수, SQL/Python 시간, 상위 SQL, 접힌 스택 파일(flamegraph용)을 남긴다.
+CRM 동기화 대상은 같은 프로세스의 Broj 대역 서버(127.0.0.1)로 보내므로 네트워크 없이 실행된다.
+
+대상:
+    export_sessions, export_worklog, export_payroll, sync_members, sync_lesson_tickets,
+    rebuild_rollups, close_period       서비스 작업
+    "GET /sessions/grid" 등             벤치마크 경로 이름 (엔드포인트를 --repeat번 호출)
+    monthly_session_analysis [-- 인자]  레거시 월별 세션 분석 (가상 급여 DB)
+    script <경로> [-- 인자]             임의 스크립트 (runpy)
+
+결과: backend/data/profiles/<대상>_<시각>.txt / .collapsed / .pstats
+    flamegraph.pl <파일>.collapsed > flame.svg   (speedscope는 .collapsed를 바로 연다)
+    python -m pstats <파일>.pstats               (snakeviz 등)
+
+사용법 (backend 디렉토리에서):
+    python -m app.profile --list
+    python -m app.profile export_sessions [--mode cprofile|sample] [--top 30]
+    python -m app.profile "GET /sessions/grid" --repeat 50 --members 5000 --sessions 30000
+    python -m app.profile sync_members --mode sample
+    python -m app.profile script ../scripts/archive_sessions.py -- --dry-run
+    python -m app.profile monthly_session_analysis -- -m 3
+"""
+
+import argparse
+import contextlib
+import re
+import shutil
+import sys
+import tempfile
+from datetime import date, datetime
+from pathlib import Path
+
+from app.benchmark.env import JGROUP_KEY, free_port, prepare_environment
+from app.profile.profiler import MODES, Profiler
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m app.profile", description="엔드포인트/스크립트 프로파일러")
+    parser.add_argument("target", nargs="?", help='대상 이름 또는 경로 이름 (예: export_sessions, "GET /sessions")')
+    parser.add_argument("args", nargs="*", help="script 경로 (대상 인자는 -- 뒤에)")
+    parser.add_argument("--list", action="store_true", help="대상 목록")
+    parser.add_argument("--mode", choices=MODES, default="cprofile", help="cprofile: 정확, sample: 부하 적음/스레드 포함")
+    parser.add_argument("--top", type=int, default=30, help="상위 함수 수")
+    parser.add_argument("--interval-ms", type=float, default=5, help="스택 샘플 간격")
+    parser.add_argument("--repeat", type=int, default=None, help="엔드포인트 호출 수 (기본 20, 무거운 요청 1)")
+    parser.add_argument("--members", type=int, default=20_000, help="회원 수")
+    parser.add_argument("--sessions", type=int, default=100_000, help="세션 수")
+    parser.add_argument("--trainers", type=int, default=12, help="트레이너 수")
+    parser.add_argument("--months", type=int, default=24, help="세션 기간 (개월)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=Path, default=BACKEND_DIR / "data" / "profiles", help="결과 디렉토리")
+    parser.add_argument("--keep", action="store_true", help="임시 DB 디렉토리 남기기")
+    argv, passthrough = sys.argv[1:], []
+    if "--" in argv:
+        split = argv.index("--")
+        argv, passthrough = argv[:split], argv[split + 1:]
+    args = parser.parse_args(argv)
+    args.args += passthrough
+
+    work_dir = Path(tempfile.mkdtemp(prefix="doubless_profile_"))
+    crm_port = free_port()
+    prepare_environment(work_dir, crm_port)
+
+    # 환경 준비 후 앱 임포트
+    from app.benchmark.datagen import Scale, generate
+    from app.benchmark.routes import ROUTES
+    from app.benchmark.runner import STUB_THREAD, CrmStubServer
+    from app.broj_stub import SyntheticCrm
+    from app.profile.sql import SqlTimer
+    from app.profile.targets import TARGETS, TargetContext, resolve
+
+    try:
+        if args.list or not args.target:
+            print("대상:")
+            for target in TARGETS.values():
+                print(f"  {target.name:<45} {target.description}")
+            print("\n엔드포인트 (벤치마크 경로 이름):")
+            for route in ROUTES:
+                print(f"  {route.name}")
+            return
+
+        try:
+            target = resolve(args.target)
+        except KeyError:
+            print(f"알 수 없는 대상: {args.target} (--list로 확인)")
+            sys.exit(1)
+
+        print("=" * 50)
+        print(f"프로파일링: {target.name} ({args.mode})")
+        print("=" * 50)
+
+        today = date.today()
+        scale = Scale(members=args.members, sessions=args.sessions, trainers=args.trainers, months=args.months, seed=args.seed)
+        crm = SyntheticCrm(members=scale.members, seed=scale.seed, today=today, jgroup_key=JGROUP_KEY)
+        if target.synthetic:
+            print(f"\n[1/2] 데이터 생성 ({work_dir})")
+            generate(scale, crm=crm, today=today, verbose=True)
+
+        ctx = TargetContext(today=today, seed=args.seed, work_dir=work_dir, crm=crm, repeat=args.repeat, args=args.args)
+        print(f"\n[2/2] 실행")
+        with CrmStubServer(crm, crm_port) if target.crm else contextlib.nullcontext():
+            run = target.prepare(ctx)
+            profiler = Profiler(args.mode, args.interval_ms / 1000, exclude_threads=[STUB_THREAD])
+            with SqlTimer() as sql, profiler:
+                summary = run()
+        print(f"  결과: {summary}")
+
+        report = f"대상: {target.name}\n{profiler.report(args.top, sql.seconds)}"
+        if sql.count:
+            report += "\n\n" + sql.report()
+        name = f"{re.sub(r'[^0-9A-Za-z]+', '_', target.name).strip('_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        paths = profiler.save(args.output, name, report)
+
+        print()
+        print(report)
+        print(f"\n프로파일링 완료! {profiler.seconds:.2f}초")
+        for path in paths:
+            print(f"  - {path}")
+    finally:
+        if args.keep:
+            print(f"  임시 DB: {work_dir}")
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""레거시 분석 스크립트용 가상 doubless.db
+
+programs/scripts/legacy/create_doubless_db.py의 스키마/적재 함수를 그대로 써서 임시 doubless.db를 만든다.
+수강권은 Broj 대역 서버와 같은 SyntheticCrm 데이터를 동기화 JSON으로 적재하고, 트레이너(employees)와
+월별 수업내역(salary_records)은 그 수강권의 담당 트레이너/회원으로 만든다.
+"""
+
+import contextlib
+import importlib.util
+import io
+import json
+import random
+import sqlite3
+from pathlib import Path
+from types import ModuleType
+
+from app.broj_stub.dataset import TRAINERS, SyntheticCrm
+
+LEGACY_DIR = Path(__file__).resolve().parents[4] / "programs" / "scripts" / "legacy"
+
+
+def load_legacy(name: str) -> ModuleType:
+    """레거시 스크립트를 모듈로 로드 (main은 실행하지 않음)"""
+    path = LEGACY_DIR / f"{name}.py"
+    if not path.exists():
+        raise FileNotFoundError(f"Legacy script not found: {path}")
+    spec = importlib.util.spec_from_file_location(f"legacy_{name}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def build_salary_db(db_path: Path, crm: SyntheticCrm, year: int, seed: int = 42) -> dict:
+    """year년 1~12월 수업내역이 있는 doubless.db 생성"""
+    schema = load_legacy("create_doubless_db")
+    rng = random.Random(seed)
+
+    tickets = [crm.lesson_ticket(p) for p in range(len(crm.lesson_ticket_owners))]
+    sync_dir = db_path.parent / "sync"
+    sync_dir.mkdir(parents=True, exist_ok=True)
+    (sync_dir / "lesson_tickets.json").write_text(
+        json.dumps({"lesson_tickets": tickets}, ensure_ascii=False), encoding="utf-8"
+    )
+    (sync_dir / "sync_info.json").write_text(
+        json.dumps({"sync_id": "profile", "files": {"lesson_tickets": "lesson_tickets.json"}}), encoding="utf-8"
+    )
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    with contextlib.redirect_stdout(io.StringIO()):
+        schema.create_member_tables(cursor)
+        schema.create_salary_tables(cursor)
+        schema.create_indexes(cursor)
+        schema.load_lesson_tickets_from_json(cursor, sync_dir)
+
+    # 마지막 트레이너는 퇴사자
+    cursor.executemany(
+        "INSERT INTO employees (name, job_type, status, start_date) VALUES (?, '트레이너', ?, ?)",
+        [(name, "퇴사" if i == len(TRAINERS) - 1 else "근무", f"{year - 1}-0{i % 9 + 1}-01") for i, name in enumerate(TRAINERS)],
+    )
+
+    # 수강권별 잔여 세션을 월마다 줄여 가며 기록 (중간 이탈/복귀/급감이 섞이도록)
+    rows = []
+    remaining = {}
+    for month in range(1, 13):
+        for ticket in tickets:
+            if ticket["kind"] != "PT" or rng.random() < 0.15:
+                continue
+            key = (ticket["trainer_name"], ticket["jgjm_member_name"])
+            registered = ticket["jglesson_origin_ticket_count"]
+            left = remaining.get(key, registered)
+            done = min(left, rng.choice((0, 1, 2, 4, 4, 6, 8)))
+            if rng.random() < 0.03:
+                done += 1                           # 잔여 초과 진행
+            left = max(left - done, 0)
+            remaining[key] = left
+            unit_price = rng.choice((50_000, 55_000, 60_000))
+            rows.append((
+                year, f"{month}월", key[0], key[1], ticket["jgjm_member_sex"],
+                registered, registered - left, left, unit_price, done, done * unit_price,
+            ))
+    cursor.executemany("""
+        INSERT OR IGNORE INTO salary_records
+            (년도, 월, 트레이너, 회원명, 성별, 등록세션, 총진행세션, 남은세션, 회단가, 당월진행세션, 당월수업료)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, rows)
+    conn.commit()
+    conn.close()
+    return {"lesson_tickets": len(tickets), "salary_records": len(rows)}
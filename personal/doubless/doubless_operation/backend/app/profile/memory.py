@@ -0,0 +1,218 @@
+"""메모리 측정 (tracemalloc + RSS)
+
+MemoryTracker 블록 안에서 memory_stage("fetch") 등으로 나눈 단계마다
+tracemalloc 최대/증가량과 RSS를 기록한다. 트래커가 없으면 memory_stage는 아무 일도 하지 않으므로
+서비스 코드에 그대로 둔다. 단계는 중첩하지 않는다 (안쪽 단계는 무시).
+같은 이름의 단계를 여러 번 지나면 (시트마다 읽기 등) 하나로 합친다.
+tracemalloc 자체가 메모리와 시간을 쓰므로 RSS와 시간은 trace=False로 따로 재는 편이 정확하다.
+RSS는 Linux(/proc), Windows(GetProcessMemoryInfo)에서 읽고, 그 외에는 최대값만 resource로 읽는다.
+"""
+
+import contextlib
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from typing import Optional
+
+MB = 1024 * 1024
+
+_active: Optional["MemoryTracker"] = None
+_NULL = contextlib.nullcontext()
+
+
+def _proc_status(key: str) -> int:
+    with open("/proc/self/status", encoding="ascii") as f:
+        for line in f:
+            if line.startswith(key + ":"):
+                return int(line.split()[1]) * 1024
+    return 0
+
+
+def _windows_counters():
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(counters)
+    process = ctypes.windll.kernel32.GetCurrentProcess()
+    ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb)
+    return counters
+
+
+def rss_bytes() -> int:
+    """현재 RSS (모르면 최대 RSS)"""
+    if sys.platform.startswith("linux"):
+        return _proc_status("VmRSS")
+    if sys.platform == "win32":
+        return _windows_counters().WorkingSetSize
+    return peak_rss_bytes()
+
+
+def peak_rss_bytes() -> int:
+    """프로세스 최대 RSS (Linux는 reset_peak_rss 이후)"""
+    if sys.platform.startswith("linux"):
+        return _proc_status("VmHWM")
+    if sys.platform == "win32":
+        return _windows_counters().PeakWorkingSetSize
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss     # macOS: bytes
+
+
+def reset_peak_rss() -> None:
+    """최대 RSS 초기화 (Linux만 가능, 나머지는 프로세스 시작부터의 최대)"""
+    if sys.platform.startswith("linux"):
+        with contextlib.suppress(OSError):
+            with open("/proc/self/clear_refs", "w") as f:
+                f.write("5")
+
+
+@dataclass
+class StageMemory:
+    """단계 하나의 메모리"""
+
+    name: str
+    seconds: float
+    peak_bytes: int                                 # 단계 중 tracemalloc 최대
+    growth_bytes: int                               # 단계 끝 - 시작 (남은 객체)
+    rss_bytes: int                                  # 단계 끝 RSS
+    top: list[str] = field(default_factory=list)    # 단계 끝 할당 상위 줄
+
+
+class MemoryTracker:
+    """with 블록 동안 tracemalloc/RSS 측정"""
+
+    def __init__(self, trace: bool = True, frames: int = 1, top: int = 0):
+        self.trace = trace
+        self.frames = frames
+        self.top = top                              # 단계마다 남길 할당 상위 줄 수
+        self.stages: list[StageMemory] = []
+        self.seconds = 0.0
+        self.peak_bytes = 0
+        self.start_rss = 0
+        self.peak_rss = 0
+        self._in_stage = False
+        self._started = 0.0
+
+    def __enter__(self) -> "MemoryTracker":
+        global _active
+        if _active is not None:
+            raise RuntimeError("MemoryTracker is already running")
+        if self.trace:
+            tracemalloc.start(self.frames)
+        reset_peak_rss()
+        self.start_rss = rss_bytes()
+        self._started = time.perf_counter()
+        _active = self
+        return self
+
+    def __exit__(self, *exc) -> None:
+        global _active
+        _active = None
+        self.seconds = time.perf_counter() - self._started
+        self.peak_rss = max(peak_rss_bytes(), rss_bytes())
+        if self.trace:
+            self.peak_bytes = max(self.peak_bytes, tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+
+    @property
+    def rss_growth_bytes(self) -> int:
+        """시작 대비 최대 RSS 증가"""
+        return max(self.peak_rss - self.start_rss, 0)
+
+    def _traced(self) -> tuple[int, int]:
+        return tracemalloc.get_traced_memory() if self.trace else (0, 0)
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        if self._in_stage:
+            yield
+            return
+        # 단계별 최대를 보려면 전역 최대를 초기화해야 하므로 그 전까지의 최대를 보관
+        current, peak = self._traced()
+        self.peak_bytes = max(self.peak_bytes, peak)
+        if self.trace:
+            tracemalloc.reset_peak()
+        started = time.perf_counter()
+        self._in_stage = True
+        try:
+            yield
+        finally:
+            self._in_stage = False
+            end, peak = self._traced()
+            self.peak_bytes = max(self.peak_bytes, peak)
+            top = []
+            if self.trace and self.top:
+                for stat in tracemalloc.take_snapshot().statistics("lineno")[:self.top]:
+                    frame = stat.traceback[0]
+                    top.append(f"{stat.size / MB:8.1f}MB {stat.count:>9,}  {frame.filename}:{frame.lineno}")
+            self._record(StageMemory(
+                name=name,
+                seconds=time.perf_counter() - started,
+                peak_bytes=peak,
+                growth_bytes=end - current,
+                rss_bytes=rss_bytes(),
+                top=top,
+            ))
+
+    def _record(self, stage: StageMemory) -> None:
+        """단계 기록 (같은 이름이 있으면 시간/증가량은 더하고 최대는 큰 값)"""
+        for prev in self.stages:
+            if prev.name == stage.name:
+                prev.seconds += stage.seconds
+                prev.peak_bytes = max(prev.peak_bytes, stage.peak_bytes)
+                prev.growth_bytes += stage.growth_bytes
+                prev.rss_bytes = stage.rss_bytes
+                prev.top = stage.top or prev.top
+                return
+        self.stages.append(stage)
+
+    def result(self) -> dict:
+        return {
+            "trace": self.trace,
+            "seconds": self.seconds,
+            "peak_bytes": self.peak_bytes,
+            "start_rss": self.start_rss,
+            "peak_rss": self.peak_rss,
+            "rss_growth_bytes": self.rss_growth_bytes,
+            "stages": [asdict(s) for s in self.stages],
+        }
+
+    def report(self) -> str:
+        if not self.trace:
+            lines = [
+                f"RSS {self.start_rss / MB:.1f}MB -> 최대 {self.peak_rss / MB:.1f}MB "
+                f"(+{self.rss_growth_bytes / MB:.1f}MB), {self.seconds:.2f}초",
+                f"  {'단계':<16} {'RSS':>9} {'초':>7}",
+            ]
+            lines += [f"  {s.name:<16} {s.rss_bytes / MB:>7.1f}MB {s.seconds:>7.2f}" for s in self.stages]
+            return "\n".join(lines)
+
+        lines = [
+            f"tracemalloc 최대 {self.peak_bytes / MB:.1f}MB, {self.seconds:.2f}초",
+            f"  {'단계':<16} {'최대':>9} {'증가':>9}",
+        ]
+        for s in self.stages:
+            lines.append(f"  {s.name:<16} {s.peak_bytes / MB:>7.1f}MB {s.growth_bytes / MB:>7.1f}MB")
+            lines += [f"      {line}" for line in s.top]
+        return "\n".join(lines)
+
+
+def memory_stage(name: str):
+    """측정 중이면 단계 기록, 아니면 아무 일도 하지 않음"""
+    tracker = _active
+    return tracker.stage(name) if tracker is not None else _NULL
@@ -0,0 +1,220 @@
+"""cProfile/샘플링 프로파일러
+
+- cprofile: 프로파일러를 켠 스레드의 함수별 호출 수, 자체/누적 시간 (정확하지만 호출마다 부하)
+- sample: interval마다 모든 스레드의 스택을 찍어 함수별 시간 추정 (부하가 적고 스레드 작업도 보임)
+
+두 방식 모두 샘플러가 접힌 스택(collapsed stack)을 모아 flamegraph.pl/speedscope로 볼 수 있다.
+표준 라이브러리만 쓰므로 레거시 스크립트(programs/scripts/legacy/profiling.py)도 그대로 가져다 쓴다.
+"""
+
+import cProfile
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Optional
+
+MODES = ("cprofile", "sample")
+
+# 할 일 없이 기다리는 스레드의 맨 위 프레임 (샘플에서 제외)
+IDLE_FRAMES = {
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("queue.py", "get"),
+    ("selectors.py", "select"),
+    ("thread.py", "_worker"),
+}
+
+
+@dataclass
+class HotFunction:
+    """상위 함수 한 줄"""
+
+    name: str
+    calls: int                                      # sample 모드는 0
+    self_seconds: float
+    total_seconds: float
+
+
+def _short_path(filename: str) -> str:
+    """표시용 파일 경로 (site-packages, 표준 라이브러리, 현재 디렉토리 기준으로 줄임)"""
+    path = filename.replace("\\", "/")
+    if "site-packages/" in path:
+        return path.split("site-packages/", 1)[1]
+    if "/lib/python3" in path:
+        return path.rsplit("/lib/", 1)[1]
+    cwd = str(Path.cwd()).replace("\\", "/") + "/"
+    return path[len(cwd):] if path.startswith(cwd) else path
+
+
+@lru_cache(maxsize=None)
+def _frame_name(filename: str, line: int, function: str) -> str:
+    if filename == "~":                             # C 함수 (cProfile)
+        return function
+    return f"{_short_path(filename)}:{line}({function})"
+
+
+class Sampler:
+    """interval마다 sys._current_frames()로 스레드별 스택 수집"""
+
+    def __init__(self, interval: float = 0.005, exclude_threads: Iterable[str] = ()):
+        self.interval = interval
+        self.exclude_threads = set(exclude_threads)
+        self.stacks: Counter = Counter()            # (스레드, 바깥 프레임, ..., 안쪽 프레임) -> 샘플 수
+        self.ticks = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="profile-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                name = names.get(ident, str(ident))
+                if ident == own or name in self.exclude_threads:
+                    continue
+                code = frame.f_code
+                if (Path(code.co_filename).name, code.co_name) in IDLE_FRAMES:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(_frame_name(code.co_filename, code.co_firstlineno, code.co_name))
+                    frame = frame.f_back
+                stack.append(name)
+                self.stacks[tuple(reversed(stack))] += 1
+            self.ticks += 1
+
+
+class Profiler:
+    """with 블록 실행을 프로파일링
+
+    with Profiler(mode="cprofile") as profiler:
+        run()
+    print(profiler.report(top=30))
+    profiler.save(Path("profiles"), "run")
+    """
+
+    def __init__(self, mode: str = "cprofile", interval: float = 0.005, exclude_threads: Iterable[str] = ()):
+        if mode not in MODES:
+            raise ValueError(f"mode must be one of {MODES}")
+        self.mode = mode
+        self.sampler = Sampler(interval, exclude_threads)
+        self.profile: Optional[cProfile.Profile] = None
+        self.stats: Optional[pstats.Stats] = None
+        self.seconds = 0.0
+        self._started = 0.0
+
+    def __enter__(self) -> "Profiler":
+        self.sampler.start()
+        if self.mode == "cprofile":
+            self.profile = cProfile.Profile()
+        self._started = time.perf_counter()
+        if self.profile:
+            self.profile.enable()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self.profile:
+            self.profile.disable()
+        self.seconds = time.perf_counter() - self._started
+        self.sampler.stop()
+        if self.profile:
+            self.stats = pstats.Stats(self.profile)
+
+    def hot_functions(self, top: int = 30, sort: str = "self") -> list[HotFunction]:
+        """자체 시간(self) 또는 누적 시간(total) 상위 함수"""
+        if self.stats:
+            rows = [
+                HotFunction(_frame_name(*key), calls, tottime, cumtime)
+                for key, (_, calls, tottime, cumtime, _) in self.stats.stats.items()
+            ]
+        else:
+            rows = self._sampled_functions()
+        key = (lambda r: r.self_seconds) if sort == "self" else (lambda r: r.total_seconds)
+        return sorted(rows, key=key, reverse=True)[:top]
+
+    def _sampled_functions(self) -> list[HotFunction]:
+        tick = self.seconds / self.sampler.ticks if self.sampler.ticks else 0.0
+        own: Counter = Counter()
+        total: Counter = Counter()
+        for stack, count in self.sampler.stacks.items():
+            frames = stack[1:]
+            if not frames:
+                continue
+            own[frames[-1]] += count
+            for frame in set(frames):
+                total[frame] += count
+        return [HotFunction(name, 0, own[name] * tick, total[name] * tick) for name in total]
+
+    def driver_seconds(self) -> Optional[float]:
+        """sqlite3 C 함수(execute/fetch/commit)에서 보낸 시간 (cprofile 모드만)"""
+        if not self.stats:
+            return None
+        return sum(
+            tottime for (filename, _, function), (_, _, tottime, _, _) in self.stats.stats.items()
+            if filename == "~" and "sqlite3." in function
+        )
+
+    def collapsed_lines(self) -> list[str]:
+        """flamegraph.pl 입력 형식 (프레임;프레임;... 샘플수)"""
+        return [f"{';'.join(stack)} {count}" for stack, count in sorted(self.sampler.stacks.items())]
+
+    def report(self, top: int = 30, sql_seconds: Optional[float] = None) -> str:
+        """요약 텍스트 (전체 시간, SQL/Python 비율, 상위 함수)
+
+        SQL 시간은 cprofile 모드면 sqlite3 C 함수 시간, 아니면 sql_seconds(예: SqlTimer)를 쓴다.
+        """
+        lines = [f"전체 {self.seconds:.2f}초 ({self.mode}, 샘플 {self.sampler.ticks:,}회)"]
+        driver = self.driver_seconds()
+        if driver is not None:
+            sql_seconds, source = driver, "sqlite3 드라이버, fetch 포함"
+        else:
+            source = "cursor.execute, fetch 제외"
+        if sql_seconds is not None and self.seconds:
+            python_seconds = max(self.seconds - sql_seconds, 0.0)
+            lines.append(
+                f"SQL {sql_seconds:.2f}초 ({sql_seconds / self.seconds:.0%}) / "
+                f"Python {python_seconds:.2f}초 ({python_seconds / self.seconds:.0%})  [{source}]"
+            )
+
+        for sort, title in (("self", "자체 시간"), ("total", "누적 시간")):
+            lines.append(f"\n상위 {top}개 함수 ({title})")
+            lines.append(f"  {'자체(s)':>9} {'누적(s)':>9} {'호출':>9}  함수")
+            for row in self.hot_functions(top, sort):
+                calls = f"{row.calls:,}" if row.calls else "-"
+                lines.append(f"  {row.self_seconds:>9.3f} {row.total_seconds:>9.3f} {calls:>9}  {row.name}")
+        return "\n".join(lines)
+
+    def save(self, directory: Path, name: str, report: Optional[str] = None) -> list[Path]:
+        """<name>.collapsed, <name>.pstats(cprofile), <name>.txt 저장"""
+        directory.mkdir(parents=True, exist_ok=True)
+        paths = []
+
+        collapsed = directory / f"{name}.collapsed"
+        collapsed.write_text("\n".join(self.collapsed_lines()) + "\n", encoding="utf-8")
+        paths.append(collapsed)
+
+        if self.stats:
+            stats_path = directory / f"{name}.pstats"
+            self.stats.dump_stats(stats_path)
+            paths.append(stats_path)
+
+        if report is not None:
+            report_path = directory / f"{name}.txt"
+            report_path.write_text(report + "\n", encoding="utf-8")
+            paths.append(report_path)
+        return paths
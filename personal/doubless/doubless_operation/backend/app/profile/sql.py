@@ -0,0 +1,54 @@
+"""SQL 실행 시간 측정
+
+SQLAlchemy 엔진 이벤트(before/after_cursor_execute)로 모든 엔진의 cursor.execute 구간을 잰다.
+결과 행을 가져오는(fetch) 시간은 포함되지 않으므로 cprofile 모드의 sqlite3 드라이버 시간과 함께 본다.
+"""
+
+import re
+import time
+from collections import defaultdict
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class SqlTimer:
+    """with 블록 동안 SQL 문별 실행 횟수/시간 집계"""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.statements: dict[str, list] = defaultdict(lambda: [0, 0.0])   # SQL -> [횟수, 시간]
+
+    def __enter__(self) -> "SqlTimer":
+        event.listen(Engine, "before_cursor_execute", self._before)
+        event.listen(Engine, "after_cursor_execute", self._after)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        event.remove(Engine, "before_cursor_execute", self._before)
+        event.remove(Engine, "after_cursor_execute", self._after)
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info.setdefault("profile_started", []).append(time.perf_counter())
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        elapsed = time.perf_counter() - conn.info["profile_started"].pop()
+        self.count += 1
+        self.seconds += elapsed
+        entry = self.statements[_WHITESPACE.sub(" ", statement).strip()]
+        entry[0] += 1
+        entry[1] += elapsed
+
+    def report(self, top: int = 10) -> str:
+        """SQL 문 수와 누적 시간 상위 문장"""
+        lines = [f"SQL {self.count:,}문, 실행 {self.seconds:.2f}초 (fetch 제외)"]
+        lines.append(f"\n상위 {top}개 SQL (누적 시간)")
+        lines.append(f"  {'시간(s)':>9} {'횟수':>8}  SQL")
+        ranked = sorted(self.statements.items(), key=lambda item: item[1][1], reverse=True)[:top]
+        for statement, (count, seconds) in ranked:
+            text = statement if len(statement) <= 160 else statement[:157] + "..."
+            lines.append(f"  {seconds:>9.3f} {count:>8,}  {text}")
+        return "\n".join(lines)
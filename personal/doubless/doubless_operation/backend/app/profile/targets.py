@@ -0,0 +1,219 @@
+"""프로파일링 대상
+
+이름으로 고르는 서비스 작업/스크립트와, 벤치마크 경로 이름("GET /sessions/grid")으로 고르는 엔드포인트.
+prepare(ctx)는 프로파일링 밖에서 준비를 마치고, 측정할 함수(결과 요약 문자열 반환)를 돌려준다.
+"""
+
+import asyncio
+import runpy
+import sys
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Optional
+
+import httpx
+
+from app.benchmark.routes import API_PREFIX, ROUTES, Context, Route
+from app.benchmark.runner import run_route
+from app.broj_stub import SyntheticCrm
+from app.db.session import get_session_context
+
+
+@dataclass
+class TargetContext:
+    today: date
+    seed: int
+    work_dir: Path
+    crm: SyntheticCrm
+    repeat: Optional[int] = None                    # 엔드포인트 호출 수 (None이면 기본값)
+    args: list[str] = field(default_factory=list)   # script 대상 인자
+
+
+@dataclass
+class Target:
+    name: str
+    description: str
+    prepare: Callable[[TargetContext], Callable[[], str]]
+    crm: bool = False                               # Broj 대역 서버 필요
+    synthetic: bool = True                          # 가상 operation.db 필요
+
+
+def _current_month(ctx: TargetContext) -> tuple[str, str]:
+    return ctx.today.replace(day=1).isoformat(), ctx.today.isoformat()
+
+
+def _prev_month(ctx: TargetContext) -> tuple[str, str]:
+    last = ctx.today.replace(day=1) - timedelta(days=1)
+    return last.replace(day=1).isoformat(), last.isoformat()
+
+
+def _export_sessions(ctx: TargetContext) -> Callable[[], str]:
+    from app.services.export_service import ExportService
+
+    start, end = _current_month(ctx)
+
+    def run() -> str:
+        with get_session_context() as session:
+            log = ExportService(session).export_sessions(start, end)
+            return f"{log.export_id} 세션 {log.session_count:,}건"
+    return run
+
+
+def _excel_export(kind: str) -> Callable[[TargetContext], Callable[[], str]]:
+    def prepare(ctx: TargetContext) -> Callable[[], str]:
+        from app.services.excel_export_service import ExcelExportService
+
+        start, end = _prev_month(ctx)
+
+        def run() -> str:
+            # 프로세스 풀 작업은 프로파일러에 잡히지 않으므로 한 프로세스에서 실행
+            with get_session_context() as session:
+                service = ExcelExportService(session, workers=1)
+                log = service.export_worklog(start, end) if kind == "worklog" else service.export_payroll(start, end)
+                return f"{log.export_id} 세션 {log.session_count:,}건, {log.file_size_bytes:,} bytes"
+        return run
+    return prepare
+
+
+def _sync_members(ctx: TargetContext) -> Callable[[], str]:
+    from app.services.member_sync_service import MemberSyncService
+
+    def run() -> str:
+        with get_session_context() as session:
+            result = asyncio.run(MemberSyncService(session).sync(mode="full"))
+            return f"회원 {result['count']:,}명 ({result['mode']})"
+    return run
+
+
+def _rebuild_rollups(ctx: TargetContext) -> Callable[[], str]:
+    from sqlalchemy import func
+    from sqlmodel import select
+
+    from app.db.models import SessionLog
+    from app.services.rollup_service import RollupService
+
+    with get_session_context() as session:
+        months = sorted(session.exec(select(func.substr(SessionLog.session_date, 1, 7)).distinct()).all())
+
+    def run() -> str:
+        with get_session_context() as session:
+            rows = sum(RollupService(session).rebuild_month(month) for month in months)
+            session.commit()
+            return f"{len(months)}개월, 집계 {rows:,}행"
+    return run
+
+
+def _close_period(ctx: TargetContext) -> Callable[[], str]:
+    from app.services.period_close_service import PeriodCloseService
+
+    year_month = _prev_month(ctx)[0][:7]
+
+    def run() -> str:
+        with get_session_context() as session:
+            close = PeriodCloseService(session).close(year_month, "profile")
+            return f"{close.year_month} 마감, 세션 {close.session_count:,}건"
+    return run
+
+
+def _monthly_session_analysis(ctx: TargetContext) -> Callable[[], str]:
+    from app.profile.legacy import build_salary_db, load_legacy
+
+    year = ctx.today.year - 1
+    db_path = ctx.work_dir / "legacy" / "doubless.db"
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    data = build_salary_db(db_path, ctx.crm, year, ctx.seed)
+    print(f"  가상 급여 DB: 수강권 {data['lesson_tickets']:,}건, 수업내역 {data['salary_records']:,}건")
+    module = load_legacy("monthly_session_analysis")
+    argv = ["monthly_session_analysis.py", "-y", str(year), "--db", str(db_path),
+            "--report-dir", str(ctx.work_dir / "legacy" / "report"), *ctx.args]
+
+    def run() -> str:
+        saved, sys.argv = sys.argv, argv
+        try:
+            module.main()
+        finally:
+            sys.argv = saved
+        return f"{year}년 12개월 분석"
+    return run
+
+
+def _script(ctx: TargetContext) -> Callable[[], str]:
+    if not ctx.args:
+        raise ValueError("script target needs a path: script <path> [args...]")
+    path = Path(ctx.args[0]).resolve()
+    if not path.exists():
+        raise FileNotFoundError(f"Script not found: {path}")
+    argv = [str(path), *ctx.args[1:]]
+
+    def run() -> str:
+        saved_argv, saved_path = sys.argv, list(sys.path)
+        sys.argv = argv
+        sys.path.insert(0, str(path.parent))
+        try:
+            runpy.run_path(str(path), run_name="__main__")
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                return f"{path.name} 종료 코드 {e.code}"
+        finally:
+            sys.argv, sys.path[:] = saved_argv, saved_path
+        return path.name
+    return run
+
+
+def _endpoint(route: Route) -> Target:
+    """벤치마크 경로를 repeat번 호출 (앞 경로가 만든 id가 필요하면 먼저 생성)"""
+
+    async def call(app, bench: Context, routes: list[Route], requests: int) -> list[dict]:
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://profile", timeout=600) as client:
+            return [
+                await run_route(client, app, r, bench, min(r.count(bench), requests) if r.count else requests, 1)
+                for r in routes
+            ]
+
+    def prepare(ctx: TargetContext) -> Callable[[], str]:
+        from app.main import app
+
+        repeat = ctx.repeat or (1 if route.heavy else 20)
+        with get_session_context() as session:
+            bench = Context.load(session, ctx.today, ctx.seed)
+        producers = [r for r in ROUTES[:ROUTES.index(route)] if r.collect]
+        if producers:
+            asyncio.run(call(app, bench, producers, repeat))
+
+        def run() -> str:
+            result = asyncio.run(call(app, bench, [route], repeat))[0]
+            return f"{API_PREFIX}{route.path} {result['requests']}회, p50 {result['p50_ms']:.1f}ms, 상태 {result['statuses']}"
+        return run
+
+    return Target(route.name, "엔드포인트 (--repeat번 호출)", prepare, crm=route.crm)
+
+
+def _route(name: str) -> Route:
+    return next(r for r in ROUTES if r.name == name)
+
+
+TARGETS: dict[str, Target] = {t.name: t for t in [
+    Target("export_sessions", "이번 달 세션 JSON 내보내기 (ExportService)", _export_sessions),
+    Target("export_worklog", "지난달 업무일지 엑셀 (ExcelExportService, 단일 프로세스)", _excel_export("worklog")),
+    Target("export_payroll", "지난달 급여 시트 엑셀 (ExcelExportService, 단일 프로세스)", _excel_export("payroll")),
+    Target("sync_members", "회원 전체 동기화 (MemberSyncService, Broj 대역 서버)", _sync_members, crm=True),
+    Target("sync_lesson_tickets", "수강권 동기화 (POST /lesson-tickets/sync, Broj 대역 서버)",
+           _endpoint(_route("POST /lesson-tickets/sync")).prepare, crm=True),
+    Target("rebuild_rollups", "전체 월 집계 재계산 (RollupService)", _rebuild_rollups),
+    Target("close_period", "지난달 마감 (PeriodCloseService)", _close_period),
+    Target("monthly_session_analysis", "레거시 월별 세션 정합성 분석 (가상 급여 DB)", _monthly_session_analysis,
+           synthetic=False),
+    Target("script", "스크립트 실행: script <경로> [인자...]", _script),
+]}
+
+
+def resolve(name: str) -> Target:
+    """대상 이름 또는 벤치마크 경로 이름 ("GET /sessions/grid")"""
+    if name in TARGETS:
+        return TARGETS[name]
+    for route in ROUTES:
+        if route.name == name:
+            return _endpoint(route)
+    raise KeyError(name)
@@ -0,0 +1,277 @@
+"""센터 내보내기 통합 서비스
+
+여러 센터가 보낸 export_*.json 파일을 중앙 DB(data/central.db)에 모은다.
+
+- 파일 파싱은 워커 프로세스에서 병렬로 하고(ExportReader로 스트리밍), 적재는 부모 프로세스
+  하나가 executemany로 한다 (SQLite 쓰기는 한 연결만 가능).
+- 세션은 (center_code, session_id, export_id) UNIQUE로 중복을 거르고(INSERT OR IGNORE),
+  이미 적재한 (center_code, export_id) 파일은 파싱 전에 건너뛴다.
+- aggregate_batch_files개 파일마다 한 번 커밋한다. 파일 단위로 세션과 파일 기록이 같은
+  트랜잭션에 들어가므로 중간에 멈춰도 다시 실행하면 이어서 적재된다.
+"""
+
+import os
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+from sqlalchemy import Boolean, Column, Index, Integer, MetaData, String, Table, UniqueConstraint, create_engine
+
+from app.core.config import get_settings
+from app.db.sqlite_pragmas import apply_pragmas
+from app.services.export_reader import ExportFormatError, ExportReader
+
+EXPORT_FILE_PATTERN = "export_*.json"
+
+# 중앙 DB 스키마 (운영 DB와 메타데이터 분리)
+central_metadata = MetaData()
+
+central_sessions = Table(
+    "central_sessions",
+    central_metadata,
+    Column("id", Integer, primary_key=True),
+    Column("center_code", String, nullable=False),
+    Column("export_id", String, nullable=False),
+    Column("session_id", Integer, nullable=False),
+    Column("session_date", String, nullable=False),
+    Column("session_time", String),
+    Column("trainer_name", String),
+    Column("member_name", String),
+    Column("member_key", Integer),
+    Column("session_type", String),
+    Column("session_status", String),
+    Column("session_index", String),
+    Column("is_event", Boolean),
+    Column("registration_type", String),
+    Column("note", String),
+    Column("created_at", String),
+    UniqueConstraint("center_code", "session_id", "export_id", name="uq_central_sessions_center_session_export"),
+    Index("ix_central_sessions_center_date", "center_code", "session_date"),
+)
+
+central_exports = Table(
+    "central_exports",
+    central_metadata,
+    Column("id", Integer, primary_key=True),
+    Column("center_code", String, nullable=False),
+    Column("export_id", String, nullable=False),
+    Column("center_name", String),
+    Column("export_date", String),
+    Column("start_date", String),
+    Column("end_date", String),
+    Column("file_name", String),
+    Column("session_count", Integer, nullable=False),
+    Column("inserted", Integer, nullable=False),
+    Column("ingested_at", String, nullable=False),
+    UniqueConstraint("center_code", "export_id", name="uq_central_exports_center_export"),
+)
+
+SESSION_FIELDS = [
+    "session_date", "session_time", "trainer_name", "member_name", "member_key", "session_type",
+    "session_status", "session_index", "is_event", "registration_type", "note", "created_at",
+]
+
+INSERT_SESSION_SQL = (
+    "INSERT OR IGNORE INTO central_sessions (center_code, export_id, session_id, "
+    + ", ".join(SESSION_FIELDS)
+    + ") VALUES (" + ", ".join("?" * (3 + len(SESSION_FIELDS))) + ")"
+)
+
+INSERT_EXPORT_SQL = (
+    "INSERT INTO central_exports (center_code, export_id, center_name, export_date, start_date, end_date, "
+    "file_name, session_count, inserted, ingested_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def _export_key(info: Optional[dict], path: str) -> tuple[str, str]:
+    if not info or not info.get("center_code") or not info.get("export_id"):
+        raise ExportFormatError(f"{Path(path).name}: export_info.center_code/export_id missing")
+    return info["center_code"], info["export_id"]
+
+
+def _session_rows(reader: ExportReader, path: str) -> Iterator[tuple]:
+    """세션 행 (center_code, export_id, session_id, 세션 필드...)"""
+    for s in reader.sessions():
+        center_code, export_id = _export_key(reader.info, path)
+        yield (center_code, export_id, s["id"], *(s.get(f) for f in SESSION_FIELDS))
+
+
+def parse_export_file(path: str) -> dict:
+    """내보내기 파일 하나 파싱 (워커 프로세스)"""
+    try:
+        with ExportReader(path) as reader:
+            rows = list(_session_rows(reader, path))
+            info = reader.info
+        _export_key(info, path)
+        return {"path": path, "info": info, "rows": rows}
+    except (OSError, ValueError, KeyError) as e:
+        return {"path": path, "error": f"{type(e).__name__}: {e}"}
+
+
+def read_export_key(path: str) -> Optional[tuple[str, str]]:
+    """파일 앞부분(export_info)만 읽어 (center_code, export_id) 확인"""
+    try:
+        with ExportReader(path, chunk_size=4096) as reader:
+            for _ in reader.sessions():
+                break
+            return _export_key(reader.info, path)
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+class AggregatorService:
+    """센터 내보내기 통합 서비스"""
+
+    def __init__(self, database_path: Optional[Path] = None, workers: Optional[int] = None):
+        self.settings = get_settings()
+        self.database_path = Path(database_path or self.settings.aggregate_db_path or self.settings.data_dir / "central.db")
+        self.workers = workers or self.settings.aggregate_workers or os.cpu_count() or 1
+
+    def init_db(self) -> None:
+        """중앙 DB 테이블 생성"""
+        self.database_path.parent.mkdir(parents=True, exist_ok=True)
+        engine = create_engine(f"sqlite:///{self.database_path}")
+        central_metadata.create_all(engine)
+        engine.dispose()
+
+    def _connect(self) -> sqlite3.Connection:
+        """자동 커밋 연결 (트랜잭션은 BEGIN/SAVEPOINT로 직접 관리)"""
+        conn = sqlite3.connect(self.database_path, timeout=30, isolation_level=None)
+        apply_pragmas(conn)
+        return conn
+
+    def find_files(self, paths: Iterable[Path]) -> list[Path]:
+        """입력 경로의 내보내기 파일 (디렉토리는 하위까지 export_*.json)"""
+        files = []
+        for path in paths:
+            path = Path(path)
+            if path.is_dir():
+                files.extend(sorted(path.rglob(EXPORT_FILE_PATTERN)))
+            elif path.exists():
+                files.append(path)
+        return files
+
+    def _write_export(self, conn: sqlite3.Connection, info: dict, path: str, session_count: int, inserted: int) -> None:
+        period = info.get("period") or {}
+        conn.execute(INSERT_EXPORT_SQL, (
+            info["center_code"],
+            info["export_id"],
+            info.get("center_name"),
+            info.get("export_date"),
+            period.get("start_date"),
+            period.get("end_date"),
+            Path(path).name,
+            session_count,
+            inserted,
+            datetime.now().isoformat(timespec="seconds"),
+        ))
+
+    def _load_file(self, conn: sqlite3.Connection, path: str, parsed: Optional[dict]) -> tuple[int, int]:
+        """파일 하나 적재 (반환: 세션 수, 새로 들어간 세션 수)
+
+        parsed가 없으면(워커 1개) 파일을 읽으면서 행을 바로 executemany로 넘긴다.
+        """
+        before = conn.total_changes
+        if parsed is None:
+            with ExportReader(path) as reader:
+                count = 0
+
+                def rows() -> Iterator[tuple]:
+                    nonlocal count
+                    for row in _session_rows(reader, path):
+                        count += 1
+                        yield row
+
+                conn.executemany(INSERT_SESSION_SQL, rows())
+                info = reader.info
+            _export_key(info, path)
+        else:
+            if "error" in parsed:
+                raise ExportFormatError(parsed["error"])
+            info, count = parsed["info"], len(parsed["rows"])
+            conn.executemany(INSERT_SESSION_SQL, parsed["rows"])
+
+        inserted = conn.total_changes - before
+        self._write_export(conn, info, path, count, inserted)
+        return count, inserted
+
+    def _parsed(self, files: list[str]) -> Iterator[tuple[str, Optional[dict]]]:
+        """(파일, 파싱 결과) 순서대로 (워커가 1개면 파싱 결과 없이 스트리밍 적재)"""
+        if self.workers <= 1 or len(files) <= 1:
+            for path in files:
+                yield path, None
+            return
+        chunksize = max(1, min(16, len(files) // (self.workers * 4)))
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(files))) as pool:
+            for parsed in pool.map(parse_export_file, files, chunksize=chunksize):
+                yield parsed["path"], parsed
+
+    def ingest(self, paths: Iterable[Path], verbose: bool = False) -> dict:
+        """내보내기 파일 적재"""
+        started = time.perf_counter()
+        self.init_db()
+        files = self.find_files(paths)
+
+        conn = self._connect()
+        try:
+            done = set(conn.execute("SELECT center_code, export_id FROM central_exports"))
+
+            # 이미 적재한 파일은 export_info만 읽고 건너뜀
+            keys: dict[str, tuple[str, str]] = {}
+            skipped = 0
+            for path in map(str, files):
+                key = read_export_key(path)
+                if key is not None and key in done:
+                    skipped += 1
+                    continue
+                keys[path] = key
+
+            ingested = sessions = inserted = 0
+            errors = []
+            batch = max(self.settings.aggregate_batch_files, 1)
+            conn.execute("BEGIN")
+            for path, parsed in self._parsed(list(keys)):
+                key = keys[path]
+                if key in done:
+                    # 같은 내보내기를 담은 다른 파일
+                    skipped += 1
+                    continue
+                conn.execute("SAVEPOINT export_file")
+                try:
+                    count, new = self._load_file(conn, path, parsed)
+                except (ValueError, KeyError, OSError, sqlite3.Error) as e:
+                    conn.execute("ROLLBACK TO SAVEPOINT export_file")
+                    conn.execute("RELEASE SAVEPOINT export_file")
+                    errors.append({"file": Path(path).name, "error": str(e)})
+                    continue
+                conn.execute("RELEASE SAVEPOINT export_file")
+
+                done.add(key)
+                ingested += 1
+                sessions += count
+                inserted += new
+                if ingested % batch == 0:
+                    conn.execute("COMMIT")
+                    conn.execute("BEGIN")
+                    if verbose:
+                        print(f"  {ingested}/{len(keys)} 파일, 세션 {inserted}건", flush=True)
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+        elapsed = time.perf_counter() - started
+        return {
+            "files": len(files),
+            "ingested": ingested,
+            "skipped": skipped,
+            "sessions": sessions,
+            "inserted": inserted,
+            "duplicates": sessions - inserted,
+            "errors": errors,
+            "workers": self.workers,
+            "seconds": round(elapsed, 3),
+            "files_per_second": round(ingested / elapsed, 1) if elapsed else 0.0,
+            "sessions_per_second": round(sessions / elapsed, 1) if elapsed else 0.0,
+        }
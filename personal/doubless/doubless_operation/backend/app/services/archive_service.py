@@ -0,0 +1,303 @@
+"""세션 보관 서비스 (hot/cold)
+
+마감된 월(전부 내보내기 완료 + 월 마감 또는 급여 마감일 경과)의 session_logs 행을 연도별 파일
+data/session_archive_YYYY.db로 옮겨 운영 테이블을 작게 유지한다.
+
+조회 범위가 보관 월에 걸치는 경우에만 해당 연도 파일을 현재 연결에 ATTACH하고,
+운영 테이블과 보관 테이블을 UNION ALL한 임시 뷰 session_logs_all을 만든다.
+ATTACH는 트랜잭션 밖에서만 가능하므로 같은 세션에서 쓰기 전에 호출해야 한다.
+"""
+
+from datetime import date, datetime
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+from sqlalchemy import Column, MetaData, Table, case, func, text
+from sqlalchemy.engine import Connection
+from sqlmodel import Session, select
+
+from app.core.centers import get_center
+from app.core.config import get_settings
+from app.db.change_tracking import mark_replaced
+from app.db.models.month_close import MonthClose, MonthCloseStatus
+from app.db.models.session_archive import SessionArchive
+from app.db.models.session_log import SessionLog
+from app.services.maintenance_service import analyze_tables
+
+ARCHIVE_SCHEMA_PREFIX = "arc_"
+UNION_VIEW = "session_logs_all"
+
+# SQLite 기본 ATTACH 한도 10개 중 여유분
+MAX_ATTACHED = 8
+
+SESSION_COLUMNS = [c.name for c in SessionLog.__table__.columns]
+
+# session_logs_all 뷰를 조회하기 위한 테이블 정의 (SessionLog와 같은 컬럼)
+union_view = Table(
+    UNION_VIEW,
+    MetaData(),
+    *[Column(c.name, c.type, primary_key=c.primary_key) for c in SessionLog.__table__.columns],
+)
+
+
+def archive_file_name(year: int) -> str:
+    return f"session_archive_{year}.db"
+
+
+def archive_schema(year: int) -> str:
+    return f"{ARCHIVE_SCHEMA_PREFIX}{year}"
+
+
+def _month_range(year_month: str) -> tuple[str, str]:
+    return f"{year_month}-01", f"{year_month}-31"
+
+
+class ArchiveService:
+    """세션 보관 서비스"""
+
+    def __init__(self, session: Session):
+        self.session = session
+        self.settings = get_settings()
+
+    def archive_path(self, year: int) -> Path:
+        return get_center().data_dir / archive_file_name(year)
+
+    # --- ATTACH / 조회 ---
+
+    def archived_years(self, start_date: Optional[str], end_date: Optional[str]) -> list[int]:
+        """범위 안에 보관된 월이 있는 연도"""
+        if not start_date and not end_date:
+            return []
+        query = select(SessionArchive.year).distinct()
+        if start_date:
+            query = query.where(SessionArchive.year_month >= start_date[:7])
+        if end_date:
+            query = query.where(SessionArchive.year_month <= end_date[:7])
+        return sorted(self.session.exec(query).all())
+
+    def _attached(self, conn: Connection) -> set[str]:
+        return {
+            row[1] for row in conn.exec_driver_sql("PRAGMA database_list")
+            if row[1].startswith(ARCHIVE_SCHEMA_PREFIX)
+        }
+
+    def _attach(self, conn: Connection, year: int, create: bool = False) -> Optional[str]:
+        """연도 보관 파일 ATTACH (없으면 None, create=True면 생성)"""
+        schema = archive_schema(year)
+        if schema in self._attached(conn):
+            return schema
+        path = self.archive_path(year)
+        if not path.exists() and not create:
+            return None
+        conn.exec_driver_sql(f"ATTACH DATABASE ? AS {schema}", (str(path),))
+        self._ensure_archive_table(conn, schema)
+        return schema
+
+    def _ensure_archive_table(self, conn: Connection, schema: str) -> None:
+        """보관 테이블 생성, 이후 모델에 추가된 컬럼 반영"""
+        table = SessionLog.__table__.to_metadata(MetaData(), schema=schema)
+        table.create(conn, checkfirst=True)
+
+        existing = {row[1] for row in conn.exec_driver_sql(f"PRAGMA {schema}.table_info(session_logs)")}
+        for column in table.columns:
+            if column.name not in existing and column.nullable:
+                column_type = column.type.compile(dialect=conn.dialect)
+                conn.exec_driver_sql(f'ALTER TABLE {schema}.session_logs ADD COLUMN "{column.name}" {column_type}')
+
+    def attach_range(self, start_date: Optional[str], end_date: Optional[str]) -> list[str]:
+        """범위에 필요한 보관 파일을 ATTACH하고 session_logs_all 뷰 구성
+
+        보관 월이 없으면 아무것도 하지 않고 빈 목록을 반환한다.
+        """
+        years = self.archived_years(start_date, end_date)
+        if not years:
+            return []
+        if len(years) > MAX_ATTACHED:
+            raise ValueError(f"Range spans more than {MAX_ATTACHED} archived years")
+
+        conn = self.session.connection()
+        needed = {archive_schema(y) for y in years}
+        attached = self._attached(conn)
+        if len(attached | needed) > MAX_ATTACHED:
+            for schema in attached - needed:
+                conn.exec_driver_sql(f"DETACH DATABASE {schema}")
+
+        schemas = [s for s in (self._attach(conn, y) for y in years) if s]
+        if conn.info.get(UNION_VIEW) != schemas:
+            columns = ", ".join(f'"{c}"' for c in SESSION_COLUMNS)
+            parts = [f"SELECT {columns} FROM main.session_logs"] + [
+                f"SELECT {columns} FROM {schema}.session_logs" for schema in schemas
+            ]
+            conn.exec_driver_sql(f"DROP VIEW IF EXISTS temp.{UNION_VIEW}")
+            conn.exec_driver_sql(f"CREATE TEMP VIEW {UNION_VIEW} AS " + " UNION ALL ".join(parts))
+            conn.info[UNION_VIEW] = schemas
+        return schemas
+
+    def session_log_table(self, start_date: Optional[str], end_date: Optional[str]) -> Table:
+        """범위 조회에 쓸 테이블 (보관 월이 있으면 session_logs_all 뷰, 없으면 session_logs)"""
+        if self.attach_range(start_date, end_date):
+            return union_view
+        return SessionLog.__table__
+
+    def get_logs(
+        self,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        where: Optional[Callable[[Table], Iterable]] = None,
+        order_by: Iterable[str] = ("session_date", "session_time"),
+    ) -> list[SessionLog]:
+        """범위 내 세션 조회 (보관 월 포함)
+
+        where는 테이블을 받아 조건 목록을 돌려주는 함수로, 운영/보관 어느 쪽이든 같은 조건을 쓴다.
+        """
+        table = self.session_log_table(start_date, end_date)
+        conditions = []
+        if start_date:
+            conditions.append(table.c.session_date >= start_date)
+        if end_date:
+            conditions.append(table.c.session_date <= end_date)
+        if where:
+            conditions.extend(where(table))
+
+        order = [text(o) for o in order_by]
+        if table is SessionLog.__table__:
+            return list(self.session.exec(select(SessionLog).where(*conditions).order_by(*order)).all())
+        statement = select(SessionLog).from_statement(select(table).where(*conditions).order_by(*order))
+        return list(self.session.execute(statement).scalars().all())
+
+    # --- 보관 작업 ---
+
+    def close_date(self, year_month: str) -> date:
+        """해당 월 급여 마감일 (다음 달 payroll_close_day)"""
+        year, month = map(int, year_month.split("-"))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return date(year, month, self.settings.payroll_close_day)
+
+    def candidate_months(self, today: Optional[date] = None) -> list[dict]:
+        """보관 대상 월 (운영 테이블에 남은 월별 건수/미내보내기 건수와 보관 가능 여부)"""
+        today = today or date.today()
+        month = func.substr(SessionLog.session_date, 1, 7)
+        rows = self.session.exec(
+            select(
+                month,
+                func.count(),
+                func.sum(case((SessionLog.exported == False, 1), else_=0)),  # noqa: E712
+            )
+            .group_by(month)
+            .order_by(month)
+        ).all()
+
+        max_id = self.session.exec(select(func.max(SessionLog.id))).one()
+        max_id_month = None
+        if max_id is not None:
+            max_id_month = self.session.get(SessionLog, max_id).session_date[:7]
+
+        closed = set(self.session.exec(
+            select(MonthClose.year_month).where(MonthClose.status == MonthCloseStatus.CLOSED)
+        ).all())
+
+        result = []
+        for year_month, total, pending in rows:
+            reason = None
+            if pending:
+                reason = "unexported sessions"
+            elif year_month not in closed and today < self.close_date(year_month):
+                reason = "payroll not closed"
+            elif year_month == max_id_month:
+                # 최대 id 행을 옮기면 운영 테이블에서 id가 재사용되어 보관 행과 겹친다
+                reason = "holds latest session id"
+            result.append({
+                "year_month": year_month,
+                "sessions": total,
+                "pending_export": pending or 0,
+                "archivable": reason is None,
+                "reason": reason,
+            })
+        return result
+
+    def archive_month(self, year_month: str) -> int:
+        """한 달치 세션을 보관 파일로 이동 (호출 전 트랜잭션이 없어야 함, 커밋 포함)
+
+        WAL 모드에서는 ATTACH한 파일 사이의 커밋이 원자적이지 않으므로 두 단계로 나눈다.
+        1) id 기준 INSERT OR IGNORE로 보관 파일에 복사 후 커밋, 운영 행이 모두 보관됐는지 확인
+        2) 보관 파일에 같은 내용으로 있는 행만 운영 테이블에서 삭제 (운영 DB만 쓰는 트랜잭션)
+        중간에 중단되어도 행은 어느 한쪽에 남고, 다시 실행하면 이미 복사된 행은 건너뛴다.
+        session_logs.id는 AUTOINCREMENT가 아니라 최대 id 행이 지워지면 재사용되므로, 이미 보관된 id와 겹친
+        다른 세션은 INSERT OR IGNORE에서 빠진다. 그래서 id만이 아니라 전체 컬럼으로 확인하고 다르면 중단한다.
+        """
+        year = int(year_month[:4])
+        start, end = _month_range(year_month)
+        columns = ", ".join(f'"{c}"' for c in SESSION_COLUMNS)
+        in_month = "session_date >= ? AND session_date <= ?"
+        same_row = " AND ".join(f'a."{c}" IS m."{c}"' for c in SESSION_COLUMNS)
+
+        conn = self.session.connection()
+        schema = self._attach(conn, year, create=True)
+        # 복사 전에 id 충돌 확인 (복사 후 중단하면 보관 파일에 일부만 남아 조회에 두 번 잡힘)
+        conflicts = conn.exec_driver_sql(
+            f"SELECT count(*) FROM main.session_logs AS m WHERE {in_month} "
+            f"AND EXISTS (SELECT 1 FROM {schema}.session_logs AS a WHERE a.id = m.id AND NOT ({same_row}))",
+            (start, end),
+        ).scalar()
+        if conflicts:
+            self.session.rollback()
+            raise RuntimeError(f"{year_month}: {conflicts} sessions reuse ids already archived in {archive_file_name(year)}")
+        conn.exec_driver_sql(
+            f"INSERT OR IGNORE INTO {schema}.session_logs ({columns}) "
+            f"SELECT {columns} FROM main.session_logs WHERE {in_month}",
+            (start, end),
+        )
+        self.session.commit()
+
+        # 커밋 후 풀에서 다른 연결을 받을 수 있으므로 다시 ATTACH 확인
+        conn = self.session.connection()
+        schema = self._attach(conn, year)
+        missing = conn.exec_driver_sql(
+            f"SELECT count(*) FROM main.session_logs AS m WHERE {in_month} "
+            f"AND NOT EXISTS (SELECT 1 FROM {schema}.session_logs AS a WHERE a.id = m.id AND {same_row})",
+            (start, end),
+        ).scalar()
+        if missing:
+            self.session.rollback()
+            raise RuntimeError(
+                f"{year_month}: {missing} sessions missing from {archive_file_name(year)} "
+                "(id already archived with different content)"
+            )
+
+        moved = conn.exec_driver_sql(
+            f"DELETE FROM main.session_logs AS m WHERE {in_month} "
+            f"AND EXISTS (SELECT 1 FROM {schema}.session_logs AS a WHERE a.id = m.id AND {same_row})",
+            (start, end),
+        ).rowcount
+        archived = conn.exec_driver_sql(
+            f"SELECT count(*) FROM {schema}.session_logs WHERE {in_month}", (start, end),
+        ).scalar()
+
+        archive = self.session.exec(
+            select(SessionArchive).where(SessionArchive.year_month == year_month)
+        ).first() or SessionArchive(year_month=year_month, year=year, file_name=archive_file_name(year))
+        archive.session_count = archived
+        archive.archived_at = datetime.now()
+        self.session.add(archive)
+
+        # 행 단위 삭제 대신 목록 재조회 표시
+        mark_replaced(self.session, SessionLog)
+        self.session.commit()
+        return moved
+
+    def run(self, today: Optional[date] = None, dry_run: bool = False) -> dict:
+        """보관 가능한 월 전체 보관"""
+        months = self.candidate_months(today)
+        archived = []
+        if not dry_run:
+            # 후보 조회로 시작된 읽기 트랜잭션 종료 (ATTACH는 트랜잭션 밖에서만 가능)
+            self.session.commit()
+            for m in months:
+                if m["archivable"]:
+                    archived.append({"year_month": m["year_month"], "moved": self.archive_month(m["year_month"])})
+            if archived:
+                # 대량 삭제 후 통계 갱신
+                analyze_tables(self.session, SessionLog)
+        return {"dry_run": dry_run, "months": months, "archived": archived}
+
+    def list_archives(self) -> list[SessionArchive]:
+        return list(self.session.exec(select(SessionArchive).order_by(SessionArchive.year_month)).all())
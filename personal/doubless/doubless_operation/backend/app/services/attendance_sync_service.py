@@ -0,0 +1,164 @@
+"""출석 동기화 서비스 (마지막 출석일 이후 월 구간 증분)"""
+
+from datetime import date, datetime, timedelta
+from typing import Iterable, Optional
+from sqlalchemy import bindparam, func, or_, update
+from sqlalchemy.dialects.sqlite import insert
+from sqlmodel import Session, select
+
+from app.core.config import get_settings
+from app.db.models.attendance_cache import AttendanceCache
+from app.db.models.member_cache import MemberCache
+from app.db.models.sync_state import SyncState
+from app.profile.memory import memory_stage
+from app.services.broj_client import BrojClient, month_windows
+from app.services.crm_mapping import to_attendance_cache
+from app.services.maintenance_service import analyze_tables
+
+SYNC_NAME = "attendance"
+
+# 출석 키가 같으면 갱신할 컬럼 (퇴장 시각 등은 나중에 채워짐)
+UPSERT_FIELDS = [
+    "jgjm_key", "member_name", "attendance_date", "attendance_time", "closed_at",
+    "ticket_name", "door_name", "status", "synced_at",
+]
+
+
+def fill_last_attendance(session: Session, keys: Optional[Iterable[int]] = None) -> None:
+    """last_attendance가 비어 있는 회원을 출석 캐시로 채움 (회원 전체 교체 후, 새 회원)
+
+    회원마다 (jgjm_key, attendance_date) 인덱스로 마지막 출석 한 건만 읽는다.
+    """
+    members = MemberCache.__table__.c
+    attendance = AttendanceCache.__table__.c
+    latest = (
+        select(attendance.attendance_date + " " + attendance.attendance_time)
+        .where(attendance.jgjm_key == members.jgjm_key)
+        .order_by(attendance.attendance_date.desc(), attendance.attendance_time.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    stmt = update(MemberCache.__table__).where(members.last_attendance.is_(None))
+    if keys is not None:
+        keys = list(keys)
+        if not keys:
+            return
+        stmt = stmt.where(members.jgjm_key.in_(keys))
+    session.connection().execute(stmt.values(last_attendance=latest))
+
+
+class AttendanceSyncService:
+    """출석 동기화 서비스
+
+    출석 캐시의 마지막 출석일부터 오늘까지를 월 단위 구간으로 CRM에서 받는다.
+    마지막 출석일 당일은 이후 출석이 더 있을 수 있어 다시 받고, 출석 키로 upsert 한다.
+    캐시가 비어 있으면 attendance_initial_months개월 전 1일부터 받는다.
+    회원별 마지막 출석은 member_cache.last_attendance에 반영해 미방문 회원 조회가 인덱스만 읽게 한다.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+        self.settings = get_settings()
+
+    def _state(self) -> SyncState:
+        """동기화 상태 조회 (없으면 생성)"""
+        state = self.session.exec(select(SyncState).where(SyncState.name == SYNC_NAME)).first()
+        return state or SyncState(name=SYNC_NAME)
+
+    def start_date(self, today: date) -> Optional[date]:
+        """조회 시작일 (마지막 출석일, 캐시가 비었으면 None)"""
+        # (attendance_date, attendance_time) 인덱스의 마지막 항목만 읽음
+        last = self.session.exec(select(func.max(AttendanceCache.attendance_date))).one()
+        return min(date.fromisoformat(last), today) if last else None
+
+    def initial_start_date(self, today: date) -> date:
+        """처음 동기화 시작일 (attendance_initial_months개월 전 1일, 이번 달 포함)"""
+        start = today.replace(day=1)
+        for _ in range(max(self.settings.attendance_initial_months, 1) - 1):
+            start = (start - timedelta(days=1)).replace(day=1)
+        return start
+
+    async def sync(self, client: Optional[BrojClient] = None, today: Optional[date] = None) -> dict:
+        """출석 동기화 실행"""
+        now = datetime.now()
+        today = today or now.date()
+        last = self.start_date(today)
+        mode = "incremental" if last else "full"
+        start = last or self.initial_start_date(today)
+
+        client = client or BrojClient()
+        if not client.access_token:
+            await client.login()
+
+        with memory_stage("fetch"):
+            records = await client.fetch_attendance(start, today, page_size=self.settings.attendance_page_size)
+        with memory_stage("apply"):
+            rows = self._upsert(records, now)
+            visits = self._update_last_attendance(rows)
+
+        state = self._state()
+        state.last_sync_at = now
+        state.last_sync_mode = mode
+        if mode == "full":
+            state.last_full_sync_at = now
+        state.last_fetched = len(records)
+        state.last_changed = len(rows)
+        self.session.add(state)
+        with memory_stage("commit"):
+            self.session.commit()
+        if mode == "full":
+            # 첫 대량 적재 후 통계 갱신
+            analyze_tables(self.session, AttendanceCache, MemberCache)
+
+        return {
+            "mode": mode,
+            "start_date": start.isoformat(),
+            "end_date": today.isoformat(),
+            "months": len(month_windows(start, today)),
+            "fetched": len(records),
+            "count": len(rows),
+            "members_updated": visits,
+            "synced_at": now.isoformat(),
+        }
+
+    def _upsert(self, records: list[dict], now: datetime) -> list[dict]:
+        """출석 키 기준 upsert (같은 키는 마지막 값)"""
+        rows = {}
+        for record in records:
+            cache = to_attendance_cache(record, now)
+            if cache is not None:
+                rows[cache.attendance_key] = cache.model_dump(exclude={"id"})
+        if not rows:
+            return []
+
+        stmt = insert(AttendanceCache.__table__)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["attendance_key"],
+            set_={field: stmt.excluded[field] for field in UPSERT_FIELDS},
+        )
+        self.session.connection().execute(stmt, list(rows.values()))
+        return list(rows.values())
+
+    def _update_last_attendance(self, rows: list[dict]) -> int:
+        """받은 출석으로 회원별 마지막 출석 갱신 (기존 값보다 늦을 때만), 대상 회원 수"""
+        latest: dict[int, str] = {}
+        for row in rows:
+            if row["jgjm_key"] is None:
+                continue
+            visited = f"{row['attendance_date']} {row['attendance_time']}"
+            if visited > latest.get(row["jgjm_key"], ""):
+                latest[row["jgjm_key"]] = visited
+        if not latest:
+            return 0
+
+        members = MemberCache.__table__.c
+        stmt = (
+            update(MemberCache.__table__)
+            .where(members.jgjm_key == bindparam("member_key"))
+            .where(or_(members.last_attendance.is_(None), members.last_attendance < bindparam("visited")))
+            .values(last_attendance=bindparam("visited"))
+        )
+        self.session.connection().execute(
+            stmt, [{"member_key": key, "visited": visited} for key, visited in latest.items()],
+        )
+        return len(latest)
@@ -0,0 +1,209 @@
+"""DB 백업 서비스
+
+SQLite 온라인 백업 API(sqlite3.Connection.backup)로 운영 DB(operation.db), 통합 DB(doubless.db)와
+세션 보관 파일(session_archive_YYYY.db)을 data/backups에 복사한다. 파일 복사와 달리 쓰기 중에도 일관된
+스냅샷을 얻고, 페이지를 backup_pages_per_step개씩 나눠 복사하면서 단계 사이에 잠시 쉬어
+다른 연결의 쓰기를 오래 막지 않는다. 복사 중 다른 연결이 원본을 바꾸면 SQLite가 백업을 처음부터
+다시 하므로, 쓰기가 계속되어 MAX_RESTARTS번 넘게 재시작되면 한 단계(전체 복사)로 다시 백업한다.
+
+백업 파일은 <이름>_YYYYMMDD_HHMMSS.db이며 integrity_check를 통과한 파일만 남기고,
+DB별로 최근 backup_retention개를 넘는 파일은 지운다. 보관 파일은 월 보관 때만 바뀌므로
+마지막 백업 이후 수정된 경우에만 백업한다.
+"""
+
+import asyncio
+import logging
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from app.core.config import get_settings
+from app.db.session import archive_files, database_files
+
+logger = logging.getLogger(__name__)
+
+TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+PARTIAL_SUFFIX = ".partial"
+# <이름>_YYYYMMDD_HHMMSS.db (이름에 _가 들어갈 수 있으므로 glob 대신 정확히 비교)
+BACKUP_FILE = re.compile(r"^(?P<name>.+)_(?P<stamp>\d{8}_\d{6})\.db$")
+
+# 단계별 백업이 원본 변경으로 이만큼 재시작되면 한 번에 복사
+MAX_RESTARTS = 3
+
+# 스케줄 백업과 수동 백업이 같은 파일 이름으로 겹치지 않도록 한 번에 하나만 실행
+_run_lock = threading.Lock()
+
+
+class BackupError(RuntimeError):
+    """백업 실패 (원본 없음, 무결성 검사 실패 등)"""
+
+
+class _TooManyRestarts(Exception):
+    """단계별 백업 중단 신호"""
+
+
+class BackupService:
+    """DB 백업 서비스"""
+
+    def __init__(self):
+        self.settings = get_settings()
+        self.backup_dir = self.settings.backups_dir
+
+    def targets(self) -> dict[str, Path]:
+        """백업 대상 DB (이름 -> 경로, 파일이 있는 것만)"""
+        return {**database_files(), **archive_files()}
+
+    def unchanged(self, name: str, source: Path) -> bool:
+        """마지막 백업 이후 원본(WAL 포함)이 수정되지 않았는지"""
+        backups = self.list_backups(name)
+        if not backups:
+            return False
+        backed_up = datetime.strptime(BACKUP_FILE.match(backups[0].name)["stamp"], TIMESTAMP_FORMAT)
+        wal = source.with_name(source.name + "-wal")
+        modified = max(p.stat().st_mtime for p in (source, wal) if p.exists())
+        return modified < backed_up.timestamp()
+
+    def backup(self, name: str, source: Path) -> dict:
+        """DB 하나 백업 후 무결성 검사 (통과하면 .partial을 떼고 보존 개수 정리)"""
+        if not source.exists():
+            raise BackupError(f"{source} does not exist")
+        self.backup_dir.mkdir(parents=True, exist_ok=True)
+
+        file_name = f"{name}_{datetime.now().strftime(TIMESTAMP_FORMAT)}.db"
+        target = self.backup_dir / file_name
+        partial = target.with_name(file_name + PARTIAL_SUFFIX)
+        partial.unlink(missing_ok=True)
+
+        started = time.perf_counter()
+        # WAL 파일은 연결이 없으면 읽기 전용으로 열 수 없으므로(-shm 생성 필요) 일반 연결로 읽는다
+        src = sqlite3.connect(source, timeout=5)
+        dst = sqlite3.connect(partial)
+        try:
+            steps, restarts = self._copy(src, dst)
+            result = dst.execute("PRAGMA integrity_check").fetchall()
+        finally:
+            dst.close()
+            src.close()
+
+        if result != [("ok",)]:
+            partial.unlink(missing_ok=True)
+            detail = "; ".join(str(row[0]) for row in result[:5])
+            raise BackupError(f"{name} backup failed integrity_check: {detail}")
+
+        partial.replace(target)
+        pruned = self.prune(name)
+        elapsed = time.perf_counter() - started
+        logger.info("backup %s -> %s (%d steps, %d restarts, %.2fs)", name, file_name, steps, restarts, elapsed)
+        return {
+            "name": name,
+            "source": str(source),
+            "file_name": file_name,
+            "size": target.stat().st_size,
+            "steps": steps,
+            "restarts": restarts,
+            "seconds": round(elapsed, 3),
+            "pruned": pruned,
+        }
+
+    def _copy(self, src: sqlite3.Connection, dst: sqlite3.Connection) -> tuple[int, int]:
+        """단계별 백업 (반환: 단계 수, 재시작 수)"""
+        step_sleep = self.settings.backup_step_sleep_ms / 1000
+        steps = restarts = 0
+        last_remaining = None
+
+        def progress(status: int, remaining: int, total: int) -> None:
+            nonlocal steps, restarts, last_remaining
+            steps += 1
+            # 남은 페이지가 늘었으면 원본 변경으로 처음부터 다시 시작된 것
+            if last_remaining is not None and remaining > last_remaining:
+                restarts += 1
+                if restarts > MAX_RESTARTS:
+                    raise _TooManyRestarts
+            last_remaining = remaining
+            if remaining and step_sleep:
+                time.sleep(step_sleep)
+
+        try:
+            src.backup(dst, pages=self.settings.backup_pages_per_step, progress=progress)
+        except _TooManyRestarts:
+            # 한 단계로 복사 (복사하는 동안만 원본 쓰기 대기)
+            src.backup(dst)
+            steps += 1
+        return steps, restarts
+
+    def run(self) -> dict:
+        """대상 DB 전체 백업 (하나가 실패해도 나머지는 계속, 진행 중인 백업이 끝날 때까지 대기)"""
+        backups, skipped, errors = [], [], []
+        archives = archive_files()
+        with _run_lock:
+            for name, source in self.targets().items():
+                try:
+                    if name in archives and self.unchanged(name, source):
+                        skipped.append(name)
+                        continue
+                    backups.append(self.backup(name, source))
+                except (BackupError, sqlite3.Error) as e:
+                    logger.error("backup %s failed: %s", name, e)
+                    errors.append({"name": name, "error": str(e)})
+        return {"backups": backups, "skipped": skipped, "errors": errors}
+
+    def list_backups(self, name: Optional[str] = None) -> list[Path]:
+        """백업 파일 목록 (최신순)"""
+        if not self.backup_dir.exists():
+            return []
+        # operation_*.db가 추가 센터의 operation_<코드>_*.db까지 잡지 않도록 이름을 정확히 비교
+        backups = []
+        for path in self.backup_dir.glob("*.db"):
+            match = BACKUP_FILE.match(path.name)
+            if match and (name is None or match["name"] == name):
+                backups.append((match["stamp"], path))
+        return [path for _, path in sorted(backups, reverse=True)]
+
+    def prune(self, name: str) -> list[str]:
+        """보존 개수를 넘는 오래된 백업 삭제"""
+        keep = max(self.settings.backup_retention, 1)
+        removed = []
+        for path in self.list_backups(name)[keep:]:
+            path.unlink(missing_ok=True)
+            removed.append(path.name)
+        return removed
+
+    def last_backup_at(self) -> Optional[datetime]:
+        """가장 최근 백업 시각 (파일 이름 기준)"""
+        times = []
+        for path in self.list_backups():
+            try:
+                times.append(datetime.strptime(BACKUP_FILE.match(path.name)["stamp"], TIMESTAMP_FORMAT))
+            except ValueError:
+                continue
+        return max(times) if times else None
+
+
+async def run_backup_schedule() -> None:
+    """backup_interval_hours마다 백업 (앱 lifespan에서 태스크로 실행)
+
+    마지막 백업이 주기보다 오래됐으면 시작 직후 한 번 백업한다.
+    백업은 스레드에서 실행해 이벤트 루프를 막지 않는다.
+    """
+    interval = get_settings().backup_interval_hours * 3600
+    if interval <= 0:
+        return
+    while True:
+        last = BackupService().last_backup_at()
+        elapsed = (datetime.now() - last).total_seconds() if last else interval
+        if elapsed < interval:
+            await asyncio.sleep(interval - elapsed)
+            continue
+        try:
+            result = await asyncio.to_thread(BackupService().run)
+            failed = bool(result["errors"]) or not result["backups"]
+        except Exception:
+            logger.exception("scheduled backup failed")
+            failed = True
+        if failed:
+            # 실패 시 마지막 백업 시각이 갱신되지 않으므로 바로 재시도하지 않는다
+            await asyncio.sleep(min(interval, 3600))
@@ -1,19 +1,41 @@
 """Broj CRM API 클라이언트"""
 
-import httpx
-from typing import Optional
-from app.core.config import get_settings
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Callable, Optional
+from app.core.centers import get_center
+from app.core.config import CenterConfig
+
+if TYPE_CHECKING:
+    import httpx
+
+
+def _async_client(timeout: float) -> "httpx.AsyncClient":
+    """httpx는 임포트가 무거우므로 (서버/스크립트 시작 시간) 처음 요청할 때 임포트"""
+    import httpx
+    return httpx.AsyncClient(timeout=timeout)
+
+
+def month_windows(start_date: date, end_date: date) -> list[tuple[date, date]]:
+    """start_date~end_date를 달력 월 단위 구간으로 분할 (첫/마지막 구간은 잘림)"""
+    windows = []
+    current = start_date
+    while current <= end_date:
+        next_month = (current.replace(day=1) + timedelta(days=32)).replace(day=1)
+        windows.append((current, min(next_month - timedelta(days=1), end_date)))
+        current = next_month
+    return windows
 
 
 class BrojClient:
     """Broj CRM API 클라이언트"""
 
-    def __init__(self):
-        self.settings = get_settings()
-        self.base_url = self.settings.broj_url
+    def __init__(self, center: Optional[CenterConfig] = None):
+        # 센터별 계정 (생략하면 현재 요청의 센터)
+        self.center = center or get_center()
+        self.base_url = self.center.broj_url
         self.access_token: Optional[str] = None
         self.jgroup_access_token: Optional[str] = None
-        self.jgroup_key = self.settings.broj_jgroup_key
+        self.jgroup_key = self.center.broj_jgroup_key
 
     async def login(self) -> bool:
         """로그인 및 토큰 획득"""
@@ -26,9 +48,9 @@ class BrojClient:
             "Referer": "https://oauth.broj.co.kr/",
         }
 
-        data = f"member_id={self.settings.broj_id}&member_password={self.settings.broj_pwd.get_secret_value()}"
+        data = f"member_id={self.center.broj_id}&member_password={self.center.broj_pwd.get_secret_value()}"
 
-        async with httpx.AsyncClient(timeout=60) as client:
+        async with _async_client(60) as client:
             response = await client.post(login_url, headers=headers, content=data)
             response.raise_for_status()
 
@@ -43,7 +65,7 @@ class BrojClient:
 
             return True
 
-    async def _get_jgroup_access_token(self, client: httpx.AsyncClient) -> None:
+    async def _get_jgroup_access_token(self, client: "httpx.AsyncClient") -> None:
         """JGroup Access Token 획득"""
         jgroup_url = f"{self.base_url}/BroJServer/api/jgroup/{self.jgroup_key}"
 
@@ -59,22 +81,31 @@ class BrojClient:
             data = response.json()
             self.jgroup_access_token = data.get("access_token")
 
-    async def fetch_members(self, page_size: int = 1000, verbose: bool = True) -> list[dict]:
-        """회원 목록 조회"""
+    async def fetch_members(
+        self,
+        page_size: int = 1000,
+        verbose: bool = True,
+        sort_column: str = "created_dttm",
+        stop_after_page: Optional[Callable[[list[dict]], bool]] = None,
+    ) -> list[dict]:
+        """회원 목록 조회
+
+        stop_after_page가 주어지면 각 페이지 수신 후 호출하여 True이면 페이징을 멈춘다 (증분 동기화용).
+        """
         if not self.access_token:
             await self.login()
 
         all_members = []
         page_index = 0
 
-        async with httpx.AsyncClient(timeout=120) as client:
+        async with _async_client(120) as client:
             while True:
                 url = f"{self.base_url}/BroJServer/api/jcustomer/jgroup/{self.jgroup_key}"
                 params = {
                     "size": page_size,
                     "page_index": page_index,
                     "status": "ALL",
-                    "sort_column": "created_dttm",
+                    "sort_column": sort_column,
                     "sort_type": "desc",
                 }
                 headers = {
@@ -117,6 +148,11 @@ class BrojClient:
                         print("      마지막 페이지입니다.", flush=True)
                     break
 
+                if stop_after_page and stop_after_page(members):
+                    if verbose:
+                        print("      이미 동기화된 회원에 도달하여 중단합니다.", flush=True)
+                    break
+
                 page_index += 1
 
         return all_members
@@ -129,7 +165,7 @@ class BrojClient:
         all_tickets = []
         page_index = 0
 
-        async with httpx.AsyncClient(timeout=120) as client:
+        async with _async_client(120) as client:
             while True:
                 url = f"{self.base_url}/BroJServer/api/jgroup/lessonticket/{self.jgroup_key}"
                 params = {
@@ -158,3 +194,117 @@ class BrojClient:
                 page_index += 1
 
         return all_tickets
+
+    async def fetch_attendance(self, start_date: date, end_date: date, page_size: int = 400) -> list[dict]:
+        """출석 목록 조회 (start_date~end_date를 월 단위 구간으로 나눠 구간마다 페이징)
+
+        증분 동기화는 마지막 출석일부터 오늘까지만 요청하므로 보통 이번 달 구간 하나다.
+        """
+        if not self.access_token:
+            await self.login()
+
+        all_attendance = []
+
+        async with _async_client(120) as client:
+            for window_start, window_end in month_windows(start_date, end_date):
+                page_index = 0
+                while True:
+                    url = f"{self.base_url}/BroJServer/api/jgroup/{self.jgroup_key}/attendance"
+                    params = {
+                        "start_date": window_start.isoformat(),
+                        "close_date": window_end.isoformat(),
+                        "size": page_size,
+                        "page_index": page_index,
+                        "sort_type": "desc",
+                    }
+                    response = await client.get(url, params=params, headers=self._api_headers())
+                    response.raise_for_status()
+
+                    data = response.json()
+                    # 응답 형식 확인 (result 배열 또는 _embedded)
+                    result = data.get("result")
+                    if isinstance(result, dict):
+                        records = result.get("_embedded", {}).get("jgattendances", [])
+                    elif isinstance(result, list):
+                        records = result
+                    else:
+                        records = data.get("_embedded", {}).get("jgattendances", [])
+
+                    if not records:
+                        break
+
+                    all_attendance.extend(records)
+
+                    if len(records) < page_size:
+                        break
+
+                    page_index += 1
+
+        return all_attendance
+
+    def _api_headers(self) -> dict:
+        """API 공통 헤더"""
+        headers = {
+            "Authorization": f"Bearer {self.access_token}",
+            "Accept": "*/*",
+            "Origin": "https://crm.broj.co.kr",
+            "Referer": "https://crm.broj.co.kr/",
+        }
+        if self.jgroup_access_token:
+            headers["x-broj-jgroup-access-token"] = self.jgroup_access_token
+        return headers
+
+    async def fetch_member(self, jgjm_key: int, keyword: str) -> Optional[dict]:
+        """회원 1명 조회 (이름/전화번호 키워드 검색 후 jgjm_key로 필터)"""
+        if not self.access_token:
+            await self.login()
+
+        async with _async_client(30) as client:
+            url = f"{self.base_url}/BroJServer/api/jcustomer/jgroup/{self.jgroup_key}"
+            params = {
+                "size": 50,
+                "page_index": 0,
+                "status": "ALL",
+                "keyword": keyword,
+                "sort_column": "created_dttm",
+                "sort_type": "desc",
+            }
+            response = await client.get(url, params=params, headers=self._api_headers())
+            response.raise_for_status()
+
+            data = response.json()
+            members = data.get("result") if isinstance(data.get("result"), list) else \
+                data.get("_embedded", {}).get("jcustomers", [])
+
+        return next((m for m in members or [] if m.get("jgjm_key") == jgjm_key), None)
+
+    async def fetch_member_lesson_tickets(self, jgjm_key: int, keyword: str, page_size: int = 100) -> list[dict]:
+        """회원 1명의 수강권 조회 (키워드 검색 후 jgjm_key로 필터)
+
+        이름 검색은 동명이인 수강권이 한 페이지를 넘을 수 있으므로 마지막 페이지까지 받는다
+        (호출 측이 결과에 없는 수강권을 지우므로 일부만 받으면 안 됨).
+        """
+        if not self.access_token:
+            await self.login()
+
+        tickets = []
+        page_index = 0
+        async with _async_client(30) as client:
+            url = f"{self.base_url}/BroJServer/api/jgroup/lessonticket/{self.jgroup_key}"
+            while True:
+                params = {
+                    "page_index": page_index,
+                    "page_size": page_size,
+                    "status": "ALL",
+                    "keyword": keyword,
+                }
+                response = await client.get(url, params=params, headers=self._api_headers())
+                response.raise_for_status()
+
+                page = response.json().get("result", [])
+                tickets.extend(page)
+                if len(page) < page_size:
+                    break
+                page_index += 1
+
+        return [t for t in tickets if t.get("jgjm_key") == jgjm_key]
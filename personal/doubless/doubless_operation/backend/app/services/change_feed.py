@@ -0,0 +1,80 @@
+"""변경 피드 서비스"""
+
+from typing import Optional
+from sqlalchemy import func
+from sqlmodel import Session, select
+
+from app.db.change_tracking import TRACKED_TABLES
+from app.db.models.change_log import ChangeLog
+
+CHANGE_PAGE_SIZE = 1000
+
+
+class ChangeFeedService:
+    """변경 피드 서비스
+
+    change_log를 버전 이후로 읽어 행별 마지막 변경만 남긴(compaction) upsert/delete 목록을 만든다.
+    replace 표시가 있는 테이블은 행 단위 변경 대신 reload 대상으로 돌려준다.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def current_version(self) -> int:
+        """현재 변경 버전"""
+        return self.session.exec(select(func.max(ChangeLog.id))).one() or 0
+
+    def changes_since(self, since: Optional[int], limit: int = CHANGE_PAGE_SIZE) -> dict:
+        """since 버전 이후 변경 (최대 limit건의 로그를 압축)"""
+        current = self.current_version()
+
+        # 첫 조회이거나 DB가 초기화된 경우 전체 재조회
+        if since is None or since > current:
+            return {
+                "version": current,
+                "has_more": False,
+                "reload": sorted(TRACKED_TABLES),
+                "upserts": {},
+                "deletes": {},
+            }
+
+        entries = self.session.exec(
+            select(ChangeLog.id, ChangeLog.table_name, ChangeLog.row_id, ChangeLog.op)
+            .where(ChangeLog.id > since)
+            .order_by(ChangeLog.id)
+            .limit(limit)
+        ).all()
+
+        reload: set[str] = set()
+        latest: dict[tuple[str, int], str] = {}
+        for _, table_name, row_id, op in entries:
+            if op == "replace":
+                reload.add(table_name)
+                latest = {k: v for k, v in latest.items() if k[0] != table_name}
+            elif table_name not in reload:
+                latest[(table_name, row_id)] = op
+
+        upsert_ids: dict[str, list[int]] = {}
+        deletes: dict[str, list[int]] = {}
+        for (table_name, row_id), op in latest.items():
+            target = upsert_ids if op == "upsert" else deletes
+            target.setdefault(table_name, []).append(row_id)
+
+        upserts: dict[str, list[dict]] = {}
+        for table_name, ids in upsert_ids.items():
+            model = TRACKED_TABLES[table_name]
+            rows = self.session.exec(select(model).where(model.id.in_(ids))).all()
+            upserts[table_name] = [row.model_dump(mode="json") for row in rows]
+
+            # 이후 삭제되었지만 아직 로그를 읽지 않은 행
+            missing = set(ids) - {row.id for row in rows}
+            if missing:
+                deletes.setdefault(table_name, []).extend(sorted(missing))
+
+        return {
+            "version": entries[-1][0] if entries else since,
+            "has_more": len(entries) == limit,
+            "reload": sorted(reload),
+            "upserts": upserts,
+            "deletes": deletes,
+        }
@@ -0,0 +1,79 @@
+"""CRM 응답 -> 로컬 캐시 모델 변환"""
+
+from datetime import datetime
+from typing import Optional
+
+from app.db.models.attendance_cache import AttendanceCache
+from app.db.models.member_cache import MemberCache
+from app.db.models.lesson_ticket_cache import LessonTicketCache
+
+
+def ms_to_date(ms: Optional[int]) -> Optional[str]:
+    """밀리초 타임스탬프를 날짜 문자열로 변환"""
+    if ms is None:
+        return None
+    try:
+        return datetime.fromtimestamp(ms / 1000).strftime("%Y-%m-%d")
+    except (ValueError, TypeError, OSError):
+        return None
+
+
+def ms_to_datetime(ms: Optional[int]) -> Optional[str]:
+    """밀리초 타임스탬프를 일시 문자열(YYYY-MM-DD HH:MM:SS)로 변환"""
+    if ms is None:
+        return None
+    try:
+        return datetime.fromtimestamp(ms / 1000).strftime("%Y-%m-%d %H:%M:%S")
+    except (ValueError, TypeError, OSError):
+        return None
+
+
+def to_member_cache(member: dict, synced_at: datetime) -> MemberCache:
+    """CRM 회원 데이터를 MemberCache로 변환"""
+    return MemberCache(
+        jgjm_key=member.get("jgjm_key"),
+        name=member.get("jgjm_member_name", ""),
+        phone=member.get("jgjm_member_phone_number"),
+        gender=member.get("jgjm_member_sex"),
+        classification=member.get("classification"),
+        customer_status=member.get("customer_status"),
+        synced_at=synced_at,
+    )
+
+
+def to_lesson_ticket_cache(ticket: dict, synced_at: datetime) -> LessonTicketCache:
+    """CRM 수강권 데이터를 LessonTicketCache로 변환"""
+    return LessonTicketCache(
+        jglesson_ticket_key=ticket.get("jglesson_ticket_key"),
+        jgjm_key=ticket.get("jgjm_key"),
+        member_name=ticket.get("jgjm_member_name", ""),
+        member_phone=ticket.get("jgjm_member_phone_number"),
+        ticket_type=ticket.get("jglesson_ticket_type", ""),
+        total_count=ticket.get("jglesson_ticket_origin_count", 0) or ticket.get("jglesson_origin_ticket_count", 0) or 0,
+        remaining_count=ticket.get("jglesson_ticket_count", 0) or 0,
+        trainer_key=ticket.get("jgjm_trainer_key"),
+        trainer_name=ticket.get("trainer_name"),
+        start_date=ms_to_date(ticket.get("jglesson_ticket_started_dttm")),
+        end_date=ms_to_date(ticket.get("jglesson_ticket_closed_dttm")),
+        status=ticket.get("status"),
+        synced_at=synced_at,
+    )
+
+
+def to_attendance_cache(record: dict, synced_at: datetime) -> Optional[AttendanceCache]:
+    """CRM 출석 데이터를 AttendanceCache로 변환 (키나 입장 시각이 없으면 None)"""
+    started = ms_to_datetime(record.get("jgm_attendance_started_dttm"))
+    if not record.get("jgm_attendance_key") or not started:
+        return None
+    return AttendanceCache(
+        attendance_key=record["jgm_attendance_key"],
+        jgjm_key=record.get("jgjm_key"),
+        member_name=record.get("jgjm_member_name") or "",
+        attendance_date=started[:10],
+        attendance_time=started[11:],
+        closed_at=ms_to_datetime(record.get("jgm_attendance_closed_dttm")),
+        ticket_name=record.get("ticket_name"),
+        door_name=record.get("door_name"),
+        status=record.get("status"),
+        synced_at=synced_at,
+    )
@@ -0,0 +1,175 @@
+"""실시간 이벤트 브로드캐스터 (Server-Sent Events)
+
+프로세스 하나에 브로드캐스터 하나를 두고, 접속한 클라이언트마다 크기가 제한된 큐를 만든다.
+발행은 모든 큐에 put_nowait로 넣기만 하므로 느린 클라이언트가 쓰기 요청을 막지 않으며,
+큐가 가득 찬 클라이언트는 연결을 끊는다 (다시 접속하면 목록을 새로 불러온다).
+"""
+
+import asyncio
+import json
+from datetime import date
+from itertools import count
+from typing import AsyncIterator, Optional
+
+from app.core.centers import CenterLocal
+from app.core.config import get_settings
+from app.db.models.session_log import SessionLog, SessionStatus
+
+# 연결 종료 신호
+_CLOSE = None
+
+
+class Subscriber:
+    """SSE 구독자 (클라이언트 연결 1개)"""
+
+    def __init__(self, queue_size: int):
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.dropped = False
+
+
+class EventBroadcaster:
+    """프로세스 내 이벤트 브로드캐스터"""
+
+    def __init__(self):
+        self._subscribers: set[Subscriber] = set()
+        self._ids = count(1)
+        self.published = 0
+        self.dropped = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self) -> Subscriber:
+        """구독 등록"""
+        subscriber = Subscriber(get_settings().sse_queue_size)
+        self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        """구독 해제"""
+        self._subscribers.discard(subscriber)
+
+    def _drop(self, subscriber: Subscriber) -> None:
+        """느린 구독자 연결 종료 (쌓인 이벤트를 버리고 종료 신호만 남김)"""
+        self._subscribers.discard(subscriber)
+        subscriber.dropped = True
+        while not subscriber.queue.empty():
+            subscriber.queue.get_nowait()
+        subscriber.queue.put_nowait(_CLOSE)
+        self.dropped += 1
+
+    def publish(self, event: str, data: dict) -> int:
+        """모든 구독자에게 이벤트 전달 (이벤트 루프 안에서 호출)"""
+        return self.publish_many([(event, data)])
+
+    def publish_many(self, events: list[tuple[str, dict]]) -> int:
+        """여러 이벤트를 한 메시지로 묶어 전달 (구독자 큐 1칸 사용)"""
+        message = "".join(format_sse(event, data, next(self._ids)) for event, data in events)
+        for subscriber in list(self._subscribers):
+            try:
+                subscriber.queue.put_nowait(message)
+            except asyncio.QueueFull:
+                self._drop(subscriber)
+        self.published += len(events)
+        return len(self._subscribers)
+
+    async def stream(self, subscriber: Subscriber, heartbeat: Optional[float] = None) -> AsyncIterator[str]:
+        """구독자 큐를 SSE 문자열로 전달 (유휴 시 heartbeat 주석 전송)
+
+        첫 메시지를 받은 뒤 sse_batch_ms 동안 모인 메시지를 한 번에 보내
+        쓰기가 몰릴 때 클라이언트별 전송 횟수를 줄인다.
+        """
+        heartbeat = heartbeat or get_settings().sse_heartbeat_seconds
+        batch_seconds = get_settings().sse_batch_ms / 1000
+        try:
+            yield f"retry: {get_settings().sse_retry_ms}\n\n"
+            while True:
+                try:
+                    message = await asyncio.wait_for(subscriber.queue.get(), timeout=heartbeat)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if message is _CLOSE:
+                    break
+                if batch_seconds > 0:
+                    await asyncio.sleep(batch_seconds)
+
+                chunks = [message]
+                while not subscriber.queue.empty():
+                    message = subscriber.queue.get_nowait()
+                    if message is _CLOSE:
+                        break
+                    chunks.append(message)
+                yield "".join(chunks)
+                if message is _CLOSE:
+                    break
+        finally:
+            self.unsubscribe(subscriber)
+
+
+def format_sse(event: str, data: dict, event_id: int) -> str:
+    """SSE 메시지 문자열"""
+    payload = json.dumps(data, ensure_ascii=False, default=str, separators=(",", ":"))
+    return f"id: {event_id}\nevent: {event}\ndata: {payload}\n\n"
+
+
+def session_payload(log: SessionLog) -> dict:
+    """세션 이벤트 본문"""
+    return {
+        "id": log.id,
+        "session_date": log.session_date,
+        "session_time": log.session_time,
+        "trainer_name": log.trainer_name,
+        "member_name": log.member_name,
+        "session_type": log.session_type,
+        "session_status": log.session_status.value if hasattr(log.session_status, "value") else log.session_status,
+        "session_index": log.session_index,
+        "exported": log.exported,
+    }
+
+
+def dashboard_delta(before: Optional[tuple[str, str, bool]], after: Optional[tuple[str, str, bool]]) -> Optional[dict]:
+    """대시보드 카운터 증감 ((session_date, status, exported) 변경 전/후)"""
+    today = date.today().isoformat()
+    delta = {"total": 0, "pending_export": 0, **{s.value: 0 for s in SessionStatus}}
+
+    for state, sign in ((before, -1), (after, 1)):
+        if state is None:
+            continue
+        session_date, status, exported = state
+        if session_date == today:
+            delta["total"] += sign
+            delta[status] += sign
+        if not exported:
+            delta["pending_export"] += sign
+
+    changed = {k: v for k, v in delta.items() if v}
+    return {"date": today, **changed} if changed else None
+
+
+def dashboard_state(log: SessionLog) -> tuple[str, str, bool]:
+    """대시보드 카운터 기준 상태"""
+    status = log.session_status.value if hasattr(log.session_status, "value") else log.session_status
+    return log.session_date, status, log.exported
+
+
+def publish_session_event(
+    action: str,
+    payload: dict,
+    before: Optional[tuple[str, str, bool]] = None,
+    after: Optional[tuple[str, str, bool]] = None,
+) -> None:
+    """세션 변경 이벤트와 대시보드 카운터 증감 발행 (커밋 후 호출)
+
+    action: created, updated, deleted
+    """
+    events = [(f"session.{action}", payload)]
+    delta = dashboard_delta(before, after)
+    if delta:
+        events.append(("dashboard.delta", delta))
+    broadcaster.publish_many(events)
+
+
+# 센터별 브로드캐스터 (구독자는 접속한 센터의 이벤트만 받음)
+broadcaster: EventBroadcaster = CenterLocal(EventBroadcaster)
@@ -0,0 +1,338 @@
+"""엑셀 내보내기 서비스
+
+업무일지(일자별 시트)와 급여 시트(트레이너별 시트)를 openpyxl write_only 모드로 생성한다.
+openpyxl은 임포트가 무거우므로 (서버 시작 시간) 엑셀을 만들 때 임포트한다.
+시트는 워커 프로세스에서 임시 파일로 병렬 생성한 뒤, 한 행씩 스트리밍하며 하나의 통합 문서로 합친다.
+"""
+
+import os
+import re
+import secrets
+import shutil
+import tempfile
+from collections import defaultdict
+from datetime import date, datetime
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import func
+from sqlmodel import Session, create_engine, select
+
+from app.core.centers import get_center, use_center
+from app.core.config import get_settings
+from app.db.models.export_log import ExportLog
+from app.db.models.lesson_ticket_cache import LessonTicketCache
+from app.db.models.member_cache import MemberCache
+from app.db.models.session_log import SessionLog, SessionStatus
+from app.services.archive_service import ArchiveService
+
+# 업무일지 시간대 (import_worklog.py와 동일: 06:00 ~ 23:00)
+WORKLOG_HOURS = range(6, 24)
+
+# 급여 시트 헤더 (upload_salary_to_db.py가 header=2로 읽는 형식)
+PAYROLL_COLUMNS = [
+    "NO", "회원명", "성별", "등록세션", "총진행세션", "남은세션",
+    "결제형태", "등록비용", "공급가", "회단가", "매출대비율", "수업료",
+    "당월진행세션", "당월수업료", "이달의매출",
+]
+
+# 급여 시트 O~Q열 요약 (upload_salary_to_db.read_sales_data 형식)
+PAYROLL_SUMMARY_COLUMNS = ["총 수업수", "잔여세션", "개인매출"]
+
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+INVALID_SHEET_CHARS = re.compile(r"[\[\]:*?/\\]")
+
+
+def sheet_title(name: str) -> str:
+    """엑셀 시트명 정리 (금지 문자 제거, 31자 제한)"""
+    return INVALID_SHEET_CHARS.sub("_", name)[:31] or "_"
+
+
+def _export_stamp() -> str:
+    """export_id/파일 이름용 시각 + 임의 접미사 (export_id는 unique라 같은 초의 내보내기가 겹치지 않도록)"""
+    return f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{secrets.token_hex(3)}"
+
+
+def format_session_info(log: SessionLog) -> Optional[str]:
+    """업무일지 회차 행 표기 (import_worklog.parse_session_index의 역변환)"""
+    if log.session_type == "OT":
+        return log.session_index or "OT"
+    if log.session_type != "PT":
+        return log.session_type
+
+    text = log.session_index or ""
+    if log.is_event:
+        text = f"{text}+E" if text else "+E"
+    return text or None
+
+
+def _in_center(center_code: str, worker, *args) -> str:
+    """워커를 요청 센터로 실행 (워커 프로세스에는 요청의 센터 contextvar가 없어 보관 파일 경로가 기본 센터로 잡힘)"""
+    with use_center(center_code):
+        return worker(*args)
+
+
+def _write_worklog_part(database_url: str, days: list[tuple[str, str]], out_path: str) -> str:
+    """일자별 업무일지 시트 묶음 생성 (워커 프로세스)
+
+    days는 (session_date, 시트명) 목록이며, 한 번의 범위 조회로 읽는다.
+    """
+    from openpyxl import Workbook
+
+    engine = create_engine(database_url)
+
+    with Session(engine) as session:
+        logs = ArchiveService(session).get_logs(days[0][0], days[-1][0])
+
+    # 일자 -> 트레이너 -> 시간대 -> 세션 목록 (같은 시간대 두 번째 세션은 다음 행 묶음에 씀)
+    grid: dict[str, dict[str, dict[int, list[SessionLog]]]] = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
+    # 시간대(WORKLOG_HOURS) 밖이거나 시간을 읽을 수 없는 세션은 시트 아래에 따로 씀 (급여 집계에서 빠지지 않도록)
+    outside: dict[str, list[SessionLog]] = defaultdict(list)
+    for log in logs:
+        try:
+            hour = int(log.session_time[:2])
+        except ValueError:
+            hour = None
+        if hour in WORKLOG_HOURS:
+            grid[log.session_date][log.trainer_name][hour].append(log)
+        else:
+            outside[log.session_date].append(log)
+
+    wb = Workbook(write_only=True)
+    for session_date, title in days:
+        ws = wb.create_sheet(title)
+        ws.append([f"{session_date} 업무일지"])
+        ws.append(["TR"] + [f"{hour:02d}:00" for hour in WORKLOG_HOURS])
+
+        # 트레이너당 2행 (회원명 / 회차), 같은 시간대에 세션이 더 있으면 2행씩 추가
+        rows = grid.get(session_date, {})
+        for trainer_name in sorted(rows):
+            slots = rows[trainer_name]
+            for n in range(max(len(cell) for cell in slots.values())):
+                ws.append([trainer_name] + [
+                    slots[hour][n].member_name if len(slots.get(hour, ())) > n else None
+                    for hour in WORKLOG_HOURS
+                ])
+                ws.append([None] + [
+                    format_session_info(slots[hour][n]) if len(slots.get(hour, ())) > n else None
+                    for hour in WORKLOG_HOURS
+                ])
+
+        if outside.get(session_date):
+            ws.append([])
+            ws.append(["시간대 밖 세션", "시간", "회원", "회차"])
+            for log in sorted(outside[session_date], key=lambda l: (l.trainer_name, l.session_time)):
+                ws.append([log.trainer_name, log.session_time, log.member_name, format_session_info(log)])
+
+    wb.save(out_path)
+    engine.dispose()
+    return out_path
+
+
+def _write_payroll_sheet(
+    database_url: str,
+    trainer_name: str,
+    start_date: str,
+    end_date: str,
+    title: str,
+    out_path: str,
+) -> str:
+    """트레이너별 급여 시트 생성 (워커 프로세스)"""
+    from openpyxl import Workbook
+
+    engine = create_engine(database_url)
+
+    with Session(engine) as session:
+        logs = ArchiveService(session).get_logs(
+            start_date,
+            end_date,
+            where=lambda t: [t.c.trainer_name == trainer_name],
+        )
+
+        # 회원별 당월 진행 세션 집계 (첫 등장 순서 유지)
+        members: dict[tuple[Optional[int], str], dict] = {}
+        for log in logs:
+            entry = members.setdefault((log.member_key, log.member_name), {
+                "completed": 0,
+                "registration_type": None,
+            })
+            if log.session_status == SessionStatus.COMPLETED:
+                entry["completed"] += 1
+            if log.registration_type:
+                entry["registration_type"] = log.registration_type
+
+        keys = {k for k, _ in members if k is not None}
+        names = {n for k, n in members if k is None}
+
+        tickets: dict = defaultdict(list)
+        genders: dict[int, Optional[str]] = {}
+        if keys:
+            for t in session.exec(select(LessonTicketCache).where(LessonTicketCache.jgjm_key.in_(keys))):
+                tickets[t.jgjm_key].append(t)
+            for m in session.exec(select(MemberCache).where(MemberCache.jgjm_key.in_(keys))):
+                genders[m.jgjm_key] = m.gender
+        if names:
+            for t in session.exec(select(LessonTicketCache).where(LessonTicketCache.member_name.in_(names))):
+                tickets[t.member_name].append(t)
+
+    def pick_ticket(candidates: list[LessonTicketCache]) -> Optional[LessonTicketCache]:
+        """담당 트레이너 일치 > 잔여 횟수 순으로 수강권 선택"""
+        if not candidates:
+            return None
+        return max(candidates, key=lambda t: (t.trainer_name == trainer_name, t.remaining_count > 0, t.start_date or ""))
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title)
+
+    total_completed = sum(e["completed"] for e in members.values())
+    body = []
+    remaining_total = 0
+    for no, ((member_key, member_name), entry) in enumerate(members.items(), start=1):
+        ticket = pick_ticket(tickets[member_key] if member_key is not None else tickets[member_name])
+        total = ticket.total_count if ticket else None
+        remaining = ticket.remaining_count if ticket else None
+        remaining_total += remaining or 0
+        body.append([
+            no,
+            member_name,
+            genders.get(member_key) if member_key is not None else None,
+            total,
+            (total - remaining) if ticket else None,
+            remaining,
+            entry["registration_type"],
+            None, None, None, None, None,
+            entry["completed"],
+            None,
+            None,
+        ])
+
+    # 0~1행: O~Q열 요약, 2행: 헤더 (O열 '이달의매출'은 매출 섹션 헤더)
+    summary_col = PAYROLL_COLUMNS.index("이달의매출")
+    ws.append([f"{start_date} ~ {end_date} {trainer_name}"] + [None] * (summary_col - 1) + PAYROLL_SUMMARY_COLUMNS)
+    ws.append([None] * summary_col + [total_completed, remaining_total, None])
+    ws.append(PAYROLL_COLUMNS)
+    for row in body:
+        ws.append(row)
+
+    wb.save(out_path)
+    engine.dispose()
+    return out_path
+
+
+class ExcelExportService:
+    """엑셀 내보내기 서비스"""
+
+    def __init__(self, session: Session, workers: Optional[int] = None):
+        self.session = session
+        self.settings = get_settings()
+        self.center = get_center()
+        self.workers = workers or self.settings.excel_export_workers or os.cpu_count() or 1
+
+    def _run(self, tasks: list[tuple], worker, out_path: Path) -> None:
+        """시트 병렬 생성 후 스트리밍 병합"""
+        from concurrent.futures import ProcessPoolExecutor
+        from openpyxl import Workbook, load_workbook
+
+        with tempfile.TemporaryDirectory(dir=self.center.exports_dir) as tmp_dir:
+            jobs = [args + (str(Path(tmp_dir) / f"{i:04d}.xlsx"),) for i, args in enumerate(tasks)]
+
+            code = self.center.code
+            if self.workers <= 1 or len(jobs) <= 1:
+                parts = [_in_center(code, worker, *job) for job in jobs]
+            else:
+                with ProcessPoolExecutor(max_workers=min(self.workers, len(jobs))) as pool:
+                    parts = list(pool.map(_in_center, [code] * len(jobs), [worker] * len(jobs), *zip(*jobs)))
+
+            merged = Workbook(write_only=True)
+            for part_path in parts:
+                part = load_workbook(part_path, read_only=True)
+                for part_ws in part.worksheets:
+                    ws = merged.create_sheet(part_ws.title)
+                    for row in part_ws.iter_rows(values_only=True):
+                        ws.append(row)
+                part.close()
+            if not parts:
+                merged.create_sheet("Sheet")
+
+            tmp_out = Path(tmp_dir) / "merged.xlsx"
+            merged.save(tmp_out)
+            shutil.move(str(tmp_out), out_path)
+
+    def _log(self, export_id: str, start_date: str, end_date: str, file_path: Path, session_count: int) -> ExportLog:
+        """내보내기 이력 저장"""
+        now = datetime.now()
+        export_log = ExportLog(
+            export_id=export_id,
+            export_date=now.strftime("%Y-%m-%d"),
+            start_date=start_date,
+            end_date=end_date,
+            session_count=session_count,
+            file_path=str(file_path),
+            file_size_bytes=file_path.stat().st_size,
+            status="completed",
+        )
+        self.session.add(export_log)
+        self.session.commit()
+        self.session.refresh(export_log)
+        return export_log
+
+    def _count_sessions(self, start_date: str, end_date: str) -> int:
+        """기간 내 세션 수 (보관 월 포함)"""
+        table = ArchiveService(self.session).session_log_table(start_date, end_date)
+        return self.session.exec(
+            select(func.count())
+            .select_from(table)
+            .where(table.c.session_date >= start_date)
+            .where(table.c.session_date <= end_date)
+        ).one()
+
+    def export_worklog(self, start_date: str, end_date: str) -> ExportLog:
+        """업무일지 엑셀 내보내기 (일자별 시트)
+
+        한 달 범위면 시트명을 일자("1"~"31")로 하여 import_worklog.py로 다시 읽을 수 있다.
+        """
+        start_day = date.fromisoformat(start_date)
+        end_day = date.fromisoformat(end_date)
+        if end_day < start_day:
+            raise ValueError("end_date must not be before start_date")
+        single_month = (start_day.year, start_day.month) == (end_day.year, end_day.month)
+
+        # 월 단위로 묶어 워커에 배분
+        months: dict[tuple[int, int], list[tuple[str, str]]] = defaultdict(list)
+        for ordinal in range(start_day.toordinal(), end_day.toordinal() + 1):
+            day = date.fromordinal(ordinal)
+            title = str(day.day) if single_month else day.strftime("%m-%d")
+            months[(day.year, day.month)].append((day.isoformat(), title))
+        tasks = [(self.center.database_url, days) for days in months.values()]
+
+        exports_dir = self.center.exports_dir
+        exports_dir.mkdir(parents=True, exist_ok=True)
+        stamp = _export_stamp()
+        file_path = exports_dir / f"worklog_{start_date}_{end_date}_{stamp}.xlsx"
+
+        self._run(tasks, _write_worklog_part, file_path)
+        return self._log(f"xlw-{stamp}", start_date, end_date, file_path, self._count_sessions(start_date, end_date))
+
+    def export_payroll(self, start_date: str, end_date: str) -> ExportLog:
+        """급여 엑셀 내보내기 (트레이너별 시트)"""
+        table = ArchiveService(self.session).session_log_table(start_date, end_date)
+        trainers = sorted(set(self.session.exec(
+            select(table.c.trainer_name)
+            .where(table.c.session_date >= start_date)
+            .where(table.c.session_date <= end_date)
+            .distinct()
+        ).all()))
+
+        tasks = [
+            (self.center.database_url, trainer_name, start_date, end_date, sheet_title(trainer_name))
+            for trainer_name in trainers
+        ]
+
+        exports_dir = self.center.exports_dir
+        exports_dir.mkdir(parents=True, exist_ok=True)
+        stamp = _export_stamp()
+        file_path = exports_dir / f"payroll_{start_date}_{end_date}_{stamp}.xlsx"
+
+        self._run(tasks, _write_payroll_sheet, file_path)
+        return self._log(f"xlp-{stamp}", start_date, end_date, file_path, self._count_sessions(start_date, end_date))
@@ -0,0 +1,129 @@
+"""내보내기 파일(export_*.json) 스트리밍 읽기
+
+ExportService가 쓰는 {"export_info": ..., "statistics": ..., "sessions": [...]} 구조를
+파일 전체를 메모리에 올리지 않고 읽는다. 조각 단위로 읽은 버퍼에서 JSONDecoder.raw_decode로
+값 하나씩 꺼내므로 세션 수가 많은 파일도 세션 1건 크기의 메모리만 더 쓴다.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\r\n]*")
+
+
+class ExportFormatError(ValueError):
+    """내보내기 파일 형식 오류"""
+
+
+class _JsonStream:
+    """JSON 토큰 단위 읽기 (구조 문자 확인 + 값 하나씩 디코딩)"""
+
+    def __init__(self, file, chunk_size: int):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """다음 조각을 읽어 버퍼에 붙임 (읽은 부분은 버림)"""
+        data = self.file.read(self.chunk_size)
+        if not data:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """공백을 건너뛴 다음 문자 (파일 끝이면 빈 문자열)"""
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ExportFormatError(f"Expected {char!r}, found {found or 'end of file'!r}")
+        self.pos += 1
+
+    def skip(self, char: str) -> bool:
+        """다음 문자가 char면 건너뛰고 True"""
+        if self.peek() == char:
+            self.pos += 1
+            return True
+        return False
+
+    def value(self):
+        """JSON 값 하나 디코딩 (버퍼 끝에서 잘렸으면 더 읽고 재시도)"""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as e:
+                if not self._fill():
+                    raise ExportFormatError(str(e)) from e
+                continue
+            # 숫자/리터럴이 버퍼 끝에서 끝났으면 뒤가 더 있을 수 있음
+            if end == len(self.buf) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return value
+
+
+class ExportReader:
+    """내보내기 파일 읽기
+
+    with ExportReader(path) as reader:
+        for session in reader.sessions():
+            ...  # reader.info는 첫 세션 전에 채워짐 (export_info가 sessions보다 앞에 있을 때)
+    """
+
+    def __init__(self, path: Union[str, Path], chunk_size: int = CHUNK_SIZE):
+        self.path = Path(path)
+        self.chunk_size = chunk_size
+        self.header: dict = {}
+        self._file = None
+
+    @property
+    def info(self) -> Optional[dict]:
+        return self.header.get("export_info")
+
+    def __enter__(self) -> "ExportReader":
+        self._file = open(self.path, encoding="utf-8")
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._file.close()
+
+    def sessions(self) -> Iterator[dict]:
+        """세션 객체를 하나씩 반환 (sessions 외 최상위 키는 header에 저장)"""
+        stream = _JsonStream(self._file, self.chunk_size)
+        # export_info보다 먼저 나온 세션 (ExportService 파일에서는 생기지 않음)
+        pending: list[dict] = []
+
+        stream.expect("{")
+        while not stream.skip("}"):
+            key = stream.value()
+            stream.expect(":")
+            if key != "sessions":
+                self.header[key] = stream.value()
+            else:
+                stream.expect("[")
+                while not stream.skip("]"):
+                    session = stream.value()
+                    if self.info is None:
+                        pending.append(session)
+                    else:
+                        yield session
+                    stream.skip(",")
+            stream.skip(",")
+        yield from pending
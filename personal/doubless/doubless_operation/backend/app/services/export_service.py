@@ -5,9 +5,10 @@ from datetime import datetime
 from pathlib import Path
 from sqlmodel import Session, select
 
-from app.core.config import get_settings
+from app.core.centers import get_center
 from app.db.models.session_log import SessionLog, SessionStatus
 from app.db.models.export_log import ExportLog
+from app.profile.memory import memory_stage
 
 
 class ExportService:
@@ -15,7 +16,7 @@ class ExportService:
 
     def __init__(self, session: Session):
         self.session = session
-        self.settings = get_settings()
+        self.center = get_center()
 
     def export_sessions(self, start_date: str, end_date: str) -> ExportLog:
         """세션 데이터 내보내기"""
@@ -30,7 +31,8 @@ class ExportService:
             .where(SessionLog.session_date <= end_date)
             .order_by(SessionLog.session_date, SessionLog.session_time)
         )
-        sessions = self.session.exec(query).all()
+        with memory_stage("query"):
+            sessions = self.session.exec(query).all()
 
         # 통계 계산
         completed = sum(1 for s in sessions if s.session_status == SessionStatus.COMPLETED)
@@ -41,8 +43,8 @@ class ExportService:
         export_data = {
             "export_info": {
                 "export_id": export_id,
-                "center_name": self.settings.center_name,
-                "center_code": self.settings.center_code,
+                "center_name": self.center.name,
+                "center_code": self.center.code,
                 "export_date": now.strftime("%Y-%m-%d"),
                 "export_time": now.strftime("%H:%M:%S"),
                 "period": {
@@ -78,13 +80,13 @@ class ExportService:
         }
 
         # 파일 저장
-        exports_dir = self.settings.exports_dir
+        exports_dir = self.center.exports_dir
         exports_dir.mkdir(parents=True, exist_ok=True)
 
         file_name = f"export_{now.strftime('%Y%m%d_%H%M%S')}.json"
         file_path = exports_dir / file_name
 
-        with open(file_path, "w", encoding="utf-8") as f:
+        with memory_stage("write"), open(file_path, "w", encoding="utf-8") as f:
             json.dump(export_data, f, ensure_ascii=False, indent=2)
 
         file_size = file_path.stat().st_size
@@ -107,7 +109,8 @@ class ExportService:
             status="completed",
         )
         self.session.add(export_log)
-        self.session.commit()
+        with memory_stage("commit"):
+            self.session.commit()
         self.session.refresh(export_log)
 
         return export_log
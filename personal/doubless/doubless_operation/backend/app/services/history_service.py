@@ -0,0 +1,155 @@
+"""회원/수강권 이력 서비스 (SCD type 2)"""
+
+import hashlib
+import json
+from datetime import datetime
+from typing import Iterable, Optional, Type
+from sqlalchemy import or_
+from sqlmodel import Session, SQLModel, select
+
+from app.db.models.member_history import MemberHistory
+from app.db.models.lesson_ticket_history import LessonTicketHistory
+
+MEMBER_FIELDS = [
+    "name", "phone", "gender", "trainer_name", "pt_remaining", "pt_total",
+    "membership_end", "classification", "customer_status",
+]
+
+LESSON_TICKET_FIELDS = [
+    "jgjm_key", "member_name", "member_phone", "ticket_type", "total_count", "remaining_count",
+    "trainer_key", "trainer_name", "start_date", "end_date", "status",
+]
+
+
+def content_hash(row, fields: list[str]) -> str:
+    """이력 대상 필드의 내용 해시"""
+    values = [getattr(row, f) for f in fields]
+    return hashlib.sha1(json.dumps(values, ensure_ascii=False, default=str).encode("utf-8")).hexdigest()
+
+
+class HistoryService:
+    """회원/수강권 이력 서비스
+
+    동기화 결과를 받아 내용 해시가 바뀐 행만 새 버전으로 기록한다.
+    커밋은 호출 측에서 한다.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def _record(
+        self,
+        model: Type[SQLModel],
+        key_field: str,
+        fields: list[str],
+        rows: Iterable,
+        at: datetime,
+        full: bool,
+    ) -> dict:
+        """변경분 기록
+
+        full=True이면 이번 동기화에 없는 현재 버전은 종료(valid_to) 처리한다.
+        """
+        rows = list(rows)
+        query = select(model).where(model.valid_to.is_(None))
+        if not full:
+            # 증분 기록은 들어온 키의 현재 버전만 조회
+            query = query.where(getattr(model, key_field).in_([getattr(r, key_field) for r in rows]))
+        current = {getattr(h, key_field): h for h in self.session.exec(query)}
+
+        seen = set()
+        inserted = closed = 0
+        for row in rows:
+            key = getattr(row, key_field)
+            seen.add(key)
+            digest = content_hash(row, fields)
+
+            previous = current.get(key)
+            if previous is not None:
+                if previous.content_hash == digest:
+                    continue
+                previous.valid_to = at
+                self.session.add(previous)
+                closed += 1
+
+            self.session.add(model(
+                **{key_field: key},
+                **{f: getattr(row, f) for f in fields},
+                content_hash=digest,
+                valid_from=at,
+            ))
+            inserted += 1
+
+        if full:
+            for key, previous in current.items():
+                if key not in seen:
+                    previous.valid_to = at
+                    self.session.add(previous)
+                    closed += 1
+
+        return {"inserted": inserted, "closed": closed, "unchanged": len(seen) - inserted}
+
+    def _close(self, model: Type[SQLModel], key_field: str, keys: Iterable, at: datetime) -> int:
+        """삭제된 키의 현재 버전 종료 (증분 갱신에서 원본에 없어진 행)"""
+        keys = list(keys)
+        if not keys:
+            return 0
+        current = self.session.exec(
+            select(model).where(model.valid_to.is_(None)).where(getattr(model, key_field).in_(keys))
+        ).all()
+        for previous in current:
+            previous.valid_to = at
+            self.session.add(previous)
+        return len(current)
+
+    def record_members(self, members: Iterable, at: datetime, full: bool = True) -> dict:
+        """회원 동기화 결과 이력 기록 (MemberCache 형태)"""
+        return self._record(MemberHistory, "jgjm_key", MEMBER_FIELDS, members, at, full)
+
+    def record_lesson_tickets(self, tickets: Iterable, at: datetime, full: bool = True) -> dict:
+        """수강권 동기화 결과 이력 기록 (LessonTicketCache 형태)"""
+        return self._record(LessonTicketHistory, "jglesson_ticket_key", LESSON_TICKET_FIELDS, tickets, at, full)
+
+    def close_lesson_tickets(self, ticket_keys: Iterable[int], at: datetime) -> int:
+        """삭제된 수강권의 현재 이력 종료"""
+        return self._close(LessonTicketHistory, "jglesson_ticket_key", ticket_keys, at)
+
+    @staticmethod
+    def _valid_at(model: Type[SQLModel], at: datetime):
+        """at 시점에 유효한 버전 조건"""
+        return (
+            (model.valid_from <= at),
+            or_(model.valid_to.is_(None), model.valid_to > at),
+        )
+
+    def member_as_of(self, jgjm_key: int, at: datetime) -> Optional[MemberHistory]:
+        """특정 시점의 회원 정보"""
+        return self.session.exec(
+            select(MemberHistory)
+            .where(MemberHistory.jgjm_key == jgjm_key)
+            .where(*self._valid_at(MemberHistory, at))
+            .order_by(MemberHistory.valid_from.desc())
+        ).first()
+
+    def lesson_tickets_as_of(self, jgjm_key: int, at: datetime) -> list[LessonTicketHistory]:
+        """특정 시점의 회원 수강권 목록"""
+        return list(self.session.exec(
+            select(LessonTicketHistory)
+            .where(LessonTicketHistory.jgjm_key == jgjm_key)
+            .where(*self._valid_at(LessonTicketHistory, at))
+            .order_by(LessonTicketHistory.start_date)
+        ).all())
+
+    def member_versions(self, jgjm_key: int) -> dict:
+        """회원/수강권 전체 변경 이력"""
+        members = self.session.exec(
+            select(MemberHistory)
+            .where(MemberHistory.jgjm_key == jgjm_key)
+            .order_by(MemberHistory.valid_from)
+        ).all()
+        tickets = self.session.exec(
+            select(LessonTicketHistory)
+            .where(LessonTicketHistory.jgjm_key == jgjm_key)
+            .order_by(LessonTicketHistory.valid_from)
+        ).all()
+        return {"member": list(members), "lesson_tickets": list(tickets)}
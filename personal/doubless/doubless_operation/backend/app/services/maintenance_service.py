@@ -0,0 +1,185 @@
+"""DB 유지보수 서비스
+
+operation.db와 doubless.db를 주기적으로 점검한다.
+
+- WAL 체크포인트: WAL이 wal_checkpoint_mb를 넘으면 TRUNCATE(파일 비움), 아니면 PASSIVE.
+  읽기가 계속되면 자동 체크포인트가 WAL 끝까지 가지 못해 파일이 커지므로 주기마다 확인한다.
+- ANALYZE / PRAGMA optimize: 통계(sqlite_stat1)가 없으면 ANALYZE, 있으면 optimize.
+  대량 적재(전체 동기화, 보관, 임포트) 직후에는 analyze_tables로 해당 테이블만 바로 갱신한다.
+- incremental_vacuum: 빈 페이지 비율이 vacuum_freelist_ratio 이상이면 반환.
+  auto_vacuum이 INCREMENTAL이 아닌 파일은 처음 한 번 VACUUM으로 전환한다.
+
+optimize/vacuum은 maintenance_idle_seconds 동안 API 요청이 없을 때만 실행한다.
+"""
+
+import asyncio
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+from sqlmodel import Session, SQLModel
+
+from app.core.activity import idle_seconds
+from app.core.config import get_settings
+from app.db.session import database_files
+from app.db.sqlite_pragmas import apply_pragmas
+
+logger = logging.getLogger(__name__)
+
+# PRAGMA auto_vacuum 값
+AUTO_VACUUM_INCREMENTAL = 2
+
+# ANALYZE 시 인덱스별 표본 행 수 (큰 테이블에서도 빠르게 끝나도록)
+ANALYSIS_LIMIT = 1000
+
+# DB별 마지막 체크포인트 결과 (프로세스 단위)
+_last_checkpoint: dict[str, dict] = {}
+_last_run: dict = {}
+
+# 스케줄 점검과 수동 점검이 겹치지 않도록 한 번에 하나만 실행
+_run_lock = threading.Lock()
+
+
+def analyze_tables(session: Session, *models: type[SQLModel]) -> None:
+    """대량 적재 후 해당 테이블 통계 갱신 (커밋 포함)"""
+    conn = session.connection()
+    conn.exec_driver_sql(f"PRAGMA analysis_limit={ANALYSIS_LIMIT}")
+    for model in models:
+        conn.exec_driver_sql(f'ANALYZE "{model.__tablename__}"')
+    session.commit()
+
+
+class MaintenanceService:
+    """DB 유지보수 서비스"""
+
+    def __init__(self):
+        self.settings = get_settings()
+
+    def _connect(self, path: Path) -> sqlite3.Connection:
+        """자동 커밋 연결 (WAL 등 연결 설정 적용)"""
+        conn = sqlite3.connect(path, timeout=5, isolation_level=None)
+        apply_pragmas(conn)
+        return conn
+
+    def _pragma(self, conn: sqlite3.Connection, name: str):
+        return conn.execute(f"PRAGMA {name}").fetchone()[0]
+
+    def stats(self, name: str, path: Path) -> dict:
+        """파일 크기, 빈 페이지, WAL 크기와 마지막 체크포인트 지연"""
+        conn = sqlite3.connect(path, timeout=5)
+        try:
+            page_size = self._pragma(conn, "page_size")
+            page_count = self._pragma(conn, "page_count")
+            freelist = self._pragma(conn, "freelist_count")
+            journal_mode = self._pragma(conn, "journal_mode")
+            auto_vacuum = self._pragma(conn, "auto_vacuum")
+            analyzed = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+            ).fetchone() is not None
+        finally:
+            conn.close()
+
+        wal = path.with_name(path.name + "-wal")
+        checkpoint = _last_checkpoint.get(name)
+        return {
+            "path": str(path),
+            "file_size": path.stat().st_size,
+            "wal_size": wal.stat().st_size if wal.exists() else 0,
+            "page_size": page_size,
+            "page_count": page_count,
+            "freelist_pages": freelist,
+            "freelist_ratio": round(freelist / page_count, 4) if page_count else 0.0,
+            "journal_mode": journal_mode,
+            "auto_vacuum": auto_vacuum,
+            "analyzed": analyzed,
+            # 마지막 체크포인트 시점에 DB에 반영되지 못한 WAL 프레임 수
+            "checkpoint_lag_frames": checkpoint["log_frames"] - checkpoint["checkpointed_frames"] if checkpoint else None,
+            "last_checkpoint": checkpoint,
+        }
+
+    def checkpoint(self, name: str, path: Path, conn: sqlite3.Connection) -> dict:
+        """WAL 체크포인트 (크기 기준 PASSIVE/TRUNCATE)"""
+        wal = path.with_name(path.name + "-wal")
+        wal_size = wal.stat().st_size if wal.exists() else 0
+        mode = "TRUNCATE" if wal_size > self.settings.wal_checkpoint_mb * 1024 * 1024 else "PASSIVE"
+        busy, log_frames, checkpointed = conn.execute(f"PRAGMA wal_checkpoint({mode})").fetchone()
+        result = {
+            "at": datetime.now().isoformat(),
+            "mode": mode,
+            "wal_size_before": wal_size,
+            "busy": bool(busy),
+            "log_frames": max(log_frames, 0),
+            "checkpointed_frames": max(checkpointed, 0),
+        }
+        _last_checkpoint[name] = result
+        return result
+
+    def optimize(self, conn: sqlite3.Connection) -> str:
+        """통계 갱신 (처음이면 ANALYZE, 이후 PRAGMA optimize)"""
+        conn.execute(f"PRAGMA analysis_limit={ANALYSIS_LIMIT}")
+        if conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'").fetchone() is None:
+            conn.execute("ANALYZE")
+            return "analyze"
+        conn.execute("PRAGMA optimize")
+        return "optimize"
+
+    def vacuum(self, conn: sqlite3.Connection) -> dict:
+        """빈 페이지 반환 (auto_vacuum이 INCREMENTAL이 아니면 VACUUM으로 전환)"""
+        page_count = self._pragma(conn, "page_count")
+        freelist = self._pragma(conn, "freelist_count")
+        if self._pragma(conn, "auto_vacuum") != AUTO_VACUUM_INCREMENTAL:
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.execute("VACUUM")
+            return {"action": "vacuum", "freed_pages": max(page_count - self._pragma(conn, "page_count"), 0)}
+        if not page_count or freelist / page_count < self.settings.vacuum_freelist_ratio:
+            return {"action": None, "freed_pages": 0}
+        conn.execute(f"PRAGMA incremental_vacuum({int(self.settings.vacuum_max_pages)})")
+        return {"action": "incremental_vacuum", "freed_pages": freelist - self._pragma(conn, "freelist_count")}
+
+    def run(self, idle: Optional[bool] = None) -> dict:
+        """점검 실행 (idle=None이면 마지막 요청 이후 경과 시간으로 판단)"""
+        if idle is None:
+            idle = idle_seconds() >= self.settings.maintenance_idle_seconds
+
+        databases, errors = {}, []
+        with _run_lock:
+            for name, path in database_files().items():
+                try:
+                    conn = self._connect(path)
+                    try:
+                        result = {"checkpoint": self.checkpoint(name, path, conn)}
+                        if idle:
+                            result["statistics"] = self.optimize(conn)
+                            result["vacuum"] = self.vacuum(conn)
+                    finally:
+                        conn.close()
+                    databases[name] = result
+                except sqlite3.Error as e:
+                    logger.error("maintenance %s failed: %s", name, e)
+                    errors.append({"name": name, "error": str(e)})
+
+        _last_run.update({"at": datetime.now().isoformat(), "idle": idle, "errors": errors})
+        return {"idle": idle, "databases": databases, "errors": errors}
+
+    def metrics(self) -> dict:
+        """DB별 상태와 마지막 점검 결과"""
+        return {
+            "databases": {name: self.stats(name, path) for name, path in database_files().items()},
+            "idle_seconds": round(idle_seconds(), 1),
+            "last_run": _last_run or None,
+        }
+
+
+async def run_maintenance_schedule() -> None:
+    """maintenance_interval_seconds마다 점검 (앱 lifespan에서 태스크로 실행, 스레드에서 실행)"""
+    interval = get_settings().maintenance_interval_seconds
+    if interval <= 0:
+        return
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(MaintenanceService().run)
+        except Exception:
+            logger.exception("scheduled maintenance failed")
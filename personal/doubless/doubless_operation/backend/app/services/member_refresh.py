@@ -0,0 +1,120 @@
+"""회원 단건 CRM 갱신 (stale-while-revalidate)
+
+상세 조회는 캐시를 바로 반환하고, 캐시가 TTL보다 오래되었으면 백그라운드에서
+해당 회원만 CRM에서 다시 받아 member_cache/lesson_ticket_cache를 갱신한다.
+CRM이 더 이상 돌려주지 않는 수강권은 전체 동기화처럼 지우고, 회원을 받지 못해도 synced_at은 갱신해
+같은 회원이 상세 조회마다 계속 다시 받아지지 않게 한다.
+같은 회원에 대한 동시 갱신 요청은 진행 중인 작업 하나로 합친다.
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Optional
+from sqlmodel import select
+
+from app.core.centers import CenterLocal
+from app.db.session import get_session_context
+from app.db.models.member_cache import MemberCache
+from app.db.models.lesson_ticket_cache import LessonTicketCache
+from app.services.broj_client import BrojClient
+from app.services.crm_mapping import to_lesson_ticket_cache, to_member_cache
+from app.services.history_service import HistoryService, LESSON_TICKET_FIELDS, MEMBER_FIELDS
+from app.services.ticket_validity import ticket_index
+
+logger = logging.getLogger(__name__)
+
+
+class MemberRefresher:
+    """회원 단건 백그라운드 갱신기 (프로세스 단위)"""
+
+    def __init__(self):
+        self._inflight: dict[int, asyncio.Task] = {}
+        self._client: Optional[BrojClient] = None
+
+    def is_refreshing(self, jgjm_key: int) -> bool:
+        task = self._inflight.get(jgjm_key)
+        return task is not None and not task.done()
+
+    def schedule(self, jgjm_key: int, keyword: str) -> bool:
+        """갱신 예약 (이미 진행 중이면 False)"""
+        if self.is_refreshing(jgjm_key):
+            return False
+
+        task = asyncio.create_task(self._refresh(jgjm_key, keyword))
+        self._inflight[jgjm_key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(jgjm_key, None))
+        return True
+
+    async def _get_client(self) -> BrojClient:
+        """로그인된 CRM 클라이언트 재사용"""
+        if self._client is None:
+            client = BrojClient()
+            await client.login()
+            self._client = client
+        return self._client
+
+    async def _refresh(self, jgjm_key: int, keyword: str) -> None:
+        """CRM에서 회원/수강권을 받아 해당 행만 갱신"""
+        try:
+            client = await self._get_client()
+            member = await client.fetch_member(jgjm_key, keyword)
+            tickets = await client.fetch_member_lesson_tickets(jgjm_key, keyword)
+        except Exception as e:
+            # 토큰 만료 등: 다음 요청에서 다시 로그인
+            self._client = None
+            logger.warning("member refresh %s failed: %s", jgjm_key, e)
+            return
+
+        now = datetime.now()
+        with get_session_context() as session:
+            history = HistoryService(session)
+
+            row = session.exec(select(MemberCache).where(MemberCache.jgjm_key == jgjm_key)).first()
+            if member is not None:
+                fresh = to_member_cache(member, now)
+                if row is None:
+                    session.add(fresh)
+                else:
+                    for field in MEMBER_FIELDS:
+                        setattr(row, field, getattr(fresh, field))
+                history.record_members([fresh], now, full=False)
+            if row is not None:
+                # 회원을 받지 못했어도 확인한 시각으로 기록 (다음 TTL까지 다시 받지 않음)
+                row.synced_at = now
+                session.add(row)
+
+            fresh_tickets = [to_lesson_ticket_cache(t, now) for t in tickets]
+            existing = {
+                t.jglesson_ticket_key: t
+                for t in session.exec(select(LessonTicketCache).where(LessonTicketCache.jgjm_key == jgjm_key))
+            }
+            for fresh in fresh_tickets:
+                row = existing.get(fresh.jglesson_ticket_key)
+                if row is None:
+                    session.add(fresh)
+                    continue
+                for field in LESSON_TICKET_FIELDS:
+                    setattr(row, field, getattr(fresh, field))
+                row.synced_at = now
+                session.add(row)
+            # CRM에 없는 수강권은 삭제 (전체 동기화와 같은 기준). 회원을 못 찾았으면 키워드 검색이
+            # 빗나갔을 수 있으므로 지우지 않고 확인 시각만 기록
+            fresh_keys = {t.jglesson_ticket_key for t in fresh_tickets}
+            missing = [row for key, row in existing.items() if key not in fresh_keys]
+            removed = missing if member is not None else []
+            for row in missing:
+                if member is not None:
+                    session.delete(row)
+                else:
+                    row.synced_at = now
+                    session.add(row)
+            history.record_lesson_tickets(fresh_tickets, now, full=False)
+            history.close_lesson_tickets([row.jglesson_ticket_key for row in removed], now)
+
+        if fresh_tickets or removed:
+            ticket_index.invalidate()
+
+
+# 센터별 갱신기 (CRM 계정이 센터마다 다름)
+member_refresher: MemberRefresher = CenterLocal(MemberRefresher)
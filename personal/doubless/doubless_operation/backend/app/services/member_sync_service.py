@@ -0,0 +1,159 @@
+"""회원 동기화 서비스 (전체/증분)"""
+
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlmodel import Session, select, delete
+
+from app.core.config import get_settings
+from app.db.change_tracking import mark_replaced
+from app.db.models.member_cache import MemberCache
+from app.db.models.member_history import MemberHistory
+from app.db.models.sync_state import SyncState
+from app.profile.memory import memory_stage
+from app.services.attendance_sync_service import fill_last_attendance
+from app.services.broj_client import BrojClient
+from app.services.crm_mapping import to_member_cache
+from app.services.history_service import HistoryService, MEMBER_FIELDS, content_hash
+from app.services.maintenance_service import analyze_tables
+
+SYNC_NAME = "members"
+
+
+class MemberSyncService:
+    """회원 동기화 서비스
+
+    증분 모드는 CRM 페이지를 정렬 순서대로 받다가, 저장된 내용 해시와 같은 회원이
+    연속으로 나오면 페이징을 멈추고 바뀐 회원만 갱신한다.
+    전체 모드는 모든 회원을 다시 받아 캐시를 교체하며, 주기적으로 자동 실행된다.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+        self.settings = get_settings()
+
+    def _state(self) -> SyncState:
+        """동기화 상태 조회 (없으면 생성)"""
+        state = self.session.exec(select(SyncState).where(SyncState.name == SYNC_NAME)).first()
+        return state or SyncState(name=SYNC_NAME)
+
+    def resolve_mode(self, mode: str, state: SyncState, now: datetime) -> str:
+        """auto 모드를 full/incremental로 결정"""
+        if mode != "auto":
+            return mode
+        if state.last_full_sync_at is None:
+            return "full"
+        if now - state.last_full_sync_at >= timedelta(hours=self.settings.member_full_sync_hours):
+            return "full"
+        return "incremental"
+
+    async def sync(self, client: Optional[BrojClient] = None, mode: str = "auto", verbose: bool = False) -> dict:
+        """회원 동기화 실행 (mode: auto, full, incremental)"""
+        now = datetime.now()
+        state = self._state()
+        mode = self.resolve_mode(mode, state, now)
+
+        client = client or BrojClient()
+        if not client.access_token:
+            await client.login()
+
+        if mode == "full":
+            with memory_stage("fetch"):
+                members_data = await client.fetch_members(verbose=verbose)
+            with memory_stage("apply"):
+                result = self._apply_full(members_data, now)
+            state.last_full_sync_at = now
+        else:
+            with memory_stage("fetch"):
+                members_data = await self._fetch_incremental(client, verbose)
+            with memory_stage("apply"):
+                result = self._apply_incremental(members_data, now)
+
+        # 새로 들어온 회원 행의 마지막 출석을 출석 캐시로 채움 (전체 교체 후에는 모든 회원)
+        self.session.flush()
+        fill_last_attendance(self.session, None if mode == "full" else [m.get("jgjm_key") for m in members_data])
+
+        state.last_sync_at = now
+        state.last_sync_mode = mode
+        state.last_fetched = len(members_data)
+        state.last_changed = result["history"]["inserted"]
+        self.session.add(state)
+        with memory_stage("commit"):
+            self.session.commit()
+        if mode == "full":
+            # 전체 교체 후 통계 갱신
+            analyze_tables(self.session, MemberCache)
+
+        return {
+            "mode": mode,
+            "fetched": len(members_data),
+            "synced_at": now.isoformat(),
+            **result,
+        }
+
+    async def _fetch_incremental(self, client: BrojClient, verbose: bool) -> list[dict]:
+        """저장된 해시와 같은 회원이 연속으로 나올 때까지 페이지 조회"""
+        known = dict(self.session.exec(
+            select(MemberHistory.jgjm_key, MemberHistory.content_hash)
+            .where(MemberHistory.valid_to.is_(None))
+        ).all())
+        unchanged_run = self.settings.member_sync_unchanged_run
+        run = 0
+
+        def stop_after_page(members: list[dict]) -> bool:
+            nonlocal run
+            for member in members:
+                cache = to_member_cache(member, datetime.now())
+                if known.get(cache.jgjm_key) == content_hash(cache, MEMBER_FIELDS):
+                    run += 1
+                    if run >= unchanged_run:
+                        return True
+                else:
+                    run = 0
+            return False
+
+        return await client.fetch_members(
+            page_size=self.settings.member_sync_page_size,
+            verbose=verbose,
+            sort_column=self.settings.member_sync_sort_column,
+            stop_after_page=stop_after_page,
+        )
+
+    def _apply_full(self, members_data: list[dict], now: datetime) -> dict:
+        """전체 교체"""
+        self.session.exec(delete(MemberCache))
+        mark_replaced(self.session, MemberCache)
+
+        caches = []
+        for member in members_data:
+            cache = to_member_cache(member, now)
+            self.session.add(cache)
+            caches.append(cache)
+
+        history = HistoryService(self.session).record_members(caches, now, full=True)
+        return {"count": len(caches), "history": history}
+
+    def _apply_incremental(self, members_data: list[dict], now: datetime) -> dict:
+        """바뀐 회원만 갱신 (upsert)"""
+        incoming = {}
+        for member in members_data:
+            cache = to_member_cache(member, now)
+            incoming[cache.jgjm_key] = cache
+
+        existing = {
+            m.jgjm_key: m
+            for m in self.session.exec(select(MemberCache).where(MemberCache.jgjm_key.in_(list(incoming))))
+        } if incoming else {}
+
+        history = HistoryService(self.session).record_members(incoming.values(), now, full=False)
+
+        for key, cache in incoming.items():
+            row = existing.get(key)
+            if row is None:
+                self.session.add(cache)
+                continue
+            for field in MEMBER_FIELDS:
+                setattr(row, field, getattr(cache, field))
+            row.synced_at = now
+            self.session.add(row)
+
+        return {"count": len(incoming), "history": history}
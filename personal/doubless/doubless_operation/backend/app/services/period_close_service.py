@@ -0,0 +1,198 @@
+"""월 마감 서비스"""
+
+import hashlib
+import json
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import case, func, insert
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select
+
+from app.db.models.month_close import MonthClose, MonthCloseAggregate, MonthCloseStatus
+from app.services.archive_service import ArchiveService
+
+# 체크섬 대상 컬럼 (급여 산정에 쓰이는 값)
+CHECKSUM_COLUMNS = [
+    "id", "session_date", "session_time", "trainer_name", "member_name", "member_key",
+    "session_type", "session_status", "session_index", "is_event", "registration_type",
+]
+
+
+class PeriodCloseError(ValueError):
+    """마감/재오픈 상태 오류"""
+
+
+class PeriodCloseService:
+    """월 마감 서비스
+
+    마감 시 해당 월 세션으로 트레이너/회원 집계를 계산해 스냅샷으로 저장하고,
+    원본 행 체크섬을 함께 남긴다. 마감된 월의 세션 수정은 period_lock 훅이 막는다.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def active_close(self, year_month: str) -> Optional[MonthClose]:
+        """현재 유효한 마감"""
+        return self.session.exec(
+            select(MonthClose)
+            .where(MonthClose.year_month == year_month)
+            .where(MonthClose.status == MonthCloseStatus.CLOSED)
+        ).first()
+
+    def closed_months(self) -> set[str]:
+        """마감된 월 목록"""
+        return set(self.session.exec(
+            select(MonthClose.year_month).where(MonthClose.status == MonthCloseStatus.CLOSED)
+        ).all())
+
+    def _source(self, year_month: str):
+        """해당 월 세션 테이블과 조건 (보관된 월이면 session_logs_all 뷰)"""
+        start, end = f"{year_month}-01", f"{year_month}-31"
+        table = ArchiveService(self.session).session_log_table(start, end)
+        return table, (table.c.session_date >= start, table.c.session_date <= end)
+
+    def compute_checksum(self, year_month: str) -> tuple[str, int]:
+        """해당 월 세션 원본 행의 SHA-256과 행 수"""
+        table, conditions = self._source(year_month)
+        rows = self.session.exec(
+            select(*[table.c[c] for c in CHECKSUM_COLUMNS]).where(*conditions).order_by(table.c.id)
+        ).all()
+
+        digest = hashlib.sha256()
+        for row in rows:
+            values = [v.value if hasattr(v, "value") else v for v in row]
+            digest.update(json.dumps(values, ensure_ascii=False, default=str).encode("utf-8"))
+            digest.update(b"\n")
+        return digest.hexdigest(), len(rows)
+
+    def _aggregate(self, year_month: str) -> list[tuple]:
+        """트레이너/회원/유형/상태별 세션 수, 이벤트 수"""
+        table, conditions = self._source(year_month)
+        return self.session.exec(
+            select(
+                table.c.trainer_name,
+                table.c.member_name,
+                table.c.session_type,
+                table.c.session_status,
+                func.count(),
+                func.sum(case((table.c.is_event == True, 1), else_=0)),  # noqa: E712
+            )
+            .where(*conditions)
+            .group_by(table.c.trainer_name, table.c.member_name, table.c.session_type, table.c.session_status)
+            .order_by(table.c.trainer_name, table.c.member_name)
+        ).all()
+
+    def close(self, year_month: str, closed_by: Optional[str] = None) -> MonthClose:
+        """월 마감 (집계 스냅샷 + 체크섬 저장, 커밋 포함)"""
+        if self.active_close(year_month):
+            raise PeriodCloseError(f"{year_month} is already closed")
+
+        # 보관 파일 ATTACH가 필요할 수 있으므로 조회를 쓰기보다 먼저 한다
+        checksum, session_count = self.compute_checksum(year_month)
+        rows = self._aggregate(year_month)
+
+        month_close = MonthClose(
+            year_month=year_month,
+            session_count=session_count,
+            checksum=checksum,
+            closed_by=closed_by,
+        )
+        self.session.add(month_close)
+        try:
+            self.session.flush()
+        except IntegrityError:
+            # 동시에 들어온 다른 마감이 먼저 커밋됨 (ix_month_closes_active_month)
+            self.session.rollback()
+            raise PeriodCloseError(f"{year_month} is already closed")
+
+        # 행 단위 ORM INSERT 대신 한 번의 executemany
+        values = []
+        trainer_totals: dict[tuple[str, str, str], list[int]] = {}
+        for trainer_name, member_name, session_type, session_status, count, events in rows:
+            status = session_status.value if hasattr(session_status, "value") else session_status
+            values.append(self._aggregate_row(month_close.id, trainer_name, member_name, session_type, status, count, events or 0))
+            total = trainer_totals.setdefault((trainer_name, session_type, status), [0, 0])
+            total[0] += count
+            total[1] += events or 0
+
+        for (trainer_name, session_type, status), (count, events) in trainer_totals.items():
+            values.append(self._aggregate_row(month_close.id, trainer_name, None, session_type, status, count, events))
+
+        if values:
+            self.session.connection().execute(insert(MonthCloseAggregate.__table__), values)
+
+        self.session.commit()
+        self.session.refresh(month_close)
+        return month_close
+
+    @staticmethod
+    def _aggregate_row(close_id: int, trainer_name: str, member_name: Optional[str], session_type: str,
+                       session_status: str, session_count: int, event_count: int) -> dict:
+        return {
+            "close_id": close_id,
+            "trainer_name": trainer_name,
+            "member_name": member_name,
+            "session_type": session_type,
+            "session_status": session_status,
+            "session_count": session_count,
+            "event_count": event_count,
+        }
+
+    def reopen(self, year_month: str, reason: str, reopened_by: Optional[str] = None) -> MonthClose:
+        """마감 해제 (스냅샷 무효화, 커밋 포함)"""
+        month_close = self.active_close(year_month)
+        if not month_close:
+            raise PeriodCloseError(f"{year_month} is not closed")
+        if not reason.strip():
+            raise PeriodCloseError("A reason is required to reopen a month")
+
+        month_close.status = MonthCloseStatus.REOPENED
+        month_close.reopened_at = datetime.now()
+        month_close.reopened_by = reopened_by
+        month_close.reopen_reason = reason
+        self.session.add(month_close)
+        self.session.commit()
+        self.session.refresh(month_close)
+        return month_close
+
+    def snapshot(self, year_month: str, trainer: Optional[str] = None, members: bool = True) -> Optional[list[MonthCloseAggregate]]:
+        """마감 스냅샷 조회 (마감되지 않았으면 None)
+
+        members=True면 회원별 행, False면 트레이너 합계 행
+        """
+        month_close = self.active_close(year_month)
+        if not month_close:
+            return None
+        query = (
+            select(MonthCloseAggregate)
+            .where(MonthCloseAggregate.close_id == month_close.id)
+            .where(
+                MonthCloseAggregate.member_name.is_not(None) if members
+                else MonthCloseAggregate.member_name.is_(None)
+            )
+            .order_by(MonthCloseAggregate.trainer_name, MonthCloseAggregate.member_name)
+        )
+        if trainer:
+            query = query.where(MonthCloseAggregate.trainer_name == trainer)
+        return list(self.session.exec(query).all())
+
+    def verify(self, year_month: str) -> dict:
+        """마감 체크섬과 현재 원본 비교"""
+        month_close = self.active_close(year_month)
+        if not month_close:
+            raise PeriodCloseError(f"{year_month} is not closed")
+        checksum, session_count = self.compute_checksum(year_month)
+        return {
+            "year_month": year_month,
+            "valid": checksum == month_close.checksum and session_count == month_close.session_count,
+            "checksum": month_close.checksum,
+            "current_checksum": checksum,
+            "session_count": month_close.session_count,
+            "current_session_count": session_count,
+        }
+
+    def list_closes(self) -> list[MonthClose]:
+        return list(self.session.exec(
+            select(MonthClose).order_by(MonthClose.year_month.desc(), MonthClose.closed_at.desc())
+        ).all())
@@ -0,0 +1,159 @@
+"""월별 세션 집계 서비스"""
+
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import case, func, insert
+from sqlmodel import Session, select, delete
+
+from app.db.models.session_log import SessionLog
+from app.db.models.monthly_session_rollup import MonthlySessionRollup
+from app.db.models.session_archive import SessionArchive
+from app.services.archive_service import ArchiveService
+
+# (year_month, trainer_name, member_name, session_type, session_status)
+RollupKey = tuple[str, str, str, str, str]
+
+
+def rollup_key(log: SessionLog) -> RollupKey:
+    """세션의 집계 키"""
+    status = log.session_status
+    return (
+        log.session_date[:7],
+        log.trainer_name,
+        log.member_name,
+        log.session_type,
+        status.value if hasattr(status, "value") else str(status),
+    )
+
+
+class RollupService:
+    """월별 세션 집계 서비스
+
+    세션 쓰기와 같은 트랜잭션 안에서 호출되며, 커밋은 호출 측에서 한다.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def _apply(self, key: RollupKey, count_delta: int, event_delta: int) -> None:
+        """집계 행에 증감 반영"""
+        year_month, trainer_name, member_name, session_type, session_status = key
+        row = self.session.exec(
+            select(MonthlySessionRollup)
+            .where(MonthlySessionRollup.year_month == year_month)
+            .where(MonthlySessionRollup.trainer_name == trainer_name)
+            .where(MonthlySessionRollup.member_name == member_name)
+            .where(MonthlySessionRollup.session_type == session_type)
+            .where(MonthlySessionRollup.session_status == session_status)
+        ).first()
+
+        if row is None:
+            if count_delta <= 0:
+                return
+            row = MonthlySessionRollup(
+                year_month=year_month,
+                trainer_name=trainer_name,
+                member_name=member_name,
+                session_type=session_type,
+                session_status=session_status,
+            )
+
+        row.session_count += count_delta
+        row.event_count += event_delta
+        row.updated_at = datetime.now()
+
+        if row.session_count <= 0:
+            if row.id is not None:
+                self.session.delete(row)
+            return
+
+        self.session.add(row)
+
+    def on_create(self, log: SessionLog) -> None:
+        """세션 생성 반영"""
+        self._apply(rollup_key(log), 1, 1 if log.is_event else 0)
+
+    def on_delete(self, log: SessionLog) -> None:
+        """세션 삭제 반영"""
+        self._apply(rollup_key(log), -1, -1 if log.is_event else 0)
+
+    def on_update(self, old_key: RollupKey, old_is_event: bool, log: SessionLog) -> None:
+        """세션 수정 반영 (이전 키에서 빼고 새 키에 더함)"""
+        new_key = rollup_key(log)
+        if old_key == new_key and old_is_event == log.is_event:
+            return
+        self._apply(old_key, -1, -1 if old_is_event else 0)
+        self._apply(new_key, 1, 1 if log.is_event else 0)
+
+    def rebuild_month(self, year_month: str) -> int:
+        """해당 월 집계를 session_logs에서 재계산 (보관된 월이면 보관 파일 포함)"""
+        start, end = f"{year_month}-01", f"{year_month}-31"
+
+        # 보관 파일 ATTACH는 쓰기 전에 해야 하므로 집계 조회를 먼저 한다
+        table = ArchiveService(self.session).session_log_table(start, end)
+        query = (
+            select(
+                table.c.trainer_name,
+                table.c.member_name,
+                table.c.session_type,
+                table.c.session_status,
+                func.count(),
+                func.sum(case((table.c.is_event == True, 1), else_=0)),  # noqa: E712
+            )
+            .where(table.c.session_date >= start)
+            .where(table.c.session_date <= end)
+            .group_by(
+                table.c.trainer_name,
+                table.c.member_name,
+                table.c.session_type,
+                table.c.session_status,
+            )
+        )
+        rows = self.session.exec(query).all()
+
+        self.session.exec(
+            delete(MonthlySessionRollup).where(MonthlySessionRollup.year_month == year_month)
+        )
+
+        # 행 단위 ORM INSERT 대신 한 번의 executemany
+        now = datetime.now()
+        values = [
+            {
+                "year_month": year_month,
+                "trainer_name": trainer_name,
+                "member_name": member_name,
+                "session_type": session_type,
+                "session_status": session_status.value if hasattr(session_status, "value") else session_status,
+                "session_count": total,
+                "event_count": events or 0,
+                "updated_at": now,
+            }
+            for trainer_name, member_name, session_type, session_status, total, events in rows
+        ]
+        if values:
+            self.session.connection().execute(insert(MonthlySessionRollup.__table__), values)
+
+        return len(values)
+
+    def rebuild_all(self) -> dict[str, int]:
+        """세션이 있는 모든 월(보관된 월 포함) 재계산 (월마다 커밋, 보관 파일 ATTACH는 트랜잭션 밖에서만 가능)"""
+        months = set(self.session.exec(select(func.substr(SessionLog.session_date, 1, 7)).distinct()).all())
+        months.update(self.session.exec(select(SessionArchive.year_month)).all())
+        self.session.commit()
+
+        result = {}
+        for year_month in sorted(months):
+            result[year_month] = self.rebuild_month(year_month)
+            self.session.commit()
+        return result
+
+    def get_month(self, year_month: str, trainer: Optional[str] = None) -> list[MonthlySessionRollup]:
+        """월별 집계 조회"""
+        query = (
+            select(MonthlySessionRollup)
+            .where(MonthlySessionRollup.year_month == year_month)
+            .order_by(MonthlySessionRollup.trainer_name, MonthlySessionRollup.member_name)
+        )
+        if trainer:
+            query = query.where(MonthlySessionRollup.trainer_name == trainer)
+        return list(self.session.exec(query).all())
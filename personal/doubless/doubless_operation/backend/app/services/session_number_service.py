@@ -0,0 +1,169 @@
+"""PT 회차 번호 서비스"""
+
+import re
+from typing import Optional
+from sqlalchemy import and_, or_
+from sqlmodel import Session, select
+
+from app.db.models.session_log import SessionLog
+from app.db.models.lesson_ticket_cache import LessonTicketCache
+
+SESSION_INDEX_PATTERN = re.compile(r"(\d+)\s*/\s*(\d+)")
+
+
+def parse_session_number(session_index: Optional[str]) -> tuple[Optional[int], Optional[int]]:
+    """"15/20" 형태 회차 표기 파싱 -> (회차, 총 회차)"""
+    if not session_index:
+        return None, None
+    match = SESSION_INDEX_PATTERN.search(session_index)
+    if not match:
+        return None, None
+    return int(match.group(1)), int(match.group(2))
+
+
+def format_session_number(session_no: Optional[int], session_total: Optional[int]) -> Optional[str]:
+    """회차 표기 생성"""
+    if session_no is None:
+        return None
+    return f"{session_no}/{session_total}" if session_total else str(session_no)
+
+
+class SessionNumberService:
+    """PT 회차 번호 서비스"""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def _last_session(
+        self,
+        member_key: Optional[int],
+        member_name: str,
+        session_date: str,
+        session_time: str,
+    ) -> Optional[SessionLog]:
+        """해당 시점 직전의 회차가 기록된 PT 세션
+
+        (member_key 또는 member_name, session_date, session_time) 인덱스 역순 조회
+        """
+        query = select(SessionLog)
+        if member_key is not None:
+            query = query.where(SessionLog.member_key == member_key)
+        else:
+            query = query.where(SessionLog.member_name == member_name)
+
+        query = (
+            query
+            .where(SessionLog.session_type == "PT")
+            .where(SessionLog.session_no.is_not(None))
+            .where(or_(
+                SessionLog.session_date < session_date,
+                and_(SessionLog.session_date == session_date, SessionLog.session_time < session_time),
+            ))
+            .order_by(SessionLog.session_date.desc(), SessionLog.session_time.desc())
+            .limit(1)
+        )
+        return self.session.exec(query).first()
+
+    def _active_ticket(self, member_key: Optional[int], session_date: str) -> Optional[LessonTicketCache]:
+        """해당 일자에 사용 가능한 수강권 (잔여 횟수 있음, 기간 내)"""
+        if member_key is None:
+            return None
+        query = (
+            select(LessonTicketCache)
+            .where(LessonTicketCache.jgjm_key == member_key)
+            .where(LessonTicketCache.remaining_count > 0)
+            .where(or_(LessonTicketCache.start_date.is_(None), LessonTicketCache.start_date <= session_date))
+            .where(or_(LessonTicketCache.end_date.is_(None), LessonTicketCache.end_date >= session_date))
+            .order_by(LessonTicketCache.start_date)
+            .limit(1)
+        )
+        return self.session.exec(query).first()
+
+    def suggest(
+        self,
+        member_key: Optional[int],
+        member_name: str,
+        session_date: str,
+        session_time: str,
+    ) -> dict:
+        """다음 회차 제안
+
+        직전 세션의 회차를 이어가되, 직전 수강권이 소진되었거나 기록이 없으면
+        활성 수강권의 (총 횟수 - 잔여 횟수 + 1)로 계산한다.
+        """
+        last = self._last_session(member_key, member_name, session_date, session_time)
+        ticket = self._active_ticket(member_key, session_date)
+
+        session_no: Optional[int] = None
+        session_total: Optional[int] = None
+        source = None
+
+        if last and (last.session_total is None or last.session_no < last.session_total):
+            session_no = last.session_no + 1
+            session_total = last.session_total
+            source = "last_session"
+        elif ticket:
+            session_no = ticket.total_count - ticket.remaining_count + 1
+            session_total = ticket.total_count
+            source = "lesson_ticket"
+
+        return {
+            "session_no": session_no,
+            "session_total": session_total,
+            "session_index": format_session_number(session_no, session_total),
+            "source": source,
+            "last_session_id": last.id if last else None,
+            "jglesson_ticket_key": ticket.jglesson_ticket_key if ticket else None,
+        }
+
+    def apply(self, log: SessionLog) -> Optional[dict]:
+        """세션에 회차 반영
+
+        session_index가 있으면 파싱하여 채우고, 회차가 없는 PT 세션이면 제안값을 채운다.
+        제안값을 사용한 경우 제안 내용을 반환한다.
+        """
+        if log.session_no is None and log.session_index:
+            log.session_no, log.session_total = parse_session_number(log.session_index)
+        if log.session_no is not None:
+            if not log.session_index:
+                log.session_index = format_session_number(log.session_no, log.session_total)
+            return None
+        if log.session_type != "PT":
+            return None
+
+        suggestion = self.suggest(log.member_key, log.member_name, log.session_date, log.session_time)
+        if suggestion["session_no"] is None:
+            return suggestion
+
+        log.session_no = suggestion["session_no"]
+        log.session_total = suggestion["session_total"]
+        log.session_index = suggestion["session_index"]
+        return suggestion
+
+    def backfill(self, batch_size: int = 1000) -> int:
+        """기존 세션의 session_index를 파싱하여 session_no/session_total 채우기"""
+        updated = 0
+        last_id = 0
+        while True:
+            rows = self.session.exec(
+                select(SessionLog)
+                .where(SessionLog.id > last_id)
+                .where(SessionLog.session_no.is_(None))
+                .where(SessionLog.session_index.is_not(None))
+                .order_by(SessionLog.id)
+                .limit(batch_size)
+            ).all()
+            if not rows:
+                break
+
+            for log in rows:
+                session_no, session_total = parse_session_number(log.session_index)
+                if session_no is not None:
+                    log.session_no = session_no
+                    log.session_total = session_total
+                    self.session.add(log)
+                    updated += 1
+            last_id = rows[-1].id
+            self.session.commit()
+
+        return updated
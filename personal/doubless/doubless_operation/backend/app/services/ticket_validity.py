@@ -0,0 +1,158 @@
+"""수강권 유효성 검사 (메모리 구간 인덱스)
+
+회원별 수강권 기간을 시작일 기준으로 정렬해 메모리에 두고,
+세션 저장 시 bisect로 해당 일자를 포함하는 수강권을 찾아 만료/소진/미등록 여부를 검사한다.
+잔여 횟수는 동기화 시점의 값이므로 소진 경고는 그 이후 세션에만 낸다 (마지막 회차를 쓴 세션이나
+이전 세션 수정은 경고하지 않음). 인덱스는 수강권 동기화 후 다시 만든다.
+수강권 전체 동기화 기록(sync_state)이 없으면 캐시에 없는 회원을 미등록으로 볼 수 없으므로
+미등록 경고를 내지 않는다 (회원 상세 갱신으로 일부 회원 수강권만 있는 경우 포함).
+"""
+
+from bisect import bisect_right
+from datetime import datetime
+from threading import Lock
+from typing import NamedTuple, Optional
+from sqlmodel import Session, select
+
+from app.core.centers import CenterLocal
+from app.db.models.lesson_ticket_cache import LessonTicketCache
+from app.db.models.session_log import SessionStatus
+from app.db.models.sync_state import SyncState
+
+MIN_DATE = "0000-00-00"
+MAX_DATE = "9999-12-31"
+
+# 수강권 전체 동기화 상태 (sync_state.name)
+SYNC_NAME = "lesson_tickets"
+
+# 수강권을 소모하는 세션만 검사
+CHECKED_SESSION_TYPES = {"PT"}
+CHECKED_STATUSES = {SessionStatus.COMPLETED.value, SessionStatus.NO_SHOW.value}
+
+
+class TicketInterval(NamedTuple):
+    """수강권 유효 구간"""
+    start_date: str
+    end_date: str
+    remaining_count: int
+    jglesson_ticket_key: int
+    ticket_type: str
+    synced_at: str          # 잔여 횟수 기준 시각 (YYYY-MM-DD HH:MM)
+
+
+class MemberTickets(NamedTuple):
+    """회원별 수강권 구간 (start_date 정렬)"""
+    starts: list[str]
+    intervals: list[TicketInterval]
+
+
+def _minute(value: datetime) -> str:
+    return value.strftime("%Y-%m-%d %H:%M")
+
+
+def _build(tickets: dict) -> dict:
+    """회원별 구간 목록 정렬"""
+    result = {}
+    for key, intervals in tickets.items():
+        intervals.sort()
+        result[key] = MemberTickets([i.start_date for i in intervals], intervals)
+    return result
+
+
+class TicketIntervalIndex:
+    """회원별 수강권 구간 인덱스"""
+
+    def __init__(self):
+        self._by_key: dict[int, MemberTickets] = {}
+        self._by_name: dict[str, MemberTickets] = {}
+        self._loaded = False
+        self._synced = False                        # 수강권 전체 동기화를 한 번이라도 했는지
+        self._lock = Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def rebuild(self, session: Session) -> int:
+        """lesson_ticket_cache에서 인덱스 재구성"""
+        by_key: dict[int, list[TicketInterval]] = {}
+        by_name: dict[str, list[TicketInterval]] = {}
+        count = 0
+
+        rows = session.exec(select(
+            LessonTicketCache.jgjm_key,
+            LessonTicketCache.member_name,
+            LessonTicketCache.start_date,
+            LessonTicketCache.end_date,
+            LessonTicketCache.remaining_count,
+            LessonTicketCache.jglesson_ticket_key,
+            LessonTicketCache.ticket_type,
+            LessonTicketCache.synced_at,
+        ))
+        for jgjm_key, member_name, start_date, end_date, remaining, ticket_key, ticket_type, synced_at in rows:
+            interval = TicketInterval(
+                start_date or MIN_DATE, end_date or MAX_DATE, remaining, ticket_key, ticket_type,
+                _minute(synced_at),
+            )
+            by_key.setdefault(jgjm_key, []).append(interval)
+            by_name.setdefault(member_name, []).append(interval)
+            count += 1
+
+        synced = session.exec(select(SyncState.id).where(SyncState.name == SYNC_NAME)).first() is not None
+
+        with self._lock:
+            self._by_key = _build(by_key)
+            self._by_name = _build(by_name)
+            self._synced = synced
+            self._loaded = True
+
+        return count
+
+    def invalidate(self) -> None:
+        """다음 검사 때 다시 구성하도록 표시"""
+        self._loaded = False
+
+    def ensure_loaded(self, session: Session) -> None:
+        """처음 사용할 때 인덱스 구성"""
+        if not self._loaded:
+            self.rebuild(session)
+
+    def check(
+        self,
+        member_key: Optional[int],
+        member_name: str,
+        session_date: str,
+        session_type: str = "PT",
+        session_status: SessionStatus = SessionStatus.COMPLETED,
+        session_time: str = "",
+    ) -> list[str]:
+        """세션 일자 기준 수강권 유효성 경고 목록 (session_time을 생략하면 소진 여부는 일자로만 비교)"""
+        status = session_status.value if hasattr(session_status, "value") else session_status
+        if session_type not in CHECKED_SESSION_TYPES or status not in CHECKED_STATUSES:
+            return []
+
+        tickets = self._by_key.get(member_key) if member_key is not None else self._by_name.get(member_name)
+        if tickets is None:
+            return [f"{member_name}: 등록된 수강권이 없습니다"] if self._synced else []
+
+        # 시작일 <= 세션일인 구간 중 종료일 >= 세션일인 구간
+        pos = bisect_right(tickets.starts, session_date)
+        if pos == 0:
+            first = tickets.intervals[0]
+            return [f"{member_name}: 수강권 시작 전 세션입니다 (시작일 {first.start_date})"]
+
+        covering = [i for i in tickets.intervals[:pos] if i.end_date >= session_date]
+        if not covering:
+            last_end = max(i.end_date for i in tickets.intervals[:pos])
+            return [f"{member_name}: 만료된 수강권입니다 (최종 만료일 {last_end})"]
+
+        # 잔여 0은 동기화 시점 기준이므로 그 뒤의 세션만 소진 초과 (이전 세션은 그 0에 이미 반영됨)
+        session_at = f"{session_date} {session_time}".rstrip()
+        if all(i.remaining_count <= 0 and session_at > i.synced_at for i in covering):
+            return [f"{member_name}: 잔여 횟수가 없는 수강권입니다 ({covering[-1].ticket_type})"]
+
+        return []
+
+
+# 센터별 인덱스
+ticket_index: TicketIntervalIndex = CenterLocal(TicketIntervalIndex)
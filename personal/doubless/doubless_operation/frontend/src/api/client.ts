@@ -1,9 +1,13 @@
 import axios from 'axios'
 
+// 멀티 센터: 비우면 서버 기본 센터
+export const centerCode: string = import.meta.env.VITE_CENTER_CODE || ''
+
 const apiClient = axios.create({
   baseURL: import.meta.env.VITE_API_URL || '/api/v1',
   headers: {
     'Content-Type': 'application/json',
+    ...(centerCode ? { 'X-Center-Code': centerCode } : {}),
   },
   timeout: 30000,
 })
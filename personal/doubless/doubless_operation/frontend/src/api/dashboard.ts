@@ -1,9 +1,15 @@
 import apiClient from './client'
-import type { DashboardData } from '../types'
+import type { DashboardBootstrap, DashboardData } from '../types'
 
 export const dashboardApi = {
   getToday: async () => {
     const response = await apiClient.get<DashboardData>('/dashboard/today')
     return response.data
   },
+
+  // 대시보드 초기 데이터 일괄 조회 (요청 1회)
+  getBootstrap: async () => {
+    const response = await apiClient.get<DashboardBootstrap>('/dashboard/bootstrap')
+    return response.data
+  },
 }
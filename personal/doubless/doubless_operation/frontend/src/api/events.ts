@@ -0,0 +1,39 @@
+import type { DashboardDelta, SessionEvent } from '../types'
+import { centerCode } from './client'
+
+// EventSource는 헤더를 붙일 수 없으므로 센터를 경로 접두사로 지정
+const apiURL = import.meta.env.VITE_API_URL || '/api/v1'
+const baseURL = centerCode ? apiURL.replace('/api/v1', `/centers/${centerCode}/api/v1`) : apiURL
+
+export interface EventHandlers {
+  onSession?: (action: 'created' | 'updated' | 'deleted', session: SessionEvent) => void
+  onDashboardDelta?: (delta: DashboardDelta) => void
+  onExport?: () => void
+  // 재연결(네트워크 끊김, 느린 구독자 연결 종료) 사이에 놓친 이벤트가 있을 수 있으므로 다시 조회
+  onResync?: () => void
+}
+
+export const eventsApi = {
+  // 서버 이벤트 구독 (SSE). 반환된 함수로 구독 해제
+  subscribe: (handlers: EventHandlers) => {
+    const source = new EventSource(`${baseURL}/events`)
+
+    let opened = false
+    source.onopen = () => {
+      if (opened) handlers.onResync?.()
+      opened = true
+    }
+
+    for (const action of ['created', 'updated', 'deleted'] as const) {
+      source.addEventListener(`session.${action}`, (e) => {
+        handlers.onSession?.(action, JSON.parse((e as MessageEvent).data))
+      })
+    }
+    source.addEventListener('dashboard.delta', (e) => {
+      handlers.onDashboardDelta?.(JSON.parse((e as MessageEvent).data))
+    })
+    source.addEventListener('export.created', () => handlers.onExport?.())
+
+    return () => source.close()
+  },
+}
@@ -1,5 +1,5 @@
 import apiClient from './client'
-import type { Member, MemberSearchResult } from '../types'
+import type { LessonTicket, Member, MemberSearchResult } from '../types'
 
 export const membersApi = {
   list: async (params?: { limit?: number; offset?: number }) => {
@@ -16,13 +16,26 @@ export const membersApi = {
     return response.data
   },
 
-  sync: async () => {
+  sync: async (mode: 'auto' | 'full' | 'incremental' = 'auto') => {
     const response = await apiClient.post<{
       success: boolean
       message: string
+      mode: 'full' | 'incremental'
       count: number
+      fetched: number
       synced_at: string
-    }>('/members/sync')
+    }>('/members/sync', null, { params: { mode } })
+    return response.data
+  },
+
+  getDetail: async (jgjmKey: number) => {
+    const response = await apiClient.get<{
+      member: Member
+      lesson_tickets: LessonTicket[]
+      synced_at: string
+      stale: boolean
+      refreshing: boolean
+    }>(`/members/${jgjmKey}/detail`)
     return response.data
   },
 
@@ -1,5 +1,5 @@
 import apiClient from './client'
-import type { SessionLog, SessionCreate } from '../types'
+import type { SessionLog, SessionCreate, SessionGrid, SessionNumberSuggestion, SessionSaveResult } from '../types'
 
 export const sessionsApi = {
   list: async (params?: { date?: string; trainer?: string }) => {
@@ -12,18 +12,35 @@ export const sessionsApi = {
     return response.data
   },
 
+  getGrid: async (start: string, end: string) => {
+    const response = await apiClient.get<SessionGrid>('/sessions/grid', {
+      params: { start, end },
+    })
+    return response.data
+  },
+
   getTrainers: async () => {
     const response = await apiClient.get<{ trainers: string[] }>('/sessions/trainers')
     return response.data
   },
 
+  suggestNextNumber: async (params: {
+    member_name: string
+    session_date: string
+    session_time?: string
+    member_key?: number
+  }) => {
+    const response = await apiClient.get<SessionNumberSuggestion>('/sessions/next-number', { params })
+    return response.data
+  },
+
   create: async (data: SessionCreate) => {
-    const response = await apiClient.post<SessionLog>('/sessions', data)
+    const response = await apiClient.post<SessionSaveResult>('/sessions', data)
     return response.data
   },
 
   update: async (id: number, data: Partial<SessionCreate>) => {
-    const response = await apiClient.put<SessionLog>(`/sessions/${id}`, data)
+    const response = await apiClient.put<SessionSaveResult>(`/sessions/${id}`, data)
     return response.data
   },
 
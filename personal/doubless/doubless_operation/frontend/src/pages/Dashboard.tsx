@@ -1,22 +1,79 @@
-import { useQuery } from '@tanstack/react-query'
+import { useEffect } from 'react'
+import { useQuery, useQueryClient } from '@tanstack/react-query'
 import { Link } from 'react-router-dom'
 import {
   ClipboardDocumentListIcon,
   ArrowDownTrayIcon,
   UsersIcon,
+  TicketIcon,
   PlusIcon,
 } from '@heroicons/react/24/outline'
 import { dashboardApi } from '../api/dashboard'
+import { eventsApi } from '../api/events'
 import { Card, CardHeader } from '../components/ui/Card'
 import { Button } from '../components/ui/Button'
+import type { DashboardBootstrap } from '../types'
+
+const RECENT_SESSION_LIMIT = 10
 
 export default function Dashboard() {
+  const queryClient = useQueryClient()
   const { data, isLoading } = useQuery({
     queryKey: ['dashboard'],
-    queryFn: dashboardApi.getToday,
-    refetchInterval: 30000, // 30초마다 갱신
+    queryFn: dashboardApi.getBootstrap,
   })
 
+  // 폴링 대신 서버 이벤트로 카운터/오늘 수업 목록 갱신 (재연결하면 놓친 이벤트 대신 다시 조회)
+  useEffect(() => {
+    const patch = (update: (prev: DashboardBootstrap) => DashboardBootstrap) =>
+      queryClient.setQueryData<DashboardBootstrap>(['dashboard'], (prev) =>
+        prev ? update(prev) : prev
+      )
+
+    return eventsApi.subscribe({
+      onDashboardDelta: (delta) =>
+        patch((prev) => ({
+          ...prev,
+          pending_export: prev.pending_export + (delta.pending_export || 0),
+          sessions:
+            delta.date === prev.date
+              ? {
+                  total: prev.sessions.total + (delta.total || 0),
+                  completed: prev.sessions.completed + (delta.completed || 0),
+                  cancelled: prev.sessions.cancelled + (delta.cancelled || 0),
+                  no_show: prev.sessions.no_show + (delta.no_show || 0),
+                }
+              : prev.sessions,
+        })),
+      onSession: (action, session) =>
+        patch((prev) => {
+          const others = prev.recent_sessions.filter((s) => s.id !== session.id)
+          if (action === 'deleted' || session.session_date !== prev.date) {
+            return { ...prev, recent_sessions: others }
+          }
+          const item = {
+            id: session.id,
+            time: session.session_time,
+            trainer: session.trainer_name,
+            member: session.member_name,
+            status: session.session_status,
+          }
+          return {
+            ...prev,
+            recent_sessions: [...others, item]
+              .sort((a, b) => a.time.localeCompare(b.time))
+              .slice(0, RECENT_SESSION_LIMIT),
+          }
+        }),
+      // 내보내기는 여러 건의 미내보내기 상태가 바뀌므로 다시 조회
+      onExport: () => queryClient.invalidateQueries({ queryKey: ['dashboard'] }),
+      onResync: () => {
+        queryClient.invalidateQueries({ queryKey: ['dashboard'] })
+        queryClient.invalidateQueries({ queryKey: ['sessions'] })
+      },
+    })
+  }, [queryClient])
+
   if (isLoading) {
     return <div className="p-6">로딩 중...</div>
   }
@@ -43,6 +100,13 @@ export default function Dashboard() {
       icon: UsersIcon,
       color: 'bg-green-500',
     },
+    {
+      name: '활성 수강권',
+      value: data?.lesson_tickets.active || 0,
+      sub: `전체 ${data?.lesson_tickets.total || 0}건`,
+      icon: TicketIcon,
+      color: 'bg-purple-500',
+    },
   ]
 
   return (
@@ -54,7 +118,7 @@ export default function Dashboard() {
       </div>
 
       {/* Stats */}
-      <div className="grid grid-cols-1 gap-6 sm:grid-cols-3">
+      <div className="grid grid-cols-1 gap-6 sm:grid-cols-2 lg:grid-cols-4">
         {stats.map((stat) => (
           <Card key={stat.name} className="card-hover">
             <div className="flex items-center gap-4">
@@ -1,23 +1,39 @@
-import { useState } from 'react'
+import { useEffect, useState } from 'react'
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query'
 import { PlusIcon, PencilIcon, TrashIcon } from '@heroicons/react/24/outline'
 import { sessionsApi } from '../api/sessions'
+import { eventsApi } from '../api/events'
 import { Card, CardHeader } from '../components/ui/Card'
 import { Button } from '../components/ui/Button'
 import { Modal } from '../components/ui/Modal'
-import type { SessionLog as SessionType, SessionCreate, SessionStatus } from '../types'
+import type { SessionLog as SessionType, SessionCreate, SessionSaveResult, SessionStatus } from '../types'
 
 export default function SessionLog() {
   const queryClient = useQueryClient()
   const [selectedDate, setSelectedDate] = useState(new Date().toISOString().split('T')[0])
   const [isModalOpen, setIsModalOpen] = useState(false)
   const [editingSession, setEditingSession] = useState<SessionType | null>(null)
+  const [saveResult, setSaveResult] = useState<SessionSaveResult | null>(null)
 
   const { data: sessions, isLoading } = useQuery({
     queryKey: ['sessions', selectedDate],
     queryFn: () => sessionsApi.getDaily(selectedDate),
   })
 
+  // 다른 데스크에서 같은 날짜 세션을 바꾸면 다시 조회
+  useEffect(
+    () =>
+      eventsApi.subscribe({
+        onSession: (_action, session) => {
+          if (session.session_date === selectedDate) {
+            queryClient.invalidateQueries({ queryKey: ['sessions', selectedDate] })
+          }
+        },
+        onResync: () => queryClient.invalidateQueries({ queryKey: ['sessions', selectedDate] }),
+      }),
+    [queryClient, selectedDate]
+  )
+
   const { data: trainersData } = useQuery({
     queryKey: ['trainers'],
     queryFn: sessionsApi.getTrainers,
@@ -25,19 +41,21 @@ export default function SessionLog() {
 
   const createMutation = useMutation({
     mutationFn: sessionsApi.create,
-    onSuccess: () => {
+    onSuccess: (result) => {
       queryClient.invalidateQueries({ queryKey: ['sessions'] })
       setIsModalOpen(false)
+      setSaveResult(result)
     },
   })
 
   const updateMutation = useMutation({
     mutationFn: ({ id, data }: { id: number; data: Partial<SessionCreate> }) =>
       sessionsApi.update(id, data),
-    onSuccess: () => {
+    onSuccess: (result) => {
       queryClient.invalidateQueries({ queryKey: ['sessions'] })
       setIsModalOpen(false)
       setEditingSession(null)
+      setSaveResult(result)
     },
   })
 
@@ -67,6 +85,11 @@ export default function SessionLog() {
     }
   }
 
+  // 자동 입력한 회차 (제안값으로 채운 경우만)
+  const suggestedIndex = saveResult?.number_suggestion?.session_index
+  const source = saveResult?.number_suggestion?.source
+  const suggestionSource = source === 'last_session' ? '직전 세션' : source === 'lesson_ticket' ? '수강권' : ''
+
   const statusLabel: Record<SessionStatus, string> = {
     completed: '완료',
     cancelled: '취소',
@@ -102,6 +125,38 @@ export default function SessionLog() {
         </div>
       </Card>
 
+      {/* 저장 결과 (회차 자동 입력, 수강권 경고) */}
+      {saveResult && (suggestedIndex || saveResult.ticket_warnings.length > 0) && (
+        <Card
+          className={saveResult.ticket_warnings.length > 0 ? 'border border-warning' : 'border border-primary-light'}
+        >
+          <div className="flex items-start justify-between gap-4">
+            <div className="space-y-1 text-sm">
+              <p className="font-medium text-gray-900">
+                {saveResult.session_date} {saveResult.session_time} {saveResult.member_name} 저장됨
+              </p>
+              {suggestedIndex && (
+                <p className="text-gray-700">
+                  회차 자동 입력: {suggestedIndex}
+                  {suggestionSource && ` (${suggestionSource} 기준)`}
+                </p>
+              )}
+              {saveResult.ticket_warnings.map((warning) => (
+                <p key={warning} className="text-warning">
+                  {warning}
+                </p>
+              ))}
+            </div>
+            <button
+              onClick={() => setSaveResult(null)}
+              className="text-sm text-gray-400 hover:text-gray-600"
+            >
+              닫기
+            </button>
+          </div>
+        </Card>
+      )}
+
       {/* Sessions Table */}
       <Card>
         <CardHeader title={`${selectedDate} 수업 목록`} />
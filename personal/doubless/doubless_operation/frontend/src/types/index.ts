@@ -9,6 +9,8 @@ export interface SessionLog {
   session_type: string
   session_status: SessionStatus
   session_index?: string
+  session_no?: number
+  session_total?: number
   is_event: boolean
   registration_type?: string
   note?: string
@@ -16,6 +18,21 @@ export interface SessionLog {
   exported: boolean
 }
 
+// POST/PUT /sessions response
+export interface SessionSaveResult extends SessionLog {
+  number_suggestion?: SessionNumberSuggestion | null
+  ticket_warnings: string[]
+}
+
+export interface SessionNumberSuggestion {
+  session_no: number | null
+  session_total: number | null
+  session_index: string | null
+  source: 'last_session' | 'lesson_ticket' | null
+  last_session_id: number | null
+  jglesson_ticket_key: number | null
+}
+
 export type SessionStatus = 'completed' | 'cancelled' | 'no_show' | 'payment'
 
 export interface SessionCreate {
@@ -27,11 +44,28 @@ export interface SessionCreate {
   session_type?: string
   session_status?: SessionStatus
   session_index?: string
+  session_no?: number
+  session_total?: number
   is_event?: boolean
   registration_type?: string
   note?: string
 }
 
+// [member, status, session_id, session_index]
+export type SessionGridCell = [number, number, number, string | null]
+
+export interface SessionGrid {
+  start: string
+  end: string
+  hours: string[]
+  dates: string[]
+  trainers: string[]
+  members: string[]
+  statuses: SessionStatus[]
+  grid: (SessionGridCell | null)[][][]
+  overflow: [number, number, number, number, number, number, string | null][]
+}
+
 // Member Types
 export interface Member {
   id: number
@@ -125,3 +159,38 @@ export interface DashboardData {
     status: string
   }[]
 }
+
+export interface DashboardBootstrap extends DashboardData {
+  members: {
+    total: number
+    synced_at: string | null
+  }
+  lesson_tickets: {
+    total: number
+    active: number
+    synced_at: string | null
+  }
+}
+
+// Realtime Event Types
+export interface SessionEvent {
+  id: number
+  session_date: string
+  session_time: string
+  trainer_name: string
+  member_name: string
+  session_type: string
+  session_status: SessionStatus
+  session_index: string | null
+  exported: boolean
+}
+
+export interface DashboardDelta {
+  date: string
+  total?: number
+  pending_export?: number
+  completed?: number
+  cancelled?: number
+  no_show?: number
+  payment?: number
+}
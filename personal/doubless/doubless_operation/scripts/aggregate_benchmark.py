@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""센터 내보내기 통합 처리량 측정
+
+임시 디렉토리에 가상 센터 내보내기 파일을 만들고(ExportService와 같은 형식), 워커 수별로
+빈 중앙 DB에 적재하는 시간을 잰다. 일부 파일은 같은 내보내기를 다른 이름으로 복사해
+파일 단위 중복 건너뛰기도 함께 확인한다.
+
+사용법:
+    python scripts/aggregate_benchmark.py [--files 1000] [--sessions 200] [--centers 50] [--workers 1 4]
+"""
+
+import argparse
+import json
+import random
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+# backend 모듈 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
+
+TRAINERS = ["김코치", "이코치", "박코치", "최코치", "정코치", "강코치"]
+SESSION_TYPES = ["PT", "PT", "PT", "OT", "기타"]
+STATUSES = ["completed", "completed", "completed", "cancelled", "no_show"]
+
+
+def write_export(path: Path, center: int, export_no: int, sessions: int, rng: random.Random) -> None:
+    """가상 내보내기 파일 1개"""
+    month = export_no % 12 + 1
+    first_id = export_no * sessions
+    data = {
+        "export_info": {
+            "export_id": f"exp-2026{month:02d}28-{export_no:06d}",
+            "center_name": f"센터{center}",
+            "center_code": f"CENTER{center:03d}",
+            "export_date": f"2026-{month:02d}-28",
+            "export_time": "21:00:00",
+            "period": {"start_date": f"2026-{month:02d}-01", "end_date": f"2026-{month:02d}-28"},
+            "version": "1.0.0",
+        },
+        "statistics": {"total_sessions": sessions, "completed": 0, "cancelled": 0, "no_show": 0},
+        "sessions": [
+            {
+                "id": first_id + i,
+                "session_date": f"2026-{month:02d}-{rng.randint(1, 28):02d}",
+                "session_time": f"{rng.randint(6, 22):02d}:00",
+                "trainer_name": rng.choice(TRAINERS),
+                "member_name": f"회원{rng.randint(1, 3000)}",
+                "member_key": rng.randint(100000, 999999),
+                "session_type": rng.choice(SESSION_TYPES),
+                "session_status": rng.choice(STATUSES),
+                "session_index": f"{rng.randint(1, 30)}/30",
+                "is_event": rng.random() < 0.05,
+                "registration_type": None,
+                "note": None,
+                "created_at": f"2026-{month:02d}-01T09:00:00",
+            }
+            for i in range(sessions)
+        ],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def generate(root: Path, files: int, sessions: int, centers: int, duplicate_ratio: float) -> int:
+    """센터별 디렉토리에 내보내기 파일 생성 (반환: 전체 바이트)"""
+    rng = random.Random(42)
+    unique = int(files * (1 - duplicate_ratio))
+    paths = []
+    for n in range(unique):
+        center = n % centers + 1
+        center_dir = root / f"CENTER{center:03d}"
+        center_dir.mkdir(exist_ok=True)
+        path = center_dir / f"export_{n:06d}.json"
+        write_export(path, center, n, sessions, rng)
+        paths.append(path)
+    for n in range(files - unique):
+        # 같은 내보내기를 다시 보낸 경우
+        source = paths[n % len(paths)]
+        shutil.copy(source, source.with_name(f"export_resent_{n:06d}.json"))
+    return sum(p.stat().st_size for p in root.rglob("export_*.json"))
+
+
+def main(files: int, sessions: int, centers: int, workers: list[int], duplicate_ratio: float):
+    # 앱 모듈은 인자 확인 뒤 임포트 (--help가 바로 뜨도록)
+    from app.services.aggregator_service import AggregatorService
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "exports"
+        root.mkdir()
+        size = generate(root, files, sessions, centers, duplicate_ratio)
+        print(f"내보내기 파일 {files}개 ({size / 1024 / 1024:.1f}MB, 센터 {centers}곳, 파일당 세션 {sessions}건)")
+
+        for count in workers:
+            database = Path(tmp) / f"central_{count}.db"
+            result = AggregatorService(database, workers=count).ingest([root])
+            print(f"  워커 {count}개: {result['seconds']}초, {result['files_per_second']}파일/초, "
+                  f"{result['sessions_per_second']:.0f}세션/초 (적재 {result['ingested']}, 건너뜀 {result['skipped']}, "
+                  f"실패 {len(result['errors'])})")
+
+            again = AggregatorService(database, workers=count).ingest([root])
+            print(f"    재실행: {again['seconds']}초, 건너뜀 {again['skipped']}, 신규 세션 {again['inserted']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="센터 내보내기 통합 처리량 측정")
+    parser.add_argument("--files", type=int, default=1000)
+    parser.add_argument("--sessions", type=int, default=200, help="파일당 세션 수")
+    parser.add_argument("--centers", type=int, default=50)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--duplicates", type=float, default=0.05, help="다시 보낸 파일 비율")
+    args = parser.parse_args()
+    main(args.files, args.sessions, args.centers, args.workers, args.duplicates)
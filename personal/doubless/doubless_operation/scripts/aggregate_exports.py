@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""센터 내보내기 통합 스크립트
+
+여러 센터의 export_*.json 파일(디렉토리는 하위까지)을 중앙 DB에 적재한다.
+이미 적재한 (센터, 내보내기 ID) 파일은 건너뛰고, 세션은 (센터, 세션 ID, 내보내기 ID)로 중복을 거른다.
+
+사용법:
+    python scripts/aggregate_exports.py <파일 또는 디렉토리>... [--db data/central.db] [--workers 4]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# backend 모듈 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
+
+
+def aggregate_exports(paths: list[str], database: str = None, workers: int = None) -> bool:
+    """적재 실행 (실패한 파일이 없으면 True)"""
+    # 앱 모듈은 인자 확인 뒤 임포트 (--help가 바로 뜨도록)
+    from app.services.aggregator_service import AggregatorService
+
+    print("=" * 50)
+    print("센터 내보내기 통합")
+    print("=" * 50)
+
+    service = AggregatorService(Path(database) if database else None, workers=workers)
+    print(f"중앙 DB: {service.database_path} (워커 {service.workers}개)")
+    result = service.ingest([Path(p) for p in paths], verbose=True)
+
+    print(f"\n파일 {result['files']}개: 적재 {result['ingested']}개, 건너뜀 {result['skipped']}개, 실패 {len(result['errors'])}개")
+    print(f"세션 {result['sessions']}건: 신규 {result['inserted']}건, 중복 {result['duplicates']}건")
+    print(f"{result['seconds']}초 ({result['files_per_second']}파일/초, {result['sessions_per_second']}세션/초)")
+    for e in result["errors"]:
+        print(f"  {e['file']}: {e['error']}")
+
+    print("\n통합 완료!")
+    return not result["errors"]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="센터 내보내기 통합")
+    parser.add_argument("paths", nargs="+", help="export_*.json 파일 또는 디렉토리")
+    parser.add_argument("--db", help="중앙 DB 경로 (기본: data/central.db)")
+    parser.add_argument("--workers", type=int, help="파싱 워커 프로세스 수 (기본: CPU 코어 수)")
+    args = parser.parse_args()
+    sys.exit(0 if aggregate_exports(args.paths, args.db, args.workers) else 1)
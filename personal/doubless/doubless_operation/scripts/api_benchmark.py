@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""백엔드 API 벤치마크
+
+임시 디렉토리에 규모를 정한 가상 operation.db를 만들고(회원/수강권은 Broj 대역 서버와 같은 데이터),
+api/v1의 모든 엔드포인트를 ASGI 클라이언트로 동시에 호출해 경로별 처리량과 p50/p95/p99 지연을 잰다.
+회원/수강권 동기화는 같은 프로세스에 띄운 Broj 대역 서버(127.0.0.1)로 보내므로 네트워크 없이 실행된다.
+
+결과는 backend/data/benchmarks/api_<시각>_<커밋>.json에 저장되고, --compare로 이전 결과와 비교한다.
+
+사용법:
+    python scripts/api_benchmark.py [--members 20000] [--sessions 100000] [--trainers 12] [--months 24]
+                                    [--requests 200] [--concurrency 8] [--heavy-requests 2]
+                                    [--only /sessions /members] [--no-crm] [--compare 이전결과.json]
+"""
+
+import argparse
+import asyncio
+import json
+import shutil
+import sys
+import tempfile
+import time
+from datetime import date, datetime
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).parent.parent / "backend"
+
+# 환경 준비 모듈만 먼저 (앱 설정은 prepare_environment 이후 임포트)
+sys.path.insert(0, str(BACKEND_DIR))
+from app.benchmark.env import JGROUP_KEY, free_port, prepare_environment
+
+
+def print_comparison(rows: list[dict], baseline_path: Path) -> None:
+    print(f"\n이전 결과와 비교: {baseline_path.name}")
+    print(f"  {'경로':<45} {'p50 ms':>22} {'p95 ms':>22} {'처리량/s':>24}")
+
+    def cell(values) -> str:
+        old, new, pct = values
+        return f"{old:>8.1f} -> {new:>8.1f} {'' if pct is None else f'{pct:+.0f}%':>5}"
+
+    for row in rows:
+        print(f"  {row['route']:<45} {cell(row['p50_ms'])} {cell(row['p95_ms'])} {cell(row['throughput_rps'])}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="백엔드 API 벤치마크")
+    parser.add_argument("--members", type=int, default=20_000, help="회원 수")
+    parser.add_argument("--sessions", type=int, default=100_000, help="세션 수")
+    parser.add_argument("--trainers", type=int, default=12, help="트레이너 수")
+    parser.add_argument("--months", type=int, default=24, help="세션 기간 (개월)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--requests", type=int, default=200, help="경로별 요청 수")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시 요청 수")
+    parser.add_argument("--heavy-requests", type=int, default=2, help="엑셀/동기화/백업 등 무거운 요청 수")
+    parser.add_argument("--only", nargs="*", help="이름에 이 문자열이 들어간 경로만 (예: /sessions)")
+    parser.add_argument("--no-crm", action="store_true", help="CRM 동기화 제외")
+    parser.add_argument("--output", type=Path, default=None, help="결과 JSON 경로")
+    parser.add_argument("--compare", type=Path, default=None, help="비교할 이전 결과 JSON")
+    parser.add_argument("--keep", action="store_true", help="임시 DB 디렉토리 남기기")
+    args = parser.parse_args()
+
+    work_dir = Path(tempfile.mkdtemp(prefix="doubless_bench_"))
+    crm_port = free_port()
+    prepare_environment(work_dir, crm_port)
+
+    # 환경 준비 후 앱 임포트
+    from app.benchmark.datagen import Scale, generate
+    from app.benchmark.routes import Context
+    from app.benchmark.runner import (
+        CrmStubServer, compare, environment, git_revision, result_file_name, run_benchmark, save_results,
+        uncovered_routes,
+    )
+    from app.broj_stub import SyntheticCrm
+    from app.db.session import get_session_context
+    from app.main import app
+
+    print("=" * 50)
+    print("API 벤치마크")
+    print("=" * 50)
+
+    missing = uncovered_routes(app)
+    if missing:
+        print(f"  ⚠️  벤치마크 목록에 없는 엔드포인트: {', '.join(missing)}")
+
+    today = date.today()
+    scale = Scale(members=args.members, sessions=args.sessions, trainers=args.trainers, months=args.months, seed=args.seed)
+    crm = SyntheticCrm(members=scale.members, seed=scale.seed, today=today, jgroup_key=JGROUP_KEY)
+
+    print(f"\n[1/2] 데이터 생성 ({work_dir})")
+    data = generate(scale, crm=crm, today=today, verbose=True)
+
+    with get_session_context() as session:
+        ctx = Context.load(session, today, scale.seed)
+
+    print(f"\n[2/2] 부하 실행 (경로별 {args.requests}건, 동시 {args.concurrency})")
+    meta = {
+        "started_at": datetime.now().isoformat(timespec="seconds"),
+        "git": git_revision(BACKEND_DIR),
+        "environment": environment(),
+        "data": data,
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "heavy_requests": args.heavy_requests,
+    }
+    started = time.perf_counter()
+    with CrmStubServer(crm, crm_port):
+        results = asyncio.run(run_benchmark(
+            app, ctx,
+            requests=args.requests,
+            concurrency=args.concurrency,
+            heavy_requests=args.heavy_requests,
+            crm=not args.no_crm,
+            only=args.only,
+        ))
+    meta["seconds"] = round(time.perf_counter() - started, 1)
+
+    output = args.output or BACKEND_DIR / "data" / "benchmarks" / result_file_name(meta)
+    save_results(output, meta, results)
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        print_comparison(compare(results, baseline["routes"]), args.compare)
+
+    errors = sum(r["errors"] for r in results.values())
+    print(f"\n벤치마크 완료! {len(results)}개 경로, 오류 {errors}건, {meta['seconds']}초 -> {output}")
+
+    if args.keep:
+        print(f"  임시 DB: {work_dir}")
+    else:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""세션 보관 스크립트
+
+마감된 월(전부 내보내기 완료 + 급여 마감일 경과)의 세션을 data/session_archive_YYYY.db로 옮긴다.
+
+사용법:
+    python scripts/archive_sessions.py [--dry-run]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# backend 모듈 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
+
+
+def archive_sessions(dry_run: bool = False) -> int:
+    """보관 실행"""
+    # 앱 모듈은 인자 확인 뒤 임포트 (--help가 바로 뜨도록)
+    from sqlmodel import Session
+    from app.db.session import engine, init_db
+    from app.services.archive_service import ArchiveService
+
+    print("=" * 50)
+    print("세션 보관" + (" (확인만)" if dry_run else ""))
+    print("=" * 50)
+
+    init_db()
+
+    with Session(engine) as session:
+        result = ArchiveService(session).run(dry_run=dry_run)
+
+    for m in result["months"]:
+        state = "보관 대상" if m["archivable"] else f"제외 ({m['reason']})"
+        print(f"  {m['year_month']}: {m['sessions']}건, 미내보내기 {m['pending_export']}건 - {state}")
+
+    moved = sum(a["moved"] for a in result["archived"])
+    if not dry_run:
+        print(f"\n보관 완료! {len(result['archived'])}개월, {moved}건")
+    return moved
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="마감된 월 세션 보관")
+    parser.add_argument("--dry-run", action="store_true", help="보관 대상만 확인")
+    args = parser.parse_args()
+
+    archive_sessions(dry_run=args.dry_run)
+    sys.exit(0)
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""PT 회차 번호 백필 스크립트
+
+기존 세션의 session_index("15/20")를 파싱하여 session_no/session_total 컬럼을 채운다.
+
+사용법:
+    python scripts/backfill_session_numbers.py
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# backend 모듈 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
+
+
+def backfill_session_numbers() -> int:
+    """session_no/session_total 백필"""
+    # 앱 모듈은 인자 확인 뒤 임포트 (--help가 바로 뜨도록)
+    from sqlmodel import Session
+    from app.db.session import engine, init_db
+    from app.services.session_number_service import SessionNumberService
+
+    print("=" * 50)
+    print("PT 회차 번호 백필 시작")
+    print("=" * 50)
+
+    # 컬럼/인덱스 생성
+    init_db()
+
+    with Session(engine) as session:
+        count = SessionNumberService(session).backfill()
+
+    print(f"\n백필 완료! 총 {count}건")
+    return count
+
+
+if __name__ == "__main__":
+    argparse.ArgumentParser(description="PT 회차 번호(session_no/session_total) 백필").parse_args()
+    backfill_session_numbers()
+    sys.exit(0)
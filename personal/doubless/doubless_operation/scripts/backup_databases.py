@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""DB 백업 스크립트
+
+운영 DB(operation.db), 통합 DB(doubless.db)와 세션 보관 파일(session_archive_YYYY.db, 마지막 백업 이후
+바뀐 것만)을 SQLite 온라인 백업으로 data/backups에 복사하고 무결성 검사 후 보존 개수(BACKUP_RETENTION)를
+넘는 오래된 백업을 지운다. 서버 실행 중에도 사용 가능.
+
+사용법:
+    python scripts/backup_databases.py
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# backend 모듈 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
+
+
+def backup_databases() -> bool:
+    """백업 실행 (실패가 없으면 True)"""
+    # 앱 모듈은 인자 확인 뒤 임포트 (--help가 바로 뜨도록)
+    from app.db.session import init_db
+    from app.services.backup_service import BackupService
+
+    print("=" * 50)
+    print("DB 백업")
+    print("=" * 50)
+
+    init_db()
+
+    service = BackupService()
+    result = service.run()
+
+    for b in result["backups"]:
+        print(f"  {b['name']}: {b['file_name']} ({b['size'] / 1024:.0f}KB, {b['steps']}단계, {b['seconds']}초)")
+        for name in b["pruned"]:
+            print(f"    오래된 백업 삭제: {name}")
+    if result["skipped"]:
+        print(f"  변경 없는 보관 파일 건너뜀: {', '.join(result['skipped'])}")
+    for e in result["errors"]:
+        print(f"  {e['name']}: 실패 - {e['error']}")
+
+    print(f"\n백업 완료! {len(result['backups'])}개 -> {service.backup_dir}")
+    return not result["errors"]
+
+
+if __name__ == "__main__":
+    argparse.ArgumentParser(description="operation.db/doubless.db/보관 파일 온라인 백업").parse_args()
+    sys.exit(0 if backup_databases() else 1)
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Broj CRM 로컬 대역 서버
+
+시드 고정 가상 데이터로 Broj CRM API를 흉내 내는 서버를 띄운다. 실제 CRM 없이 회원/수강권 동기화,
+레거시 다운로드 스크립트의 성능을 같은 조건으로 반복 측정할 때 사용한다.
+
+클라이언트 연결:
+    백엔드         BROJ_URL=http://127.0.0.1:9000 (센터별 broj_url도 가능), BROJ_ID/BROJ_PWD는 아무 값
+    레거시 스크립트 BROJ_URL=http://127.0.0.1:9000 python download_members.py
+
+지연/오류는 실행 중에도 바꿀 수 있다:
+    curl -X PUT localhost:9000/_stub/config -H 'Content-Type: application/json' \\
+         -d '{"latency_ms": 200, "jitter_ms": 100, "error_rate": 0.05}'
+    curl localhost:9000/_stub/stats
+    curl -X POST 'localhost:9000/_stub/mutate?count=500'   # 회원 변경 (증분 동기화 측정)
+
+사용법:
+    python scripts/broj_stub.py [--members 100000] [--seed 42] [--port 9000]
+                                [--latency-ms 0] [--jitter-ms 0] [--error-rate 0] [--error-status 503]
+"""
+
+import argparse
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+# backend 모듈 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Broj CRM 로컬 대역 서버")
+    parser.add_argument("--members", type=int, default=100_000, help="가상 회원 수")
+    parser.add_argument("--seed", type=int, default=42, help="데이터 시드 (같으면 같은 데이터)")
+    parser.add_argument("--today", type=date.fromisoformat, default=None, help="기준일 YYYY-MM-DD (기본: 오늘)")
+    parser.add_argument("--jgroup-key", default="533109104", help="BROJ_JGROUP_KEY와 같은 값")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--latency-ms", type=float, default=0, help="요청마다 넣는 지연")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="0~N ms 추가 지연")
+    parser.add_argument("--error-rate", type=float, default=0, help="오류 응답 확률 (0~1)")
+    parser.add_argument("--error-status", type=int, default=503, help="오류 응답 상태 코드")
+    parser.add_argument("--fault-seed", type=int, default=None, help="지연/오류 난수 시드")
+    args = parser.parse_args()
+
+    # 앱 모듈은 인자 확인 뒤 임포트 (--help가 바로 뜨도록)
+    import uvicorn
+
+    from app.broj_stub import StubOptions, SyntheticCrm, create_app
+
+    print("=" * 50)
+    print("Broj CRM 대역 서버")
+    print("=" * 50)
+
+    started = time.perf_counter()
+    crm = SyntheticCrm(members=args.members, seed=args.seed, today=args.today, jgroup_key=args.jgroup_key)
+    print(f"  회원 {crm.member_count:,}명, 수강권 {len(crm.lesson_ticket_owners):,}건, "
+          f"회원권 {len(crm.ticket_owners):,}건 ({time.perf_counter() - started:.1f}초)")
+
+    options = StubOptions(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        seed=args.fault_seed,
+    )
+    print(f"  지연 {options.latency_ms:g}+0~{options.jitter_ms:g}ms, 오류 {options.error_rate:.1%} ({options.error_status})")
+    print(f"\n  BROJ_URL=http://{args.host}:{args.port}")
+    print(f"  BROJ_JGROUP_KEY={crm.jgroup_key}\n")
+
+    uvicorn.run(create_app(crm, options), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""엔드포인트 쿼리 계획/쿼리 수 점검
+
+임시 디렉토리에 가상 operation.db를 만들고 api/v1 엔드포인트를 순서대로 호출하면서
+요청마다 실행된 SQL의 EXPLAIN QUERY PLAN과 문장 수를 확인한다.
+session_logs / member_cache / lesson_ticket_cache 전체 스캔이나 요청당 SQL 문 수 예산 초과가 있으면
+종료 코드 1로 끝나므로 커밋 전/CI에서 성능 회귀를 막는 용도로 쓴다.
+예산은 backend/app/benchmark/query_budget.py의 BUDGETS에 있다.
+
+사용법:
+    python scripts/check_query_budgets.py [--members 5000] [--sessions 30000] [--requests 3]
+                                          [--only /sessions] [--plans]
+"""
+
+import argparse
+import asyncio
+import shutil
+import sys
+import tempfile
+from datetime import date
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).parent.parent / "backend"
+
+# 환경 준비 모듈만 먼저 (앱 설정은 prepare_environment 이후 임포트)
+sys.path.insert(0, str(BACKEND_DIR))
+from app.benchmark.env import JGROUP_KEY, free_port, prepare_environment
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="엔드포인트 쿼리 계획/쿼리 수 점검")
+    parser.add_argument("--members", type=int, default=5_000, help="회원 수")
+    parser.add_argument("--sessions", type=int, default=30_000, help="세션 수")
+    parser.add_argument("--months", type=int, default=12, help="세션 기간 (개월)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--requests", type=int, default=3, help="경로별 요청 수")
+    parser.add_argument("--only", nargs="*", help="이름에 이 문자열이 들어간 경로만 (예: /sessions)")
+    parser.add_argument("--plans", action="store_true", help="경로별 SQL과 계획 출력")
+    args = parser.parse_args()
+
+    work_dir = Path(tempfile.mkdtemp(prefix="doubless_query_"))
+    prepare_environment(work_dir, free_port())
+
+    # 환경 준비 후 앱 임포트
+    import httpx
+
+    from app.benchmark.datagen import Scale, generate
+    from app.benchmark.query_budget import BUDGETS, Budget, check, record_route, routes_to_check
+    from app.benchmark.routes import Context
+    from app.broj_stub import SyntheticCrm
+    from app.db.session import get_engine, get_session_context
+    from app.main import app
+
+    print("=" * 50)
+    print("쿼리 계획/쿼리 수 점검")
+    print("=" * 50)
+
+    try:
+        today = date.today()
+        scale = Scale(members=args.members, sessions=args.sessions, months=args.months, seed=args.seed)
+        crm = SyntheticCrm(members=scale.members, seed=scale.seed, today=today, jgroup_key=JGROUP_KEY)
+        print(f"\n[1/2] 데이터 생성 ({work_dir})")
+        generate(scale, crm=crm, today=today, verbose=True)
+
+        with get_session_context() as session:
+            ctx = Context.load(session, today, scale.seed)
+
+        routes = [r for r in routes_to_check() if not args.only or any(p in r.name for p in args.only)]
+        print(f"\n[2/2] 경로 {len(routes)}개 점검 (경로별 {args.requests}건)")
+
+        async def run() -> list:
+            transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+            async with httpx.AsyncClient(transport=transport, base_url="http://check", timeout=600) as client:
+                results = []
+                for route in routes:
+                    requests = min(route.count(ctx), args.requests) if route.count else args.requests
+                    if requests > 0:
+                        results.append(await record_route(client, get_engine(), route, ctx, requests))
+                return results
+
+        violations = []
+        for result in asyncio.run(run()):
+            budget = BUDGETS.get(result.route, Budget())
+            found = check(result, budget)
+            violations += found
+            mark = "❌" if found else "✅"
+            print(f"  {mark} {result.route:<45} SQL {max(result.statements, default=0):>3}/{budget.max_statements:<3} "
+                  f"상태 {result.statuses}")
+            if args.plans:
+                for statement, plan in result.plans.items():
+                    print(f"      {statement[:120]}")
+                    for detail in plan:
+                        print(f"        {detail}")
+
+        if violations:
+            print(f"\n위반 {len(violations)}건:")
+            for v in violations:
+                print(f"  - {v.route}: {v.detail}")
+                if v.sql:
+                    print(f"      {v.sql[:200]}")
+            sys.exit(1)
+        print("\n점검 완료! 위반 없음")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
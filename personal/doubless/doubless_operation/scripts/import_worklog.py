@@ -16,11 +16,6 @@ import re
 # backend 모듈 경로 추가
 sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
 
-import pandas as pd
-from sqlmodel import Session
-from app.db.session import engine
-from app.db.models.session_log import SessionLog
-
 
 def parse_session_index(text: str) -> tuple[str, str, bool]:
     """
@@ -29,6 +24,8 @@ def parse_session_index(text: str) -> tuple[str, str, bool]:
     Returns:
         (session_type, session_index, is_event)
     """
+    import pandas as pd
+
     if pd.isna(text) or not str(text).strip():
         return "PT", None, False
 
@@ -56,6 +53,17 @@ def parse_session_index(text: str) -> tuple[str, str, bool]:
 
 def import_worklog(excel_path: str, year: int = 2026, month: int = 1):
     """엑셀 업무일지를 DB에 임포트"""
+    # pandas와 앱 모듈은 인자 확인 뒤 임포트 (사용법/파일 오류가 바로 뜨도록)
+    import pandas as pd
+    from sqlmodel import Session
+    from app.db.session import engine
+    from app.db.models.session_log import SessionLog
+    from app.db.models.monthly_session_rollup import MonthlySessionRollup
+    from app.profile.memory import memory_stage
+    from app.services.maintenance_service import analyze_tables
+    from app.services.rollup_service import RollupService
+    from app.services.session_number_service import parse_session_number
+    from app.services.ticket_validity import ticket_index
 
     print("=" * 60)
     print(f"업무일지 임포트: {excel_path}")
@@ -76,7 +84,9 @@ def import_worklog(excel_path: str, year: int = 2026, month: int = 1):
         except:
             continue
 
-        df = pd.read_excel(excel_path, sheet_name=sheet_name, header=None)
+        # 열어 둔 파일에서 시트만 읽기 (시트마다 파일 전체를 다시 파싱하지 않음)
+        with memory_stage("parse"):
+            df = xl.parse(sheet_name, header=None)
 
         # 헤더 행 찾기 (TR이 있는 행)
         header_row = None
@@ -145,6 +155,7 @@ def import_worklog(excel_path: str, year: int = 2026, month: int = 1):
                             session_info = next_row.iloc[col_idx]
 
                         session_type, session_index, is_event = parse_session_index(session_info)
+                        session_no, session_total = parse_session_number(session_index)
 
                         session = SessionLog(
                             session_date=session_date,
@@ -154,6 +165,8 @@ def import_worklog(excel_path: str, year: int = 2026, month: int = 1):
                             session_type=session_type,
                             session_status="completed",
                             session_index=session_index,
+                            session_no=session_no,
+                            session_total=session_total,
                             is_event=is_event,
                             note=f"엑셀 임포트 ({sheet_name}일)",
                         )
@@ -171,10 +184,38 @@ def import_worklog(excel_path: str, year: int = 2026, month: int = 1):
     print(f"\n총 {len(all_sessions)}건 저장 중...")
 
     with Session(engine) as session:
+        # 수강권 유효성 검사
+        with memory_stage("validate"):
+            ticket_index.rebuild(session)
+        warnings = []
+        for log in all_sessions:
+            for warning in ticket_index.check(
+                log.member_key, log.member_name, log.session_date, log.session_type, log.session_status,
+                log.session_time,
+            ):
+                warnings.append(f"{log.session_date} {log.session_time} {log.trainer_name}: {warning}")
+        if warnings:
+            print(f"\n수강권 경고 {len(warnings)}건:")
+            for warning in warnings[:50]:
+                print(f"  - {warning}")
+            if len(warnings) > 50:
+                print(f"  ... 외 {len(warnings) - 50}건")
+
         for log in all_sessions:
             session.add(log)
+        with memory_stage("insert"):
+            session.flush()
+
+        # 월별 집계 재계산
+        rollup = RollupService(session)
+        for year_month in sorted({log.session_date[:7] for log in all_sessions}):
+            with memory_stage("rollup"):
+                rollup.rebuild_month(year_month)
         session.commit()
 
+        # 대량 적재 후 통계 갱신
+        analyze_tables(session, SessionLog, MonthlySessionRollup)
+
     print("\n" + "=" * 60)
     print(f"임포트 완료! 총 {len(all_sessions)}건")
     print("=" * 60)
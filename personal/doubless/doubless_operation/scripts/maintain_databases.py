@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""DB 유지보수 스크립트
+
+operation.db와 doubless.db에 WAL 설정, 체크포인트, ANALYZE/optimize, incremental_vacuum을 실행하고
+파일 크기/빈 페이지/WAL 상태를 출력한다. 서버는 MAINTENANCE_INTERVAL_SECONDS마다 자동 점검한다.
+
+사용법:
+    python scripts/maintain_databases.py
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# backend 모듈 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
+
+
+def maintain_databases() -> bool:
+    """유지보수 실행 (실패가 없으면 True)"""
+    # 앱 모듈은 인자 확인 뒤 임포트 (--help가 바로 뜨도록)
+    from app.db.session import init_db
+    from app.services.maintenance_service import MaintenanceService
+
+    print("=" * 50)
+    print("DB 유지보수")
+    print("=" * 50)
+
+    init_db()
+
+    service = MaintenanceService()
+    result = service.run(idle=True)
+    metrics = service.metrics()["databases"]
+
+    for name, r in result["databases"].items():
+        m = metrics[name]
+        checkpoint = r["checkpoint"]
+        print(f"  {name}: {m['file_size'] / 1024:.0f}KB, 빈 페이지 {m['freelist_pages']}/{m['page_count']}, "
+              f"WAL {m['wal_size'] / 1024:.0f}KB ({m['journal_mode']})")
+        print(f"    체크포인트 {checkpoint['mode']}: {checkpoint['checkpointed_frames']}/{checkpoint['log_frames']} 프레임"
+              + (" (사용 중)" if checkpoint["busy"] else ""))
+        print(f"    통계: {r['statistics']}, vacuum: {r['vacuum']['action'] or '불필요'} "
+              f"({r['vacuum']['freed_pages']}페이지 반환)")
+    for e in result["errors"]:
+        print(f"  {e['name']}: 실패 - {e['error']}")
+
+    print("\n유지보수 완료!")
+    return not result["errors"]
+
+
+if __name__ == "__main__":
+    argparse.ArgumentParser(description="DB 체크포인트/통계/incremental_vacuum").parse_args()
+    sys.exit(0 if maintain_databases() else 1)
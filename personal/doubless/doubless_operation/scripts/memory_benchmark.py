@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""동기화/내보내기/임포트 메모리 벤치마크
+
+임시 디렉토리에 현재 센터 규모의 --factor배(기본 10배) 가상 operation.db를 만들고
+회원 동기화, 수강권 동기화, 세션 JSON 내보내기, 업무일지 엑셀 임포트를 대상마다 새 프로세스에서 실행해
+단계별 RSS(추적 없이)와 tracemalloc 최대/증가량(따로 한 번 더)을 잰다. 예산(backend/app/benchmark/memory_budget.py의 MEMORY_BUDGETS)을
+넘으면 종료 코드 1로 끝난다. CRM 동기화는 Broj 대역 서버(127.0.0.1)로 보내므로 네트워크 없이 실행된다.
+
+사용법:
+    python scripts/memory_benchmark.py [--factor 10] [--only sync_members export_sessions] [--top 5]
+"""
+
+import argparse
+import importlib.util
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).parent.parent / "backend"
+
+# 환경 준비 모듈만 먼저 (앱 설정은 prepare_environment 이후 임포트)
+sys.path.insert(0, str(BACKEND_DIR))
+from app.benchmark.env import JGROUP_KEY, free_port, prepare_environment
+
+
+def run_child(args: argparse.Namespace) -> None:
+    """대상 하나를 측정해 결과 JSON 저장 (자식 프로세스)"""
+    prepare_environment(args.work_dir, args.crm_port)
+
+    from app.benchmark.memory_budget import BENCH_TODAY, TARGETS
+    from app.profile.memory import MemoryTracker
+    from app.profile.targets import TargetContext
+
+    target = TARGETS[args.child]
+    ctx = TargetContext(today=BENCH_TODAY, seed=args.seed, work_dir=args.work_dir, crm=None)
+    run = target.prepare(ctx)
+    with MemoryTracker(trace=not args.no_trace, top=args.top) as tracker:
+        summary = run()
+
+    result = tracker.result() | {"summary": summary, "report": tracker.report()}
+    args.result.write_text(json.dumps(result, ensure_ascii=False), encoding="utf-8")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="동기화/내보내기/임포트 메모리 벤치마크")
+    parser.add_argument("--factor", type=float, default=None, help="현재 규모 대비 배수 (기본 10)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--only", nargs="*", help="대상 이름")
+    parser.add_argument("--top", type=int, default=0, help="단계마다 할당 상위 줄 수")
+    parser.add_argument("--keep", action="store_true", help="임시 DB 디렉토리 남기기")
+    # 자식 프로세스용
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--work-dir", type=Path, help=argparse.SUPPRESS)
+    parser.add_argument("--crm-port", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--result", type=Path, help=argparse.SUPPRESS)
+    parser.add_argument("--no-trace", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args)
+        return
+
+    work_dir = Path(tempfile.mkdtemp(prefix="doubless_memory_"))
+    crm_port = free_port()
+    prepare_environment(work_dir, crm_port)
+
+    # 환경 준비 후 앱 임포트
+    from app.benchmark.datagen import generate
+    from app.benchmark.memory_budget import BENCH_TODAY, DEFAULT_FACTOR, MEMORY_BUDGETS, TARGETS, check, scaled
+    from app.benchmark.runner import CrmStubServer
+    from app.broj_stub import SyntheticCrm
+
+    factor = args.factor or DEFAULT_FACTOR
+    names = args.only or list(TARGETS)
+    unknown = [n for n in names if n not in TARGETS]
+    if unknown:
+        print(f"알 수 없는 대상: {', '.join(unknown)} (대상: {', '.join(TARGETS)})")
+        sys.exit(1)
+
+    print("=" * 50)
+    print(f"메모리 벤치마크 (현재 규모 x{factor:g})")
+    print("=" * 50)
+
+    violations = []
+    try:
+        scale = scaled(factor, args.seed)
+        crm = SyntheticCrm(members=scale.members, seed=scale.seed, today=BENCH_TODAY, jgroup_key=JGROUP_KEY)
+        print(f"\n[1/2] 데이터 생성 ({work_dir})")
+        generate(scale, crm=crm, today=BENCH_TODAY, verbose=True)
+
+        print(f"\n[2/2] 대상 {len(names)}개 측정")
+        with CrmStubServer(crm, crm_port):
+            for name in names:
+                if name == "import_worklog" and importlib.util.find_spec("pandas") is None:
+                    print(f"\n  - {name}: 건너뜀 (pandas 미설치)")
+                    continue
+
+                # RSS는 tracemalloc 없이, Python 할당은 tracemalloc으로 따로 실행
+                runs = {}
+                for mode in ("rss", "trace"):
+                    result_path = work_dir / f"memory_{name}_{mode}.json"
+                    command = [sys.executable, __file__, "--child", name, "--work-dir", str(work_dir),
+                               "--crm-port", str(crm_port), "--result", str(result_path),
+                               "--seed", str(args.seed), "--top", str(args.top)]
+                    proc = subprocess.run(
+                        command + (["--no-trace"] if mode == "rss" else []),
+                        capture_output=True, text=True, encoding="utf-8", errors="replace",
+                    )
+                    if proc.returncode != 0 or not result_path.exists():
+                        print(f"\n  ❌ {name}: 실행 실패 ({mode}, 종료 코드 {proc.returncode})")
+                        print("\n".join(f"      {line}" for line in proc.stderr.strip().splitlines()[-15:]))
+                        break
+                    runs[mode] = json.loads(result_path.read_text(encoding="utf-8"))
+                if len(runs) < 2:
+                    violations.append(f"{name}: 실행 실패")
+                    continue
+
+                budget = MEMORY_BUDGETS[name]
+                found = check(name, {"peak_bytes": runs["trace"]["peak_bytes"],
+                                     "rss_growth_bytes": runs["rss"]["rss_growth_bytes"]}, budget)
+                violations += [f"{name}: {v}" for v in found]
+                print(f"\n  {'❌' if found else '✅'} {name}: {runs['rss']['summary']} "
+                      f"(예산: 최대 {budget.peak_mb:.0f}MB, RSS +{budget.rss_mb:.0f}MB)")
+                for mode in ("rss", "trace"):
+                    print("\n".join(f"    {line}" for line in runs[mode]["report"].splitlines()))
+
+        if violations:
+            print(f"\n위반 {len(violations)}건:")
+            for v in violations:
+                print(f"  - {v}")
+            sys.exit(1)
+        print("\n메모리 벤치마크 완료! 위반 없음")
+    finally:
+        if args.keep:
+            print(f"  임시 DB: {work_dir}")
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
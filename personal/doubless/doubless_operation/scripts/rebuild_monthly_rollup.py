@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""월별 집계 재계산 스크립트
+
+session_logs(보관된 월 포함)로 monthly_session_rollup을 다시 만든다. 집계 테이블이 처음 생길 때는
+서버/스크립트의 init_db가 자동으로 채우므로, 직접 DB를 고쳤거나 집계가 어긋났을 때 쓴다.
+
+사용법:
+    python scripts/rebuild_monthly_rollup.py [--month 2025-01]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Optional
+
+# backend 모듈 경로 추가
+sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
+
+
+def rebuild_monthly_rollup(month: Optional[str] = None) -> int:
+    """집계 재계산 (월을 생략하면 전체)"""
+    # 앱 모듈은 인자 확인 뒤 임포트 (--help가 바로 뜨도록)
+    from sqlmodel import Session
+    from app.db.session import engine, init_db
+    from app.services.rollup_service import RollupService
+
+    print("=" * 50)
+    print("월별 집계 재계산" + (f" ({month})" if month else ""))
+    print("=" * 50)
+
+    init_db()
+
+    with Session(engine) as session:
+        service = RollupService(session)
+        if month:
+            result = {month: service.rebuild_month(month)}
+            session.commit()
+        else:
+            result = service.rebuild_all()
+
+    for year_month, rows in result.items():
+        print(f"  {year_month}: {rows}행")
+
+    print(f"\n재계산 완료! {len(result)}개월")
+    return len(result)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="월별 집계(monthly_session_rollup) 재계산")
+    parser.add_argument("--month", help="한 달만 재계산 (YYYY-MM)")
+    args = parser.parse_args()
+
+    rebuild_monthly_rollup(args.month)
+    sys.exit(0)
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""실시간 이벤트(SSE) 부하 테스트
+
+실행 중인 백엔드에 SSE 클라이언트를 여러 개 연결하고, 일정 속도로 세션을 생성/삭제하며
+이벤트 전달 지연과 연결 종료 여부를 측정한다. 테스트용 DB로 띄운 서버에서 실행할 것.
+
+사용법:
+    python scripts/sse_load_test.py [--url http://localhost:8000] [--clients 200] [--rate 50] [--duration 20]
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import statistics
+import time
+from urllib.parse import urlsplit
+
+import httpx
+
+TEST_DATE = "2099-12-31"
+TEST_NOTE = "sse-load-test"
+
+
+class ClientStats:
+    """클라이언트별 수신 기록"""
+
+    def __init__(self):
+        self.received: dict[str, float] = {}
+        self.events = 0
+        self.closed_by_server = False
+
+
+SESSION_CREATED = re.compile(rb'event: session\.created\ndata: \{.*?"member_name":"((?:[^"\\]|\\.)*)"')
+
+
+async def listen(url: str, stats: ClientStats, ready: asyncio.Event, stop: asyncio.Event):
+    """SSE 수신 (session.created 수신 시각 기록)
+
+    클라이언트 수백 개를 한 프로세스에서 돌려도 측정이 부하 생성 CPU에 묻히지 않도록
+    HTTP 클라이언트 대신 소켓에서 직접 읽는다.
+    """
+    target = urlsplit(url)
+    reader, writer = await asyncio.open_connection(target.hostname, target.port or 80)
+    writer.write(
+        f"GET /api/v1/events HTTP/1.1\r\nHost: {target.netloc}\r\nAccept: text/event-stream\r\n\r\n".encode()
+    )
+    await writer.drain()
+    ready.set()
+
+    buffer = b""
+    try:
+        while not stop.is_set():
+            data = await reader.read(65536)
+            if not data:
+                stats.closed_by_server = True
+                break
+            now = time.perf_counter()
+            buffer += data
+            complete, _, buffer = buffer.rpartition(b"\n\n")
+            stats.events += complete.count(b"\nevent: ")
+            for match in SESSION_CREATED.finditer(complete):
+                stats.received[json.loads(b'"' + match.group(1) + b'"')] = now
+    finally:
+        writer.close()
+
+
+async def write_load(client: httpx.AsyncClient, url: str, rate: int, duration: float) -> dict[str, float]:
+    """세션 생성 후 바로 삭제 (쓰기 2건)를 rate건/초로 반복, 회원명별 생성 요청 시각 반환
+
+    삭제 후 id가 재사용될 수 있어 회원명을 고유 키로 쓴다.
+    """
+    sent: dict[str, float] = {}
+    interval = 2 / rate
+    start = time.perf_counter()
+    n = 0
+    while time.perf_counter() - start < duration:
+        member_name = f"회원{n}"
+        t0 = time.perf_counter()
+        response = await client.post(f"{url}/api/v1/sessions", json={
+            "session_date": TEST_DATE,
+            "session_time": f"{6 + n % 18:02d}:00",
+            "trainer_name": "부하테스트",
+            "member_name": member_name,
+            "session_type": "기타",
+            "note": TEST_NOTE,
+        })
+        response.raise_for_status()
+        sent[member_name] = t0
+        await client.delete(f"{url}/api/v1/sessions/{response.json()['id']}")
+        n += 1
+        await asyncio.sleep(max(0.0, start + n * interval - time.perf_counter()))
+    return sent
+
+
+def percentile(values: list[float], p: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))] if values else 0.0
+
+
+async def main(url: str, clients: int, rate: int, duration: float):
+    async with httpx.AsyncClient(timeout=30) as client:
+        stats = [ClientStats() for _ in range(clients)]
+        ready = [asyncio.Event() for _ in range(clients)]
+        stop = asyncio.Event()
+        listeners = [asyncio.create_task(listen(url, s, r, stop)) for s, r in zip(stats, ready)]
+        await asyncio.wait_for(asyncio.gather(*(r.wait() for r in ready)), timeout=60)
+        print(f"SSE 클라이언트 {clients}개 연결, {rate}건/초 x {duration:.0f}초 쓰기 시작")
+
+        sent = await write_load(client, url, rate, duration)
+        await asyncio.sleep(1)
+        stop.set()
+        for task in listeners:
+            task.cancel()
+        await asyncio.gather(*listeners, return_exceptions=True)
+
+        server = (await client.get(f"{url}/api/v1/events/stats")).json()
+
+    latencies = [
+        (s.received[member_name] - t0) * 1000
+        for s in stats
+        for member_name, t0 in sent.items()
+        if member_name in s.received
+    ]
+    expected = len(sent) * clients
+    print(f"쓰기 {len(sent) * 2}건 ({len(sent) * 2 / duration:.1f}건/초), session.created 수신 {len(latencies)}/{expected}건")
+    print(f"전달 지연(ms) p50 {percentile(latencies, .5):.1f} / p95 {percentile(latencies, .95):.1f} "
+          f"/ p99 {percentile(latencies, .99):.1f} / 평균 {statistics.fmean(latencies) if latencies else 0:.1f}")
+    print(f"서버가 끊은 연결 {sum(s.closed_by_server for s in stats)}개, 서버 통계 {server}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SSE 부하 테스트")
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--rate", type=int, default=50, help="초당 쓰기 건수")
+    parser.add_argument("--duration", type=float, default=20, help="쓰기 시간 (초)")
+    args = parser.parse_args()
+    asyncio.run(main(args.url, args.clients, args.rate, args.duration))
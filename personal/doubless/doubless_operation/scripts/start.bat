@@ -13,8 +13,18 @@ echo [1/2] Backend 서버 시작 중...
 cd backend
 start /B cmd /c "venv\Scripts\python.exe -m uvicorn app.main:app --host 0.0.0.0 --port 8002"
 
-REM 잠시 대기
-timeout /t 3 /nobreak > nul
+REM /health가 응답할 때까지 대기 (최대 30초)
+set /a tries=0
+:wait_health
+curl -s -o nul http://localhost:8002/health && goto ready
+set /a tries+=1
+if %tries% geq 30 (
+    echo   서버 응답 없음, 브라우저를 그대로 엽니다.
+    goto ready
+)
+timeout /t 1 /nobreak > nul
+goto wait_health
+:ready
 
 REM 브라우저 열기
 echo [2/2] 브라우저 열기...
@@ -23,7 +33,7 @@ start http://localhost:8002
 echo.
 echo ================================================
 echo   서버가 시작되었습니다!
-echo   브라우저: http://localhost:8000
+echo   브라우저: http://localhost:8002
 echo   종료하려면 이 창을 닫으세요.
 echo ================================================
 pause
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""서버/스크립트 시작 시간 측정
+
+임시 DB로 uvicorn을 띄워 /health가 처음 응답할 때까지의 시간을 잰다 (빈 DB: 스키마 생성, 두 번째: 스키마 확인만).
+scripts/*.py의 --help 시간도 재서 목표(서버 --server-target초, 스크립트 --target초)를 넘으면 종료 코드 1로 끝난다.
+
+사용법:
+    python scripts/startup_benchmark.py [--runs 3] [--target 1.0] [--server-target 1.5] [--only server]
+"""
+
+import argparse
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).parent
+BACKEND_DIR = SCRIPTS_DIR.parent / "backend"
+
+sys.path.insert(0, str(BACKEND_DIR))
+from app.benchmark.env import free_port, prepare_environment
+
+# --help가 없는 스크립트 (첫 인자를 파일 경로로 받음)
+SKIP_HELP = {"startup_benchmark.py", "import_worklog.py"}
+
+
+def server_start(port: int, timeout: float = 30.0) -> tuple[float, dict]:
+    """uvicorn 실행부터 /health 첫 응답까지 (초, 시작 보고)"""
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port)],
+        cwd=BACKEND_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            if proc.poll() is not None:
+                raise RuntimeError(proc.stderr.read().decode("utf-8", "replace")[-2000:])
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1) as resp:
+                    body = json.loads(resp.read())
+                return time.perf_counter() - started, body.get("startup", {})
+            except OSError:
+                time.sleep(0.02)
+        raise RuntimeError(f"{timeout:.0f}초 안에 /health 응답 없음")
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+
+def help_time(script: Path) -> tuple[float, int]:
+    """스크립트 --help 시간 (초, 종료 코드)"""
+    started = time.perf_counter()
+    proc = subprocess.run([sys.executable, str(script), "--help"], capture_output=True)
+    return time.perf_counter() - started, proc.returncode
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="서버/스크립트 시작 시간 측정")
+    parser.add_argument("--runs", type=int, default=3, help="항목마다 반복 횟수 (최소값 사용)")
+    parser.add_argument("--target", type=float, default=1.0, help="스크립트 --help 목표 시간 (초)")
+    # uvicorn + FastAPI + SQLAlchemy 임포트만 약 0.9~1.1초 (1코어 Linux), 앱 몫은 report의 imports에서 프레임워크를 뺀 부분
+    parser.add_argument("--server-target", type=float, default=1.5, help="서버 /health 첫 응답 목표 시간 (초)")
+    parser.add_argument("--only", choices=["server", "scripts"], help="한쪽만 측정")
+    args = parser.parse_args()
+
+    work_dir = Path(tempfile.mkdtemp(prefix="doubless_startup_"))
+    prepare_environment(work_dir, free_port())
+
+    print("=" * 50)
+    print(f"시작 시간 측정 (서버 {args.server_target:g}초, 스크립트 {args.target:g}초)")
+    print("=" * 50)
+
+    misses = []
+    try:
+        if args.only != "scripts":
+            print("\n[서버] uvicorn -> /health")
+            for run in range(args.runs):
+                seconds, report = server_start(free_port())
+                label = "빈 DB" if run == 0 else "기존 DB"
+                stages = ", ".join(f"{s['name']} {s['ms']:.0f}ms" for s in report.get("stages", []))
+                mark = "✅" if seconds <= args.server_target else "❌"
+                print(f"  {mark} {label}: {seconds:.2f}초 ({stages})")
+                # 빈 DB는 스키마 생성 비용이 들어가므로 기존 DB 기준으로 판정
+                if run > 0 and seconds > args.server_target:
+                    misses.append(f"서버 시작 {seconds:.2f}초")
+
+        if args.only != "server":
+            print("\n[스크립트] --help")
+            for script in sorted(SCRIPTS_DIR.glob("*.py")):
+                if script.name in SKIP_HELP:
+                    continue
+                results = [help_time(script) for _ in range(args.runs)]
+                seconds = min(s for s, _ in results)
+                code = results[-1][1]
+                mark = "✅" if seconds <= args.target and code == 0 else "❌"
+                print(f"  {mark} {script.name:<32} {seconds:.2f}초" + (f" (종료 코드 {code})" if code else ""))
+                if seconds > args.target or code:
+                    misses.append(f"{script.name} --help {seconds:.2f}초")
+
+        if misses:
+            print(f"\n목표 초과 {len(misses)}건:")
+            for miss in misses:
+                print(f"  - {miss}")
+            sys.exit(1)
+        print("\n시작 시간 측정 완료! 모두 목표 이내")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""프론트엔드 정적 파일 전송량 측정
+
+index.html과 그 안의 스크립트/스타일을 브라우저처럼 받아 첫 방문과 재방문(브라우저 캐시 있음)에서
+요청 수와 전송 바이트를 잰다. 기존 StaticFiles와 PrecompressedStaticFiles를 같은 빌드로 비교한다.
+재방문은 Cache-Control이 max-age/immutable이면 요청하지 않고, 아니면 ETag/Last-Modified로 재검증한다.
+빌드(backend/static)가 없으면 표준 라이브러리 소스로 만든 가상 번들로 잰다 (압축률이 실제 JS와 비슷).
+
+사용법:
+    python scripts/static_benchmark.py [--dir backend/static]
+"""
+
+import argparse
+import asyncio
+import re
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).parent.parent / "backend"
+
+# backend 모듈 경로 추가
+sys.path.insert(0, str(BACKEND_DIR))
+
+ACCEPT_ENCODING = "gzip, deflate, br, zstd"         # Chrome/Safari 태블릿
+ASSET_REF = re.compile(r'(?:src|href)="(/[^"]+)"')
+
+
+def synthetic_build(root: Path) -> None:
+    """가상 Vite 빌드 (index.html, 해시 붙은 JS/CSS, favicon)"""
+    sources = sorted(Path(shutil.__file__).parent.glob("*.py"))
+    js, css = [], []
+    for source in sources:
+        text = source.read_text(encoding="utf-8", errors="replace")
+        if sum(map(len, js)) < 650_000:
+            js.append(text)
+        elif sum(map(len, css)) < 40_000:
+            css.append(text)
+    (root / "assets").mkdir(parents=True)
+    (root / "assets" / "index-B7xK2mQa.js").write_text("".join(js), encoding="utf-8")
+    (root / "assets" / "index-Cw9pLr3D.css").write_text("".join(css), encoding="utf-8")
+    (root / "favicon.svg").write_text('<svg xmlns="http://www.w3.org/2000/svg"/>', encoding="utf-8")
+    (root / "index.html").write_text(
+        '<!doctype html><html lang="ko"><head><meta charset="UTF-8" />'
+        '<link rel="icon" href="/favicon.svg" /><title>Doubless Operation</title>'
+        '<script type="module" crossorigin src="/assets/index-B7xK2mQa.js"></script>'
+        '<link rel="stylesheet" crossorigin href="/assets/index-Cw9pLr3D.css"></head>'
+        '<body><div id="root"></div></body></html>',
+        encoding="utf-8",
+    )
+
+
+async def fetch(client, url: str, cache: dict) -> tuple[int, int, int]:
+    """요청 하나 (상태 코드, 본문 바이트, 헤더 바이트), 응답 헤더는 cache에 저장"""
+    headers = {"accept-encoding": ACCEPT_ENCODING}
+    cached = cache.get(url)
+    if cached:
+        if cached.get("etag"):
+            headers["if-none-match"] = cached["etag"]
+        if cached.get("last-modified"):
+            headers["if-modified-since"] = cached["last-modified"]
+    async with client.stream("GET", url, headers=headers) as resp:
+        body = 0
+        async for chunk in resp.aiter_raw():
+            body += len(chunk)
+        header_bytes = len(f"HTTP/1.1 {resp.status_code} \r\n") + sum(
+            len(k) + len(v) + 4 for k, v in resp.headers.raw
+        )
+        if resp.status_code == 200:
+            cache[url] = dict(resp.headers)
+    return resp.status_code, body, header_bytes
+
+
+def fresh(cached: dict) -> bool:
+    """브라우저가 재검증 없이 캐시를 쓰는 응답인지"""
+    cache_control = cached.get("cache-control", "")
+    return "immutable" in cache_control or bool(re.search(r"max-age=[1-9]", cache_control))
+
+
+async def load(app, urls: list[str]) -> dict:
+    """첫 방문/재방문 요청 수와 바이트"""
+    import httpx
+
+    cache: dict = {}
+    result = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://localhost") as client:
+        for visit in ("first", "repeat"):
+            requests = body = header = not_modified = 0
+            for url in urls:
+                if visit == "repeat" and url in cache and fresh(cache[url]):
+                    continue
+                status, body_bytes, header_bytes = await fetch(client, url, cache)
+                requests += 1
+                body += body_bytes
+                header += header_bytes
+                not_modified += status == 304
+            result[visit] = {"requests": requests, "body": body, "header": header, "not_modified": not_modified}
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="프론트엔드 정적 파일 전송량 측정")
+    parser.add_argument("--dir", type=Path, default=BACKEND_DIR / "static", help="빌드 디렉토리")
+    args = parser.parse_args()
+
+    from starlette.applications import Starlette
+    from starlette.routing import Mount
+    from starlette.staticfiles import StaticFiles
+
+    from app.core.static_files import PrecompressedStaticFiles
+
+    work_dir = Path(tempfile.mkdtemp(prefix="doubless_static_"))
+    try:
+        # 압축 변형이 원본 빌드 옆에 생기지 않도록 복사본으로 측정
+        build = work_dir / "static"
+        if args.dir.exists():
+            shutil.copytree(args.dir, build)
+            label = str(args.dir)
+        else:
+            synthetic_build(build)
+            label = "가상 번들 (빌드 없음)"
+
+        index_html = (build / "index.html").read_text(encoding="utf-8")
+        urls = ["/"] + list(dict.fromkeys(ASSET_REF.findall(index_html)))
+
+        print("=" * 50)
+        print(f"정적 파일 전송량: {label}")
+        print("=" * 50)
+        print(f"  요청 대상 {len(urls)}개: {', '.join(urls)}")
+
+        apps = {
+            "StaticFiles": Starlette(routes=[Mount("/", StaticFiles(directory=build, html=True))]),
+            "Precompressed": Starlette(routes=[Mount("/", PrecompressedStaticFiles(build))]),
+        }
+        results = {name: asyncio.run(load(app, urls)) for name, app in apps.items()}
+
+        print(f"\n  {'':<14} {'방문':<6} {'요청':>4} {'304':>4} {'본문':>12} {'헤더':>8} {'합계':>12}")
+        for name, result in results.items():
+            for visit, label in (("first", "첫"), ("repeat", "재")):
+                r = result[visit]
+                print(f"  {name:<14} {label:<6} {r['requests']:>4} {r['not_modified']:>4} "
+                      f"{r['body']:>12,} {r['header']:>8,} {r['body'] + r['header']:>12,}")
+
+        base, new = results["StaticFiles"], results["Precompressed"]
+        print()
+        for visit, label in (("first", "첫 방문"), ("repeat", "재방문")):
+            before = base[visit]["body"] + base[visit]["header"]
+            after = new[visit]["body"] + new[visit]["header"]
+            print(f"  {label}: 요청 {base[visit]['requests']} -> {new[visit]['requests']}, "
+                  f"{before:,} -> {after:,} bytes ({(after - before) / max(before, 1):+.1%})")
+        print("\n정적 파일 측정 완료!")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,9 +2,12 @@
 """회원 동기화 CLI 스크립트
 
 사용법:
-    python scripts/sync_members.py
+    python scripts/sync_members.py [auto|full|incremental]
+
+    auto(기본): 마지막 전체 동기화 후 MEMBER_FULL_SYNC_HOURS가 지났으면 전체, 아니면 증분
 """
 
+import argparse
 import asyncio
 import sys
 from pathlib import Path
@@ -12,61 +15,43 @@ from pathlib import Path
 # backend 모듈 경로 추가
 sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
 
-from datetime import datetime
-from sqlmodel import Session, delete
-from app.db.session import engine
-from app.db.models.member_cache import MemberCache
-from app.services.broj_client import BrojClient
+SYNC_MODES = ("auto", "full", "incremental")
 
 
-async def sync_members():
+async def sync_members(mode: str = "auto"):
     """CRM에서 회원 데이터를 가져와 로컬 DB에 저장"""
+    # 앱 모듈은 인자 확인 뒤 임포트 (--help가 바로 뜨도록)
+    from sqlmodel import Session
+    from app.db.session import engine, init_db
+    from app.services.broj_client import BrojClient
+    from app.services.member_sync_service import MemberSyncService
+
     print("=" * 50, flush=True)
-    print("회원 동기화 시작", flush=True)
+    print(f"회원 동기화 시작 ({mode})", flush=True)
     print("=" * 50, flush=True)
 
     try:
         # CRM 로그인
-        print("\n[1/3] CRM 로그인 중...", flush=True)
+        print("\n[1/2] CRM 로그인 중...", flush=True)
         client = BrojClient()
         await client.login()
         print("      로그인 성공", flush=True)
 
-        # 회원 데이터 가져오기
-        print("\n[2/3] 회원 데이터 가져오는 중...", flush=True)
-        members_data = await client.fetch_members()
-        print(f"      {len(members_data)}명 조회됨", flush=True)
-
-        # DB에 저장
-        print("\n[3/3] 로컬 DB에 저장 중...", flush=True)
+        # 회원 데이터 가져오기 및 저장
+        print("\n[2/2] 회원 데이터 가져와 로컬 DB에 저장 중...", flush=True)
+        init_db()
         with Session(engine) as session:
-            # 기존 데이터 삭제
-            session.exec(delete(MemberCache))
-            session.commit()
-
-            count = 0
-            for member in members_data:
-                cache = MemberCache(
-                    jgjm_key=member.get("jgjm_key"),
-                    name=member.get("jgjm_member_name", ""),
-                    phone=member.get("jgjm_member_phone_number"),
-                    gender=member.get("jgjm_member_sex"),
-                    classification=member.get("classification"),
-                    customer_status=member.get("customer_status"),
-                    synced_at=datetime.now(),
-                )
-                session.add(cache)
-                count += 1
-
-            session.commit()
-
-        print(f"      {count}명 저장 완료")
+            result = await MemberSyncService(session).sync(client, mode=mode, verbose=True)
+
+        history = result["history"]
+        print(f"      {result['fetched']}명 조회, {result['count']}명 저장 ({result['mode']})")
+        print(f"      이력: 신규/변경 {history['inserted']}건, 종료 {history['closed']}건", flush=True)
 
         print("\n" + "=" * 50)
-        print(f"동기화 완료! 총 {count}명")
+        print(f"동기화 완료! 총 {result['count']}명")
         print("=" * 50)
 
-        return count
+        return result["count"]
 
     except Exception as e:
         import traceback
@@ -77,5 +62,10 @@ async def sync_members():
 
 
 if __name__ == "__main__":
-    count = asyncio.run(sync_members())
+    parser = argparse.ArgumentParser(description="CRM 회원 동기화")
+    parser.add_argument("mode", nargs="?", choices=SYNC_MODES, default="auto",
+                        help="auto: 주기에 따라 전체/증분 자동 선택")
+    args = parser.parse_args()
+
+    count = asyncio.run(sync_members(args.mode))
     sys.exit(0 if count > 0 else 1)
@@ -351,4 +351,5 @@ def main():
         members_conn.close()
 
 if __name__ == "__main__":
-    main()
+    from profiling import run_main
+    run_main(main)
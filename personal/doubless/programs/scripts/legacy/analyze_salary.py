@@ -290,4 +290,5 @@ def save_report(anomalies, output_path):
     print(f"\n✅ 보고서 저장 완료: {output_path}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    from profiling import run_main
+    run_main(main)
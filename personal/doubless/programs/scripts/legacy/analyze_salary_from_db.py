@@ -672,4 +672,5 @@ def main():
     print(f"  - 종합분석보고서.md")
 
 if __name__ == "__main__":
-    main()
+    from profiling import run_main
+    run_main(main)
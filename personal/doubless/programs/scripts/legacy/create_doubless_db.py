@@ -15,7 +15,6 @@ import sqlite3
 import json
 from pathlib import Path
 from datetime import datetime
-import shutil
 
 
 def ms_to_datetime(ms_timestamp):
@@ -636,7 +635,15 @@ def main():
         backup_dir = DATA_DIR / 'backups'
         backup_dir.mkdir(exist_ok=True)
         backup_path = backup_dir / f'doubless_{datetime.now().strftime("%Y%m%d_%H%M%S")}.db'
-        shutil.copy(DOUBLESS_DB, backup_path)
+        # 파일 복사 대신 SQLite 백업 API로 일관된 스냅샷을 만들고 검사한 뒤에 원본 삭제
+        src_conn = sqlite3.connect(DOUBLESS_DB)
+        dst_conn = sqlite3.connect(backup_path)
+        src_conn.backup(dst_conn, pages=256)
+        check = dst_conn.execute("PRAGMA integrity_check").fetchone()[0]
+        dst_conn.close()
+        src_conn.close()
+        if check != 'ok':
+            raise SystemExit(f"백업 무결성 검사 실패 ({check}), 기존 DB를 유지합니다")
         print(f"\n기존 DB 백업: {backup_path.name}")
         DOUBLESS_DB.unlink()
 
@@ -679,4 +686,5 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    from profiling import run_main
+    run_main(main)
@@ -349,4 +349,5 @@ def main():
     print(f"  • 회원 DB 없음: {not_in_db}건")
 
 if __name__ == "__main__":
-    main()
+    from profiling import run_main
+    run_main(main)
@@ -5,6 +5,7 @@ Broj CRM 출석정보 다운로드 프로그램
 이 프로그램은 Broj CRM 시스템에서 출석 정보를 월별로 다운로드하여 SQLite DB에 저장합니다.
 """
 
+import os
 import requests
 import json
 import yaml
@@ -14,6 +15,9 @@ from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 import sys
 
+# Broj 서버 주소 (BROJ_URL 환경변수로 로컬 대역 서버 등으로 변경 가능)
+BROJ_URL = os.environ.get("BROJ_URL", "https://brojserver.broj.co.kr").rstrip("/")
+
 
 def ms_to_datetime(ms_timestamp):
     """밀리초 타임스탬프를 datetime 문자열로 변환"""
@@ -58,7 +62,7 @@ class BrojAttendanceDownloader:
         """로그인 및 토큰 획득"""
         print("🔐 로그인 중...")
 
-        login_url = "https://brojserver.broj.co.kr/BroJServer/joauth/login"
+        login_url = f"{BROJ_URL}/BroJServer/joauth/login"
 
         headers = {
             "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
@@ -108,7 +112,7 @@ class BrojAttendanceDownloader:
 
     def get_jgroup_access_token(self):
         """JGroup Access Token 획득"""
-        jgroup_url = f"https://brojserver.broj.co.kr/BroJServer/api/jgroup/{self.jgroup_key}"
+        jgroup_url = f"{BROJ_URL}/BroJServer/api/jgroup/{self.jgroup_key}"
 
         headers = {
             "Accept": "*/*",
@@ -197,7 +201,7 @@ class BrojAttendanceDownloader:
         page_size = 400
 
         while True:
-            api_url = f"https://brojserver.broj.co.kr/BroJServer/api/jgroup/{self.jgroup_key}/attendance"
+            api_url = f"{BROJ_URL}/BroJServer/api/jgroup/{self.jgroup_key}/attendance"
 
             params = {
                 "start_date": start_date,
@@ -475,4 +479,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    from profiling import run_main
+    run_main(main)
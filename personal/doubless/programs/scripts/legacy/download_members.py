@@ -5,6 +5,7 @@ Broj CRM 회원정보 다운로드 프로그램
 이 프로그램은 Broj CRM 시스템에서 회원 정보를 자동으로 다운로드합니다.
 """
 
+import os
 import requests
 import json
 import yaml
@@ -13,6 +14,9 @@ from datetime import datetime
 import sys
 import shutil
 
+# Broj 서버 주소 (BROJ_URL 환경변수로 로컬 대역 서버 등으로 변경 가능)
+BROJ_URL = os.environ.get("BROJ_URL", "https://brojserver.broj.co.kr").rstrip("/")
+
 class BrojMemberDownloader:
     """Broj CRM 회원 다운로더"""
 
@@ -46,7 +50,7 @@ class BrojMemberDownloader:
         """로그인 및 토큰 획득"""
         print("🔐 로그인 중...")
 
-        login_url = "https://brojserver.broj.co.kr/BroJServer/joauth/login"
+        login_url = f"{BROJ_URL}/BroJServer/joauth/login"
 
         headers = {
             "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
@@ -146,7 +150,7 @@ class BrojMemberDownloader:
 
     def _get_jgroup_list(self):
         """사용자의 JGroup 목록 조회"""
-        jgroup_list_url = "https://brojserver.broj.co.kr/BroJServer/api/jgroup"
+        jgroup_list_url = f"{BROJ_URL}/BroJServer/api/jgroup"
 
         headers = {
             "Accept": "*/*",
@@ -179,7 +183,7 @@ class BrojMemberDownloader:
     def get_jgroup_access_token(self):
         """JGroup Access Token 획득"""
         # 먼저 jgroup 정보를 가져와야 함
-        jgroup_url = f"https://brojserver.broj.co.kr/BroJServer/api/jgroup/{self.jgroup_key}"
+        jgroup_url = f"{BROJ_URL}/BroJServer/api/jgroup/{self.jgroup_key}"
 
         headers = {
             "Accept": "*/*",
@@ -223,7 +227,7 @@ class BrojMemberDownloader:
             print(f"\n   📄 페이지 {page_index + 1} 다운로드 중...")
 
             # API URL 구성 (수강권)
-            api_url = f"https://brojserver.broj.co.kr/BroJServer/api/jgroup/lessonticket/{self.jgroup_key}"
+            api_url = f"{BROJ_URL}/BroJServer/api/jgroup/lessonticket/{self.jgroup_key}"
 
             params = {
                 "size": page_size,
@@ -346,7 +350,7 @@ class BrojMemberDownloader:
 
             # API URL 구성 (회원권)
             # 예: https://brojserver.broj.co.kr/BroJServer/jgroup/ticketdetails/533109104
-            api_url = f"https://brojserver.broj.co.kr/BroJServer/jgroup/ticketdetails/{self.jgroup_key}"
+            api_url = f"{BROJ_URL}/BroJServer/jgroup/ticketdetails/{self.jgroup_key}"
 
             # URL 인코딩된 시간 문자열 생성
             # 예: Fri Dec 26 2025 00:57:58 GMT+0900 (한국 표준시)
@@ -471,7 +475,7 @@ class BrojMemberDownloader:
             print(f"\n   📄 페이지 {page_index + 1} 다운로드 중...")
 
             # API URL 구성
-            api_url = f"https://brojserver.broj.co.kr/BroJServer/api/jcustomer/jgroup/{self.jgroup_key}"
+            api_url = f"{BROJ_URL}/BroJServer/api/jcustomer/jgroup/{self.jgroup_key}"
 
             params = {
                 "size": page_size,
@@ -777,4 +781,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    from profiling import run_main
+    run_main(main)
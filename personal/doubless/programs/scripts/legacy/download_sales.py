@@ -10,6 +10,7 @@ Broj CRM 매출정보 다운로드 프로그램
 - SQLite DB에 자동 저장 (신규 추가/업데이트)
 """
 
+import os
 import requests
 import json
 import yaml
@@ -19,6 +20,9 @@ from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 import sys
 
+# Broj 서버 주소 (BROJ_URL 환경변수로 로컬 대역 서버 등으로 변경 가능)
+BROJ_URL = os.environ.get("BROJ_URL", "https://brojserver.broj.co.kr").rstrip("/")
+
 
 def ms_to_datetime(ms_timestamp):
     """밀리초 타임스탬프를 datetime 문자열로 변환"""
@@ -63,7 +67,7 @@ class BrojSalesDownloader:
         """로그인 및 토큰 획득"""
         print("🔐 로그인 중...")
 
-        login_url = "https://brojserver.broj.co.kr/BroJServer/joauth/login"
+        login_url = f"{BROJ_URL}/BroJServer/joauth/login"
 
         headers = {
             "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
@@ -114,7 +118,7 @@ class BrojSalesDownloader:
     def get_jgroup_access_token(self):
         """JGroup Access Token 획득"""
         # 올바른 API endpoint 사용
-        auth_url = f"https://brojserver.broj.co.kr/BroJServer/api/authorization/jgroup?jgroup_key={self.jgroup_key}"
+        auth_url = f"{BROJ_URL}/BroJServer/api/authorization/jgroup?jgroup_key={self.jgroup_key}"
 
         headers = {
             "Accept": "*/*",
@@ -173,7 +177,7 @@ class BrojSalesDownloader:
         page_index = 0
         page_size = 100
 
-        api_url = "https://brojserver.broj.co.kr/BroJServer/jgroup/api/reterive/jgproducthistory/jpql"
+        api_url = f"{BROJ_URL}/BroJServer/jgroup/api/reterive/jgproducthistory/jpql"
 
         while True:
             # JSON payload 생성
@@ -493,4 +497,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    from profiling import run_main
+    run_main(main)
@@ -433,6 +433,10 @@ def main():
                         help='최근 N개월만 분석 (기본값: 전체)')
     parser.add_argument('-y', '--year', type=int, default=2025,
                         help='분석 연도 (기본값: 2025)')
+    parser.add_argument('--db', type=Path, default=None,
+                        help='DB 경로 (기본값: data/doubless.db)')
+    parser.add_argument('--report-dir', type=Path, default=None,
+                        help='보고서 폴더 (기본값: pay/report/session_analysis)')
     args = parser.parse_args()
 
     recent_months = args.months
@@ -446,7 +450,7 @@ def main():
     print('=' * 80)
 
     base_dir = Path(__file__).parent.parent
-    db_path = base_dir / 'data' / 'doubless.db'
+    db_path = args.db or base_dir / 'data' / 'doubless.db'
 
     if not db_path.exists():
         print(f'❌ DB 파일을 찾을 수 없습니다: {db_path}')
@@ -462,7 +466,7 @@ def main():
         analysis_id = analysis_time.strftime('%Y%m%d_%H%M%S')
 
         # 보고서 기본 경로
-        report_base_dir = base_dir / 'pay' / 'report' / 'session_analysis'
+        report_base_dir = args.report_dir or base_dir / 'pay' / 'report' / 'session_analysis'
 
         # 분석 폴더 생성 (타임스탬프)
         if recent_months:
@@ -642,4 +646,5 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    from profiling import run_main
+    run_main(main)
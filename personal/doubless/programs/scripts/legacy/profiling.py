@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+레거시 스크립트 프로파일링 (--profile)
+
+스크립트 인자에 --profile을 붙이면 main()을 cProfile로 실행하고 다음을 출력/저장한다.
+- 상위 함수 (자체/누적 시간)
+- SQL(sqlite3) 시간 vs Python 시간
+- 접힌 스택 파일 (flamegraph.pl, speedscope)
+
+프로파일러는 doubless_operation/backend의 app.profile.profiler(표준 라이브러리만 사용)를 쓴다.
+결과 파일: programs/profiles/<스크립트>_<시각>.*
+
+사용법:
+    python monthly_session_analysis.py -m 3 --profile
+    python download_members.py --profile
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[3] / 'doubless_operation' / 'backend'
+PROFILE_DIR = Path(__file__).resolve().parents[2] / 'profiles'
+
+
+def run_main(main, top=30):
+    """--profile이 있으면 프로파일링하며 main 실행, 없으면 그냥 실행"""
+    if '--profile' not in sys.argv:
+        return main()
+    sys.argv.remove('--profile')
+
+    sys.path.insert(0, str(BACKEND_DIR))
+    from app.profile.profiler import Profiler
+
+    profiler = Profiler(mode='cprofile')
+    try:
+        with profiler:
+            return main()
+    finally:
+        report = profiler.report(top=top)
+        name = f'{Path(sys.argv[0]).stem}_{datetime.now().strftime("%Y%m%d_%H%M%S")}'
+        paths = profiler.save(PROFILE_DIR, name, report)
+
+        print('\n' + '=' * 80)
+        print('프로파일 결과')
+        print('=' * 80)
+        print(report)
+        print(f'\n저장 위치:')
+        for path in paths:
+            print(f'  - {path}')
@@ -401,4 +401,5 @@ def main():
         members_conn.close()
 
 if __name__ == "__main__":
-    main()
+    from profiling import run_main
+    run_main(main)
@@ -1,11 +1,15 @@
 #!/usr/bin/env python3
 """출석정보 API 응답 구조 확인"""
 
+import os
 import requests
 import json
 import yaml
 from pathlib import Path
 
+# Broj 서버 주소 (BROJ_URL 환경변수로 로컬 대역 서버 등으로 변경 가능)
+BROJ_URL = os.environ.get("BROJ_URL", "https://brojserver.broj.co.kr").rstrip("/")
+
 def load_config():
     """설정 파일 로드"""
     base_dir = Path(__file__).parent.parent
@@ -24,7 +28,7 @@ def load_config():
 def login(config):
     """로그인"""
     session = requests.Session()
-    login_url = "https://brojserver.broj.co.kr/BroJServer/joauth/login"
+    login_url = f"{BROJ_URL}/BroJServer/joauth/login"
 
     headers = {
         "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
@@ -51,7 +55,7 @@ def login(config):
 
 def get_jgroup_access_token(session, access_token, jgroup_key):
     """JGroup Access Token 획득"""
-    jgroup_url = f"https://brojserver.broj.co.kr/BroJServer/api/jgroup/{jgroup_key}"
+    jgroup_url = f"{BROJ_URL}/BroJServer/api/jgroup/{jgroup_key}"
 
     headers = {
         "Accept": "*/*",
@@ -78,7 +82,7 @@ def test_attendance_api():
     print(f"✅ JGroup Access Token 획득")
 
     # 테스트: 2026년 1월 1일부터 3일까지
-    api_url = f"https://brojserver.broj.co.kr/BroJServer/api/jgroup/{jgroup_key}/attendance"
+    api_url = f"{BROJ_URL}/BroJServer/api/jgroup/{jgroup_key}/attendance"
 
     params = {
         "start_date": "2026-01-01",
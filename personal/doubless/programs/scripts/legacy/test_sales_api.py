@@ -3,6 +3,7 @@
 Broj CRM 매출정보 API 테스트 프로그램
 """
 
+import os
 import requests
 import json
 import yaml
@@ -10,6 +11,9 @@ from pathlib import Path
 from datetime import datetime
 import sys
 
+# Broj 서버 주소 (BROJ_URL 환경변수로 로컬 대역 서버 등으로 변경 가능)
+BROJ_URL = os.environ.get("BROJ_URL", "https://brojserver.broj.co.kr").rstrip("/")
+
 
 class BrojSalesAPITester:
     """Broj CRM 매출정보 API 테스터"""
@@ -41,7 +45,7 @@ class BrojSalesAPITester:
         """로그인 및 토큰 획득"""
         print("🔐 로그인 중...")
 
-        login_url = "https://brojserver.broj.co.kr/BroJServer/joauth/login"
+        login_url = f"{BROJ_URL}/BroJServer/joauth/login"
 
         headers = {
             "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
@@ -88,7 +92,7 @@ class BrojSalesAPITester:
 
     def get_jgroup_access_token(self):
         """JGroup Access Token 획득"""
-        jgroup_url = f"https://brojserver.broj.co.kr/BroJServer/api/jgroup/{self.jgroup_key}"
+        jgroup_url = f"{BROJ_URL}/BroJServer/api/jgroup/{self.jgroup_key}"
 
         headers = {
             "Accept": "*/*",
@@ -134,7 +138,7 @@ class BrojSalesAPITester:
         start_time = 1733000400000
         end_time = 1735660799000
 
-        api_url = "https://brojserver.broj.co.kr/BroJServer/jgroup/api/reterive/jgproducthistory/jpql"
+        api_url = f"{BROJ_URL}/BroJServer/jgroup/api/reterive/jgproducthistory/jpql"
 
         # 여러 payload 조합 시도
         payloads_to_try = [